@@ -1,3 +1,10 @@
-from pisat.calc.altitude import press2alti
-from pisat.calc.position import Position
+from pisat.calc.altitude import press2alti, press2alti_array, AltitudeEstimator
+from pisat.calc.position import Position, PositionArray
+from pisat.calc.projection import EnuProjection
 from pisat.calc.navigator import Navigator
+from pisat.calc.route import RouteNavigator
+from pisat.calc.geofence import Geofence
+
+from pisat.calc.stream_filter import (
+    StreamFilter, WindowFilter, EMA, MovingStats, RunningMax, RunningMin, RollingMedian, Derivative, Debounce
+)
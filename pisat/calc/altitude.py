@@ -1,13 +1,182 @@
 
-import math
+from typing import Optional
+
+import numpy as np
+
+from pisat.calc.stream_filter import Number, StreamFilter
 
 
 PRESS_ATOMOSPHERE = 1013.25         # hpa
 TEMP_ABS_CELSIUS0 = 273.15           # K
+TEMP_STANDARD = 15.                 # degrees Celsius
+LAPSE_RATE = 0.0065                 # K/m
+EXPONENT_BAROMETRIC = 1. / 5.257
 
 
 def press2alti(press: float, temp: float) -> float:
-    dep_p = math.pow(PRESS_ATOMOSPHERE / press, 1. / 5.257) - 1
+    dep_p = (PRESS_ATOMOSPHERE / press) ** EXPONENT_BAROMETRIC - 1
     dep_t = temp + TEMP_ABS_CELSIUS0
-    return dep_p * dep_t / 0.0065
-    
\ No newline at end of file
+    return dep_p * dep_t / LAPSE_RATE
+
+
+def press2alti_array(press, temp, press_ref: float = PRESS_ATOMOSPHERE) -> np.ndarray:
+    """Vectorized press2alti with a reference pressure.
+
+    Parameters
+    ----------
+        press : array_like
+            Pressures in hPa.
+        temp : array_like
+            Temperatures in degrees Celsius.
+        press_ref : float, optional
+            Pressure at the altitude of 0 in hPa, by default 1013.25.
+
+    Returns
+    -------
+        np.ndarray
+            Altitudes in meters.
+    """
+    dep_p = np.power(np.divide(press_ref, press, dtype=np.float64), EXPONENT_BAROMETRIC) - 1
+    dep_t = np.add(temp, TEMP_ABS_CELSIUS0)
+    return dep_p * dep_t / LAPSE_RATE
+
+
+class AltitudeEstimator(StreamFilter):
+    """Altitude relative to the ground estimated from pressures.
+
+    The mean pressure of the first 'counts_baseline' samples is captured
+    as the pressure of the ground, and the following samples are converted
+    into altitudes relative to the ground by the barometric formula.
+    The power of the baseline and the factor of the temperature are
+    precomputed, so only one power is calculated for each sample.
+
+    The estimator can be attached to a channel of pressures of DataLogger,
+    and its output can be a derived channel of the logger.
+
+    Examples
+    --------
+        >> estimator = AltitudeEstimator(counts_baseline=100, temp=20.)
+        >> dlogger.derive("bme280-altitude", "bme280-press", estimator)
+        >> ...
+        >> estimator.value                          # the latest altitude
+        >> dlogger.history("bme280-altitude", 2.)   # altitudes in the last 2 seconds
+
+    See Also
+    --------
+        pisat.core.logger.DataLogger.derive : Derived channels of DataLogger.
+    """
+
+    COUNTS_BASELINE_DEFAULT = 50
+
+    def __init__(self,
+                 counts_baseline: int = COUNTS_BASELINE_DEFAULT,
+                 temp: float = TEMP_STANDARD) -> None:
+        """
+        Parameters
+        ----------
+            counts_baseline : int, optional
+                Number of samples for the baseline, by default 50.
+            temp : float, optional
+                Temperature of the air in degrees Celsius, by default 15.
+
+        Raises
+        ------
+            ValueError
+                Raised if 'counts_baseline' is not positive.
+        """
+        if counts_baseline <= 0:
+            raise ValueError(
+                "'counts_baseline' must be larger than 0."
+            )
+        super().__init__()
+        self._counts_baseline: int = counts_baseline
+        self._sum_baseline: float = 0.
+        self._press_ref: Optional[float] = None
+        self._press_ref_pow: Optional[float] = None
+        self._altitude: Optional[float] = None
+        self.temp = temp
+
+    @property
+    def counts_baseline(self) -> int:
+        return self._counts_baseline
+
+    @property
+    def temp(self) -> float:
+        return self._temp
+
+    @temp.setter
+    def temp(self, temp: float) -> None:
+        self._temp: float = temp
+        self._scale: float = (temp + TEMP_ABS_CELSIUS0) / LAPSE_RATE
+
+    @property
+    def press_ref(self) -> Optional[float]:
+        """Pressure of the ground, or None while capturing the baseline."""
+        return self._press_ref
+
+    @property
+    def ready(self) -> bool:
+        return self._press_ref is not None
+
+    @property
+    def value(self) -> Optional[float]:
+        return self._altitude
+
+    def calibrate(self, press_ref: float) -> None:
+        """Set the pressure of the ground without capturing the baseline.
+        """
+        self._press_ref = press_ref
+        self._press_ref_pow = press_ref ** EXPONENT_BAROMETRIC
+
+    def _update(self, x: Number, timestamp: Optional[float]) -> None:
+        if self._press_ref is None:
+            self._sum_baseline += x
+            if self._counts + 1 < self._counts_baseline:
+                return
+            self.calibrate(self._sum_baseline / self._counts_baseline)
+
+        # NOTE (p0 / p) ** k is calculated as p0 ** k * p ** -k.
+        self._altitude = (self._press_ref_pow * x ** - EXPONENT_BAROMETRIC - 1) * self._scale
+
+    def reset(self) -> None:
+        """Discard the baseline and capture it again."""
+        super().reset()
+        self._sum_baseline = 0.
+        self._press_ref = None
+        self._press_ref_pow = None
+        self._altitude = None
+
+    def estimate_array(self, press) -> np.ndarray:
+        """Estimate altitudes of a sequence of pressures at once.
+
+        If the baseline is being captured, the pressures complete it
+        after the samples given by 'update' so far, unless the estimator
+        has been calibrated. The state of the estimator is not changed.
+
+        Parameters
+        ----------
+            press : array_like
+                Pressures in the order of time.
+
+        Returns
+        -------
+            np.ndarray
+                Altitudes relative to the ground, which are the same as
+                'value' after 'update' is given the pressures in order.
+                NaN stands for None, which means the baseline is not
+                captured yet.
+        """
+        press = np.asarray(press, dtype=np.float64)
+        altitudes = np.full(press.shape, np.nan)
+        press_ref = self._press_ref
+        head = 0
+        if press_ref is None:
+            # NOTE The baseline is continued from the samples given by 'update'.
+            need = self._counts_baseline - self._counts
+            if len(press) < need:
+                return altitudes
+            press_ref = (self._sum_baseline + press[:need].sum()) / self._counts_baseline
+            head = need - 1
+
+        altitudes[head:] = press2alti_array(press[head:], self._temp, press_ref=press_ref)
+        return altitudes
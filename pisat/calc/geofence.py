@@ -0,0 +1,363 @@
+#! python3
+
+"""
+
+pisat.calc.geofence
+~~~~~~~~~~~~~~~~~~~
+Containment and distance queries of polygons for every GPS fix.
+Geofence projects polygons given in longitudes and latitudes into a
+local east-north frame and builds a uniform grid over them. Each cell
+of the grid keeps the edges overlapping it and whether its center is
+inside each polygon, so a query of containment only counts crossings
+of the segment from the center of the cell to the position with the
+edges in the cell, and a query of distance only looks into cells
+around the position. Both are near-constant time for each fix.
+
+Batch queries for validating whole logs are vectorized with NumPy
+over positions and edges.
+
+[info]
+pisat.calc.EnuProjection
+pisat.calc.RouteNavigator
+"""
+
+import math
+from typing import Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from pisat.calc.position import Position, PositionArray
+from pisat.calc.projection import EnuProjection
+
+
+Polygon = Union[Iterable[Position], PositionArray]
+
+
+class Geofence:
+    """Index of polygons for containment and distance queries.
+
+    Examples
+    --------
+        >> fence = Geofence([allowed_zone, no_go_1, no_go_2])
+        >> fence.contains(p)        # indices of polygons containing p
+        >> fence.inside(p, 0)       # whether p is inside the allowed zone
+        >> fence.nearest(p)         # index of the nearest polygon and the distance to it
+        >>
+        >> # validation of a log
+        >> inside = fence.contains_array(longis, latis)    # (n, 3)
+
+    See Also
+    --------
+        pisat.calc.EnuProjection : Projection used by this class.
+    """
+
+    # NOTE The target of the average number of cells for an edge
+    CELLS_PER_EDGE = 4
+    SIZE_CHUNK = 1 << 12
+
+    def __init__(self,
+                 polygons: Sequence[Polygon],
+                 projection: Optional[EnuProjection] = None,
+                 cell: Optional[float] = None) -> None:
+        """
+        Parameters
+        ----------
+            polygons : Sequence[Polygon]
+                Polygons given as sequences of vertices. Polygons don't
+                need to be closed, i.e. the last vertex needs not to be
+                the same as the first one.
+            projection : Optional[EnuProjection], optional
+                Projection of polygons and positions, by default None.
+                If None, the projection whose origin is the center of
+                all vertices is used.
+            cell : Optional[float], optional
+                Size of cells of the grid in meters, by default None.
+                If None, the size is determined by the number of edges.
+
+        Raises
+        ------
+            ValueError
+                Raised if no polygon is given, a polygon has less than
+                3 vertices, or 'cell' is not positive.
+        """
+        polygons = [p if isinstance(p, PositionArray) else PositionArray.from_positions(p) for p in polygons]
+        if not len(polygons):
+            raise ValueError(
+                "At least one polygon must be given."
+            )
+        if projection is None:
+            longi = np.concatenate([p.longi for p in polygons])
+            lati = np.concatenate([p.lati for p in polygons])
+            projection = EnuProjection(Position(float(longi.mean()), float(lati.mean())))
+
+        self._projection: EnuProjection = projection
+        self._counts_polygons: int = len(polygons)
+
+        starts, ends, owners = [], [], []
+        for index, polygon in enumerate(polygons):
+            east, north = projection.forward_array(polygon.longi, polygon.lati)
+            vertices = np.stack((east, north), axis=1)
+            if len(vertices) > 1 and np.array_equal(vertices[0], vertices[-1]):
+                vertices = vertices[:-1]
+            if len(vertices) < 3:
+                raise ValueError(
+                    "Polygons must have at least 3 vertices."
+                )
+            starts.append(vertices)
+            ends.append(np.roll(vertices, -1, axis=0))
+            owners.append(np.full(len(vertices), index))
+
+        self._starts: np.ndarray = np.concatenate(starts)
+        self._ends: np.ndarray = np.concatenate(ends)
+        self._owners: np.ndarray = np.concatenate(owners)
+        self._build(cell)
+
+    def _build(self, cell: Optional[float]) -> None:
+        vertices = self._starts
+        lower = vertices.min(axis=0)
+        upper = vertices.max(axis=0)
+        extent = np.maximum(upper - lower, 1e-9)
+
+        if cell is None:
+            cell = math.sqrt(extent[0] * extent[1] / (self.CELLS_PER_EDGE * len(vertices)))
+            cell = max(cell, float(extent.max()) / 1024, 1e-6)
+        elif cell <= 0:
+            raise ValueError(
+                "'cell' must be positive."
+            )
+
+        self._cell: float = cell
+        self._lower: Tuple[float, float] = (float(lower[0]), float(lower[1]))
+        self._shape: Tuple[int, int] = tuple(int(n) for n in np.floor(extent / cell) + 1)
+
+        # NOTE
+        #   Edges are assigned to all cells overlapping their bounding boxes,
+        #   which is a superset of cells overlapping the edges themselves.
+        nx, ny = self._shape
+        self._cells: List[List[int]] = [[] for _ in range(nx * ny)]
+        low = np.floor((np.minimum(self._starts, self._ends) - lower) / cell).astype(np.int64)
+        high = np.floor((np.maximum(self._starts, self._ends) - lower) / cell).astype(np.int64)
+        low = np.minimum(low, (nx - 1, ny - 1))
+        high = np.minimum(high, (nx - 1, ny - 1))
+        for edge, ((ix0, iy0), (ix1, iy1)) in enumerate(zip(low.tolist(), high.tolist())):
+            for ix in range(ix0, ix1 + 1):
+                for iy in range(iy0, iy1 + 1):
+                    self._cells[ix * ny + iy].append(edge)
+
+        ix, iy = np.meshgrid(np.arange(nx), np.arange(ny), indexing="ij")
+        centers_x = self._lower[0] + (ix.ravel() + 0.5) * cell
+        centers_y = self._lower[1] + (iy.ravel() + 0.5) * cell
+        self._inside_centers: List[List[bool]] = self._contains_enu(centers_x, centers_y).tolist()
+
+        # NOTE Edges are also kept as lists of floats for scalar queries.
+        self._x0, self._y0 = self._starts.T.tolist()
+        self._x1, self._y1 = self._ends.T.tolist()
+        self._owners_list: List[int] = self._owners.tolist()
+
+    @property
+    def projection(self) -> EnuProjection:
+        return self._projection
+
+    @property
+    def cell(self) -> float:
+        return self._cell
+
+    def __len__(self) -> int:
+        return self._counts_polygons
+
+    def _locate(self, x: float, y: float) -> Tuple[int, int]:
+        return (int(math.floor((x - self._lower[0]) / self._cell)),
+                int(math.floor((y - self._lower[1]) / self._cell)))
+
+    def _contains(self, x: float, y: float) -> List[bool]:
+        ix, iy = self._locate(x, y)
+        nx, ny = self._shape
+        if not (0 <= ix < nx and 0 <= iy < ny):
+            return [False] * self._counts_polygons
+
+        index = ix * ny + iy
+        inside = list(self._inside_centers[index])
+        cx = self._lower[0] + (ix + 0.5) * self._cell
+        cy = self._lower[1] + (iy + 0.5) * self._cell
+        dx, dy = x - cx, y - cy
+
+        # NOTE
+        #   Each crossing of the segment from the center to the position
+        #   with an edge flips the containment of the polygon of the edge.
+        #   Vertices on the segment are regarded as on the positive side.
+        x0, y0, x1, y1 = self._x0, self._y0, self._x1, self._y1
+        for edge in self._cells[index]:
+            side0 = dx * (y0[edge] - cy) - dy * (x0[edge] - cx) > 0
+            side1 = dx * (y1[edge] - cy) - dy * (x1[edge] - cx) > 0
+            if side0 == side1:
+                continue
+            ex, ey = x1[edge] - x0[edge], y1[edge] - y0[edge]
+            side_center = ex * (cy - y0[edge]) - ey * (cx - x0[edge]) > 0
+            side_point = ex * (y - y0[edge]) - ey * (x - x0[edge]) > 0
+            if side_center != side_point:
+                owner = self._owners_list[edge]
+                inside[owner] = not inside[owner]
+
+        return inside
+
+    def contains(self, p: Position) -> List[int]:
+        """Indices of polygons containing the position.
+
+        Parameters
+        ----------
+            p : Position
+                Position to be tested.
+
+        Returns
+        -------
+            List[int]
+                Indices of polygons in the order given.
+        """
+        inside = self._contains(*self._projection.forward(p))
+        return [index for index, flag in enumerate(inside) if flag]
+
+    def inside(self, p: Position, index: Optional[int] = None) -> bool:
+        """Whether the position is inside the polygon.
+
+        Parameters
+        ----------
+            p : Position
+                Position to be tested.
+            index : Optional[int], optional
+                Index of the polygon, by default None.
+                If None, whether the position is inside any polygon.
+
+        Returns
+        -------
+            bool
+                Whether the position is inside.
+        """
+        inside = self._contains(*self._projection.forward(p))
+        if index is None:
+            return any(inside)
+        return inside[index]
+
+    def _distance_edge(self, edge: int, x: float, y: float) -> float:
+        x0, y0 = self._x0[edge], self._y0[edge]
+        ex, ey = self._x1[edge] - x0, self._y1[edge] - y0
+        norm = ex * ex + ey * ey
+        t = ((x - x0) * ex + (y - y0) * ey) / norm if norm > 0 else 0.
+        t = min(max(t, 0.), 1.)
+        return math.hypot(x - x0 - t * ex, y - y0 - t * ey)
+
+    def nearest(self, p: Position) -> Tuple[int, float]:
+        """Nearest polygon and the distance to its boundary.
+
+        Cells are searched in rings around the position until no cell
+        can have a nearer edge, so the time depends on the distance
+        from the position to the nearest edge, not on the number of edges.
+
+        Parameters
+        ----------
+            p : Position
+                Position to be tested.
+
+        Returns
+        -------
+            Tuple[int, float]
+                Index of the polygon and the distance to its boundary in meters.
+        """
+        x, y = self._projection.forward(p)
+        nx, ny = self._shape
+        ix, iy = self._locate(x, y)
+        ix = min(max(ix, 0), nx - 1)
+        iy = min(max(iy, 0), ny - 1)
+
+        best_edge, best_distance = -1, math.inf
+        checked = set()
+        for ring in range(max(nx, ny)):
+            # NOTE
+            #   Cells in the ring are at least (ring - 1) cells away from
+            #   the position, or from its projection onto the grid.
+            if (ring - 1) * self._cell > best_distance:
+                break
+            for jx in range(ix - ring, ix + ring + 1):
+                if not 0 <= jx < nx:
+                    continue
+                edge_ring = abs(jx - ix) == ring
+                for jy in range(iy - ring, iy + ring + 1):
+                    if not 0 <= jy < ny or not (edge_ring or abs(jy - iy) == ring):
+                        continue
+                    for edge in self._cells[jx * ny + jy]:
+                        if edge in checked:
+                            continue
+                        checked.add(edge)
+                        distance = self._distance_edge(edge, x, y)
+                        if distance < best_distance:
+                            best_edge, best_distance = edge, distance
+
+        return self._owners_list[best_edge], best_distance
+
+    def _contains_enu(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        # NOTE Ray casting to the east vectorized over positions and edges.
+        result = np.zeros((len(x), self._counts_polygons), dtype=bool)
+        x0, y0 = self._starts[:, 0], self._starts[:, 1]
+        x1, y1 = self._ends[:, 0], self._ends[:, 1]
+        for head in range(0, len(x), self.SIZE_CHUNK):
+            px = x[head:head + self.SIZE_CHUNK, np.newaxis]
+            py = y[head:head + self.SIZE_CHUNK, np.newaxis]
+            straddle = (y0 > py) != (y1 > py)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                cross = x0 + (py - y0) * (x1 - x0) / (y1 - y0)
+            crossings = straddle & (px < cross)
+            for index in range(self._counts_polygons):
+                mask = self._owners == index
+                result[head:head + self.SIZE_CHUNK, index] = np.count_nonzero(crossings[:, mask], axis=1) % 2 == 1
+        return result
+
+    def contains_array(self, longi, lati) -> np.ndarray:
+        """Containment of positions in each polygon.
+
+        Parameters
+        ----------
+            longi : array_like
+                Longitudes in radians.
+            lati : array_like
+                Latitudes in radians.
+
+        Returns
+        -------
+            np.ndarray
+                Boolean array of the shape (n, number of polygons).
+        """
+        x, y = self._projection.forward_array(np.atleast_1d(longi), np.atleast_1d(lati))
+        return self._contains_enu(x, y)
+
+    def nearest_array(self, longi, lati) -> Tuple[np.ndarray, np.ndarray]:
+        """Nearest polygons of positions and distances to their boundaries.
+
+        Parameters
+        ----------
+            longi : array_like
+                Longitudes in radians.
+            lati : array_like
+                Latitudes in radians.
+
+        Returns
+        -------
+            Tuple[np.ndarray, np.ndarray]
+                Indices of the polygons and distances in meters.
+        """
+        x, y = self._projection.forward_array(np.atleast_1d(longi), np.atleast_1d(lati))
+        x0, y0 = self._starts[:, 0], self._starts[:, 1]
+        ex, ey = (self._ends - self._starts).T
+        norm = ex ** 2 + ey ** 2
+        norm = np.where(norm > 0, norm, 1.)
+
+        indices = np.empty(len(x), dtype=np.int64)
+        distances = np.empty(len(x), dtype=np.float64)
+        for head in range(0, len(x), self.SIZE_CHUNK):
+            dx = x[head:head + self.SIZE_CHUNK, np.newaxis] - x0
+            dy = y[head:head + self.SIZE_CHUNK, np.newaxis] - y0
+            t = np.clip((dx * ex + dy * ey) / norm, 0., 1.)
+            distance = np.hypot(dx - t * ex, dy - t * ey)
+            edges = np.argmin(distance, axis=1)
+            indices[head:head + self.SIZE_CHUNK] = self._owners[edges]
+            distances[head:head + self.SIZE_CHUNK] = distance[np.arange(len(edges)), edges]
+
+        return indices, distances
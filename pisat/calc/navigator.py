@@ -4,23 +4,60 @@ from typing import Optional
 
 from pisat.base.component import Component
 from pisat.calc.position import Position
+from pisat.calc.projection import EnuProjection
 
 
 class Navigator(Component):
     
     ABS_TOL = 1e-16
     
-    def __init__(self, goal: Position, name: Optional[str] = None) -> None:
+    def __init__(self, 
+                 goal: Position, 
+                 name: Optional[str] = None, 
+                 projection: Optional[EnuProjection] = None) -> None:
+        """
+        Parameters
+        ----------
+            goal : Position
+                Goal of navigation.
+            name : Optional[str], optional
+                Name of the component, by default None.
+            projection : Optional[EnuProjection], optional
+                Projection used for navigation, by default None.
+                If given, positions are projected into the local frame of 
+                the projection and distances and azimuths are calculated 
+                as 2D vectors, which is faster than Hubeny's formula.
+                Errors of the mode are documented in pisat.calc.projection, 
+                for example below 1 cm of distances within 10 km of the 
+                origin. The goal is recommended as the origin.
+        """
         super().__init__(name=name)
         
         self._goal = goal
+        self._projection = projection
+        if projection is not None:
+            self._east_goal, self._north_goal = projection.forward(goal)
         
     @property
     def goal(self):
         return self._goal
     
+    @property
+    def projection(self):
+        return self._projection
+    
+    def _azimuth(self, p: Position) -> float:
+        if self._projection is None:
+            return self._goal.azimuth_from(p)
+        
+        east, north = self._projection.forward(p)
+        azim = math.atan2(self._east_goal - east, self._north_goal - north)
+        if azim < 0:
+            azim += 2 * math.pi
+        return azim
+    
     def delta_angle(self, p: Position, heading: float, degree: Optional[str] = None) -> float:
-        azim = self._goal.azimuth_from(p)
+        azim = self._azimuth(p)
         delta = math.pi - heading + azim
         
         if math.isclose(delta, 0, abs_tol=self.ABS_TOL):
@@ -33,4 +70,8 @@ class Navigator(Component):
         return delta
     
     def delta_distance(self, p: Position) -> float:
-        return self._goal.distance_from(p) 
+        if self._projection is None:
+            return self._goal.distance_from(p)
+        
+        east, north = self._projection.forward(p)
+        return math.hypot(self._east_goal - east, self._north_goal - north)
@@ -10,6 +10,7 @@ import numpy as np
 MAJOR_RADIUS_WGS84 = 6378137.000
 MINOR_RADIUS_WGS84 = 6356752.314245
 ECCENTRICITY = math.sqrt(1 - (MINOR_RADIUS_WGS84 / MAJOR_RADIUS_WGS84) ** 2)
+ECCENTRICITY_SQUARED = ECCENTRICITY ** 2
 
 
 def diff_geopos(longi_1, lati_1, longi_2, lati_2) -> Tuple[float]:
@@ -106,19 +107,150 @@ def calc_relative_coordinate(longi_1, lati_1, longi_2, lati_2) -> Tuple[float]:
     return tuple(coordinate)
 
 
+#   NOTE
+#       Vectorized versions of the functions above.
+#       Arguments can be scalars or arrays of radians which can be broadcast,
+#       for example a position and arrays of many positions.
+
+#   Quadrants of relative_quadrant indexed by signs of differences of
+#   longitudes and latitudes plus one.
+QUADRANTS = np.array([[3, -3, 2],
+                      [-4, 0, -2],
+                      [4, -1, 1]])
+
+
+def diff_geopos_array(longi_1, lati_1, longi_2, lati_2) -> Tuple[np.ndarray, np.ndarray]:
+    """Vectorized diff_geopos."""
+    longi_1 = np.asarray(longi_1, dtype=np.float64)
+    longi_2 = np.asarray(longi_2, dtype=np.float64)
+    diff_longi = longi_1 - longi_2
+    diff_lati = np.subtract(lati_1, lati_2, dtype=np.float64)
+    
+    # Compensation is needed only as for longitude.
+    abs_diff_longi = 2 * math.pi - np.abs(longi_1) - np.abs(longi_2)
+    diff_longi = np.where(np.abs(diff_longi) > math.pi, - np.sign(diff_longi) * abs_diff_longi, diff_longi)
+    
+    return (diff_longi, diff_lati)
+
+
+def relative_quadrant_array(longi_1, lati_1, longi_2, lati_2) -> np.ndarray:
+    """Vectorized relative_quadrant."""
+    diff_longi, diff_lati = diff_geopos_array(longi_1, lati_1, longi_2, lati_2)
+    index_longi = np.sign(diff_longi).astype(np.int64) + 1
+    index_lati = np.sign(diff_lati).astype(np.int64) + 1
+    return QUADRANTS[index_longi, index_lati]
+
+
+def _distance_hubeny_array(diff_longi, diff_lati, mean_lati) -> np.ndarray:
+    sin_mean_lati = np.sin(mean_lati)
+    denom_carvature = np.sqrt(1 - (ECCENTRICITY * sin_mean_lati) ** 2)
+    meridian_carvature = MAJOR_RADIUS_WGS84 * (1 - ECCENTRICITY ** 2) / denom_carvature ** 3
+    prime_carvature = MAJOR_RADIUS_WGS84 / denom_carvature
+    return np.hypot(diff_lati * meridian_carvature, diff_longi * prime_carvature * np.cos(mean_lati))
+
+
+def distance_hubeny_array(longi_1, lati_1, longi_2, lati_2) -> np.ndarray:
+    """Vectorized distance_hubeny."""
+    diff_longi, diff_lati = diff_geopos_array(longi_1, lati_1, longi_2, lati_2)
+    mean_lati = np.add(lati_1, lati_2) / 2
+    return _distance_hubeny_array(diff_longi, diff_lati, mean_lati)
+
+
+def calc_relative_coordinate_array(longi_1, lati_1, longi_2, lati_2) -> Tuple[np.ndarray, np.ndarray]:
+    """Vectorized calc_relative_coordinate."""
+    diff_longi, diff_lati = diff_geopos_array(longi_1, lati_1, longi_2, lati_2)
+    lati_2 = np.asarray(lati_2, dtype=np.float64)
+    
+    # NOTE
+    #   The x coordinate is the distance along the latitude of the second
+    #   position, and the y coordinate is the one along the meridian of it,
+    #   and their signs are those of the differences as the quadrant map.
+    diff_x = _distance_hubeny_array(diff_longi, 0., lati_2)
+    diff_y = _distance_hubeny_array(0., diff_lati, np.add(lati_1, lati_2) / 2)
+    return (np.where(diff_longi < 0, - diff_x, diff_x), 
+            np.where(diff_lati < 0, - diff_y, diff_y))
+
+
+def calc_azimuth_array(longi_1, lati_1, longi_2, lati_2) -> np.ndarray:
+    """Azimuths of the first positions seen from the second ones in [0, 2pi).
+    
+    The azimuth is measured clockwise from the north as Position.azimuth_from.
+    """
+    delta_x, delta_y = calc_relative_coordinate_array(longi_1, lati_1, longi_2, lati_2)
+    return np.mod(math.pi / 2 - np.arctan2(delta_y, delta_x), 2 * math.pi)
+
+
+def calc_distance_azimuth_array(longi_1, lati_1, longi_2, lati_2) -> Tuple[np.ndarray, np.ndarray]:
+    """Distances and azimuths of the first positions seen from the second ones at once.
+    
+    Examples
+    --------
+        >> # distances and azimuths of many points from the current position
+        >> distances, azimuths = calc_distance_azimuth_array(longis, latis, current.longi, current.lati)
+    """
+    diff_longi, diff_lati = diff_geopos_array(longi_1, lati_1, longi_2, lati_2)
+    lati_2 = np.asarray(lati_2, dtype=np.float64)
+    mean_lati = np.add(lati_1, lati_2) / 2
+    
+    distance = _distance_hubeny_array(diff_longi, diff_lati, mean_lati)
+    diff_x = _distance_hubeny_array(diff_longi, 0., lati_2)
+    diff_y = _distance_hubeny_array(0., diff_lati, mean_lati)
+    delta_x = np.where(diff_longi < 0, - diff_x, diff_x)
+    delta_y = np.where(diff_lati < 0, - diff_y, diff_y)
+    azimuth = np.mod(math.pi / 2 - np.arctan2(delta_y, delta_x), 2 * math.pi)
+    
+    return (distance, azimuth)
+
+
 class Position:
+    """Geographic position with cached trigonometric terms.
+    
+    Radians of the longitude and the latitude, and sin and cos of 
+    the latitude and the half of it are computed once when the object 
+    is created, so distances and azimuths to other positions need no 
+    trigonometric functions of latitudes. This is effective for fixed 
+    positions such as the goal of a Navigator.
+    
+    See Also
+    --------
+        pisat.calc.PositionArray : Batch of positions.
+    """
+    
+    __slots__ = ("_longi", "_lati", "_sin_lati", "_cos_lati", "_sin_half", "_cos_half", "_prime")
     
     ABS_TOL = 1e-16
     
     def __init__(self, longi: float, lati: float, degree: bool = False) -> None:
-        self._pos = np.array([longi, lati])
-        
         if degree:
-            self._pos = self.to_radian(self._pos)
+            longi = self.to_radian(longi)
+            lati = self.to_radian(lati)
+            
+        self._longi = float(longi)
+        self._lati = float(lati)
+        self._sin_lati = math.sin(self._lati)
+        self._cos_lati = math.cos(self._lati)
+        self._sin_half = math.sin(self._lati / 2)
+        self._cos_half = math.cos(self._lati / 2)
+        self._prime = MAJOR_RADIUS_WGS84 / math.sqrt(1 - ECCENTRICITY_SQUARED * self._sin_lati ** 2)
+        
+    def _mean_lati(self, p) -> Tuple[float, float]:
+        # NOTE
+        #   sin and cos of the mean latitude by the addition theorem
+        #   with those of the half latitudes.
+        sin_mean = self._sin_half * p._cos_half + self._cos_half * p._sin_half
+        cos_mean = self._cos_half * p._cos_half - self._sin_half * p._sin_half
+        return sin_mean, cos_mean
+    
+    def _relative_coordinate(self, p) -> Tuple[float, float]:
+        # Same as calc_relative_coordinate(self.longi, self.lati, p.longi, p.lati)
+        diff_longi, diff_lati = diff_geopos(self._longi, self._lati, p._longi, p._lati)
+        sin_mean, _ = self._mean_lati(p)
+        denom_carvature = 1 - ECCENTRICITY_SQUARED * sin_mean ** 2
+        meridian_carvature = MAJOR_RADIUS_WGS84 * (1 - ECCENTRICITY_SQUARED) / (denom_carvature * math.sqrt(denom_carvature))
+        return (diff_longi * p._prime * p._cos_lati, diff_lati * meridian_carvature)
     
     def azimuth_from(self, p, degree: bool = False) -> float:
-        delta_x, delta_y = calc_relative_coordinate(self.longi, self.lati, p.longi, p.lati)
-        print(delta_x, delta_y)
+        delta_x, delta_y = self._relative_coordinate(p)
         azim = math.pi / 2 - math.atan2(delta_y, delta_x)
         if azim < 0:
             azim += 2 * math.pi
@@ -128,7 +260,7 @@ class Position:
         return azim
 
     def azimuth_to(self, p, degree: bool = False) -> float:
-        delta_x, delta_y = calc_relative_coordinate(p.longi, p.lati, self.longi, self.lati)
+        delta_x, delta_y = p._relative_coordinate(self)
         azim = math.pi / 2 - math.atan2(delta_y, delta_x)
         if azim < 0:
             azim += 3 / 2 * math.pi
@@ -138,12 +270,12 @@ class Position:
         return azim
     
     def diff_from(self, p):
-        diff_longi, diff_lati = diff_geopos(self.longi, self.lati, p.longi, p.lati)
+        diff_longi, diff_lati = diff_geopos(self._longi, self._lati, p._longi, p._lati)
         diff_pos = self.__class__(diff_longi, diff_lati) 
         return diff_pos
     
     def direction_from(self, p, degree: bool = False) -> float:
-        delta_x, delta_y = calc_relative_coordinate(self.longi, self.lati, p.longi, p.lati)
+        delta_x, delta_y = self._relative_coordinate(p)
         azim = - math.atan2(delta_x, delta_y)
         
         if math.isclose(azim, 0., abs_tol=self.ABS_TOL):
@@ -156,7 +288,7 @@ class Position:
         return azim
     
     def direction_to(self, p, degree: bool = False) -> float:
-        delta_x, delta_y = calc_relative_coordinate(p.longi, p.lati, self.longi, self.lati)
+        delta_x, delta_y = p._relative_coordinate(self)
         azim = - math.atan2(delta_x, delta_y)
         
         if math.isclose(azim, 0., abs_tol=self.ABS_TOL):
@@ -169,15 +301,25 @@ class Position:
         return azim
     
     def distance_from(self, p) -> float:
-        return distance_hubeny(self.longi, self.lati, p.longi, p.lati)
+        # Same as distance_hubeny(self.longi, self.lati, p.longi, p.lati)
+        diff_longi, diff_lati = diff_geopos(self._longi, self._lati, p._longi, p._lati)
+        sin_mean, cos_mean = self._mean_lati(p)
+        denom_carvature = 1 - ECCENTRICITY_SQUARED * sin_mean ** 2
+        sqrt_denom = math.sqrt(denom_carvature)
+        meridian_carvature = MAJOR_RADIUS_WGS84 * (1 - ECCENTRICITY_SQUARED) / (denom_carvature * sqrt_denom)
+        prime_carvature = MAJOR_RADIUS_WGS84 / sqrt_denom
+        return math.hypot(diff_lati * meridian_carvature, diff_longi * prime_carvature * cos_mean)
     
     @property
-    def longi(self):
-        return self._pos[0]
+    def longi(self) -> float:
+        return self._longi
     
     @property
-    def lati(self):
-        return self._pos[1]
+    def lati(self) -> float:
+        return self._lati
+    
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._longi!r}, {self._lati!r})"
     
     @staticmethod
     def to_radian(degree: Union[int, float, np.ndarray]):
@@ -186,3 +328,125 @@ class Position:
     @staticmethod
     def to_degree(radian: Union[int, float, np.ndarray]):
         return radian / math.pi * 180.
+
+
+class PositionArray:
+    """Batch of geographic positions with cached trigonometric terms.
+    
+    This is the vectorized counterpart of Position. Distances and 
+    azimuths between a Position and all positions of the array are 
+    calculated in one call.
+    
+    Examples
+    --------
+        >> waypoints = PositionArray(longis, latis, degree=True)
+        >> waypoints.distance_from(current)    # (n, )
+        >> waypoints.azimuth_from(current)     # (n, )
+        
+    See Also
+    --------
+        pisat.calc.Position : Single position.
+    """
+    
+    __slots__ = ("_longi", "_lati", "_sin_half", "_cos_half", "_cos_lati", "_prime")
+    
+    def __init__(self, longi, lati, degree: bool = False) -> None:
+        """
+        Parameters
+        ----------
+            longi : array_like
+                Longitudes.
+            lati : array_like
+                Latitudes.
+            degree : bool, optional
+                Whether the values are in degrees, by default False.
+
+        Raises
+        ------
+            ValueError
+                Raised if 'longi' and 'lati' are not 1-D arrays of the same length.
+        """
+        longi = np.array(longi, dtype=np.float64, ndmin=1)
+        lati = np.array(lati, dtype=np.float64, ndmin=1)
+        if longi.ndim != 1 or longi.shape != lati.shape:
+            raise ValueError(
+                "'longi' and 'lati' must be 1-D arrays of the same length."
+            )
+        if degree:
+            longi = Position.to_radian(longi)
+            lati = Position.to_radian(lati)
+            
+        self._longi = longi
+        self._lati = lati
+        self._sin_half = np.sin(lati / 2)
+        self._cos_half = np.cos(lati / 2)
+        self._cos_lati = np.cos(lati)
+        self._prime = MAJOR_RADIUS_WGS84 / np.sqrt(1 - ECCENTRICITY_SQUARED * np.sin(lati) ** 2)
+        
+        for array in (self._longi, self._lati):
+            array.flags.writeable = False
+            
+    @classmethod
+    def from_positions(cls, positions):
+        """Create an array from an iterable of Position."""
+        positions = list(positions)
+        return cls([p.longi for p in positions], [p.lati for p in positions])
+    
+    @property
+    def longi(self) -> np.ndarray:
+        return self._longi
+    
+    @property
+    def lati(self) -> np.ndarray:
+        return self._lati
+    
+    def __len__(self) -> int:
+        return len(self._longi)
+    
+    def __getitem__(self, index: int) -> Position:
+        return Position(self._longi[index], self._lati[index])
+    
+    def __iter__(self):
+        for longi, lati in zip(self._longi, self._lati):
+            yield Position(longi, lati)
+            
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(size={len(self)})"
+    
+    def _mean_lati(self, p: Position) -> Tuple[np.ndarray, np.ndarray]:
+        sin_mean = self._sin_half * p._cos_half + self._cos_half * p._sin_half
+        cos_mean = self._cos_half * p._cos_half - self._sin_half * p._sin_half
+        return sin_mean, cos_mean
+    
+    def _relative_coordinate(self, p: Position) -> Tuple[np.ndarray, np.ndarray]:
+        diff_longi, diff_lati = diff_geopos_array(self._longi, self._lati, p._longi, p._lati)
+        sin_mean, _ = self._mean_lati(p)
+        denom_carvature = 1 - ECCENTRICITY_SQUARED * sin_mean ** 2
+        meridian_carvature = MAJOR_RADIUS_WGS84 * (1 - ECCENTRICITY_SQUARED) / (denom_carvature * np.sqrt(denom_carvature))
+        return (diff_longi * (p._prime * p._cos_lati), diff_lati * meridian_carvature)
+    
+    def relative_coordinate_from(self, p: Position) -> Tuple[np.ndarray, np.ndarray]:
+        """East and north coordinates of the positions relative to 'p' in meters.
+        
+        These are the same as calc_relative_coordinate of each position and 'p'.
+        """
+        return self._relative_coordinate(p)
+    
+    def distance_from(self, p: Position) -> np.ndarray:
+        """Distances between the positions and 'p' as Position.distance_from."""
+        diff_longi, diff_lati = diff_geopos_array(self._longi, self._lati, p._longi, p._lati)
+        sin_mean, cos_mean = self._mean_lati(p)
+        denom_carvature = 1 - ECCENTRICITY_SQUARED * sin_mean ** 2
+        sqrt_denom = np.sqrt(denom_carvature)
+        meridian_carvature = MAJOR_RADIUS_WGS84 * (1 - ECCENTRICITY_SQUARED) / (denom_carvature * sqrt_denom)
+        prime_carvature = MAJOR_RADIUS_WGS84 / sqrt_denom
+        return np.hypot(diff_lati * meridian_carvature, diff_longi * prime_carvature * cos_mean)
+    
+    def azimuth_from(self, p: Position, degree: bool = False) -> np.ndarray:
+        """Azimuths of the positions seen from 'p' as Position.azimuth_from."""
+        delta_x, delta_y = self._relative_coordinate(p)
+        azim = np.mod(math.pi / 2 - np.arctan2(delta_y, delta_x), 2 * math.pi)
+        
+        if degree:
+            azim = Position.to_degree(azim)
+        return azim
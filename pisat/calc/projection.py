@@ -0,0 +1,208 @@
+#! python3
+
+"""
+
+pisat.calc.projection
+~~~~~~~~~~~~~~~~~~~~~
+Projection of geographic positions into a local east-north-up frame.
+Over an operating area of a few kilometers, positions can be projected
+once into the plane tangent to the WGS84 ellipsoid at a reference
+point such as the goal, and then distances and headings are plain 2D
+vector math instead of repeated calculations of curvatures.
+
+The projection is exact in the sense of the transformation through
+ECEF coordinates on the ellipsoid, and the error of a round trip of
+'forward' and 'inverse' is below 1e-8 m. At latitudes below 60 degrees,
+the error of 2D distances compared with distance_hubeny is
+
+- from the origin: below 1 mm within 2 km, below 1 cm within 10 km
+  and below 10 cm within 20 km of the origin.
+- between two positions within 10 km of the origin: below 5 cm,
+  or 2e-6 of the distance.
+
+The error grows with the cube of the distance from the origin.
+The north of the frame differs from the true north at a position by
+the convergence of meridians, about sin(latitude) * (difference of
+longitudes), for example 0.08 degrees at 10 km east of the origin
+at the latitude of 40 degrees.
+
+[info]
+pisat.calc.Position
+pisat.calc.Navigator
+"""
+
+import math
+from typing import Tuple
+
+import numpy as np
+
+from pisat.calc.position import (
+    Position, MAJOR_RADIUS_WGS84, ECCENTRICITY_SQUARED, MINOR_RADIUS_WGS84
+)
+
+
+class EnuProjection:
+    """Projection into the local east-north-up frame around an origin.
+
+    Coordinates are in meters; the east and north axes are tangent to
+    the ellipsoid at the origin and the up axis is its normal. Positions
+    are assumed to be on the ellipsoid, so the up coordinate is dropped
+    by 'forward' and determined from the ellipsoid by 'inverse'.
+
+    Examples
+    --------
+        >> projection = EnuProjection(goal)
+        >> east, north = projection.forward(current)
+        >> easts, norths = projection.forward_array(longis, latis)
+        >> projection.inverse(east, north)    # Position
+
+    See Also
+    --------
+        pisat.calc.Navigator : Navigator can use the projection.
+    """
+
+    # NOTE Second eccentricity squared used by Bowring's formula.
+    SECOND_ECCENTRICITY_SQUARED = (MAJOR_RADIUS_WGS84 / MINOR_RADIUS_WGS84) ** 2 - 1
+    COUNTS_ITERATION = 3
+
+    def __init__(self, origin: Position) -> None:
+        """
+        Parameters
+        ----------
+            origin : Position
+                Origin of the frame, for example the goal.
+
+        Raises
+        ------
+            TypeError
+                Raised if 'origin' is not Position.
+        """
+        if not isinstance(origin, Position):
+            raise TypeError(
+                "'origin' must be Position."
+            )
+
+        self._origin = origin
+        self._sin_origin = origin._sin_lati
+        self._cos_origin = origin._cos_lati
+
+        # NOTE
+        #   ECEF coordinates of the origin in the frame rotated by
+        #   the longitude of the origin, where its y coordinate is 0.
+        self._x_origin = origin._prime * origin._cos_lati
+        self._z_origin = origin._prime * (1 - ECCENTRICITY_SQUARED) * origin._sin_lati
+
+    @property
+    def origin(self) -> Position:
+        return self._origin
+
+    def _forward(self, sin_lati, cos_lati, prime, sin_longi, cos_longi):
+        # NOTE Arguments of longitudes are relative to the origin.
+        x = prime * cos_lati * cos_longi - self._x_origin
+        z = prime * (1 - ECCENTRICITY_SQUARED) * sin_lati - self._z_origin
+        east = prime * cos_lati * sin_longi
+        north = - self._sin_origin * x + self._cos_origin * z
+        return east, north
+
+    def forward(self, p: Position) -> Tuple[float, float]:
+        """Project a position.
+
+        Parameters
+        ----------
+            p : Position
+                Position to be projected.
+
+        Returns
+        -------
+            Tuple[float, float]
+                East and north coordinates in meters.
+        """
+        diff_longi = p._longi - self._origin._longi
+        return self._forward(p._sin_lati, p._cos_lati, p._prime, math.sin(diff_longi), math.cos(diff_longi))
+
+    def forward_array(self, longi, lati) -> Tuple[np.ndarray, np.ndarray]:
+        """Project positions given as arrays of radians.
+
+        Parameters
+        ----------
+            longi : array_like
+                Longitudes in radians.
+            lati : array_like
+                Latitudes in radians.
+
+        Returns
+        -------
+            Tuple[np.ndarray, np.ndarray]
+                East and north coordinates in meters.
+        """
+        lati = np.asarray(lati, dtype=np.float64)
+        diff_longi = np.subtract(longi, self._origin._longi, dtype=np.float64)
+        sin_lati = np.sin(lati)
+        prime = MAJOR_RADIUS_WGS84 / np.sqrt(1 - ECCENTRICITY_SQUARED * sin_lati ** 2)
+        return self._forward(sin_lati, np.cos(lati), prime, np.sin(diff_longi), np.cos(diff_longi))
+
+    def inverse_array(self, east, north) -> Tuple[np.ndarray, np.ndarray]:
+        """Transform coordinates of the frame into positions on the ellipsoid.
+
+        Parameters
+        ----------
+            east : array_like
+                East coordinates in meters.
+            north : array_like
+                North coordinates in meters.
+
+        Returns
+        -------
+            Tuple[np.ndarray, np.ndarray]
+                Longitudes and latitudes in radians.
+        """
+        east = np.asarray(east, dtype=np.float64)
+        north = np.asarray(north, dtype=np.float64)
+        sin_origin, cos_origin = self._sin_origin, self._cos_origin
+
+        # NOTE
+        #   The up coordinate is unknown, so it is corrected iteratively
+        #   by the height of the point above the ellipsoid, starting from
+        #   the drop of the sphere with the radius of the prime vertical.
+        up = - (east ** 2 + north ** 2) / (2 * self._origin._prime)
+        for _ in range(self.COUNTS_ITERATION):
+            x = self._x_origin - sin_origin * north + cos_origin * up
+            z = self._z_origin + cos_origin * north + sin_origin * up
+            longi, lati, height = self._to_geodetic(x, east, z)
+            up = up - height
+
+        longi = np.mod(longi + self._origin._longi + math.pi, 2 * math.pi) - math.pi
+        return longi, lati
+
+    def inverse(self, east: float, north: float) -> Position:
+        """Transform coordinates of the frame into a position on the ellipsoid.
+
+        Parameters
+        ----------
+            east : float
+                East coordinate in meters.
+            north : float
+                North coordinate in meters.
+
+        Returns
+        -------
+            Position
+                Position on the ellipsoid.
+        """
+        longi, lati = self.inverse_array(east, north)
+        return Position(float(longi), float(lati))
+
+    @classmethod
+    def _to_geodetic(cls, x, y, z):
+        # NOTE Bowring's formula, which is accurate enough near the ellipsoid.
+        p = np.hypot(x, y)
+        theta = np.arctan2(z * MAJOR_RADIUS_WGS84, p * MINOR_RADIUS_WGS84)
+        lati = np.arctan2(z + cls.SECOND_ECCENTRICITY_SQUARED * MINOR_RADIUS_WGS84 * np.sin(theta) ** 3,
+                          p - ECCENTRICITY_SQUARED * MAJOR_RADIUS_WGS84 * np.cos(theta) ** 3)
+        sin_lati = np.sin(lati)
+        prime = MAJOR_RADIUS_WGS84 / np.sqrt(1 - ECCENTRICITY_SQUARED * sin_lati ** 2)
+        height = p * np.cos(lati) + z * sin_lati - prime * (1 - ECCENTRICITY_SQUARED * sin_lati ** 2)
+        return np.arctan2(y, x), lati, height
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._origin!r})"
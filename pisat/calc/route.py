@@ -0,0 +1,279 @@
+#! python3
+
+"""
+
+pisat.calc.route
+~~~~~~~~~~~~~~~~
+Navigation along a route of multiple waypoints.
+RouteNavigator projects waypoints into a local east-north frame once
+and precomputes vectors and lengths of legs between them, so each
+GPS fix is processed in O(1) without scanning all waypoints: the
+cross-track error from the current leg, the switch to the next
+waypoint and the distance remaining along the route.
+
+[info]
+pisat.calc.Navigator
+pisat.calc.EnuProjection
+pisat.actuator.TwoWheels
+"""
+
+import math
+from typing import Iterable, List, Optional, Tuple, Union
+
+from pisat.base.component import Component
+from pisat.calc.position import Position, PositionArray
+from pisat.calc.projection import EnuProjection
+
+
+class RouteNavigator(Component):
+    """Navigator along a route of waypoints.
+
+    The first waypoint is the start of the route and the rover heads
+    for the second waypoint first. A waypoint is regarded as reached
+    when the rover is within 'radius' of it or has passed the line
+    perpendicular to the leg at the waypoint, and the navigator
+    switches to the next leg.
+
+    Examples
+    --------
+        >> class Running(Node):
+        >>
+        >>     def enter(self):
+        >>         self.route = RouteNavigator(waypoints, radius=3.)
+        >>         self.wheels = self.manager.get_component("wheels")
+        >>         self.gps = self.manager.get_component("gps")
+        >>
+        >>     def control(self):
+        >>         while not self.route.finished:
+        >>             model = self.gps.read()
+        >>             self.route.update(Position(model.longitude, model.latitude, degree=True))
+        >>             error = self.route.heading_error(heading)
+        >>             if error > 0:
+        >>                 self.wheels.curve_cw(min(100., abs(error) * GAIN), base=SPEED)
+        >>             else:
+        >>                 self.wheels.curve_ccw(min(100., abs(error) * GAIN), base=SPEED)
+        >>         self.wheels.brake()
+
+    See Also
+    --------
+        pisat.calc.Navigator : Navigator for a single goal.
+        pisat.actuator.TwoWheels : Driver of two wheels.
+    """
+
+    RADIUS_DEFAULT = 3.
+
+    def __init__(self,
+                 waypoints: Union[Iterable[Position], PositionArray],
+                 radius: float = RADIUS_DEFAULT,
+                 projection: Optional[EnuProjection] = None,
+                 name: Optional[str] = None) -> None:
+        """
+        Parameters
+        ----------
+            waypoints : Union[Iterable[Position], PositionArray]
+                Waypoints of the route including the start.
+            radius : float, optional
+                Radius of arrival at waypoints in meters, by default 3.
+            projection : Optional[EnuProjection], optional
+                Projection of waypoints and positions, by default None.
+                If None, the projection whose origin is the last waypoint is used.
+            name : Optional[str], optional
+                Name of the component, by default None.
+
+        Raises
+        ------
+            ValueError
+                Raised if the number of waypoints is less than 2, or 'radius' is negative.
+        """
+        super().__init__(name=name)
+
+        if not isinstance(waypoints, PositionArray):
+            waypoints = PositionArray.from_positions(waypoints)
+        if len(waypoints) < 2:
+            raise ValueError(
+                "The number of 'waypoints' must be no less than 2."
+            )
+        if radius < 0:
+            raise ValueError(
+                "'radius' must be no less than 0."
+            )
+        if projection is None:
+            projection = EnuProjection(waypoints[-1])
+
+        self._waypoints: PositionArray = waypoints
+        self._radius: float = radius
+        self._projection: EnuProjection = projection
+
+        # NOTE
+        #   Legs are kept as lists of floats because indexing of them
+        #   is faster than that of NumPy arrays for scalar operations.
+        east, north = projection.forward_array(waypoints.longi, waypoints.lati)
+        self._east: List[float] = east.tolist()
+        self._north: List[float] = north.tolist()
+        self._lengths: List[float] = []
+        self._units: List[Tuple[float, float]] = []
+        for i in range(len(waypoints) - 1):
+            diff_east = self._east[i + 1] - self._east[i]
+            diff_north = self._north[i + 1] - self._north[i]
+            length = math.hypot(diff_east, diff_north)
+            self._lengths.append(length)
+            if length > 0:
+                self._units.append((diff_east / length, diff_north / length))
+            else:
+                self._units.append((0., 0.))
+
+        # NOTE lengths of the route after each waypoint
+        self._remainings: List[float] = [0.] * len(waypoints)
+        for i in reversed(range(len(waypoints) - 1)):
+            self._remainings[i] = self._remainings[i + 1] + self._lengths[i]
+
+        self.reset()
+
+    def reset(self) -> None:
+        """Restart the route from the first leg."""
+        self._index: int = 1
+        self._finished: bool = False
+        self._east_current: Optional[float] = None
+        self._north_current: Optional[float] = None
+        self._along_track: float = 0.
+        self._cross_track: float = 0.
+        self._distance_waypoint: float = self._lengths[0]
+
+    @property
+    def waypoints(self) -> PositionArray:
+        return self._waypoints
+
+    @property
+    def radius(self) -> float:
+        return self._radius
+
+    @property
+    def projection(self) -> EnuProjection:
+        return self._projection
+
+    @property
+    def index(self) -> int:
+        """Index of the waypoint the rover heads for."""
+        return self._index
+
+    @property
+    def next_waypoint(self) -> Position:
+        return self._waypoints[self._index]
+
+    @property
+    def finished(self) -> bool:
+        """Whether the last waypoint has been reached."""
+        return self._finished
+
+    @property
+    def cross_track(self) -> float:
+        """Distance from the current leg in meters, positive on the right side of it."""
+        return self._cross_track
+
+    @property
+    def along_track(self) -> float:
+        """Distance along the current leg from its start in meters."""
+        return self._along_track
+
+    @property
+    def distance_waypoint(self) -> float:
+        """Distance to the next waypoint in meters."""
+        return self._distance_waypoint
+
+    @property
+    def distance_remaining(self) -> float:
+        """Distance to the last waypoint through remaining waypoints in meters."""
+        if self._finished:
+            return 0.
+        return self._distance_waypoint + self._remainings[self._index]
+
+    def update(self, p: Position) -> bool:
+        """Update the progress with a position.
+
+        Parameters
+        ----------
+            p : Position
+                Current position.
+
+        Returns
+        -------
+            bool
+                Whether the navigator has switched to the next waypoint.
+        """
+        east, north = self._projection.forward(p)
+        self._east_current, self._north_current = east, north
+        if self._finished:
+            return False
+
+        switched = False
+        while True:
+            self._update_leg(east, north)
+            if self._distance_waypoint > self._radius and self._along_track < self._lengths[self._index - 1]:
+                break
+
+            switched = True
+            if self._index == len(self._lengths):
+                self._finished = True
+                break
+            self._index += 1
+
+        return switched
+
+    def _update_leg(self, east: float, north: float) -> None:
+        start = self._index - 1
+        diff_east = east - self._east[start]
+        diff_north = north - self._north[start]
+        unit_east, unit_north = self._units[start]
+        self._along_track = diff_east * unit_east + diff_north * unit_north
+        self._cross_track = diff_east * unit_north - diff_north * unit_east
+        self._distance_waypoint = math.hypot(self._east[self._index] - east, self._north[self._index] - north)
+
+    def azimuth(self, degree: bool = False) -> float:
+        """Azimuth of the next waypoint from the last position given by 'update'.
+
+        The azimuth is measured clockwise from the north in [0, 2pi).
+
+        Raises
+        ------
+            ValueError
+                Raised if 'update' has not been called.
+        """
+        if self._east_current is None:
+            raise ValueError(
+                "'update' must be called before."
+            )
+
+        azim = math.atan2(self._east[self._index] - self._east_current,
+                          self._north[self._index] - self._north_current)
+        if azim < 0:
+            azim += 2 * math.pi
+
+        if degree:
+            azim = Position.to_degree(azim)
+        return azim
+
+    def heading_error(self, heading: float, degree: bool = False) -> float:
+        """Angle to turn from the heading to the next waypoint.
+
+        Parameters
+        ----------
+            heading : float
+                Heading of the rover clockwise from the north.
+            degree : bool, optional
+                Whether 'heading' and the result are in degrees, by default False.
+
+        Returns
+        -------
+            float
+                Angle in (-pi, pi], positive if the rover should turn clockwise.
+        """
+        if degree:
+            heading = Position.to_radian(heading)
+
+        error = math.remainder(self.azimuth() - heading, 2 * math.pi)
+        if error == - math.pi:
+            error = math.pi
+
+        if degree:
+            error = Position.to_degree(error)
+        return error
@@ -0,0 +1,509 @@
+#! python3
+
+"""
+
+pisat.calc.stream_filter
+~~~~~~~~~~~~~~~~~~~~~~~~
+Streaming filters updated sample by sample.
+Filters in this module hold only the state required for the next
+sample, and update it in O(1) or O(log n) per sample instead of
+iterating over a history every cycle. So judges of nodes, such as
+detection of descent, landing or apogee, can use moving averages,
+medians or derivatives of data at a high rate.
+
+A filter can be updated by hand, or be attached to a channel of
+DataLogger, for example 'bme280-press', to be updated every time
+the logger reads sensors.
+
+[info]
+pisat.core.logger.DataLogger
+"""
+
+from collections import deque
+import heapq
+import math
+import time
+from typing import Deque, Dict, List, Optional, Tuple, Union
+
+
+Number = Union[int, float]
+
+
+class StreamFilter:
+    """Base class of streaming filters.
+
+    Subclasses must override '_update' and 'value', and 'reset'
+    if they have their own state.
+    """
+
+    def __init__(self) -> None:
+        self._counts: int = 0
+
+    @property
+    def counts(self) -> int:
+        """Number of samples given since the filter was reset."""
+        return self._counts
+
+    @property
+    def ready(self) -> bool:
+        """Whether the value of the filter is available."""
+        return self._counts > 0
+
+    @property
+    def value(self):
+        """Output of the filter, or None if no sample is given."""
+        raise NotImplementedError
+
+    def update(self, x: Number, timestamp: Optional[float] = None):
+        """Update the filter with a new sample.
+
+        Parameters
+        ----------
+            x : Number
+                New sample.
+            timestamp : Optional[float], optional
+                Time of the sample in seconds, by default None.
+                Only filters depending on time use it.
+
+        Returns
+        -------
+            Output of the filter.
+        """
+        self._update(x, timestamp)
+        self._counts += 1
+        return self.value
+
+    def _update(self, x: Number, timestamp: Optional[float]) -> None:
+        raise NotImplementedError
+
+    def reset(self) -> None:
+        """Discard all samples given.
+        """
+        self._counts = 0
+
+    def __call__(self, x: Number, timestamp: Optional[float] = None):
+        return self.update(x, timestamp)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(value={self.value}, counts={self._counts})"
+
+
+class WindowFilter(StreamFilter):
+    """Base class of streaming filters over a fixed number of samples."""
+
+    def __init__(self, size: int) -> None:
+        """
+        Parameters
+        ----------
+            size : int
+                Number of samples in the window.
+
+        Raises
+        ------
+            ValueError
+                Raised if 'size' is not positive.
+        """
+        if size <= 0:
+            raise ValueError(
+                "'size' must be larger than 0."
+            )
+        super().__init__()
+        self._size: int = size
+        self._window: Deque[Number] = deque()
+
+    @property
+    def size(self):
+        return self._size
+
+    @property
+    def full(self) -> bool:
+        return len(self._window) >= self._size
+
+    def _update(self, x: Number, timestamp: Optional[float]) -> None:
+        if self.full:
+            self._remove(self._window.popleft())
+        self._window.append(x)
+        self._add(x)
+
+    def _add(self, x: Number) -> None:
+        raise NotImplementedError
+
+    def _remove(self, x: Number) -> None:
+        raise NotImplementedError
+
+    def reset(self) -> None:
+        super().reset()
+        self._window.clear()
+
+
+class EMA(StreamFilter):
+    """Exponential moving average.
+
+    The first sample initializes the average, and then
+    y = y + alpha * (x - y) for each sample.
+    """
+
+    def __init__(self, alpha: float) -> None:
+        """
+        Parameters
+        ----------
+            alpha : float
+                Smoothing factor in (0, 1]. Larger one follows samples faster.
+
+        Raises
+        ------
+            ValueError
+                Raised if 'alpha' is not in (0, 1].
+        """
+        if not 0 < alpha <= 1:
+            raise ValueError(
+                "'alpha' must be in (0, 1]."
+            )
+        super().__init__()
+        self._alpha: float = alpha
+        self._value: Optional[float] = None
+
+    @classmethod
+    def from_span(cls, span: Number) -> "EMA":
+        """Create a filter equivalent to a moving average of 'span' samples."""
+        return cls(2 / (span + 1))
+
+    @property
+    def alpha(self):
+        return self._alpha
+
+    @property
+    def value(self) -> Optional[float]:
+        return self._value
+
+    def _update(self, x: Number, timestamp: Optional[float]) -> None:
+        if self._value is None:
+            self._value = x
+        else:
+            self._value += self._alpha * (x - self._value)
+
+    def reset(self) -> None:
+        super().reset()
+        self._value = None
+
+
+class MovingStats(WindowFilter):
+    """Mean and variance over a fixed window with Welford's algorithm.
+
+    The value of the filter is the mean. The variance is the
+    population one over samples in the window.
+    """
+
+    def __init__(self, size: int) -> None:
+        super().__init__(size)
+        self._mean: float = 0.
+        self._m2: float = 0.
+
+    @property
+    def value(self) -> Optional[float]:
+        return self.mean
+
+    @property
+    def mean(self) -> Optional[float]:
+        if not len(self._window):
+            return None
+        return self._mean
+
+    @property
+    def variance(self) -> Optional[float]:
+        if not len(self._window):
+            return None
+        # NOTE M2 can be slightly negative because of rounding errors.
+        return max(self._m2, 0.) / len(self._window)
+
+    @property
+    def std(self) -> Optional[float]:
+        variance = self.variance
+        if variance is None:
+            return None
+        return math.sqrt(variance)
+
+    def _update(self, x: Number, timestamp: Optional[float]) -> None:
+        if not self.full:
+            self._window.append(x)
+            self._add(x)
+            return
+
+        # NOTE
+        #   Replacing the oldest sample with the new one at once is
+        #   more stable than removing it and adding the new one.
+        old = self._window.popleft()
+        self._window.append(x)
+        mean_old = self._mean
+        self._mean += (x - old) / self._size
+        self._m2 += (x - old) * (x - self._mean + old - mean_old)
+
+    def _add(self, x: Number) -> None:
+        delta = x - self._mean
+        self._mean += delta / len(self._window)
+        self._m2 += delta * (x - self._mean)
+
+    def reset(self) -> None:
+        super().reset()
+        self._mean = 0.
+        self._m2 = 0.
+
+
+class RunningMax(WindowFilter):
+    """Maximum over a fixed window with a monotonic deque."""
+
+    def __init__(self, size: int) -> None:
+        super().__init__(size)
+        self._candidates: Deque[Tuple[int, Number]] = deque()
+
+    @property
+    def value(self) -> Optional[Number]:
+        if not len(self._candidates):
+            return None
+        return self._candidates[0][1]
+
+    def _dominates(self, x: Number, y: Number) -> bool:
+        return x >= y
+
+    def _update(self, x: Number, timestamp: Optional[float]) -> None:
+        # NOTE
+        #   Candidates are pairs of the index and the value, and samples
+        #   dominated by a newer one never become the extremum.
+        candidates = self._candidates
+        while len(candidates) and self._dominates(x, candidates[-1][1]):
+            candidates.pop()
+        candidates.append((self._counts, x))
+        if candidates[0][0] <= self._counts - self._size:
+            candidates.popleft()
+
+    def reset(self) -> None:
+        super().reset()
+        self._candidates.clear()
+
+
+class RunningMin(RunningMax):
+    """Minimum over a fixed window with a monotonic deque."""
+
+    def _dominates(self, x: Number, y: Number) -> bool:
+        return x <= y
+
+
+class RollingMedian(WindowFilter):
+    """Median over a fixed window with two heaps.
+
+    The lower half of the window is held in a max heap and the upper
+    half in a min heap. Samples leaving the window are removed lazily
+    when they come to the top of a heap. Samples must not be NaN.
+    """
+
+    def __init__(self, size: int) -> None:
+        super().__init__(size)
+        self._low: List[Number] = []
+        self._high: List[Number] = []
+        self._counts_low: int = 0
+        self._counts_high: int = 0
+        self._delayed: Dict[Number, int] = {}
+
+    @property
+    def value(self) -> Optional[float]:
+        if not len(self._window):
+            return None
+        if self._counts_low > self._counts_high:
+            return -self._low[0]
+        return (-self._low[0] + self._high[0]) / 2
+
+    def _prune(self, heap: List[Number], sign: int) -> None:
+        while len(heap):
+            x = heap[0] * sign
+            counts = self._delayed.get(x)
+            if not counts:
+                break
+            if counts == 1:
+                del self._delayed[x]
+            else:
+                self._delayed[x] = counts - 1
+            heapq.heappop(heap)
+
+    def _balance(self) -> None:
+        if self._counts_low > self._counts_high + 1:
+            heapq.heappush(self._high, -heapq.heappop(self._low))
+            self._counts_low -= 1
+            self._counts_high += 1
+            self._prune(self._low, -1)
+        elif self._counts_low < self._counts_high:
+            heapq.heappush(self._low, -heapq.heappop(self._high))
+            self._counts_low += 1
+            self._counts_high -= 1
+            self._prune(self._high, 1)
+
+    def _add(self, x: Number) -> None:
+        if not len(self._low) or x <= -self._low[0]:
+            heapq.heappush(self._low, -x)
+            self._counts_low += 1
+        else:
+            heapq.heappush(self._high, x)
+            self._counts_high += 1
+        self._balance()
+
+    def _remove(self, x: Number) -> None:
+        self._delayed[x] = self._delayed.get(x, 0) + 1
+        if x <= -self._low[0]:
+            self._counts_low -= 1
+            if x == -self._low[0]:
+                self._prune(self._low, -1)
+        else:
+            self._counts_high -= 1
+            if x == self._high[0]:
+                self._prune(self._high, 1)
+        self._balance()
+
+    def reset(self) -> None:
+        super().reset()
+        self._low.clear()
+        self._high.clear()
+        self._counts_low = 0
+        self._counts_high = 0
+        self._delayed.clear()
+
+
+class Derivative(StreamFilter):
+    """Finite-difference derivative with respect to time.
+
+    The derivative is the backward difference between the newest sample
+    and the one 'span' samples before it, divided by the difference of
+    their timestamps. A larger span is less sensitive to noise.
+    """
+
+    def __init__(self, span: int = 1) -> None:
+        """
+        Parameters
+        ----------
+            span : int, optional
+                Number of samples between the two samples differentiated,
+                by default 1.
+
+        Raises
+        ------
+            ValueError
+                Raised if 'span' is not positive.
+        """
+        if span <= 0:
+            raise ValueError(
+                "'span' must be larger than 0."
+            )
+        super().__init__()
+        self._span: int = span
+        self._samples: Deque[Tuple[float, Number]] = deque(maxlen=span + 1)
+
+    @property
+    def span(self):
+        return self._span
+
+    @property
+    def ready(self) -> bool:
+        return len(self._samples) > self._span
+
+    @property
+    def value(self) -> Optional[float]:
+        if not self.ready:
+            return None
+        time_old, x_old = self._samples[0]
+        time_new, x_new = self._samples[-1]
+        if time_new == time_old:
+            return None
+        return (x_new - x_old) / (time_new - time_old)
+
+    def _update(self, x: Number, timestamp: Optional[float]) -> None:
+        if timestamp is None:
+            timestamp = time.monotonic()
+        self._samples.append((timestamp, x))
+
+    def reset(self) -> None:
+        super().reset()
+        self._samples.clear()
+
+
+class Debounce(StreamFilter):
+    """Binary state with a threshold, hysteresis and debouncing.
+
+    The state becomes active after samples beyond the threshold continue
+    'counts' times, and becomes inactive after samples behind the threshold
+    shifted by the hysteresis continue 'counts' times. So noise around the
+    threshold doesn't toggle the state.
+    """
+
+    def __init__(self,
+                 threshold: Number,
+                 counts: int = 1,
+                 hysteresis: Number = 0,
+                 above: bool = True,
+                 initial: bool = False) -> None:
+        """
+        Parameters
+        ----------
+            threshold : Number
+                Threshold to be active.
+            counts : int, optional
+                Number of successive samples to change the state, by default 1.
+            hysteresis : Number, optional
+                Margin to be inactive, by default 0.
+            above : bool, optional
+                If True, samples larger than the threshold make the state
+                active, otherwise smaller ones do, by default True.
+            initial : bool, optional
+                Initial state, by default False.
+
+        Raises
+        ------
+            ValueError
+                Raised if 'counts' is not positive or 'hysteresis' is negative.
+        """
+        if counts <= 0:
+            raise ValueError(
+                "'counts' must be larger than 0."
+            )
+        if hysteresis < 0:
+            raise ValueError(
+                "'hysteresis' must be no less than 0."
+            )
+        super().__init__()
+        self._threshold: Number = threshold
+        self._counts_required: int = counts
+        self._hysteresis: Number = hysteresis
+        self._above: bool = above
+        self._initial: bool = initial
+        self._state: bool = initial
+        self._streak: int = 0
+
+    @property
+    def threshold(self):
+        return self._threshold
+
+    @property
+    def state(self) -> bool:
+        return self._state
+
+    @property
+    def value(self) -> bool:
+        return self._state
+
+    def _update(self, x: Number, timestamp: Optional[float]) -> None:
+        sign = 1 if self._above else -1
+        if self._state:
+            crossed = sign * (x - self._threshold) < -self._hysteresis
+        else:
+            crossed = sign * (x - self._threshold) > 0
+
+        # NOTE The streak is reset by a sample which doesn't cross.
+        if crossed:
+            self._streak += 1
+            if self._streak >= self._counts_required:
+                self._state = not self._state
+                self._streak = 0
+        else:
+            self._streak = 0
+
+    def reset(self) -> None:
+        super().reset()
+        self._state = self._initial
+        self._streak = 0
@@ -1,4 +1,6 @@
 from pisat.core.logger.logque import LogQueue
 from pisat.core.logger.refque import RefQueue
+from pisat.core.logger.sample_window import SampleWindow
 from pisat.core.logger.datalogger import DataLogger
-from pisat.core.logger.systemlogger import SystemLogger
\ No newline at end of file
+from pisat.core.logger.systemlogger import SystemLogger
+from pisat.core.logger.capture_logger import CaptureLogger, CaptureReader
\ No newline at end of file
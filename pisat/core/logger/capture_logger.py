@@ -0,0 +1,391 @@
+#! python3
+
+"""
+
+pisat.core.logger.capture_logger
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+Raw capture of sensors into a binary file and its offline decoder.
+CaptureLogger reads raw frames of sensors with 'read_raw' and writes
+them into a binary file with timestamps without decoding, so logging
+at the highest rate costs only reads of registers and copies of bytes.
+CaptureReader parses the file on the ground and decodes frames into
+NumPy arrays per sensor with the decoder registered with the ID of
+the sensor class and the context dumped by the sensor, for example
+calibration parameters of Bme280 or units of Bno055.
+
+A capture file begins with the header, MAGIC, the version and
+the reference of time, and records follow it. Each record has
+a header of the kind, the index of the sensor, the length of
+the payload and the timestamp given by time.monotonic_ns(), and
+the payload of the length. A record of KIND_SENSOR declares the
+decoder ID, the name and the context of a sensor, and records of
+KIND_FRAME have raw frames of the sensor.
+
+[info]
+pisat.sensor.SensorBase
+pisat.core.logger.DataLogger
+"""
+
+import struct
+import time
+from typing import BinaryIO, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from pisat.base.component_group import ComponentGroup
+from pisat.sensor.sensor_base import SensorBase
+from pisat.util.about_time import get_time_stamp
+
+
+class CaptureLogger(ComponentGroup):
+    """Logger writing raw frames of sensors into a binary file.
+
+    Examples
+    --------
+        >> with CaptureLogger(bme280, bno055, path="flight.cap") as logger:
+        >>     while flying:
+        >>         logger.read()
+        >>
+        >> # on the ground
+        >> data = CaptureReader("flight.cap").load()
+        >> data["bme280"]["press"]
+
+    See Also
+    --------
+        pisat.core.logger.CaptureReader : Decoder of capture files.
+        pisat.sensor.SensorBase : Sensors supporting raw capture.
+    """
+
+    MAGIC = b"PISATCAP"
+    VERSION = 1
+
+    # NOTE
+    #   The header of a file is the version and the reference of time,
+    #   which is a pair of time.time_ns() and time.monotonic_ns() at once.
+    FORMAT_HEADER_FILE = "<Bqq"
+    FORMAT_HEADER_RECORD = "<BBHq"
+
+    KIND_SENSOR = 0
+    KIND_FRAME = 1
+
+    SEPARATOR = b"\0"
+    FILE_EXTENSION_DEFAULT = "cap"
+    SIZE_BUFFER_DEFAULT = 1 << 16
+    MAX_SENSORS = 0x100
+
+    def __init__(self,
+                 *sensors: SensorBase,
+                 path: Optional[str] = None,
+                 buffering: int = SIZE_BUFFER_DEFAULT,
+                 name: Optional[str] = None) -> None:
+        """
+        Parameters
+        ----------
+            sensors : Tuple[SensorBase, ...]
+                Sensors supporting raw capture.
+            path : Optional[str], optional
+                Capture file to be generated, by default None.
+                If None, the name is generated with the time stamp.
+            buffering : int, optional
+                Size of the buffer of the file in bytes, by default 65536.
+            name : Optional[str], optional
+                Name of the component, by default None.
+        """
+        super().__init__(name=name)
+
+        if path is None:
+            path = get_time_stamp(self.__class__.__name__, self.FILE_EXTENSION_DEFAULT)
+
+        self._path: str = path
+        self._sensors: List[SensorBase] = []
+        self._indices: Dict[SensorBase, int] = {}
+        self._items: List[Tuple[int, SensorBase]] = []
+        self._counts_declaration: int = 0
+
+        self._header_record: struct.Struct = struct.Struct(self.FORMAT_HEADER_RECORD)
+        self._file: BinaryIO = open(path, "wb", buffering=buffering)
+        self._file.write(self.MAGIC)
+        self._file.write(struct.pack(self.FORMAT_HEADER_FILE, self.VERSION, time.time_ns(), time.monotonic_ns()))
+
+        try:
+            self.append(*sensors)
+        except Exception:
+            self._file.close()
+            raise
+
+    @property
+    def path(self):
+        return self._path
+
+    @property
+    def closed(self) -> bool:
+        return self._file.closed
+
+    def append(self, *sensors: SensorBase) -> None:
+        """Append sensors and declare them in the file.
+
+        Parameters
+        ----------
+            sensors : Tuple[SensorBase, ...]
+                Sensors supporting raw capture.
+
+        Raises
+        ------
+            TypeError
+                Raised if a sensor is not SensorBase.
+            ValueError
+                Raised if a sensor doesn't support raw capture.
+        """
+        for sensor in sensors:
+            if not isinstance(sensor, SensorBase):
+                raise TypeError(
+                    "Components of 'sensors' must be SensorBase."
+                )
+            if sensor.ID_DECODER is None:
+                raise ValueError(
+                    f"{sensor.__class__.__name__} doesn't support raw capture."
+                )
+
+        super().append(*sensors)
+        for sensor in sensors:
+            self._sensors.append(sensor)
+            self.update_context(sensor)
+
+    def update_context(self, sensor: SensorBase) -> None:
+        """Declare the sensor again with its current context.
+
+        This method should be called when settings of the sensor which
+        affect decoding are changed, for example units of Bno055.
+        Frames written after this method are decoded with the new context.
+
+        Parameters
+        ----------
+            sensor : SensorBase
+                Sensor appended to the logger.
+
+        Raises
+        ------
+            ValueError
+                Raised if the sensor has not been appended, or if the number
+                of declarations exceeds MAX_SENSORS.
+        """
+        if sensor not in self._sensors:
+            raise ValueError(
+                "The sensor has not been appended to the logger."
+            )
+        if self._counts_declaration >= self.MAX_SENSORS:
+            raise ValueError(
+                f"The number of declarations of sensors must be no more than {self.MAX_SENSORS}."
+            )
+
+        # NOTE
+        #   A sensor declared again is given a new index,
+        #   so frames with the old index keep the old context.
+        index = self._counts_declaration
+        self._counts_declaration += 1
+        self._indices[sensor] = index
+        self._items = [(self._indices[s], s) for s in self._sensors]
+
+        payload = self.SEPARATOR.join((sensor.ID_DECODER.encode(),
+                                       sensor.name.encode(),
+                                       sensor.dump_context()))
+        self._write_record(self.KIND_SENSOR, index, payload)
+
+    def _write_record(self, kind: int, index: int, payload: bytes) -> None:
+        self._file.write(self._header_record.pack(kind, index, len(payload), time.monotonic_ns()))
+        self._file.write(payload)
+
+    def read(self) -> None:
+        """Read raw frames of all sensors and write them.
+        """
+        for index, sensor in self._items:
+            self._write_record(self.KIND_FRAME, index, sensor.read_raw())
+
+    def flush(self) -> None:
+        self._file.flush()
+
+    def close(self) -> None:
+        """Write buffered records and close the file.
+        """
+        if not self._file.closed:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        self.close()
+
+
+class CaptureReader:
+    """Offline decoder of capture files written by CaptureLogger.
+
+    Frames are decoded by the class registered with the decoder ID of
+    each sensor, so drivers are not needed to be connected to hardware.
+    If a file is truncated, for example by power loss, records before
+    the broken one are read.
+
+    Examples
+    --------
+        >> reader = CaptureReader("flight.cap")
+        >> reader.names
+        ['bme280', 'bno055']
+        >> data = reader.load()
+        >> data["bno055"]["acc"]          # (n, 3)
+        >> data["bno055"]["timestamp"]    # (n, ), seconds since the epoch
+
+    See Also
+    --------
+        pisat.core.logger.CaptureLogger : Writer of capture files.
+    """
+
+    KEY_TIMESTAMP = "timestamp"
+
+    def __init__(self, path: str) -> None:
+        """
+        Parameters
+        ----------
+            path : str
+                Capture file to be read.
+
+        Raises
+        ------
+            ValueError
+                Raised if the file is not a capture file, or its version
+                is not supported.
+        """
+        with open(path, "rb") as f:
+            self._data: bytes = f.read()
+
+        self._path: str = path
+        self._declarations: Dict[int, Tuple[str, str, bytes]] = {}
+        self._offsets: Dict[int, List[int]] = {}
+        self._lengths: Dict[int, int] = {}
+        self._timestamps: Dict[int, List[int]] = {}
+        self._parse()
+
+    def _parse(self) -> None:
+        data = self._data
+        magic = CaptureLogger.MAGIC
+        if data[:len(magic)] != magic:
+            raise ValueError(
+                "The file is not a capture file."
+            )
+
+        header_file = struct.Struct(CaptureLogger.FORMAT_HEADER_FILE)
+        header_record = struct.Struct(CaptureLogger.FORMAT_HEADER_RECORD)
+
+        cursor = len(magic)
+        version, self._time_ref, self._monotonic_ref = header_file.unpack_from(data, cursor)
+        if version != CaptureLogger.VERSION:
+            raise ValueError(
+                f"The version {version} of the file is not supported."
+            )
+        cursor += header_file.size
+
+        while cursor + header_record.size <= len(data):
+            kind, index, length, timestamp = header_record.unpack_from(data, cursor)
+            head = cursor + header_record.size
+            if head + length > len(data):
+                break
+            cursor = head + length
+
+            if kind == CaptureLogger.KIND_SENSOR:
+                id_decoder, name, context = data[head:cursor].split(CaptureLogger.SEPARATOR, 2)
+                self._declarations[index] = (id_decoder.decode(), name.decode(), context)
+                self._offsets[index] = []
+                self._timestamps[index] = []
+            elif kind == CaptureLogger.KIND_FRAME:
+                if index not in self._declarations:
+                    continue
+                if self._lengths.setdefault(index, length) != length:
+                    raise ValueError(
+                        f"Lengths of frames of the sensor '{self._declarations[index][1]}' are not the same."
+                    )
+                self._offsets[index].append(head)
+                self._timestamps[index].append(timestamp)
+
+    @property
+    def path(self):
+        return self._path
+
+    @property
+    def names(self) -> List[str]:
+        """Names of sensors in the order of declarations."""
+        return list(dict.fromkeys(name for _, name, _ in self._declarations.values()))
+
+    def counts(self, name: str) -> int:
+        """Number of frames of the sensor."""
+        return sum(len(self._offsets[index]) for index in self._indices(name))
+
+    def _indices(self, name: str) -> List[int]:
+        indices = [index for index, (_, n, _) in self._declarations.items() if n == name]
+        if not len(indices):
+            raise ValueError(
+                f"The sensor '{name}' is not in the file."
+            )
+        return indices
+
+    def _to_time(self, timestamps: List[int]) -> np.ndarray:
+        # NOTE Monotonic timestamps are converted into seconds since the epoch.
+        timestamps = np.asarray(timestamps, dtype=np.int64) - self._monotonic_ref + self._time_ref
+        return timestamps * 1e-9
+
+    def _read_frames(self, index: int) -> np.ndarray:
+        offsets = np.asarray(self._offsets[index], dtype=np.int64)
+        length = self._lengths.get(index, 0)
+        buffer = np.frombuffer(self._data, dtype=np.uint8)
+        return buffer[offsets[:, np.newaxis] + np.arange(length)]
+
+    def read_raw(self, name: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Read raw frames of the sensor.
+
+        Parameters
+        ----------
+            name : str
+                Name of the sensor.
+
+        Returns
+        -------
+            Tuple[np.ndarray, np.ndarray]
+                Frames as uint8 of the shape (n, length of a frame) and
+                their timestamps in seconds since the epoch.
+        """
+        indices = self._indices(name)
+        frames = np.concatenate([self._read_frames(index) for index in indices])
+        timestamps = self._to_time([t for index in indices for t in self._timestamps[index]])
+        return frames, timestamps
+
+    def decode(self, name: str) -> Dict[str, np.ndarray]:
+        """Decode frames of the sensor into arrays.
+
+        Parameters
+        ----------
+            name : str
+                Name of the sensor.
+
+        Returns
+        -------
+            Dict[str, np.ndarray]
+                Arrays indexed by names of data given by the decoder,
+                and 'timestamp' in seconds since the epoch.
+        """
+        results = []
+        for index in self._indices(name):
+            id_decoder, _, context = self._declarations[index]
+            decoder = SensorBase.get_decoder(id_decoder)
+            result = decoder.decode_raw(self._read_frames(index), context)
+            result[self.KEY_TIMESTAMP] = self._to_time(self._timestamps[index])
+            results.append(result)
+
+        return {key: np.concatenate([result[key] for result in results]) for key in results[0]}
+
+    def load(self) -> Dict[str, Dict[str, np.ndarray]]:
+        """Decode frames of all sensors.
+
+        Returns
+        -------
+            Dict[str, Dict[str, np.ndarray]]
+                Arrays of each sensor indexed by names of sensors.
+        """
+        return {name: self.decode(name) for name in self.names}
@@ -19,12 +19,18 @@ pisat.core.logger.LogQueue
 pisat.core.logger.RefQueue
 """
 
-from typing import Generic, Optional, Set, Type, TypeVar
+import time
+from typing import Dict, Generic, List, Optional, Set, Tuple, Type, TypeVar
+
+import numpy as np
 
 from pisat.base.component_group import ComponentGroup
+from pisat.calc.stream_filter import StreamFilter
 from pisat.sensor.sensor_base import SensorBase
 from pisat.core.logger.logque import LogQueue
 from pisat.core.logger.refque import RefQueue
+from pisat.core.logger.sample_window import SampleWindow
+from pisat.model.datamodel import DataModelBase
 from pisat.model.linked_datamodel import LinkedDataModelBase
 
 
@@ -43,6 +49,14 @@ class DataLogger(ComponentGroup, Generic[LinkedModel]):
     
     This class is a ComponentGroup.
     
+    Notes
+    -----
+        Timestamps of samples are kept only in windows of channels, 
+        which are maintained if 'winlen' is positive, so 'history' and 
+        'value_at' are available only for such channels. Rows of LogQueue 
+        and models of RefQueue have no timestamp; 'timestamp' gives the 
+        time of the last 'read' if it is needed with them.
+    
     See Also
     --------
         pisat.core.logger.SensorController : 
@@ -55,6 +69,7 @@ class DataLogger(ComponentGroup, Generic[LinkedModel]):
                  que: LogQueue,
                  *sensors: SensorBase,
                  reflen: int = 100,
+                 winlen: int = 0,
                  modelclass: Optional[Type[LinkedModel]] = None,
                  name: Optional[str] = None):
         """
@@ -66,6 +81,9 @@ class DataLogger(ComponentGroup, Generic[LinkedModel]):
                 A LogQueue object as a container.
             reflen : int, optional
                 size of inner RefQueue object, by default 100
+            winlen : int, optional
+                capacity of windows of channels, by default 0.
+                If 0, no window is maintained.
             name : Optional[str], optional
                 name of this Component, by default None
         """
@@ -75,6 +93,17 @@ class DataLogger(ComponentGroup, Generic[LinkedModel]):
         self._que = que
         self._refque = RefQueue(maxlen=reflen)
         self._modelclass = None
+        self._filters: Dict[Tuple[str, str], List[StreamFilter]] = {}
+        self._derived: Dict[Tuple[str, str], StreamFilter] = {}
+        self._winlen: int = winlen
+        self._windows: Dict[Tuple[str, str], Optional[SampleWindow]] = {}
+        self._ignored: List[Tuple[str, str]] = []
+        self._timestamp: Optional[float] = None
+        
+        if winlen < 0:
+            raise ValueError(
+                "'winlen' must be no less than 0."
+            )
         
         if modelclass is not None:
             self.set_model(modelclass)
@@ -86,6 +115,20 @@ class DataLogger(ComponentGroup, Generic[LinkedModel]):
     def refqueue(self):
         return self._refque
     
+    @property
+    def timestamp(self) -> Optional[float]:
+        """Time of the last 'read' given by time.monotonic()."""
+        return self._timestamp
+    
+    @property
+    def winlen(self) -> int:
+        return self._winlen
+    
+    @property
+    def channels(self) -> Tuple[str]:
+        """Channels whose windows are maintained."""
+        return tuple(f"{publisher}-{dname}" for publisher, dname in self._windows)
+    
     def append(self, *sensors: SensorBase) -> None:
         """Append and set Sensors or Adapters into SensorController
         
@@ -138,12 +181,323 @@ class DataLogger(ComponentGroup, Generic[LinkedModel]):
         except KeyError:
             raise ValueError("The SensorGroup doesn't have the sensor.")
     
+    @staticmethod
+    def parse_channel(channel: str) -> Tuple[str, str]:
+        """Split a channel into the name of the publisher and the data name.
+        
+        A channel is a tag of data given by DataModelBase.get_tag, 
+        for example 'bme280-press'. Names of publishers can include '-', 
+        so the channel is split at the last one.
+
+        Parameters
+        ----------
+            channel : str
+                Channel of data.
+
+        Returns
+        -------
+            Tuple[str, str]
+                Name of the publisher and the data name.
+
+        Raises
+        ------
+            ValueError
+                Raised if 'channel' is not the form of 'publisher-dname'.
+        """
+        parts = channel.rsplit("-", 1)
+        if len(parts) != 2 or not all(parts):
+            raise ValueError(
+                "'channel' must be the form of 'publisher-dname'."
+            )
+        return parts[0], parts[1]
+    
+    def attach(self, channel: str, *filters: StreamFilter) -> None:
+        """Attach streaming filters to a channel.
+        
+        Attached filters are updated with data of the channel and 
+        the timestamp given by time.monotonic() every time 'read' 
+        is called. Data which are None are not given to filters.
+
+        Parameters
+        ----------
+            channel : str
+                Channel of data, for example 'bme280-press'.
+            filters : Tuple[StreamFilter, ...]
+                Filters to be attached.
+                
+        Raises
+        ------
+            TypeError
+                Raised if a filter is not StreamFilter.
+        """
+        for f in filters:
+            if not isinstance(f, StreamFilter):
+                raise TypeError(
+                    "Components of 'filters' must be StreamFilter."
+                )
+        self._filters.setdefault(self.parse_channel(channel), []).extend(filters)
+        
+    def detach(self, channel: str, *filters: StreamFilter) -> None:
+        """Detach streaming filters from a channel.
+
+        Parameters
+        ----------
+            channel : str
+                Channel of data.
+            filters : Tuple[StreamFilter, ...]
+                Filters to be detached. If no filter is given, 
+                all filters of the channel are detached.
+                Channels derived from detached filters are removed.
+        """
+        key = self.parse_channel(channel)
+        if not len(filters):
+            self._filters.pop(key, None)
+        else:
+            attached = self._filters.get(key, [])
+            for f in filters:
+                if f in attached:
+                    attached.remove(f)
+            if not len(attached):
+                self._filters.pop(key, None)
+        
+        # NOTE Derived channels of detached filters are removed.
+        attached = [f for filters in self._filters.values() for f in filters]
+        for key, f in list(self._derived.items()):
+            if f not in attached:
+                self._derived.pop(key)
+                self._windows.pop(key, None)
+            
+    def get_filters(self, channel: str) -> Tuple[StreamFilter]:
+        """Get filters attached to a channel."""
+        return tuple(self._filters.get(self.parse_channel(channel), ()))
+    
+    def derive(self, channel: str, source: str, f: StreamFilter) -> None:
+        """Define a channel of outputs of a filter attached to another channel.
+        
+        The filter is attached to the source channel, and its output is 
+        appended to the window of the derived channel every time 'read' 
+        is called, so the derived channel can be queried by 'window', 
+        'history' and 'value_at' as other channels if 'winlen' is positive. 
+        Derived channels are kept when the model is changed.
+
+        Parameters
+        ----------
+            channel : str
+                Derived channel, for example 'bme280-altitude'.
+            source : str
+                Channel of inputs of the filter, for example 'bme280-press'.
+            f : StreamFilter
+                Filter giving data of the derived channel.
+
+        Raises
+        ------
+            ValueError
+                Raised if the channel is already a channel of the logger.
+                
+        Examples
+        --------
+            >> dlogger.derive("bme280-altitude", "bme280-press", AltitudeEstimator(100))
+            >> dlogger.window("bme280-altitude", 50)
+        """
+        key = self.parse_channel(channel)
+        if key in self._derived or key in self._windows:
+            raise ValueError(
+                f"The channel '{channel}' already exists."
+            )
+        
+        self.attach(source, f)
+        self._derived[key] = f
+        if self._winlen > 0:
+            self._windows[key] = None
+    
+    def _update_filters(self, models: Dict[str, DataModelBase], timestamp: float) -> None:
+        for (publisher, dname), filters in self._filters.items():
+            model = models.get(publisher)
+            if model is None:
+                continue
+            x = getattr(model, dname, None)
+            if x is None:
+                continue
+            for f in filters:
+                f.update(x, timestamp)
+    
+    def window(self, channel: str, n: Optional[int] = None):
+        """Get the latest samples of a channel as an array.
+        
+        Windows are maintained for channels of linked loggables of 
+        the model set by 'set_model', for example the model of the 
+        current Node, if 'winlen' is positive. The returned array is 
+        a read-only view of the window ordered from the oldest sample, 
+        so it is not copied and is overwritten by later 'read'. Data 
+        which are None are not appended to windows. Samples are stamped 
+        with the time of 'read' given by time.monotonic() for 'history' 
+        and 'value_at'.
+
+        Parameters
+        ----------
+            channel : str
+                Channel of data, for example 'bme280-press'.
+            n : Optional[int], optional
+                Number of samples, by default None.
+                If None or larger than the number of samples kept, 
+                all samples kept are returned.
+
+        Returns
+        -------
+            np.ndarray
+                View of the shape (n, ) or (n, *shape of data).
+                
+        Raises
+        ------
+            ValueError
+                Raised if the window of the channel is not maintained.
+                Windows of channels whose data are not numerical are 
+                not maintained.
+                
+        Examples
+        --------
+            >> class Falling(Node):
+            >>     model = LinkedDataModel    # it links Bme280.DataModel.press
+            >>
+            >>     def judge(self, data):
+            >>         press = self.dlogger.window("bme280-press", 200)
+            >>         return press.mean() > THRESHOLD_PRESS
+        """
+        window = self._get_window(channel)
+        if window is None:
+            return np.empty(0)
+        return window.view(n)
+    
+    def history(self, 
+                channel: str, 
+                duration: float, 
+                now: Optional[float] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Get samples of a channel in the last duration.
+        
+        Samples are searched by their timestamps with binary search, 
+        so the time of the query is O(log n) for the capacity of 
+        the window even when the rate of sampling varies. Samples 
+        older than the window are not included.
+
+        Parameters
+        ----------
+            channel : str
+                Channel of data, for example 'bme280-press'.
+            duration : float
+                Duration in seconds.
+            now : Optional[float], optional
+                Current time given by time.monotonic(), by default None.
+                If None, time.monotonic() is called.
+
+        Returns
+        -------
+            Tuple[np.ndarray, np.ndarray]
+                Read-only views of samples and their timestamps.
+                
+        Raises
+        ------
+            ValueError
+                Raised if the window of the channel is not maintained.
+                
+        Examples
+        --------
+            >> press, _ = dlogger.history("bme280-press", 2.)
+            >> press.mean()    # mean pressure over the last 2 seconds
+        """
+        if now is None:
+            now = time.monotonic()
+        
+        window = self._get_window(channel)
+        if window is None:
+            return np.empty(0), np.empty(0)
+        return window.between(now - duration, now)
+    
+    def value_at(self, channel: str, timestamp: float):
+        """Get the value of a channel at the time.
+
+        Parameters
+        ----------
+            channel : str
+                Channel of data, for example 'bme280-press'.
+            timestamp : float
+                Time given by time.monotonic().
+
+        Returns
+        -------
+            Optional[np.ndarray]
+                The latest sample logged not after the time, or None 
+                if the window has no such sample.
+                
+        Raises
+        ------
+            ValueError
+                Raised if the window of the channel is not maintained.
+                
+        Examples
+        --------
+            >> dlogger.value_at("bme280-press", time.monotonic() - 0.5)
+        """
+        window = self._get_window(channel)
+        if window is None:
+            return None
+        return window.at(timestamp)
+    
+    def _get_window(self, channel: str) -> Optional[SampleWindow]:
+        key = self.parse_channel(channel)
+        if key not in self._windows:
+            raise ValueError(
+                f"The window of the channel '{channel}' is not maintained."
+            )
+        return self._windows[key]
+    
+    def _update_windows(self, models: Dict[str, DataModelBase], timestamp: float) -> None:
+        for key, window in self._windows.items():
+            f = self._derived.get(key)
+            if f is not None:
+                x = f.value
+            else:
+                model = models.get(key[0])
+                if model is None:
+                    continue
+                x = getattr(model, key[1], None)
+            if x is None:
+                continue
+            # NOTE 
+            #   The shape of data is determined by the first sample, and 
+            #   channels of samples which can't be kept in windows are dropped.
+            if window is not None:
+                try:
+                    window.append(x, timestamp)
+                except (TypeError, ValueError):
+                    self._ignored.append(key)
+                continue
+            
+            try:
+                self._windows[key] = SampleWindow.from_sample(self._winlen, x, timestamp)
+            except TypeError:
+                self._ignored.append(key)
+                
+        if len(self._ignored):
+            for key in self._ignored:
+                self._windows.pop(key)
+            self._ignored.clear()
+    
     def set_model(self, modelclass: Type[LinkedModel]) -> None:
         if modelclass is not None and not issubclass(modelclass, LinkedDataModelBase):
             raise TypeError(
                 "'modelclass' must be a subclass of LinkedDataModelBase or None."
             )
         self._modelclass = modelclass
+        
+        # NOTE
+        #   Only windows of channels used by the model are maintained.
+        #   Windows of channels used by the previous model too are kept.
+        if self._winlen > 0:
+            keys = []
+            if modelclass is not None:
+                keys = [self.parse_channel(link.channel) for _, link in modelclass.linked_loggables]
+            keys.extend(self._derived)
+            self._windows = {key: self._windows.get(key) for key in keys}
                 
     def read(self):
         """Execute transaction for reading, caching and saving data log.
@@ -160,6 +514,14 @@ class DataLogger(ComponentGroup, Generic[LinkedModel]):
             pisat.core.logger.RefQueue : RefQueue.append is used inside.
         """
         data = [sensor.read() for sensor in self._sensors]
+        self._timestamp = time.monotonic()
+        if len(self._filters) or len(self._windows):
+            models = {model.publisher: model for model in data}
+            if len(self._filters):
+                self._update_filters(models, self._timestamp)
+            if len(self._windows):
+                self._update_windows(models, self._timestamp)
+            
         self._que.append(*data)
         if self._modelclass is None:
             return self._que._queue_main[0]
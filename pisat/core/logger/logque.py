@@ -12,6 +12,9 @@ This class can only write the format List[str, Logable] or
 Tuple[str, Logable] data. If you want to the format Dict[str, Logable], 
 then you can use DictLogQueue instead.
 
+If 'raw' is True, data of sensors returning RawDataModelBase are 
+written as raw bytes in hexadecimal without being decoded.
+
 [info]
 pisat.core.logger.DictLogQueue
 
@@ -21,7 +24,7 @@ from collections import deque
 from concurrent.futures import ThreadPoolExecutor
 import csv
 import math
-from typing import Deque, Generic, Optional, TypeVar
+from typing import Any, Deque, Dict, Generic, Optional, TypeVar
 
 from pisat.base.component import Component
 from pisat.model.datamodel import DataModelBase
@@ -60,7 +63,8 @@ class LogQueue(Component, Generic[Model]):
                  modelclass: Model,
                  maxlen: int = 10000,
                  path: Optional[str] = None,
-                 name: Optional[str] = None):
+                 name: Optional[str] = None,
+                 raw: bool = False):
         """
         Parameters
         ----------
@@ -68,6 +72,9 @@ class LogQueue(Component, Generic[Model]):
                 Size of the main queue.
             path : Optional[str], optional
                 log file to be generated, by default None.
+            raw : bool, optional
+                If True, raw bytes of linked models are written instead of 
+                decoded data, by default False.
             name : Optional[str], optional
                 name of this component, by default None.
         """
@@ -79,6 +86,7 @@ class LogQueue(Component, Generic[Model]):
             )
 
         self._modelclass = modelclass
+        self._raw = raw
 
         self._limit_main: int = maxlen
         self._limit_sub: int = 0
@@ -113,6 +121,10 @@ class LogQueue(Component, Generic[Model]):
     @property
     def modelclass(self):
         return self._modelclass
+    
+    @property
+    def raw(self):
+        return self._raw
 
     @classmethod
     def _calc_sublen(cls, len_main: int) -> int:
@@ -193,7 +205,7 @@ class LogQueue(Component, Generic[Model]):
         
         with open(self._path, "at", newline="") as f:
             if self._first:
-                self._dnames = que[0].extract().keys()
+                self._dnames = self._extract(que[0]).keys()
                 
             writer = csv.DictWriter(f, self._dnames)
             if self._first:
@@ -201,7 +213,17 @@ class LogQueue(Component, Generic[Model]):
                 self._first = False
                 
             while len(que):
-                writer.writerow(que.popleft().extract())
+                writer.writerow(self._extract(que.popleft()))
+                
+    def _extract(self, model: Model) -> Dict[str, Any]:
+        if not self._raw:
+            return model.extract()
+        
+        data = model.extract_raw()
+        for key, val in data.items():
+            if isinstance(val, bytes):
+                data[key] = val.hex()
+        return data
                 
     def close(self) -> None:
         """Execute post-process of logging.
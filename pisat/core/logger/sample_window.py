@@ -0,0 +1,281 @@
+#! python3
+
+"""
+
+pisat.core.logger.sample_window
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+Fixed-size window of the latest samples of a channel.
+A SampleWindow keeps samples and their monotonic timestamps in
+preallocated NumPy arrays updated in place, and gives the latest
+samples as an ordered view of the arrays without copying.
+DataLogger maintains a window for each channel used by the model
+of the current Node, so Node.judge can evaluate the last N samples
+or samples in the last T seconds as an array.
+
+The arrays have twice the capacity and each sample is written
+into both halves, so the latest N samples are always contiguous
+in the arrays and can be sliced as a view in the order of time.
+Timestamps in the view are sorted, so queries by time are binary
+searches with numpy.searchsorted in O(log n).
+
+[info]
+pisat.core.logger.DataLogger
+"""
+
+import time
+from typing import Any, Optional, Tuple
+
+import numpy as np
+
+
+class SampleWindow:
+    """Ring of the latest samples giving ordered views without copying.
+
+    Views returned by 'view' are read-only and share memory with
+    the window, so they are overwritten by samples appended later.
+    Copy them if they are needed after the next 'append'.
+
+    Examples
+    --------
+        >> window = SampleWindow(200)
+        >> window.append(1013.25)
+        >> window.view(100)    # the latest 100 samples at most, oldest first
+        >> values, timestamps = window.between(time.monotonic() - 2.)
+        >> window.at(time.monotonic() - 0.5)
+
+    See Also
+    --------
+        pisat.core.logger.DataLogger.window : Windows of channels of a DataLogger.
+    """
+
+    DTYPE_DEFAULT = np.float64
+
+    def __init__(self,
+                 capacity: int,
+                 shape: Tuple[int, ...] = (),
+                 dtype: Any = DTYPE_DEFAULT) -> None:
+        """
+        Parameters
+        ----------
+            capacity : int
+                Maximum number of samples to be kept.
+            shape : Tuple[int, ...], optional
+                Shape of a sample, by default ().
+            dtype : Any, optional
+                Data type of samples, by default np.float64.
+
+        Raises
+        ------
+            ValueError
+                Raised if 'capacity' is not positive.
+        """
+        if capacity <= 0:
+            raise ValueError(
+                "'capacity' must be positive."
+            )
+
+        self._capacity: int = capacity
+        self._buffer: np.ndarray = np.zeros((2 * capacity, *shape), dtype=dtype)
+        self._timestamps: np.ndarray = np.zeros(2 * capacity, dtype=np.float64)
+        self._head: int = 0
+        self._counts: int = 0
+
+    @classmethod
+    def from_sample(cls, 
+                    capacity: int, 
+                    x: Any, 
+                    timestamp: Optional[float] = None) -> "SampleWindow":
+        """Create a window whose shape is that of the sample.
+
+        Parameters
+        ----------
+            capacity : int
+                Maximum number of samples to be kept.
+            x : Any
+                Sample, for example a float or a tuple of floats.
+            timestamp : Optional[float], optional
+                Timestamp of the sample, by default None.
+
+        Returns
+        -------
+            SampleWindow
+                Window with the sample appended.
+
+        Raises
+        ------
+            TypeError
+                Raised if the sample can't be converted into an array of floats.
+        """
+        try:
+            sample = np.asarray(x, dtype=cls.DTYPE_DEFAULT)
+        except (TypeError, ValueError):
+            raise TypeError(
+                f"The sample {x!r} can't be converted into an array of floats."
+            )
+
+        window = cls(capacity, shape=sample.shape)
+        window.append(sample, timestamp)
+        return window
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def counts(self) -> int:
+        """Number of samples appended so far."""
+        return self._counts
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        """Shape of a sample."""
+        return self._buffer.shape[1:]
+
+    def __len__(self) -> int:
+        return min(self._counts, self._capacity)
+
+    def append(self, x: Any, timestamp: Optional[float] = None) -> None:
+        """Append a sample overwriting the oldest one if the window is full.
+
+        Parameters
+        ----------
+            x : Any
+                Sample.
+            timestamp : Optional[float], optional
+                Timestamp of the sample in seconds, by default None.
+                If None, time.monotonic() is used. Timestamps must not
+                decrease because queries by time assume they are sorted.
+        """
+        if timestamp is None:
+            timestamp = time.monotonic()
+
+        head = self._head
+        self._buffer[head] = x
+        self._buffer[head + self._capacity] = x
+        self._timestamps[head] = timestamp
+        self._timestamps[head + self._capacity] = timestamp
+        self._head = head + 1 if head + 1 < self._capacity else 0
+        self._counts += 1
+
+    def view(self, n: Optional[int] = None) -> np.ndarray:
+        """Get the latest samples as a read-only view, oldest first.
+
+        Parameters
+        ----------
+            n : Optional[int], optional
+                Number of samples, by default None.
+                If None or larger than the number of samples kept,
+                all samples kept are returned.
+
+        Returns
+        -------
+            np.ndarray
+                View of the shape (n, *shape).
+
+        Raises
+        ------
+            ValueError
+                Raised if 'n' is negative.
+        """
+        return self._slice(self._buffer, n)
+
+    def timestamps(self, n: Optional[int] = None) -> np.ndarray:
+        """Get timestamps of the latest samples as a read-only view.
+
+        Parameters
+        ----------
+            n : Optional[int], optional
+                Number of samples, by default None.
+                The number is handled in the same way as 'view'.
+
+        Returns
+        -------
+            np.ndarray
+                View of the shape (n, ).
+        """
+        return self._slice(self._timestamps, n)
+
+    def _slice(self, buffer: np.ndarray, n: Optional[int]) -> np.ndarray:
+        size = len(self)
+        if n is None or n > size:
+            n = size
+        elif n < 0:
+            raise ValueError(
+                "'n' must be no less than 0."
+            )
+
+        # NOTE
+        #   Samples from the oldest to the latest are placed in
+        #   [head, head + capacity) because of writing into both halves.
+        end = self._head + self._capacity
+        view = buffer[end - n:end]
+        view.flags.writeable = False
+        return view
+
+    def between(self,
+                start: float,
+                end: Optional[float] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Get samples whose timestamps are in [start, end].
+
+        Parameters
+        ----------
+            start : float
+                Beginning of the range in seconds.
+            end : Optional[float], optional
+                End of the range in seconds, by default None.
+                If None, the range includes the latest sample.
+
+        Returns
+        -------
+            Tuple[np.ndarray, np.ndarray]
+                Read-only views of samples and their timestamps.
+        """
+        timestamps = self.timestamps()
+        first = timestamps.searchsorted(start, side="left")
+        if end is None:
+            last = len(timestamps)
+        else:
+            last = timestamps.searchsorted(end, side="right")
+
+        return self.view()[first:last], timestamps[first:last]
+
+    def at(self, timestamp: float) -> Optional[np.ndarray]:
+        """Get the latest sample at the time.
+
+        Parameters
+        ----------
+            timestamp : float
+                Time in seconds.
+
+        Returns
+        -------
+            Optional[np.ndarray]
+                The latest sample whose timestamp is not after the time,
+                or None if there is no such sample in the window.
+        """
+        timestamps = self.timestamps()
+        index = timestamps.searchsorted(timestamp, side="right")
+        if index == 0:
+            return None
+        return self.view()[index - 1]
+
+    @property
+    def latest(self) -> Optional[np.ndarray]:
+        """The latest sample, or None if no sample has been appended."""
+        if not self._counts:
+            return None
+        return self.view(1)[0]
+
+    @property
+    def latest_timestamp(self) -> Optional[float]:
+        """Timestamp of the latest sample, or None if no sample has been appended."""
+        if not self._counts:
+            return None
+        return float(self._timestamps[self._head + self._capacity - 1])
+
+    def clear(self) -> None:
+        self._head = 0
+        self._counts = 0
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(capacity={self._capacity}, shape={self.shape}, counts={self._counts})"
@@ -1,3 +1,4 @@
 from pisat.core.nav.post_event import PostEvent
 from pisat.core.nav.node import Node
 from pisat.core.nav.context import Context
+from pisat.core.nav.interrupt_event import InterruptEvent
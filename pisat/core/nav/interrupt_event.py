@@ -0,0 +1,188 @@
+#! python3
+
+"""
+
+pisat.core.nav.interrupt_event
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+An event fired by an interrupt line of a sensor.
+This class binds an interrupt pin of a sensor to an edge
+callback of a DigitalInputHandlerBase and turns the edge
+into a thread-safe event. Nodes can block until the event
+occurs instead of polling sensors in the judge method, and
+the event can also set a PostEvent with a package.
+
+This class is a Component, so objects of the class can be
+registered into a ComponentManager and retrieved by Nodes.
+
+[info]
+pisat.handler.DigitalInputHandlerBase
+pisat.core.nav.PostEvent
+"""
+
+from threading import Event, Lock
+from typing import Any, Callable, Optional
+
+from pisat.base.component import Component
+from pisat.core.nav.post_event import PostEvent
+from pisat.handler.digital_input_handler_base import DigitalInputHandlerBase
+
+
+class InterruptEvent(Component):
+    """An event fired by an interrupt line of a sensor.
+
+    This class binds an interrupt pin of a sensor to an edge
+    callback of a DigitalInputHandlerBase and turns the edge
+    into a thread-safe event. Nodes can block until the event
+    occurs instead of polling sensors in the judge method, and
+    the event can also set a PostEvent with a package.
+
+    Examples
+    --------
+        >> handler = PigpioDigitalInputHandler(pi, PIN_INT, pullup=True)
+        >> apds9301.set_interrupt(low=10, high=1000, islevel=True)
+        >> landing = InterruptEvent(handler,
+                                    acknowledge=apds9301.clear_interrupt,
+                                    name="landing")
+        >>
+        >> # in Node.judge
+        >> if landing.wait(timeout=1.):
+        >>     landing.clear()
+        >>     return True
+
+    See Also
+    --------
+        pisat.handler.DigitalInputHandlerBase : Handler of the interrupt pin.
+        pisat.core.nav.PostEvent : Event which can be set by this class.
+    """
+
+    def __init__(self,
+                 handler: DigitalInputHandlerBase,
+                 edge: DigitalInputHandlerBase.Edge = DigitalInputHandlerBase.Edge.FALLING,
+                 acknowledge: Optional[Callable[[], Any]] = None,
+                 name: Optional[str] = None) -> None:
+        """
+        Parameters
+        ----------
+            handler : DigitalInputHandlerBase
+                Handler of the pin connected with the interrupt line.
+            edge : DigitalInputHandlerBase.Edge, optional
+                Edge regarded as an interrupt, by default Edge.FALLING.
+            acknowledge : Optional[Callable[[], Any]], optional
+                Function to clear the interrupt of the sensor, by default None.
+                The function is called in the 'clear' method.
+            name : Optional[str], optional
+                Name of the component, by default None.
+
+        Raises
+        ------
+            TypeError
+                Raised if 'handler' is not DigitalInputHandlerBase.
+            TypeError
+                Raised if 'edge' is not DigitalInputHandlerBase.Edge.
+        """
+        if not isinstance(handler, DigitalInputHandlerBase):
+            raise TypeError(
+                "'handler' must be DigitalInputHandlerBase."
+            )
+        if not isinstance(edge, DigitalInputHandlerBase.Edge):
+            raise TypeError(
+                "'edge' must be DigitalInputHandlerBase.Edge."
+            )
+        super().__init__(name=name)
+
+        self._handler: DigitalInputHandlerBase = handler
+        self._edge: DigitalInputHandlerBase.Edge = edge
+        self._acknowledge: Optional[Callable[[], Any]] = acknowledge
+
+        self._event: Event = Event()
+        self._lock: Lock = Lock()
+        self._count: int = 0
+        self._tick: Optional[int] = None
+        self._post: Optional[PostEvent] = None
+        self._package: Any = None
+
+        self._handler.set_callback(self._fire, edge=edge)
+
+    @property
+    def handler(self):
+        return self._handler
+
+    @property
+    def edge(self):
+        return self._edge
+
+    @property
+    def count(self) -> int:
+        """Number of interrupts since the event was created."""
+        return self._count
+
+    @property
+    def tick(self) -> Optional[int]:
+        """Tick of the last interrupt in microseconds."""
+        return self._tick
+
+    def is_set(self) -> bool:
+        return self._event.is_set()
+
+    def _fire(self, level: bool, tick: int) -> None:
+        with self._lock:
+            self._count += 1
+            self._tick = tick
+            post, package = self._post, self._package
+
+        self._event.set()
+        if post is not None:
+            post.set(package)
+
+    def bind(self, event: PostEvent, package: Any = None) -> None:
+        """Set given PostEvent with the package when an interrupt occurs.
+
+        Parameters
+        ----------
+            event : PostEvent
+                PostEvent to be set.
+            package : Any, optional
+                Package given to the PostEvent, by default None.
+        """
+        if not isinstance(event, PostEvent):
+            raise TypeError(
+                "'event' must be PostEvent."
+            )
+        with self._lock:
+            self._post = event
+            self._package = package
+
+    def unbind(self) -> None:
+        """Stop setting the PostEvent bound by 'bind'.
+        """
+        with self._lock:
+            self._post = None
+            self._package = None
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until an interrupt occurs.
+
+        Parameters
+        ----------
+            timeout : Optional[float], optional
+                Timeout in seconds, by default None. If None, this method
+                blocks until an interrupt occurs.
+
+        Returns
+        -------
+            bool
+                True if an interrupt has occured, False if timeout.
+        """
+        return self._event.wait(timeout=timeout)
+
+    def clear(self) -> None:
+        """Reset the internal flag and acknowledge the interrupt of the sensor.
+        """
+        self._event.clear()
+        if self._acknowledge is not None:
+            self._acknowledge()
+
+    def close(self) -> None:
+        """Cancel the callback of the handler.
+        """
+        self._handler.clear_callback()
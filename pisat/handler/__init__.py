@@ -9,6 +9,7 @@ from pisat.handler.pwm_handler_base import PWMHandlerBase
 from pisat.handler.i2c_handler_base import I2CHandlerBase
 from pisat.handler.spi_handler_base import SPIHandlerBase
 from pisat.handler.serial_handler_base import SerialHandlerBase
+from pisat.handler.edge_capture import EdgeCapture
 
 from pisat.handler.handler_base import DataBrokenError
 
@@ -1,10 +1,22 @@
 
-from typing import Optional
+from enum import Enum
+from typing import Callable, Optional
 from pisat.handler.digital_io_handler_base import DigitalIOHandlerBase
 
 
 class DigitalInputHandlerBase(DigitalIOHandlerBase):
     
+    class Edge(Enum):
+        RISING = 0
+        FALLING = 1
+        EITHER = 2
+        
+    # NOTE
+    #   Ticks given to callbacks are microseconds as an unsigned 32 bit 
+    #   counter same as pigpio, so a tick wraps around about every 71.6 
+    #   minutes. Use 'diff_tick' to calculate a span between two ticks.
+    TICK_MAX = 0xFFFFFFFF
+    
     def __init__(self, 
                  pin: int, 
                  pullup: bool = False,
@@ -30,4 +42,33 @@ class DigitalInputHandlerBase(DigitalIOHandlerBase):
         pass
     
     def observe(self) -> bool:
-        pass
\ No newline at end of file
+        pass
+    
+    @classmethod
+    def diff_tick(cls, tick_init: int, tick_final: int) -> int:
+        return (tick_final - tick_init) & cls.TICK_MAX
+    
+    def set_callback(self, 
+                     callback: Callable[[bool, int], None],
+                     edge: Edge = Edge.EITHER) -> None:
+        """Register a function called when an edge is detected on the pin.
+        
+        Only one callback can be registered on a handler, so a callback 
+        already set is replaced with the new one. The callback is called 
+        in a thread of the backend library and should return as soon as 
+        possible.
+
+        Parameters
+        ----------
+            callback : Callable[[bool, int], None]
+                Function recieving the level after the edge and the tick 
+                of the edge in microseconds.
+            edge : DigitalInputHandlerBase.Edge, optional
+                Edge to be detected, by default Edge.EITHER.
+        """
+        pass
+    
+    def clear_callback(self) -> None:
+        """Cancel the callback registered by 'set_callback'.
+        """
+        pass
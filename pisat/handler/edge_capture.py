@@ -0,0 +1,177 @@
+#! python3
+
+"""
+
+pisat.handler.edge_capture
+~~~~~~~~~~~~~~~~~~~~~~~~~~
+Capture of edges on a digital input pin with timestamps.
+This class records edges detected by the callback of a
+DigitalInputHandlerBase with their ticks in microseconds,
+so widths of pulses can be measured without polling the pin.
+When pigpio is used as the backend, the ticks are stamped by
+the pigpio daemon and are not affected by jitter of Python.
+
+[info]
+pisat.handler.DigitalInputHandlerBase
+"""
+
+from collections import deque
+from threading import Condition
+from typing import Deque, Optional, Tuple
+
+from pisat.handler.digital_input_handler_base import DigitalInputHandlerBase
+
+
+class EdgeCapture:
+    """Capture of edges on a digital input pin with timestamps.
+
+    This class records edges detected by the callback of a
+    DigitalInputHandlerBase with their ticks in microseconds,
+    so widths of pulses can be measured without polling the pin.
+
+    Examples
+    --------
+        >> capture = EdgeCapture(handler)
+        >> capture.start()
+        >> # ... some operations to output a pulse ...
+        >> width = capture.wait_pulse(timeout=0.1)
+
+    See Also
+    --------
+        pisat.handler.DigitalInputHandlerBase : Handler whose edges are captured.
+    """
+
+    def __init__(self,
+                 handler: DigitalInputHandlerBase,
+                 maxlen: int = 16) -> None:
+        """
+        Parameters
+        ----------
+            handler : DigitalInputHandlerBase
+                Handler of the pin to be captured.
+            maxlen : int, optional
+                Number of edges to be held, by default 16.
+
+        Raises
+        ------
+            TypeError
+                Raised if 'handler' is not DigitalInputHandlerBase.
+        """
+        if not isinstance(handler, DigitalInputHandlerBase):
+            raise TypeError(
+                "'handler' must be DigitalInputHandlerBase."
+            )
+
+        self._handler: DigitalInputHandlerBase = handler
+        self._edges: Deque[Tuple[bool, int]] = deque(maxlen=maxlen)
+        self._cond: Condition = Condition()
+        self._capturing: bool = False
+
+    @property
+    def handler(self):
+        return self._handler
+
+    @property
+    def capturing(self) -> bool:
+        return self._capturing
+
+    @property
+    def edges(self) -> Tuple[Tuple[bool, int]]:
+        """Captured edges as pairs of the level after the edge and its tick."""
+        with self._cond:
+            return tuple(self._edges)
+
+    def __len__(self):
+        with self._cond:
+            return len(self._edges)
+
+    def _on_edge(self, level: bool, tick: int) -> None:
+        with self._cond:
+            self._edges.append((level, tick))
+            self._cond.notify_all()
+
+    def start(self) -> None:
+        """Start capturing edges of both directions.
+        """
+        self.clear()
+        self._handler.set_callback(self._on_edge, edge=DigitalInputHandlerBase.Edge.EITHER)
+        self._capturing = True
+
+    def stop(self) -> None:
+        """Stop capturing edges.
+        """
+        self._handler.clear_callback()
+        self._capturing = False
+
+    def clear(self) -> None:
+        """Discard captured edges.
+        """
+        with self._cond:
+            self._edges.clear()
+
+    def wait(self, count: int = 1, timeout: Optional[float] = None) -> bool:
+        """Block until given number of edges are captured.
+
+        Parameters
+        ----------
+            count : int, optional
+                Number of edges to be waited, by default 1.
+            timeout : Optional[float], optional
+                Timeout in seconds, by default None. If None, this
+                method blocks until the edges are captured.
+
+        Returns
+        -------
+            bool
+                True if the edges have been captured, False if timeout.
+        """
+        with self._cond:
+            return self._cond.wait_for(lambda: len(self._edges) >= count, timeout=timeout)
+
+    def wait_pulse(self, level: bool = True, timeout: Optional[float] = None) -> Optional[int]:
+        """Block until a pulse is completed and return its width.
+
+        Parameters
+        ----------
+            level : bool, optional
+                Level of the pulse, by default True.
+            timeout : Optional[float], optional
+                Timeout in seconds, by default None. If None, this
+                method blocks until a pulse is completed.
+
+        Returns
+        -------
+            Optional[int]
+                Width of the pulse in microseconds, or None if timeout.
+        """
+        with self._cond:
+            if self._cond.wait_for(lambda: self._calc_pulse_width(level) is not None, timeout=timeout):
+                return self._calc_pulse_width(level)
+            return None
+
+    def pulse_width(self, level: bool = True) -> Optional[int]:
+        """Calculate the width of the first completed pulse.
+
+        Parameters
+        ----------
+            level : bool, optional
+                Level of the pulse, by default True. If True, the pulse
+                starts with a rising edge and ends with a falling edge.
+
+        Returns
+        -------
+            Optional[int]
+                Width of the pulse in microseconds, or None if no
+                pulse has been completed.
+        """
+        with self._cond:
+            return self._calc_pulse_width(level)
+
+    def _calc_pulse_width(self, level: bool) -> Optional[int]:
+        tick_init = None
+        for edge, tick in self._edges:
+            if edge == level:
+                tick_init = tick
+            elif tick_init is not None:
+                return self._handler.diff_tick(tick_init, tick)
+        return None
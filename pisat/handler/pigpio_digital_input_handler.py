@@ -1,5 +1,5 @@
 
-from typing import Optional
+from typing import Callable, Optional
 
 from pisat.util.platform import is_raspberry_pi
 from pisat.handler.digital_input_handler_base import DigitalInputHandlerBase
@@ -10,6 +10,13 @@ if is_raspberry_pi():
 
 class PigpioDigitalInputHandler(DigitalInputHandlerBase):
     
+    # NOTE
+    #   Same values as the constants of pigpio, so that the handler
+    #   works with a substitute of pigpio.pi such as FakePi.
+    MODE_INPUT = 0
+    PUD_DOWN = 1
+    PUD_UP = 2
+    
     def __init__(self, 
                  pi,
                  pin: int,
@@ -18,19 +25,37 @@ class PigpioDigitalInputHandler(DigitalInputHandlerBase):
                  name: Optional[str] = None) -> None:
         
         self._pi: pigpio.pi = pi
-        self._pi.set_mode(pin, pigpio.INPUT)
+        self._pi.set_mode(pin, self.MODE_INPUT)
+        self._callback = None
         
         super().__init__(pin, pullup=pullup, pulldown=pulldown, name=name)
     
     def set_pull_up_down(self, pulldown: bool = False) -> None:
         if pulldown:
-            self._pi.set_pull_up_down(self._pin, pigpio.PUD_DOWN)
+            self._pi.set_pull_up_down(self._pin, self.PUD_DOWN)
         else:
-            self._pi.set_pull_up_down(self._pin, pigpio.PUD_UP)
+            self._pi.set_pull_up_down(self._pin, self.PUD_UP)
     
     def clear_pull_up_down(self) -> None:
-        self._pi.set_pull_up_down(self._pin, pigpio.PUD_DOWN)
+        self._pi.set_pull_up_down(self._pin, self.PUD_DOWN)
     
     def observe(self) -> bool:
         return bool(self._pi.read(self._pin))
-        
\ No newline at end of file
+    
+    def set_callback(self, 
+                     callback: Callable[[bool, int], None],
+                     edge: DigitalInputHandlerBase.Edge = DigitalInputHandlerBase.Edge.EITHER) -> None:
+        self.clear_callback()
+        
+        def wrapper(gpio: int, level: int, tick: int):
+            # NOTE level 2 means a watchdog timeout, not an edge.
+            if level < 2:
+                callback(bool(level), tick)
+        
+        # NOTE values of Edge are same as pigpio's ones.
+        self._callback = self._pi.callback(self._pin, edge.value, wrapper)
+        
+    def clear_callback(self) -> None:
+        if self._callback is not None:
+            self._callback.cancel()
+            self._callback = None
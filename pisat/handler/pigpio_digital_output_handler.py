@@ -1,25 +1,34 @@
 
 from typing import Optional
 
-import pigpio
-
+from pisat.util.platform import is_raspberry_pi
 from pisat.handler.digital_output_handler_base import DigitalOutputHandlerBase
 
+if is_raspberry_pi():
+    import pigpio
+
 
 class PigpioDigitalOutputHandler(DigitalOutputHandlerBase):
     
+    # NOTE
+    #   Same values as the constants of pigpio, so that the handler
+    #   works with a substitute of pigpio.pi such as FakePi.
+    MODE_OUTPUT = 1
+    LOW = 0
+    HIGH = 1
+    
     def __init__(self,
-                 pi: pigpio.pi,
+                 pi,
                  pin: int,
                  name: Optional[str] = None) -> None:
         super().__init__(pin, name=name)
         
         self._pi: pigpio.pi = pi
-        self._pi.set_mode(pin, pigpio.OUTPUT)
+        self._pi.set_mode(pin, self.MODE_OUTPUT)
         
     def set_high(self) -> None:
-        self._pi.write(self._pin, pigpio.HIGH)
+        self._pi.write(self._pin, self.HIGH)
         
     def set_low(self) -> None:
-        self._pi.write(self._pin, pigpio.LOW)
+        self._pi.write(self._pin, self.LOW)
         
\ No newline at end of file
@@ -1,5 +1,5 @@
 
-from typing import Optional, Tuple, Union
+from typing import Optional, Union
 from enum import Enum
 
 from pisat.util.platform import is_raspberry_pi
@@ -57,19 +57,15 @@ class PigpioSerialHandler(SerialHandlerBase):
     def handle(self):
         return self._handle
     
-    @property
-    def counts_readable(self):
-        self._pi.serial_data_available(self._handle)
+    def _counts_pending(self) -> int:
+        return self._pi.serial_data_available(self._handle)
         
     def close(self) -> None:
         self._pi.serial_close(self._handle)
         
-    def read(self, count: int) -> Tuple[int, bytes]:
-        if count < 0:
-            ValueError("'count' must be no less than 0.")
-            
+    def _read_pending(self, count: int) -> bytes:
         data = self._pi.serial_read(self._handle, count)
-        return (data[0], bytes(data[1]))
+        return bytes(data[1])
     
     def write(self, data: Union[bytes, bytearray]) -> None:
         self._pi.serial_write(self._handle, data)
@@ -15,7 +15,8 @@ OTHER INFORMATION
     
 """
 
-from typing import Optional, Tuple, Union
+import select
+from typing import Optional, Union
 from enum import Enum
 
 from serial import Serial
@@ -77,21 +78,30 @@ class PyserialSerialHandler(SerialHandlerBase):
                                       timeout=read_timeout,
                                       write_timeout=write_timeout)
 
-    @property
-    def counts_readable(self):
+    def _counts_pending(self) -> int:
         return self._serial.in_waiting
 
+    def _read_pending(self, count: int) -> bytes:
+        return self._serial.read(size=count)
+
+    def _wait_pending(self, timeout: float) -> bool:
+        # NOTE
+        #   A port on POSIX has a file descriptor, so the thread can sleep 
+        #   in select until data arrives. Otherwise polling is used.
+        try:
+            fd = self._serial.fileno()
+        except (AttributeError, NotImplementedError):
+            return super()._wait_pending(timeout)
+
+        readable, _, _ = select.select([fd], [], [], timeout if timeout >= 0 else None)
+        return bool(len(readable))
+
     @property
     def counts_writable(self):
         return self._serial.out_waiting
 
-    def read(self, count: int) -> Tuple[int, bytes]:
-        if count < 0:
-            raise ValueError(
-                "'count' must be no less than 0."
-            )
-        res = self._serial.read(size=count)
-        return (len(res), res)
+    def close(self) -> None:
+        self._serial.close()
 
     def write(self, data: Union[bytes, bytearray]) -> None:
         self._serial.write(data)
@@ -1,5 +1,6 @@
 
-from typing import Optional
+import time
+from typing import Callable, Optional
 
 from pisat.util.platform import is_raspberry_pi
 from pisat.handler.digital_input_handler_base import DigitalInputHandlerBase
@@ -23,8 +24,11 @@ class RpiGpioDigitalInputHandler(DigitalInputHandlerBase):
         # Setup default mode.
         if not (pullup or pulldown):
             GPIO.setup(pin, GPIO.IN)
+            
+        self._has_callback: bool = False
         
     def close(self) -> None:
+        self.clear_callback()
         GPIO.cleanup(self._pin)
         
     def set_pull_up_down(self, pulldown: bool) -> None:
@@ -40,4 +44,30 @@ class RpiGpioDigitalInputHandler(DigitalInputHandlerBase):
         
     def observe(self) -> bool:
         return bool(GPIO.input(self._pin))
-        
\ No newline at end of file
+    
+    def set_callback(self, 
+                     callback: Callable[[bool, int], None],
+                     edge: DigitalInputHandlerBase.Edge = DigitalInputHandlerBase.Edge.EITHER) -> None:
+        self.clear_callback()
+        
+        if edge == self.Edge.RISING:
+            detected = GPIO.RISING
+        elif edge == self.Edge.FALLING:
+            detected = GPIO.FALLING
+        else:
+            detected = GPIO.BOTH
+        
+        # NOTE
+        #   RPi.GPIO gives neither levels nor ticks to callbacks, 
+        #   so they are emulated as well as possible.
+        def wrapper(channel: int):
+            tick = (time.perf_counter_ns() // 1000) & self.TICK_MAX
+            callback(bool(GPIO.input(channel)), tick)
+        
+        GPIO.add_event_detect(self._pin, detected, callback=wrapper)
+        self._has_callback = True
+        
+    def clear_callback(self) -> None:
+        if self._has_callback:
+            GPIO.remove_event_detect(self._pin)
+            self._has_callback = False
@@ -14,6 +14,9 @@ class SerialHandlerBase(HandlerBase):
         USB_2 = "/dev/ttyUSB2"
         USB_3 = "/dev/ttyUSB3"
         UART = "/dev/serial0"
+        
+    # sec
+    INTERVAL_POLL = 1e-3
     
     def __init__(self,
                  port: str,
@@ -23,6 +26,7 @@ class SerialHandlerBase(HandlerBase):
         
         self._port: str = port
         self._baudrate: int = baudrate
+        self._buffer: bytearray = bytearray()
         
     @property
     def port(self):
@@ -33,43 +37,169 @@ class SerialHandlerBase(HandlerBase):
         return self._baudrate
     
     @property
-    def counts_readable(self):
-        pass
+    def counts_readable(self) -> int:
+        """Number of bytes which can be read without blocking."""
+        return len(self._buffer) + self._counts_pending()
+    
+    def _counts_pending(self) -> int:
+        """Number of bytes received by the device but not read yet.
+        
+        This method is an abstract method for subclasses.
+        """
+        return 0
+    
+    def _read_pending(self, count: int) -> bytes:
+        """Read at most 'count' bytes from the device.
+        
+        This method is an abstract method for subclasses.
+        """
+        return b''
+    
+    def _wait_pending(self, timeout: float) -> bool:
+        """Block until the device receives any bytes.
+        
+        Subclasses should override this method if the backend has a 
+        blocking way to wait data. The default implementation sleeps 
+        for a short interval between checks instead of spinning.
+
+        Parameters
+        ----------
+            timeout : float
+                Timeout in seconds. If negative, waits without timeout.
+
+        Returns
+        -------
+            bool
+                True if any bytes can be read, False if timeout.
+        """
+        time_init = time.time()
+        while not self._counts_pending():
+            if timeout >= 0 and time.time() - time_init >= timeout:
+                return False
+            time.sleep(self.INTERVAL_POLL)
+        return True
+    
+    def _fill(self, timeout: float = 0.) -> int:
+        counts = self._counts_pending()
+        if not counts:
+            if not self._wait_pending(timeout):
+                return 0
+            counts = self._counts_pending()
+        data = self._read_pending(max(counts, 1))
+        self._buffer.extend(data)
+        return len(data)
     
     def close(self) -> None:
         pass
     
     def read(self, count: int) -> Tuple[int, bytes]:
-        pass
+        """Read at most 'count' bytes.
+        
+        Bytes already buffered by 'readline' are returned first.
+
+        Parameters
+        ----------
+            count : int
+                Number of bytes to be read.
+
+        Returns
+        -------
+            Tuple[int, bytes]
+                Number of bytes actually read and the bytes.
+        """
+        if count < 0:
+            raise ValueError(
+                "'count' must be no less than 0."
+            )
+        
+        result = self._buffer[:count]
+        del self._buffer[:count]
+        if len(result) < count:
+            result.extend(self._read_pending(count - len(result)))
+        return (len(result), bytes(result))
+    
+    def read_available(self, timeout: float = 0.) -> bytes:
+        """Read all bytes which have been received.
+
+        Parameters
+        ----------
+            timeout : float, optional
+                Time to wait data in seconds if nothing has been received, 
+                by default 0. If negative, waits without timeout.
+
+        Returns
+        -------
+            bytes
+                Received bytes, which may be empty at timeout.
+        """
+        if not len(self._buffer):
+            self._fill(timeout)
+        elif self._counts_pending():
+            self._fill()
+        result = bytes(self._buffer)
+        self._buffer.clear()
+        return result
+    
+    def read_exact(self, count: int, timeout: float = 0.) -> bytes:
+        """Read 'count' bytes, blocking until all of them are received.
+
+        Parameters
+        ----------
+            count : int
+                Number of bytes to be read.
+            timeout : float, optional
+                Timeout in seconds while no bytes are received, by default 0. 
+                If negative, waits without timeout.
+
+        Returns
+        -------
+            bytes
+                Bytes read, which are less than 'count' bytes at timeout.
+        """
+        while len(self._buffer) < count:
+            if not self._fill(timeout):
+                break
+            
+        result = bytes(self._buffer[:count])
+        del self._buffer[:count]
+        return result
     
     def readline(self, end: bytes = b'\n', timeout: float = 0.) -> bytes:
-        result = bytearray()
+        """Read bytes until the terminator.
+        
+        Received bytes are buffered in chunks, so the backend is called 
+        once for all bytes available instead of once for every byte.
+
+        Parameters
+        ----------
+            end : bytes, optional
+                Terminator of a line, by default b'\n'.
+            timeout : float, optional
+                Timeout in seconds while no bytes are received, by default 0. 
+                If negative, waits without timeout.
+
+        Returns
+        -------
+            bytes
+                A line including the terminator, or bytes received before 
+                the timeout if the terminator has not been found.
+        """
         cursor = 0
-        tail = len(end)
-        time_last = - 1
         while True:
-            if not self.counts_readable:
-                if time_last < 0:
-                    time_last = time.time()
-                    continue
-                if time.time() - time_last > timeout:
-                    break
-                else:
-                    continue
-            else:
-                time_last = - 1
-            
-            count, char = self.read(1)
-            result.extend(char)
+            index = self._buffer.find(end, cursor)
+            if index >= 0:
+                index += len(end)
+                break
             
-            if ord(char) == end[cursor]:
-                cursor += 1
-                if cursor == tail:
-                    break
-            else:
-                cursor = 0
+            # NOTE The terminator can be split across chunks.
+            cursor = max(len(self._buffer) - len(end) + 1, 0)
+            if not self._fill(timeout):
+                index = len(self._buffer)
+                break
             
-        return bytes(result)
+        result = bytes(self._buffer[:index])
+        del self._buffer[:index]
+        return result
     
     def readlines(self, size: int = -1, end: bytes = b'\n') -> Tuple[bytes]:
         result = []
@@ -1,3 +1,4 @@
 
 from pisat.model.datamodel import loggable, cached_loggable, DataModelBase
+from pisat.model.raw_datamodel import RawDataModelBase
 from pisat.model.linked_datamodel import linked_loggable, LinkedDataModelBase
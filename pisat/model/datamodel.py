@@ -58,8 +58,14 @@ class cached_loggable(loggable):
         if obj is None:
             return self
         if self._fget is not None:
+            # NOTE
+            #   The cache is looked up here too because this method can be
+            #   called directly, for example by linked_loggable.
+            name = self._fget.__name__
+            if name in obj.__dict__:
+                return obj.__dict__[name]
             value = self._fget(obj)
-            obj.__dict__[self._fget.__name__] = value
+            obj.__dict__[name] = value
             return value
         raise AttributeError(
             "'getter' has not been set yet."
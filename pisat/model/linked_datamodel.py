@@ -6,6 +6,7 @@ from typing import Any, Dict, Generic, List, Optional, Tuple
 from pisat.model.datamodel import (
     loggable, DataModelBase, Loggable, Model, GetReturn
 )
+from pisat.model.raw_datamodel import RawDataModelBase
 from pisat.util.deco import class_property
 
 
@@ -27,8 +28,14 @@ class linked_loggable(loggable, Generic[Model, GetReturn, Loggable]):
         if obj is None:
             return self
         if self._fget is not None:
-            if self._model is not None:
-                return self._fget(self._model)
+            # NOTE
+            #   A model synced with the linked model is preferred to the one
+            #   synced with this loggable, so that each linked model keeps its
+            #   own data. The getter is called through the original loggable
+            #   so that cached_loggable caches its value in the model.
+            model = obj._models.get(self._publisher, self._model)
+            if model is not None:
+                return self._loggable.__get__(model, type(model))
             else:
                 return self._default
             
@@ -42,6 +49,20 @@ class linked_loggable(loggable, Generic[Model, GetReturn, Loggable]):
     @property
     def publisher(self) -> str:
         return self._publisher
+    
+    @property
+    def logging(self) -> bool:
+        return self._logging
+    
+    @property
+    def dname(self) -> str:
+        """Name of the data in the model of the publisher."""
+        return self._fget.__name__
+    
+    @property
+    def channel(self) -> str:
+        """Tag of the data given by the model of the publisher, e.g. 'bme280-press'."""
+        return f"{self._publisher}-{self.dname}"
         
     def sync(self, model: DataModelBase) -> None:
         self._model = model
@@ -62,6 +83,10 @@ class LinkedDataModelBase(DataModelBase):
                 cls._Pub2Link[linked.publisher] = []
             cls._Pub2Link[linked.publisher].append(linked)
             
+    def __init__(self, publisher: str) -> None:
+        super().__init__(publisher)
+        self._models: Dict[str, DataModelBase] = {}
+        
     @class_property
     def linked_loggables(cls):
         return cls._linked_loggables
@@ -71,6 +96,36 @@ class LinkedDataModelBase(DataModelBase):
         for model in models:
             links = self._Pub2Link.get(model.publisher)
             if links is not None:
+                self._models[model.publisher] = model
                 for link in links:
                     link.sync(model)
+                    
+    def extract_raw(self) -> Dict[str, Loggable]:
+        """Extract data with raw bytes of linked models keeping them.
+        
+        Data of linked models which are RawDataModelBase with raw bytes
+        are replaced with the raw bytes of the models, and the others
+        are extracted in the same way as 'extract'.
+
+        Returns
+        -------
+            Dict[str, Loggable]
+                Extracted data.
+        """
+        result = {}
+        publishers_raw = set()
+        for publisher, links in self._Pub2Link.items():
+            model = self._models.get(publisher)
+            if isinstance(model, RawDataModelBase) and model.raw is not None:
+                if any(link.logging for link in links):
+                    result.update(model.extract_raw())
+                publishers_raw.add(publisher)
+        
+        for dname, logg in self.loggables:
+            if isinstance(logg, linked_loggable) and logg.publisher in publishers_raw:
+                continue
+            result.update(logg.extract(self, dname))
+            
+        return result
+
     
\ No newline at end of file
@@ -0,0 +1,80 @@
+#! python3
+
+"""
+
+pisat.model.raw_datamodel
+~~~~~~~~~~~~~~~~~~~~~~~~~
+A base class of data models keeping raw bytes of registers.
+A sensor can return a model holding the bytes read from the
+device as they are, instead of decoding all data in 'read'.
+Each loggable of the model decodes its data from the raw bytes
+at the first access, so loggables should be cached_loggable.
+Users pay only for data they actually use, and loggers can
+persist the raw bytes directly with 'extract_raw'.
+
+[info]
+pisat.model.DataModelBase
+pisat.model.cached_loggable
+"""
+
+from typing import Dict, Optional, Union
+
+from pisat.model.datamodel import DataModelBase
+
+
+class RawDataModelBase(DataModelBase):
+    """Base class of data models keeping raw bytes of registers.
+
+    Examples
+    --------
+        >> class DataModel(RawDataModelBase):
+        >>
+        >>     @cached_loggable
+        >>     def value(self):
+        >>         return int.from_bytes(self.raw[:2], "little") / 16
+        >>
+        >> model = DataModel("sensor")
+        >> model.setup(raw)
+        >> model.value              # decoded at the first access
+        >> model.decoded("value")   # True
+
+    See Also
+    --------
+        pisat.model.cached_loggable : Loggable caching its value in a model.
+    """
+
+    DNAME_RAW = "raw"
+
+    def __init__(self, publisher: str) -> None:
+        super().__init__(publisher)
+        self._raw: Optional[bytes] = None
+
+    def setup(self, raw: Optional[Union[bytes, bytearray, memoryview]] = None) -> None:
+        """
+        Parameters
+        ----------
+            raw : Optional[Union[bytes, bytearray, memoryview]], optional
+                Raw bytes read from a device, by default None.
+        """
+        self._raw = None if raw is None else bytes(raw)
+
+    @property
+    def raw(self) -> Optional[bytes]:
+        return self._raw
+
+    def decoded(self, dname: str) -> bool:
+        """Whether the data has been decoded and cached in the model."""
+        return dname in self.__dict__
+
+    def extract_raw(self) -> Dict[str, bytes]:
+        """Extract the raw bytes instead of decoded data.
+
+        Returns
+        -------
+            Dict[str, bytes]
+                Raw bytes indexed by the tag of 'raw', or decoded data
+                if the model has no raw bytes.
+        """
+        if self._raw is None:
+            return self.extract()
+        return {self.get_tag(self.DNAME_RAW): self._raw}
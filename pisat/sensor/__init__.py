@@ -15,3 +15,5 @@ from pisat.sensor.sam_m8q import SamM8Q
 from pisat.sensor.gysfdmaxb import Gysfdmaxb
 
 from pisat.sensor.number_generator import NumberGenerator
+from pisat.sensor.cached_sensor import CachedSensor
+from pisat.sensor.bno055_sampler import Bno055Sampler
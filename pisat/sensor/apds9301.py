@@ -11,7 +11,11 @@ This module works completely, regardless of whether using the pisat system or no
 APDS9301 datasheet
     https://datasheetspdf.com/datasheet/APDS-9301.html
 
-TODO    interrupt settings, debug, docstring
+TODO    debug, docstring
+
+NOTE    The INT pin of APDS9301 is active low and the interrupt is 
+        latched until 'clear_interrupt' is called. Use InterruptEvent 
+        with Edge.FALLING and 'acknowledge=clear_interrupt' to wait it.
 """
 
 import math
@@ -242,10 +246,10 @@ class Apds9301(SensorBase):
                       persistence: Optional[int] = None):
         
         if low is not None:
-            if self.THRESHOLD_MIN <= low <= self.THRESHOLD_MIN:
+            if self.THRESHOLD_MIN <= low <= self.THRESHOLD_MAX:
                 self._threshold_low = low
                 lower = low & 0x00FF
-                upper = low & 0xFF00
+                upper = (low & 0xFF00) >> 8
                 self._set_threshold_low(lower, upper)
             else:
                 raise ValueError(
@@ -254,10 +258,10 @@ class Apds9301(SensorBase):
                 )
                 
         if high is not None:
-            if self.THRESHOLD_MIN <= high <= self.THRESHOLD_MIN:
+            if self.THRESHOLD_MIN <= high <= self.THRESHOLD_MAX:
                 self._threshold_high = high
                 lower = high & 0x00FF
-                upper = high & 0xFF00
+                upper = (high & 0xFF00) >> 8
                 self._set_threshold_high(lower, upper)
             else:
                 raise ValueError(
@@ -14,8 +14,12 @@ BME280 datasheet
 TODO    docstring
 """
 
-from typing import Optional, Tuple, Union
+import struct
+from typing import Dict, Optional, Tuple, Union
 
+import numpy as np
+
+from pisat.handler.handler_base import DataBrokenError
 from pisat.handler.i2c_handler_base import I2CHandlerBase
 from pisat.handler.spi_handler_base import SPIHandlerBase
 from pisat.model.datamodel import loggable, DataModelBase
@@ -59,6 +63,13 @@ class Bme280(SensorBase):
     OPTION_T_SB_DEFAILT     = 0b000
     OPTION_FILTER_DEFAILT   = 0b100
     OPTION_SPI3W_EN_DEFAILT = 0b0
+    
+    #   RAW CAPTURE
+    #   A frame is the 8 bytes from REG_PRESS, and the context is 
+    #   the calibration parameters dig_T1 ~ dig_T3, dig_P1 ~ dig_P9 
+    #   and dig_H1 ~ dig_H6 in this order.
+    ID_DECODER              = "bme280"
+    FORMAT_CONTEXT          = "<18i"
 
     #   -   -   -   -   -   -   -   -   -   -   -   -   -   -   -   -   -   -
     #   OPTIONS
@@ -241,8 +252,9 @@ class Bme280(SensorBase):
 
     def read(self):
         raw_press, raw_temp, raw_hum = self._read_raw_data()
-        press = self.calc_press(raw_press)
+        # NOTE temp must be calculated first because it updates 'temp_fine'.
         temp = self.calc_temp(raw_temp)
+        press = self.calc_press(raw_press)
         hum = self.calc_hum(raw_hum)
         
         model = self.DataModel(self.name)
@@ -376,6 +388,68 @@ class Bme280(SensorBase):
         h = 419430400 if h > 419430400 else h
         return h / 4194304
 
+    #   -   -   -   -   -   -   -   -   -   -   -   -   -   -   -   -   -   -   -   -   -
+    #   Raw Capture
+    #
+    #   NOTE
+    #   *   The compensation of 'decode_raw' is the same as the one of calc_* methods, 
+    #       but vectorized with NumPy.
+    #   -   -   -   -   -   -   -   -   -   -   -   -   -   -   -   -   -   -   -   -   -
+
+    def read_raw(self) -> bytes:
+        count, raw = self._handler.read(Bme280.REG_PRESS[0], Bme280.SIZE_BYTES_REG_DATA)
+        if count != Bme280.SIZE_BYTES_REG_DATA:
+            raise DataBrokenError(
+                "Failed to read data registers."
+            )
+        return bytes(raw)
+
+    def dump_context(self) -> bytes:
+        return struct.pack(Bme280.FORMAT_CONTEXT, *self._dig_temp, *self._dig_press, *self._dig_hum)
+
+    @classmethod
+    def decode_raw(cls, frames: np.ndarray, context: bytes) -> Dict[str, np.ndarray]:
+        dig = struct.unpack(cls.FORMAT_CONTEXT, context)
+        dig_temp, dig_press, dig_hum = dig[0:3], dig[3:12], dig[12:18]
+
+        frames = np.asarray(frames, dtype=np.uint8).reshape(-1, cls.SIZE_BYTES_REG_DATA).astype(np.int64)
+        raw_press = frames[:, 0] << 12 | frames[:, 1] << 4 | frames[:, 2] >> 4
+        raw_temp = frames[:, 3] << 12 | frames[:, 4] << 4 | frames[:, 5] >> 4
+        raw_hum = frames[:, 6] << 8 | frames[:, 7]
+
+        # [deg C]
+        var1 = ((raw_temp / 8 - dig_temp[0] * 2) * dig_temp[1]) / 2048
+        var2 = (raw_temp / 16 - dig_temp[0]) ** 2 * dig_temp[2] / 67108864
+        temp_fine = np.trunc(var1 + var2).astype(np.int64)
+        temp = ((var1 + var2) * 5 + 128) / 25600
+
+        # [hPa]
+        var1 = temp_fine - 128000
+        var2 = var1 ** 2 * dig_press[5] \
+            + ((var1 * dig_press[4]) << 17) \
+            + (dig_press[3] << 35)
+        var1 = (((var1 ** 2 * dig_press[2]) >> 8)
+                + ((var1 * dig_press[1]) << 12))
+        var1 = (((1 << 47) + var1) * dig_press[0]) >> 33
+
+        invalid = var1 == 0
+        p = 1048576 - raw_press
+        p = (((p << 31) - var2) * 3125) // np.where(invalid, 1, var1)
+        var1 = (dig_press[8] * (p >> 13) ** 2) >> 25
+        var2 = (dig_press[7] * p) >> 19
+        press = ((p + var1 + var2) / 256 + (dig_press[6] * 16.0)) / 25600
+        press[invalid] = 0.       # CAUTION
+
+        # [%]
+        h = temp_fine - 76800
+        h = (((((raw_hum << 14) - (dig_hum[3] << 20) - dig_hum[4] * h) + 16384) >> 15)
+             * ((((((h * dig_hum[5] >> 10) * ((h * dig_hum[2] >> 11) + 32768)) >> 10) + 2097152)
+                 * dig_hum[1] + 8192) >> 14))
+        h = h - ((((h >> 15) * (h >> 15)) >> 7) * dig_hum[0] >> 4)
+        hum = np.clip(h, 0, 419430400) / 4194304
+
+        return {"press": press, "temp": temp, "hum": hum}
+
     def _read_calib_params(self) -> bytearray:
         count, raw = self._handler.read_seq_byte(*Bme280.REG_CALIB_PARAMS)
         return raw
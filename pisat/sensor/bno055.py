@@ -1,12 +1,17 @@
 
 
-from typing import Callable, Optional, Tuple, Union
+import struct
+import time
+from typing import Dict, List, Optional, Tuple, Union
 from enum import Enum
 
+import numpy as np
+
 from pisat.handler.handler_base import DataBrokenError
 from pisat.handler.i2c_handler_base import I2CHandlerBase
 from pisat.handler.serial_handler_base import SerialHandlerBase
-from pisat.model.datamodel import DataModelBase, loggable
+from pisat.model.datamodel import cached_loggable
+from pisat.model.raw_datamodel import RawDataModelBase
 from pisat.sensor.sensor_base import SensorBase
 from pisat.util.deco import cached_property
 from pisat.util.type import is_all_None
@@ -14,7 +19,23 @@ from pisat.util.type import is_all_None
 class Bno055Base(SensorBase):
     
 
-    class DataModel(DataModelBase):
+    class DataModel(RawDataModelBase):
+        
+        # NOTE
+        #   Offsets of data in the raw bytes read from ACC_DATA_X_LSB.
+        #   Vectors are int16 in little endian and temperature is int8.
+        OFFSET_ACC = 0
+        OFFSET_MAG = 6
+        OFFSET_GYRO = 12
+        OFFSET_EULER = 18
+        OFFSET_QUAT = 24
+        OFFSET_ACC_LIN = 32
+        OFFSET_ACC_GRA = 38
+        OFFSET_TEMP = 44
+        
+        COO_XYZ = ("X", "Y", "Z")
+        COO_EULER = ("HEADING", "PITCH", "ROLL")
+        COO_QUAT = ("X", "Y", "Z", "W")
         
         def setup(self, 
                   acc: Tuple[float] = (None, None, None),
@@ -24,89 +45,110 @@ class Bno055Base(SensorBase):
                   quat: Tuple[float] = (None, None, None),
                   acc_lin: Tuple[float] = (None, None, None),
                   acc_gra: Tuple[float] = (None, None, None),
-                  temp: float = None):
-                        
-            self._acc = acc
-            self._mag = mag
-            self._gyro = gyro
-            self._euler = euler
-            self._quat = quat
-            self._acc_lin = acc_lin
-            self._acc_gra = acc_gra
-            self._temp = temp
-            
-            def get_name(tag: str, coo: Tuple[str]):
-                return [f"{self.publisher}-{tag}_{x}" for x in coo]
+                  temp: float = None,
+                  raw: Optional[Union[bytes, bytearray]] = None,
+                  divisors: Optional[Tuple[float]] = None):
             
-            self._name_acc = get_name("acc", ("X", "Y", "Z"))
-            self._name_mag = get_name("mag", ("X", "Y", "Z"))
-            self._name_gyro = get_name("gyro", ("X", "Y", "Z"))
-            self._name_euler = get_name("euler", ("HEADING", "PITCH", "ROLL"))
-            self._name_quat = get_name("quat", ("X", "Y", "Z", "W"))
-            self._name_acc_lin = get_name("acc_lin", ("X", "Y", "Z"))
-            self._name_acc_gra = get_name("acc_gra", ("X", "Y", "Z"))
+            # NOTE
+            #   If 'raw' is given, each data is decoded from it at the first
+            #   access with 'divisors' given by the sensor, which are divisors
+            #   of acc, mag, gyro, euler, quat and temp in this order.
+            #   Otherwise, given data are cached as decoded ones.
+            super().setup(raw)
+            self._divisors = divisors
+            if raw is None:
+                self.__dict__.update(acc=acc, mag=mag, gyro=gyro, euler=euler, quat=quat,
+                                     acc_lin=acc_lin, acc_gra=acc_gra, temp=temp)
+                
+        def _decode_vector(self, offset: int, counts: int, divisor: float) -> Tuple[float]:
+            return tuple(val / divisor for val in struct.unpack_from(f"<{counts}h", self._raw, offset))
+        
+        def _format_vector(self, dname: str, coo: Tuple[str]):
+            vector = getattr(self, dname)
+            return {f"{self.publisher}-{dname}_{x}": val for x, val in zip(coo, vector)}
             
-        @loggable
+        @cached_loggable
         def acc(self):
-            return self._acc
+            return self._decode_vector(self.OFFSET_ACC, 3, self._divisors[0])
         
         @acc.formatter
         def acc(self):
-            return {name: val for name, val in zip(self._name_acc, self._acc)}
+            return self._format_vector("acc", self.COO_XYZ)
         
-        @loggable
+        @cached_loggable
         def mag(self):
-            return self._mag
+            return self._decode_vector(self.OFFSET_MAG, 3, self._divisors[1])
         
         @mag.formatter
         def mag(self):
-            return {name: val for name, val in zip(self._name_mag, self._mag)}
+            return self._format_vector("mag", self.COO_XYZ)
         
-        @loggable
+        @cached_loggable
         def gyro(self):
-            return self._gyro
+            return self._decode_vector(self.OFFSET_GYRO, 3, self._divisors[2])
         
         @gyro.formatter
         def gyro(self):
-            return {name: val for name, val in zip(self._name_gyro, self._gyro)}
+            return self._format_vector("gyro", self.COO_XYZ)
         
-        @loggable
+        @cached_loggable
         def euler(self):
-            return self._euler
+            return self._decode_vector(self.OFFSET_EULER, 3, self._divisors[3])
         
         @euler.formatter
         def euler(self):
-            return {name: val for name, val in zip(self._name_euler, self._euler)}
+            return self._format_vector("euler", self.COO_EULER)
         
-        @loggable
+        @cached_loggable
         def quat(self):
-            return self._quat
+            return self._decode_vector(self.OFFSET_QUAT, 4, self._divisors[4])
         
         @quat.formatter
         def quat(self):
-            return {name: val for name, val in zip(self._name_quat, self._quat)}
+            return self._format_vector("quat", self.COO_QUAT)
         
-        @loggable
+        @cached_loggable
         def acc_lin(self):
-            return self._acc_lin
+            return self._decode_vector(self.OFFSET_ACC_LIN, 3, self._divisors[0])
         
         @acc_lin.formatter
         def acc_lin(self):
-            return {name: val for name, val in zip(self._name_acc_lin, self._acc_lin)}
+            return self._format_vector("acc_lin", self.COO_XYZ)
         
-        @loggable
+        @cached_loggable
         def acc_gra(self):
-            return self._acc_gra
+            return self._decode_vector(self.OFFSET_ACC_GRA, 3, self._divisors[0])
         
         @acc_gra.formatter
         def acc_gra(self):
-            return {name: val for name, val in zip(self._name_acc_gra, self._acc_gra)}
+            return self._format_vector("acc_gra", self.COO_XYZ)
                 
-        @loggable
+        @cached_loggable
         def temp(self):
-            return self._temp
+            temp = struct.unpack_from("<b", self._raw, self.OFFSET_TEMP)[0]
+            return int(temp / self._divisors[5])
 
 
+    # NOTE
+    #   Raw capture. A frame is the raw bytes read by '_retreive_data', and
+    #   its elements are int16 in little endian except the last byte of
+    #   temperature as int8.
+    ID_DECODER = "bno055"
+    FORMAT_CONTEXT = "<4B"
+    
+    LEN_FRAME = 45
+    LEN_FRAME_VECTORS = 44
+    INDEX_FRAME_TEMP = 44
+    SLICES_FRAME = {
+        "acc": slice(0, 3),
+        "mag": slice(3, 6),
+        "gyro": slice(6, 9),
+        "euler": slice(9, 12),
+        "quat": slice(12, 16),
+        "acc_lin": slice(16, 19),
+        "acc_gra": slice(19, 22),
+    }
+        
     # RESISTOR ADDRESS
     class RegPage0:
         CHIP_ID = 0x00
@@ -736,13 +778,13 @@ class Bno055Base(SensorBase):
                       acc_hg: Enum,
                       gyro_hr: Enum,
                       gyro_am: Enum) -> int:
-                for arg in locals().values()[1:]:
+                for arg in (acc_nm, acc_am, acc_hg, gyro_hr, gyro_am):
                     if not isinstance(arg, cls):
                         raise TypeError(
                             "The arguments must be Bno055.InterruptEnabled.State."
                         )
                 
-                return acc_nm.value << 7 | acc_am.value << 6 | acc_hg << 5 |\
+                return acc_nm.value << 7 | acc_am.value << 6 | acc_hg.value << 5 |\
                     gyro_hr.value << 3 | gyro_am.value << 2
         
         def __init__(self) -> None:
@@ -752,17 +794,16 @@ class Bno055Base(SensorBase):
             self._gyro_hr = self.State.DISABLED
             self._gyro_am = self.State.DISABLED
             
-        @classmethod
-        def _set_state(cls, state, attr: Optional[bool] = None) -> None:
-            if attr is not None:
-                if isinstance(attr, bool):
-                    if attr:
-                        state = cls.State.ENABLED
+        def _set_state(self, attr: str, state: Optional[bool] = None) -> None:
+            if state is not None:
+                if isinstance(state, bool):
+                    if state:
+                        setattr(self, attr, self.State.ENABLED)
                     else:
-                        state = cls.State.DISABLED
+                        setattr(self, attr, self.State.DISABLED)
                 else:
-                    TypeError(
-                        "'attr' must be bool or None."
+                    raise TypeError(
+                        "'state' must be bool or None."
                     )
             
         def _build_byte(self,
@@ -771,9 +812,9 @@ class Bno055Base(SensorBase):
                         acc_hg: Optional[bool] = None,
                         gyro_hr: Optional[bool] = None,
                         gyro_am: Optional[bool] = None) -> int:
-            for arg, state in zip((acc_nm, acc_am, acc_hg, gyro_hr, gyro_am),
-                                  (self._acc_nm, self._acc_am, self._acc_hg, self._gyro_hr, self._gyro_am)):
-                self._set_state(state, arg)
+            for attr, state in zip(("_acc_nm", "_acc_am", "_acc_hg", "_gyro_hr", "_gyro_am"),
+                                   (acc_nm, acc_am, acc_hg, gyro_hr, gyro_am)):
+                self._set_state(attr, state)
             return self.State.build(self._acc_nm, self._acc_am, self._acc_hg, self._gyro_hr, self._gyro_am)
             
         @property
@@ -810,13 +851,13 @@ class Bno055Base(SensorBase):
                       acc_hg: Enum,
                       gyro_hr: Enum,
                       gyro_am: Enum) -> int:
-                for arg in locals().values()[1:]:
+                for arg in (acc_nm, acc_am, acc_hg, gyro_hr, gyro_am):
                     if not isinstance(arg, cls):
                         raise TypeError(
                             "The arguments must be Bno055.InterruptMask.State."
                         )
                 
-                return acc_nm.value << 7 | acc_am.value << 6 | acc_hg << 5 |\
+                return acc_nm.value << 7 | acc_am.value << 6 | acc_hg.value << 5 |\
                     gyro_hr.value << 3 | gyro_am.value << 2
         
         def __init__(self) -> None:
@@ -826,17 +867,16 @@ class Bno055Base(SensorBase):
             self._gyro_hr = self.State.DISABLED
             self._gyro_am = self.State.DISABLED
             
-        @classmethod
-        def _set_state(cls, state, attr: Optional[bool] = None) -> None:
-            if attr is not None:
-                if isinstance(attr, bool):
-                    if attr:
-                        state = cls.State.ENABLED
+        def _set_state(self, attr: str, state: Optional[bool] = None) -> None:
+            if state is not None:
+                if isinstance(state, bool):
+                    if state:
+                        setattr(self, attr, self.State.ENABLED)
                     else:
-                        state = cls.State.DISABLED
+                        setattr(self, attr, self.State.DISABLED)
                 else:
-                    TypeError(
-                        "'attr' must be bool or None."
+                    raise TypeError(
+                        "'state' must be bool or None."
                     )
             
         def _build_byte(self,
@@ -845,9 +885,9 @@ class Bno055Base(SensorBase):
                         acc_hg: Optional[bool] = None,
                         gyro_hr: Optional[bool] = None,
                         gyro_am: Optional[bool] = None) -> int:
-            for arg, state in zip((acc_nm, acc_am, acc_hg, gyro_hr, gyro_am),
-                                  (self._acc_nm, self._acc_am, self._acc_hg, self._gyro_hr, self._gyro_am)):
-                self._set_state(state, arg)
+            for attr, state in zip(("_acc_nm", "_acc_am", "_acc_hg", "_gyro_hr", "_gyro_am"),
+                                   (acc_nm, acc_am, acc_hg, gyro_hr, gyro_am)):
+                self._set_state(attr, state)
             return self.State.build(self._acc_nm, self._acc_am, self._acc_hg, self._gyro_hr, self._gyro_am)
             
         @property
@@ -948,19 +988,13 @@ class Bno055Base(SensorBase):
     #   -   -   -   -   -   -   -   -   -   -   -   -   -   -   -   -   -   -   #
     
     def read(self):
-        raw = self._retreive_data()
-        vec_acc = self._calc_vector(raw[:6], self._calc_acc)
-        vec_mag = self._calc_vector(raw[6:12], self._calc_mag)
-        vec_gyro = self._calc_vector(raw[12:18], self._calc_gyro)
-        vec_euler = self._calc_vector(raw[18:24], self._calc_euler)
-        vec_quaternion = self._calc_vector(raw[24:32], self._calc_quaternion)
-        vec_lin_acc = self._calc_vector(raw[32:38], self._calc_acc)
-        vec_grv_acc = self._calc_vector(raw[38:44], self._calc_acc)
-        temp = self._calc_temp(raw[44])
-        
+        return self._decode_data(self._retreive_data())
+
+    def _decode_data(self, raw: Union[bytes, bytearray]) -> DataModel:
+        # NOTE
+        #   Data are decoded in the model only when they are accessed.
         model = self.DataModel(self.name)
-        model.setup(acc=vec_acc, mag=vec_mag, gyro=vec_gyro, euler=vec_euler,
-                    quat=vec_quaternion, acc_lin=vec_lin_acc, acc_gra=vec_grv_acc, temp=temp)
+        model.setup(raw=raw, divisors=self._calc_divisors())
         return model
 
     def _retreive_data(self) -> bytearray:
@@ -969,55 +1003,85 @@ class Bno055Base(SensorBase):
         raw.extend(self._read_seq_bytes(self.RegPage0.SECOND_DATA_REG, self.RegPage0.SECOND_LEN_DATA))
         return raw
     
-    def _calc_vector(self, data: bytes, func: Callable[[int], Union[int, float]]) -> Tuple[float]:
-        vector = []
-        for i in range(len(data) // 2):
-            element = data[i * 2 + 1] << 8 | data[i * 2]
-            if (element & 0x8000):
-                element -= 0xFFFF + 1
-                
-            vector.append(element)
-
-        return tuple(map(func, vector))                
+    def _calc_divisors(self) -> Tuple[float]:
+        return self.calc_divisors(self._unit_acc, self._unit_gyro, self._unit_euler, self._unit_temp)
     
-    def _calc_acc(self, data: int) -> float:
-        # See datasheet page 31
-        if self._unit_acc == self.AccUnit.MPS2:
-            return data / 100
-        else:
-            return data
+    @classmethod
+    def calc_divisors(cls, 
+                      unit_acc: AccUnit, 
+                      unit_gyro: GyroUnit, 
+                      unit_euler: EulerUnit, 
+                      unit_temp: TempUnit) -> Tuple[float]:
+        # NOTE
+        #   Divisors of acc, mag, gyro, euler, quat and temp in this order,
+        #   which convert raw values into ones in the given units.
         
-    def _calc_mag(self, data: int) -> float:
+        # See datasheet page 31
+        div_acc = 100 if unit_acc == cls.AccUnit.MPS2 else 1
         # See datasheet page 32
-        return data / 16
-    
-    def _calc_gyro(self, data: int) -> float:
+        div_mag = 16
         # See datasheet page 33
-        if self._unit_gyro == self.GyroUnit.DPS:
-            return data / 16
-        else:
-            return data / 900
-        
-    def _calc_euler(self, data: int) -> float:
-        # See datasheet page 35
-        if self._unit_euler == self.EulerUnit.DEGREES:
-            return data / 16
-        else:
-            return data / 900
-        
-    def _calc_quaternion(self, data: int) -> float:
+        div_gyro = 16 if unit_gyro == cls.GyroUnit.DPS else 900
         # See datasheet page 35
-        return data / (2 << 13)
-    
-    def _calc_temp(self, data: int) -> int:
+        div_euler = 16 if unit_euler == cls.EulerUnit.DEGREES else 900
+        div_quat = 2 << 13
         # See datasheet page 37
-        if (data & 0x8000):
-                data -= 0xFFFF + 1
+        div_temp = 1 if unit_temp == cls.TempUnit.CELSIUS else 0.5
         
-        if self._unit_temp == self.TempUnit.CELSIUS:
-            return data
-        else:
-            return data * 2
+        return (div_acc, div_mag, div_gyro, div_euler, div_quat, div_temp)
+    
+    #   -   -   -   -   -   -   -   -   -   -   -   -   -   -   -   -   -   -   #
+    #   Raw Capture                                                             #
+    #   -   -   -   -   -   -   -   -   -   -   -   -   -   -   -   -   -   -   #
+    
+    def read_raw(self) -> bytes:
+        return bytes(self._retreive_data())
+    
+    def dump_context(self) -> bytes:
+        # NOTE The context is values of the units of acc, gyro, euler and temp.
+        return struct.pack(self.FORMAT_CONTEXT, self._unit_acc.value, self._unit_gyro.value,
+                           self._unit_euler.value, self._unit_temp.value)
+    
+    @classmethod
+    def decode_raw(cls, frames: np.ndarray, context: bytes) -> Dict[str, np.ndarray]:
+        acc, gyro, euler, temp = struct.unpack(cls.FORMAT_CONTEXT, context)
+        divisors = cls.calc_divisors(cls.AccUnit(acc), cls.GyroUnit(gyro), 
+                                     cls.EulerUnit(euler), cls.TempUnit(temp))
+        return cls.decode_frames(frames, divisors)
+    
+    @classmethod
+    def decode_frames(cls, frames: np.ndarray, divisors: Tuple[float]) -> Dict[str, np.ndarray]:
+        """Decode raw frames into arrays at once.
+
+        Parameters
+        ----------
+            frames : np.ndarray
+                Raw frames as uint8, whose length of the last axis is 45.
+            divisors : Tuple[float]
+                Divisors given by 'calc_divisors'.
+
+        Returns
+        -------
+            Dict[str, np.ndarray]
+                Arrays indexed by names of data. Vectors are of the shape 
+                (n, 3) or (n, 4) for 'quat', and 'temp' is of the shape (n, ).
+                Arrays of vectors are views of one array.
+        """
+        frames = np.asarray(frames, dtype=np.uint8).reshape(-1, cls.LEN_FRAME)
+        vectors = np.ascontiguousarray(frames[:, :cls.LEN_FRAME_VECTORS]).view("<i2").astype(np.float64)
+        
+        div_acc, div_mag, div_gyro, div_euler, div_quat, div_temp = divisors
+        expanded = np.empty(cls.LEN_FRAME_VECTORS // 2, dtype=np.float64)
+        for dname, div in (("acc", div_acc), ("mag", div_mag), ("gyro", div_gyro), ("euler", div_euler),
+                           ("quat", div_quat), ("acc_lin", div_acc), ("acc_gra", div_acc)):
+            expanded[cls.SLICES_FRAME[dname]] = div
+        vectors /= expanded
+        
+        result = {dname: vectors[:, s] for dname, s in cls.SLICES_FRAME.items()}
+        temp = frames[:, cls.INDEX_FRAME_TEMP].view(np.int8).astype(np.float64)
+        temp /= div_temp
+        result["temp"] = temp
+        return result
         
     #   -   -   -   -   -   -   -   -   -   -   -   -   -   -   -   -   -   -   #
     #   For Setting                                                             #
@@ -1077,13 +1141,24 @@ class Bno055Base(SensorBase):
     def change_page(self) -> None:
         if self._current_page == self.Page.PAGE_0:
             self._write_single_byte(self.RegPage0.PAGE_ID, self.Page.PAGE_1.value)
+            self._current_page = self.Page.PAGE_1
         else:
             self._write_single_byte(self.RegPage1.PAGE_ID, self.Page.PAGE_0.value)
+            self._current_page = self.Page.PAGE_0
     
     @property
     def current_page_id(self):
         return self._current_page
     
+    def _write_page1_byte(self, reg: int, data: int) -> None:
+        # NOTE Registers of the page 1 are writable only in CONFIG_MODE.
+        with self.config:
+            self._write_single_byte(self.RegPage0.PAGE_ID, self.Page.PAGE_1.value)
+            try:
+                self._write_single_byte(reg, data)
+            finally:
+                self._write_single_byte(self.RegPage1.PAGE_ID, self.Page.PAGE_0.value)
+    
     #   -   -   -   -   -   -   -   -   -   -   -   -   -   -   -   -   -   -   
     #   Calibration
     #
@@ -1258,7 +1333,7 @@ class Bno055Base(SensorBase):
                      gyro_hr: Optional[bool] = None,
                      gyro_am: Optional[bool] = None) -> None:
         data = self._interrupt_mask._build_byte(acc_nm, acc_am, acc_hg, gyro_hr, gyro_am)
-        self._write_single_byte(self.RegPage1.INT_MSK.value, data)
+        self._write_page1_byte(self.RegPage1.INT_MSK, data)
         
     @property
     def interrupt_mask(self):
@@ -1271,7 +1346,7 @@ class Bno055Base(SensorBase):
                         gyro_hr: Optional[bool] = None,
                         gyro_am: Optional[bool] = None) -> None:
         data = self._interrupt_enabled._build_byte(acc_nm, acc_am, acc_hg, gyro_hr, gyro_am)
-        self._write_single_byte(self.RegPage1.INT_EN.value, data)
+        self._write_page1_byte(self.RegPage1.INT_EN, data)
     
     @property
     def interrupt_enabled(self):
@@ -1688,104 +1763,182 @@ class UARTBno055(Bno055Base):
         MAX_LENGTH_ERROR = 0x08
         MIN_LENGTH_ERROR = 0x09
         RECEIVE_CHARACTER_TIMEOUT = 0x0A
+        
+    # NOTE
+    #   Statuses caused by a transient failure of the transmission, 
+    #   so commands are sent again on these statuses.
+    STATUS_RETRY = (StatusWrite.FAIL.value, StatusRead.FAIL.value,
+                    StatusRead.BUS_OVER_RUN_ERROR.value, StatusRead.RECEIVE_CHARACTER_TIMEOUT.value)
+    
+    # sec
+    TIMEOUT_RESPONSE = 0.1
+    INTERVAL_RETRY = 2e-3
+    
+    RETRIES_MAX = 3
+    LEN_HEADER = 2
+    MAX_LEN_DATA = 128
     
     def __init__(self,
                  handler: SerialHandlerBase,
+                 timeout: float = TIMEOUT_RESPONSE,
+                 retries: int = RETRIES_MAX,
                  name: Optional[str] = None) -> None:
+        """
+        Parameters
+        ----------
+            handler : SerialHandlerBase
+                Handler of the UART port connected with BNO055.
+            timeout : float, optional
+                Timeout of a response in seconds, by default UARTBno055.TIMEOUT_RESPONSE.
+            retries : int, optional
+                Number of retries of a command failed transiently, 
+                by default UARTBno055.RETRIES_MAX. The interval between 
+                retries starts from UARTBno055.INTERVAL_RETRY and is doubled 
+                at every retry.
+            name : Optional[str], optional
+                Name of the component, by default None.
+        """
         super().__init__(handler, name=name)
 
         self._handler: Optional[SerialHandlerBase] = handler
+        self._timeout: float = timeout
+        self._retries: int = retries
         self._clear_buf()
         
+    @property
+    def timeout(self):
+        return self._timeout
+    
+    @property
+    def retries(self):
+        return self._retries
+        
     def _clear_buf(self):
-        while self._handler.counts_readable:
-            self._handler.read(1)
+        while len(self._handler.read_available()):
+            pass
+        
+    @classmethod
+    def build_read_command(cls, reg: int, counts: int) -> bytes:
+        return bytes((cls.Protocol.START_BYTE.value, cls.Protocol.READ_BYTE.value, reg, counts))
+    
+    @classmethod
+    def build_write_command(cls, reg: int, data: Union[int, bytes, bytearray]) -> bytes:
+        if isinstance(data, int):
+            data = bytes((data, ))
+        return bytes((cls.Protocol.START_BYTE.value, cls.Protocol.WRITE_BYTE.value, reg, len(data))) + data
         
     def _read_single_byte(self, reg: int) -> int:
         return self._read_seq_bytes(reg, 1)[0]
     
     def _read_seq_bytes(self, reg: int, counts: int) -> bytes:
-        # send command to read
-        raw = bytearray()
-        raw.append(self.Protocol.START_BYTE.value)
-        raw.append(self.Protocol.READ_BYTE.value)
-        raw.append(reg)
-        raw.append(counts)
-        self._handler.write(raw)
-        
-        # wait response
-        while self._handler.counts_readable < 2:
-            pass
+        return self._request(self.build_read_command(reg, counts), counts)
+    
+    def _write_single_byte(self, reg: int, data: Union[int, bytes, bytearray]) -> None:
+        self._request(self.build_write_command(reg, data))
         
-        # response handling
-        _, response = self._handler.read(2)
-        if response[0] == self.Protocol.READ_RESPONSE.value:
-            pass
-        elif response[0] == self.Protocol.RESPONSE_HEADER.value:
-            if response[1] == self.StatusRead.FAIL.value:
-                self._read_seq_bytes(reg, counts)
-            else:
-                for status in self.StatusRead:
-                    if response[1] == status.value:
-                        raise DataBrokenError(
-                            "Reading register has failed. STATUS: {}"
-                            .format(status)
-                        )
-        else:
-            raise DataBrokenError(
-                "Found data read was broken."
-            )
+    def _retreive_data(self) -> bytearray:
+        # NOTE
+        #   Data registers are contiguous and a UART command can read 
+        #   128 bytes at most, so all of them are read by one command.
+        counts = self.RegPage0.FIRST_LEN_DATA + self.RegPage0.SECOND_LEN_DATA
+        return bytearray(self._read_seq_bytes(self.RegPage0.FIRST_DATA_REG, counts))
+    
+    def read_registers(self, *requests: Tuple[int, int]) -> List[bytes]:
+        """Read multiple blocks of registers with pipelined commands.
+        
+        All commands are sent at once and responses are received in order, 
+        so a round trip is needed only once for all blocks. Commands failed 
+        are sent again one by one.
 
-        length = response[1]
-        while self._handler.counts_readable < length:
-            pass
+        Parameters
+        ----------
+            *requests : Tuple[int, int]
+                Pairs of the address of the first register and the number 
+                of bytes to be read.
 
-        recv_count, data = self._handler.read(length)
-        if recv_count != length:
-            raise DataBrokenError(
-                "Found data read was broken."
-            )
-            
-        return data
-    
-    def _write_single_byte(self, reg: int, data: bytes) -> None:
-        # send command to write
-        raw = bytearray()
-        raw.append(self.Protocol.START_BYTE.value)
-        raw.append(self.Protocol.WRITE_BYTE.value)
-        raw.append(reg)
-        raw.append(len(data))
-        raw.extend(data)
-        self._handler.write(raw)
-        
-        # wait response
-        while self._handler.counts_readable < 2:
-            pass
+        Returns
+        -------
+            List[bytes]
+                Data of the blocks in the order of 'requests'.
+
+        Raises
+        ------
+            DataBrokenError
+                Raised if a block can't be read even by retries.
+        """
+        for _, counts in requests:
+            if not (0 < counts <= self.MAX_LEN_DATA):
+                raise ValueError(
+                    f"Number of bytes must be 0 < 'counts' <= {self.MAX_LEN_DATA}."
+                )
         
-        # response handling
-        _, response = self._handler.read(2)
-        if response[0] == self.Protocol.RESPONSE_HEADER.value:
-            if response[1] == self.StatusWrite.SUCCESS.value:
-                pass
-            elif response[1] == self.StatusWrite.FAIL.value:
-                # try agin
-                self._write_single_byte(self, reg, data)
-            else:
-                for status in self.StatusWrite:
-                    if response[1] == status.value:
-                        raise DataBrokenError(
-                            "Writing register has failed. STATUS: {}"
-                            .format(status)
-                        )
-                else:
+        self._handler.write(b"".join(self.build_read_command(reg, counts) for reg, counts in requests))
+        
+        results: List[Optional[bytes]] = [None] * len(requests)
+        for i, (_, counts) in enumerate(requests):
+            results[i] = self._receive(counts)
+            if results[i] is None:
+                # NOTE Responses after a lost one can't be trusted.
+                self._clear_buf()
+                break
+            
+        for i, request in enumerate(requests):
+            if results[i] is None:
+                results[i] = self._read_seq_bytes(*request)
+        return results
+    
+    def _request(self, command: bytes, counts: Optional[int] = None) -> bytes:
+        for retry in range(self._retries + 1):
+            if retry:
+                time.sleep(self.INTERVAL_RETRY * (1 << (retry - 1)))
+                self._clear_buf()
+                
+            self._handler.write(command)
+            result = self._receive(counts)
+            if result is not None:
+                return result
+            
+        raise DataBrokenError(
+            f"No valid response has been received in {self._retries + 1} attempts."
+        )
+        
+    def _receive(self, counts: Optional[int] = None) -> Optional[bytes]:
+        # NOTE
+        #   Returns None if the command should be sent again, or raises 
+        #   DataBrokenError if the command is invalid. 'counts' is None 
+        #   for a write command.
+        response = self._handler.read_exact(self.LEN_HEADER, timeout=self._timeout)
+        if len(response) < self.LEN_HEADER:
+            return None
+        
+        header, length = response
+        if header == self.Protocol.READ_RESPONSE.value and counts is not None:
+            if length != counts:
+                self._clear_buf()
+                return None
+            data = self._handler.read_exact(length, timeout=self._timeout)
+            return data if len(data) == length else None
+        
+        elif header == self.Protocol.RESPONSE_HEADER.value:
+            if counts is None and length == self.StatusWrite.SUCCESS.value:
+                return b""
+            if length in self.STATUS_RETRY:
+                return None
+            
+            statuses = self.StatusRead if counts is not None else self.StatusWrite
+            for status in statuses:
+                if length == status.value:
                     raise DataBrokenError(
-                        "Writing register has faild and any status has not been found."
+                        f"Accessing register has failed. STATUS: {status}"
                     )
-        else:
             raise DataBrokenError(
-                "Found data read was broken."
+                "Accessing register has failed and any status has not been found."
             )
             
+        # NOTE Bytes are out of sync, so the response is discarded.
+        self._clear_buf()
+        return None
+            
     
 class Bno055(Bno055Base):
     
@@ -1799,11 +1952,12 @@ class Bno055(Bno055Base):
         if isinstance(handler, I2CHandlerBase):
             self._base = I2CBno055(handler, name=name)
         elif isinstance(handler, SerialHandlerBase):
-            self._base = SerialHandlerBase(handler, name=name)
+            self._base = UARTBno055(handler, name=name)
             
         self._read_single_byte = self._base._read_single_byte
         self._read_seq_bytes = self._base._read_seq_bytes
         self._write_single_byte = self._base._write_single_byte
+        self._retreive_data = self._base._retreive_data
         
         self.setup()
     
\ No newline at end of file
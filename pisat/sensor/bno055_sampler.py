@@ -0,0 +1,349 @@
+#! python3
+
+"""
+
+pisat.sensor.bno055_sampler
+~~~~~~~~~~~~~~~~~~~~~~~~~~~
+A background sampler of BNO055 at a fixed rate.
+This class reads raw 45-byte frames of BNO055 in a dedicated thread
+at a fixed period and stores them in a preallocated ring buffer
+without decoding. Frames are decoded only when they are requested,
+and a window of frames is decoded at once into NumPy arrays, so
+filters can be applied to a high-rate stream without allocating
+Python objects per frame.
+
+[info]
+pisat.sensor.Bno055
+"""
+
+from threading import Condition, Event, Thread
+import time
+from typing import Dict, Optional, Union
+
+import numpy as np
+
+from pisat.handler.handler_base import DataBrokenError
+from pisat.sensor.bno055 import Bno055Base
+from pisat.sensor.sensor_base import SensorBase
+
+
+class Bno055Sampler(SensorBase):
+    """A background sampler of BNO055 at a fixed rate.
+
+    Registers of BNO055 must not be accessed by other methods of
+    the sensor while sampling, because transactions of the sampling
+    thread and of the other methods are not serialized. The sensor
+    should be configured before 'start', or after 'stop'.
+
+    Examples
+    --------
+        >> sampler = Bno055Sampler(bno055, rate=100., size=512)
+        >> sampler.start()
+        >> model = sampler.read()              # the latest frame
+        >> window = sampler.read_window(200)   # the last 200 frames
+        >> window["acc"].mean(axis=0)
+        >> sampler.stop()
+
+    See Also
+    --------
+        pisat.sensor.Bno055 : Sensor to be sampled.
+    """
+
+    LEN_FRAME = Bno055Base.LEN_FRAME
+
+    KEY_TIMESTAMP = "timestamp"
+
+    RATE_DEFAULT = 100.
+    SIZE_DEFAULT = 256
+
+    # NOTE Periods waited for the first frame in 'read'.
+    COUNTS_PERIOD_FIRST = 5
+
+    def __init__(self,
+                 sensor: Bno055Base,
+                 rate: Union[int, float] = RATE_DEFAULT,
+                 size: int = SIZE_DEFAULT,
+                 name: Optional[str] = None) -> None:
+        """
+        Parameters
+        ----------
+            sensor : Bno055Base
+                Sensor to be sampled.
+            rate : Union[int, float], optional
+                Sampling rate in Hz, by default 100.
+            size : int, optional
+                Number of frames held in the ring buffer, by default 256.
+            name : Optional[str], optional
+                Name of the component, by default None.
+
+        Raises
+        ------
+            TypeError
+                Raised if 'sensor' is not Bno055Base.
+            ValueError
+                Raised if 'rate' or 'size' is not positive.
+        """
+        if not isinstance(sensor, Bno055Base):
+            raise TypeError(
+                "'sensor' must be Bno055Base."
+            )
+        if rate <= 0:
+            raise ValueError(
+                "'rate' must be larger than 0."
+            )
+        if size <= 0:
+            raise ValueError(
+                "'size' must be larger than 0."
+            )
+        super().__init__(name=name)
+
+        self._sensor: Bno055Base = sensor
+        self._rate: float = rate
+        self._size: int = size
+
+        # NOTE
+        #   The ring buffer is allocated once, and '_frames' is a view
+        #   of it as an array of frames to copy windows out of it.
+        self._ring: bytearray = bytearray(size * self.LEN_FRAME)
+        self._frames: np.ndarray = np.frombuffer(self._ring, dtype=np.uint8).reshape(size, self.LEN_FRAME)
+        self._timestamps: np.ndarray = np.zeros(size, dtype=np.float64)
+        self._counts_frame: int = 0
+        self._counts_error: int = 0
+        self._counts_overrun: int = 0
+
+        self._cond: Condition = Condition()
+        self._event_stop: Event = Event()
+        self._thread: Optional[Thread] = None
+
+        self._model: Optional[Bno055Base.DataModel] = None
+        self._counts_model: int = 0
+
+    @property
+    def sensor(self):
+        return self._sensor
+
+    @property
+    def rate(self):
+        return self._rate
+
+    @property
+    def size(self):
+        return self._size
+
+    @property
+    def running(self) -> bool:
+        thread = self._thread
+        return thread is not None and thread.is_alive()
+
+    @property
+    def counts_frame(self) -> int:
+        """Number of frames sampled since the sampler was created."""
+        return self._counts_frame
+
+    @property
+    def counts_error(self) -> int:
+        """Number of frames failed to be read."""
+        return self._counts_error
+
+    @property
+    def counts_overrun(self) -> int:
+        """Number of periods skipped because reading a frame took too long."""
+        return self._counts_overrun
+
+    def __len__(self):
+        with self._cond:
+            return min(self._counts_frame, self._size)
+
+    def start(self) -> None:
+        """Start sampling in background.
+        """
+        if self.running:
+            return
+        self._event_stop.clear()
+        self._thread = Thread(target=self._sample, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop sampling and wait the thread.
+
+        Parameters
+        ----------
+            timeout : Optional[float], optional
+                Timeout of waiting the thread in seconds, by default None.
+        """
+        with self._cond:
+            self._event_stop.set()
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def clear(self) -> None:
+        """Discard sampled frames.
+        """
+        with self._cond:
+            self._counts_frame = 0
+            self._model = None
+            self._counts_model = 0
+
+    def wait(self, counts: int = 1, timeout: Optional[float] = None) -> bool:
+        """Block until given number of frames are sampled in total.
+
+        Parameters
+        ----------
+            counts : int, optional
+                Number of frames to be waited, by default 1.
+            timeout : Optional[float], optional
+                Timeout in seconds, by default None.
+
+        Returns
+        -------
+            bool
+                True if the frames have been sampled, False if timeout.
+        """
+        with self._cond:
+            return self._cond.wait_for(lambda: self._counts_frame >= counts, timeout=timeout)
+
+    def _sample(self) -> None:
+        period = 1 / self._rate
+        time_next = time.monotonic()
+
+        while not self._event_stop.is_set():
+            try:
+                raw = self._sensor._retreive_data()
+                timestamp = time.monotonic()
+                if len(raw) != self.LEN_FRAME:
+                    raise DataBrokenError(
+                        "Invalid length of a frame."
+                    )
+                with self._cond:
+                    index = self._counts_frame % self._size
+                    head = index * self.LEN_FRAME
+                    self._ring[head:head + self.LEN_FRAME] = raw
+                    self._timestamps[index] = timestamp
+                    self._counts_frame += 1
+                    self._cond.notify_all()
+            except Exception:
+                self._counts_error += 1
+
+            # NOTE
+            #   Periods are scheduled from the beginning to avoid drift,
+            #   and skipped if the thread has been too late.
+            time_next += period
+            remain = time_next - time.monotonic()
+            if remain < 0:
+                skipped = int(-remain // period)
+                self._counts_overrun += skipped
+                time_next += skipped * period
+                remain += skipped * period
+            self._event_stop.wait(max(remain, 0))
+
+    def read(self) -> Bno055Base.DataModel:
+        """Read the data model of the latest frame.
+
+        If no frame has been sampled yet, a frame is read from the sensor
+        directly when the sampler is not running, or the first frame is
+        waited for COUNTS_PERIOD_FIRST periods when it is running. If no
+        frame is sampled in the periods, for example because every read
+        of the sampling thread fails, a frame is read from the sensor
+        directly, so its error is raised. The latest frame is decoded
+        only once even if this method is called faster than the
+        sampling rate.
+
+        Returns
+        -------
+            Bno055Base.DataModel
+                Data model of the sensor.
+        """
+        with self._cond:
+            if self._counts_frame == 0 and self.running:
+                self._cond.wait_for(lambda: self._counts_frame > 0 or self._event_stop.is_set(),
+                                    timeout=self.COUNTS_PERIOD_FIRST / self._rate)
+            counts = self._counts_frame
+            if counts > 0:
+                if self._model is not None and self._counts_model == counts:
+                    return self._model
+                head = ((counts - 1) % self._size) * self.LEN_FRAME
+                raw = bytes(self._ring[head:head + self.LEN_FRAME])
+
+        if counts == 0:
+            return self._sensor.read()
+
+        model = self._sensor._decode_data(raw)
+        with self._cond:
+            if counts >= self._counts_model:
+                self._model = model
+                self._counts_model = counts
+        return model
+
+    def read_raw_window(self, n: int) -> np.ndarray:
+        """Copy the last raw frames out of the ring buffer.
+
+        Parameters
+        ----------
+            n : int
+                Number of frames, which must not be larger than 'size'.
+
+        Returns
+        -------
+            np.ndarray
+                Raw frames as uint8 of the shape (m, 45) from the oldest
+                to the latest, where m is 'n' or less if fewer frames
+                have been sampled.
+        """
+        return self._copy_window(n)[0]
+
+    def read_window(self, n: int) -> Dict[str, np.ndarray]:
+        """Decode the last frames into arrays.
+
+        Parameters
+        ----------
+            n : int
+                Number of frames, which must not be larger than 'size'.
+
+        Returns
+        -------
+            Dict[str, np.ndarray]
+                Arrays indexed by names of data of BNO055, from the oldest
+                frame to the latest. Vectors are of the shape (m, 3) or
+                (m, 4) for 'quat', where m is 'n' or less if fewer frames
+                have been sampled. 'temp' and 'timestamp' are of the shape
+                (m, ). 'timestamp' is given by time.monotonic().
+        """
+        frames, timestamps = self._copy_window(n)
+        window = self.decode(frames)
+        window[self.KEY_TIMESTAMP] = timestamps
+        return window
+
+    def _copy_window(self, n: int):
+        if n < 0 or n > self._size:
+            raise ValueError(
+                "'n' must be between 0 and 'size'."
+            )
+
+        with self._cond:
+            n = min(n, self._counts_frame)
+            begin = (self._counts_frame - n) % self._size
+            end = begin + n
+            if end <= self._size:
+                return self._frames[begin:end].copy(), self._timestamps[begin:end].copy()
+            else:
+                end -= self._size
+                return (np.concatenate((self._frames[begin:], self._frames[:end])),
+                        np.concatenate((self._timestamps[begin:], self._timestamps[:end])))
+
+    def decode(self, frames: np.ndarray) -> Dict[str, np.ndarray]:
+        """Decode raw frames into arrays with the current units of the sensor.
+
+        Parameters
+        ----------
+            frames : np.ndarray
+                Raw frames as uint8, whose length of the last axis is 45.
+
+        Returns
+        -------
+            Dict[str, np.ndarray]
+                Arrays indexed by names of data of BNO055.
+                Arrays of vectors are views of one array.
+        """
+        return Bno055Base.decode_frames(frames, self._sensor._calc_divisors())
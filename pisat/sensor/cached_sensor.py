@@ -0,0 +1,278 @@
+#! python3
+
+"""
+
+pisat.sensor.cached_sensor
+~~~~~~~~~~~~~~~~~~~~~~~~~~
+A wrapper of a sensor which caches the last data model.
+This class keeps the last data model of a sensor for a time to live
+(TTL). After the TTL expires, the stale model is returned at once
+and a new one is read in background, which is known as the
+stale-while-revalidate policy. So a fast loop like Node.judge never
+blocks on a slow device like Opt3002, HcSr04 or a GPS receiver, and
+the policy can be configured per sensor without changing the driver.
+
+Models returned are the ones of the wrapped sensor as they are,
+so the wrapper can be used in SensorGroup and DataLogger with
+linked data models of the wrapped sensor. If 'stamp' is True, each
+model is wrapped with the time when it was read, which is logged as
+'<publisher>-timestamp' together with the data of the model.
+
+[info]
+pisat.sensor.SensorBase
+"""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+import time
+from threading import Lock
+from typing import Any, Dict, Optional, Union
+
+from pisat.model.datamodel import DataModelBase, Loggable, loggable
+from pisat.sensor.sensor_base import SensorBase
+
+
+class CachedSensor(SensorBase):
+    """A wrapper of a sensor which caches the last data model.
+
+    Examples
+    --------
+        >> opt3002 = CachedSensor(Opt3002(handler, name="opt3002"), ttl=0.8)
+        >> model = opt3002.read()    # blocks only for the first time
+        >> model = opt3002.read()    # returns the cache while fresh
+        >> opt3002.age               # seconds since the model was read
+        >>
+        >> opt3002 = CachedSensor(Opt3002(handler, name="opt3002"), ttl=0.8, stamp=True)
+        >> model = opt3002.read()
+        >> model.lux                 # data of the wrapped model
+        >> model.timestamp           # time when this model was read
+
+    See Also
+    --------
+        pisat.sensor.SensorBase : Sensor to be wrapped.
+    """
+
+    THREAD_MAX_WORKERS = 1
+
+    class DataModel(DataModelBase):
+        """Data model of the wrapped sensor with the time when it was read.
+
+        Attributes other than 'timestamp' and 'model' are the ones of
+        the wrapped model, and 'extract' returns the data of the wrapped
+        model and the timestamp.
+        """
+
+        def setup(self, model: DataModelBase, timestamp: float):
+            self._model = model
+            self._timestamp = timestamp
+
+        @property
+        def model(self) -> DataModelBase:
+            return self._model
+
+        @loggable
+        def timestamp(self):
+            """Time when the model was read, given by time.monotonic()."""
+            return self._timestamp
+
+        @property
+        def age(self) -> float:
+            return time.monotonic() - self._timestamp
+
+        def extract(self) -> Dict[str, Loggable]:
+            result = self._model.extract()
+            result.update(super().extract())
+            return result
+
+        def __getattr__(self, name: str) -> Any:
+            # NOTE Called only if the attribute is not found in this model.
+            if name == "_model":
+                raise AttributeError(name)
+            return getattr(self._model, name)
+
+    def __init__(self,
+                 sensor: SensorBase,
+                 ttl: Union[int, float],
+                 revalidate: bool = True,
+                 stamp: bool = False,
+                 name: Optional[str] = None) -> None:
+        """
+        Parameters
+        ----------
+            sensor : SensorBase
+                Sensor to be wrapped.
+            ttl : Union[int, float]
+                Time to live of a data model in seconds.
+            revalidate : bool, optional
+                If True, an expired model is returned and a new one is read
+                in background, by default True. If False, a new model is read
+                in 'read' when the cache has expired.
+            stamp : bool, optional
+                If True, models are returned as CachedSensor.DataModel with
+                the time when they were read, by default False.
+            name : Optional[str], optional
+                Name of the component, by default None.
+
+        Raises
+        ------
+            TypeError
+                Raised if 'sensor' is not SensorBase.
+            ValueError
+                Raised if 'ttl' is negative.
+        """
+        if not isinstance(sensor, SensorBase):
+            raise TypeError(
+                "'sensor' must be SensorBase."
+            )
+        super().__init__(name=name)
+
+        self._sensor: SensorBase = sensor
+        self.ttl = ttl
+        self._stamp: bool = stamp
+        self._revalidate: bool = revalidate
+
+        self._lock: Lock = Lock()
+        self._model: Optional[DataModelBase] = None
+        self._timestamp: Optional[float] = None
+        self._invalidated: bool = False
+        self._future: Optional[Future] = None
+        self._error: Optional[BaseException] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        if revalidate:
+            self._executor = ThreadPoolExecutor(max_workers=self.THREAD_MAX_WORKERS)
+
+    @property
+    def sensor(self):
+        return self._sensor
+
+    @property
+    def ttl(self):
+        return self._ttl
+
+    @ttl.setter
+    def ttl(self, val: Union[int, float]):
+        if not isinstance(val, (int, float)):
+            raise TypeError(
+                "'ttl' must be int or float."
+            )
+        if val < 0:
+            raise ValueError(
+                "'ttl' must be no less than 0."
+            )
+        self._ttl = val
+
+    @property
+    def revalidate(self):
+        return self._revalidate
+
+    @property
+    def stamp(self):
+        return self._stamp
+
+    @property
+    def timestamp(self) -> Optional[float]:
+        """Time when the cached model was read, given by time.monotonic()."""
+        return self._timestamp
+
+    @property
+    def age(self) -> Optional[float]:
+        """Seconds since the cached model was read, or None if no model is cached.
+
+        The cached model can be replaced by a background read after 'read',
+        so the age of a returned model should be given by the model with
+        'stamp' enabled.
+        """
+        timestamp = self._timestamp
+        if timestamp is None:
+            return None
+        return time.monotonic() - timestamp
+
+    @property
+    def expired(self) -> bool:
+        age = self.age
+        return age is None or age >= self._ttl or self._invalidated
+
+    @property
+    def refreshing(self) -> bool:
+        """Whether the model is being read in background."""
+        future = self._future
+        return future is not None and not future.done()
+
+    def read(self) -> DataModelBase:
+        """Read the cached model.
+
+        If no model is cached, this method blocks until a model is read.
+        If the cache has expired, the stale model is returned and a new one
+        is read in background when 'revalidate' is True.
+
+        Returns
+        -------
+            DataModelBase
+                Data model of the wrapped sensor, or CachedSensor.DataModel
+                if 'stamp' is True.
+
+        Raises
+        ------
+            Exception
+                An exception raised in the last background read, if any.
+        """
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+        if self._model is None:
+            return self.refresh()
+        if self.expired:
+            if self._revalidate:
+                self._submit()
+            else:
+                return self.refresh()
+        return self._model
+
+    def refresh(self) -> DataModelBase:
+        """Read a new model from the wrapped sensor and cache it.
+
+        Returns
+        -------
+            DataModelBase
+                New data model of the wrapped sensor, or CachedSensor.DataModel
+                if 'stamp' is True.
+        """
+        return self._store(self._sensor.read())
+
+    def invalidate(self) -> None:
+        """Make the cache expire so that a new model is read at the next 'read'.
+        """
+        self._invalidated = True
+
+    def close(self) -> None:
+        """Wait the background read and stop the thread.
+        """
+        if self._executor is not None:
+            self._revalidate = False
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def _store(self, model: DataModelBase) -> DataModelBase:
+        timestamp = time.monotonic()
+        if self._stamp:
+            stamped = self.DataModel(model.publisher)
+            stamped.setup(model, timestamp)
+            model = stamped
+
+        with self._lock:
+            self._model = model
+            self._timestamp = timestamp
+            self._invalidated = False
+        return model
+
+    def _submit(self) -> None:
+        with self._lock:
+            if self._future is not None and not self._future.done():
+                return
+            self._future = self._executor.submit(self._refresh_background)
+
+    def _refresh_background(self) -> None:
+        try:
+            self.refresh()
+        except Exception as e:
+            self._error = e
@@ -4,6 +4,7 @@ from typing import Optional, Union
 
 from pisat.handler.digital_input_handler_base import DigitalInputHandlerBase
 from pisat.handler.digital_output_handler_base import DigitalOutputHandlerBase
+from pisat.handler.edge_capture import EdgeCapture
 from pisat.model.datamodel import DataModelBase, loggable
 from pisat.sensor.sensor_base import SensorBase
 
@@ -27,16 +28,61 @@ class HcSr04(SensorBase):
     # m/s at 15 celsius deg
     VELOCITY_SOUND_AIR = 340.65
     
+    # sec
+    # NOTE An echo pulse is 38 ms at most even if no obstacle is found.
+    TIME_ECHO_MAX = 0.038
+    
+    # sec
+    # NOTE An echo pulse starts about 0.5 ms after a trigger, with some margin.
+    TIME_LATENCY_TRIGGER = 0.002
+    
     def __init__(self,
                  input: DigitalInputHandlerBase,
                  output: DigitalOutputHandlerBase,
                  timeout: float = -1.,
+                 nonblock: bool = False,
                  name: Optional[str] = None) -> None:
+        """
+        Parameters
+        ----------
+            input : DigitalInputHandlerBase
+                Handler of the echo pin.
+            output : DigitalOutputHandlerBase
+                Handler of the trigger pin.
+            timeout : float, optional
+                Timeout of an echo in seconds, by default -1. 
+                If negative, waits an echo for TIME_ECHO_MAX after the 
+                latency of the trigger.
+            nonblock : bool, optional
+                If True, 'read' returns the last measurement and triggers 
+                the next one without waiting the echo, by default False.
+            name : Optional[str], optional
+                Name of the component, by default None.
+                
+        Raises
+        ------
+            ValueError
+                Raised if 'nonblock' is True and 'input' doesn't support callbacks.
+        """
         super().__init__(name=name)
         
         self._handler_input = input
         self._handler_output = output
         self._timeout = timeout
+        self._nonblock = nonblock
+        self._triggered = False
+        
+        # NOTE
+        #   Handlers which don't implement callbacks can't be captured,
+        #   so echoes are observed by polling as fallback.
+        self._capture: Optional[EdgeCapture] = None
+        if type(input).set_callback is not DigitalInputHandlerBase.set_callback:
+            self._capture = EdgeCapture(input)
+            self._capture.start()
+        elif nonblock:
+            raise ValueError(
+                "'nonblock' requires 'input' which supports callbacks."
+            )
         
     @property
     def timeout(self):
@@ -50,26 +96,93 @@ class HcSr04(SensorBase):
             )
         self._timeout = val
         
+    @property
+    def nonblock(self):
+        return self._nonblock
+    
+    @property
+    def ready(self) -> bool:
+        """Whether an echo of the last trigger has been captured."""
+        if self._capture is None:
+            return False
+        return self._capture.pulse_width() is not None
+        
     def read(self):
-        dist = self._read_distance(self._timeout)
+        if self._nonblock:
+            dist = None
+            if self._triggered and self.ready:
+                dist = self.collect_distance(timeout=0)
+            self.trigger()
+        else:
+            dist = self._read_distance(self._timeout)
         
         model = self.DataModel(self.name)
         model.setup(dist)
         return model
+    
+    def trigger(self) -> None:
+        """Output a trigger pulse without waiting its echo.
         
-    def _read_distance(self, timeout: float = -1.) -> Optional[float]:
+        The echo is captured in background and can be collected later 
+        by 'collect' or 'collect_distance', so other sensors can be read 
+        during the echo. If the echo pin can't be captured, this method 
+        only outputs the pulse.
+        """
+        if self._capture is not None:
+            self._capture.clear()
         self._output_pulse()
-        time_echo = self._observe_time_echo(timeout=timeout)
+        self._triggered = True
+        
+    def collect(self, timeout: Optional[float] = None):
+        """Collect the echo of the last trigger as a DataModel.
+
+        Parameters
+        ----------
+            timeout : Optional[float], optional
+                Timeout in seconds, by default None. If None, the timeout 
+                given in the constructor is used.
+
+        Returns
+        -------
+            HcSr04.DataModel
+                Data model whose 'dist' is None if no echo is captured.
+        """
+        model = self.DataModel(self.name)
+        model.setup(self.collect_distance(timeout=timeout))
+        return model
+        
+    def collect_distance(self, timeout: Optional[float] = None) -> Optional[float]:
+        if timeout is None:
+            timeout = self._timeout
+        if not self._triggered:
+            return None
+        if timeout < 0:
+            timeout = self.TIME_LATENCY_TRIGGER + self.TIME_ECHO_MAX
+        
+        if self._capture is None:
+            time_echo = self._observe_time_echo(timeout=timeout)
+        else:
+            width = self._capture.wait_pulse(level=True, timeout=timeout)
+            time_echo = None if width is None else width * 1e-6
+        
+        self._triggered = False
         if time_echo is None:
             return None
         else:
             return time_echo * self.VELOCITY_SOUND_AIR / 2
+        
+    def _read_distance(self, timeout: float = -1.) -> Optional[float]:
+        self.trigger()
+        return self.collect_distance(timeout=timeout)
     
     def _output_pulse(self) -> None:
         self._handler_output.set_high()
         time.sleep(self.TIME_OUTPUT_PULSE)
         self._handler_output.set_low()
         
+    def close(self) -> None:
+        if self._capture is not None:
+            self._capture.stop()
         
     def _observe_time_echo(self, timeout: float = -1.) -> Optional[float]:
         time_temp = time.time()
@@ -1,7 +1,10 @@
 
 
+import time
+from threading import Lock
 from typing import Optional, Tuple, Union
 
+from pisat.handler.digital_input_handler_base import DigitalInputHandlerBase
 from pisat.handler.i2c_handler_base import I2CHandlerBase
 from pisat.model.datamodel import DataModelBase, loggable
 from pisat.sensor.sensor_base import SensorBase
@@ -14,13 +17,19 @@ class Opt3002(SensorBase):
     
     class DataModel(DataModelBase):
         
-        def setup(self, irr: float):
+        def setup(self, irr: float, timestamp: Optional[float] = None):
             self._irr = irr
+            self._timestamp = timestamp
             
         @loggable
         def irradiance(self):
             return self._irr
         
+        @loggable
+        def timestamp(self):
+            """Time when the conversion was completed, given by time.time()."""
+            return self._timestamp
+        
     
     class AddrI2C:
         GND = 0b1000100
@@ -56,7 +65,7 @@ class Opt3002(SensorBase):
         
         @classmethod
         def parse_optical_power(cls, data: float) -> Tuple[int]:
-            data = cls.WEIGHT_OPTICAL_POWER
+            data = data / cls.WEIGHT_OPTICAL_POWER
             
             # decide exponent
             exponent = cls.MIN_EXPONENT
@@ -79,7 +88,7 @@ class Opt3002(SensorBase):
         @classmethod
         def parse_raw_data(cls, data: Union[bytes, bytearray]) -> Tuple[int]:
             raw_data = data[0] << 8 | data[1]
-            exponent = raw_data & cls.BIT_EXPONENT
+            exponent = (raw_data & cls.BIT_EXPONENT) >> 12
             mantissa = raw_data & (cls.BIT_MANTISSA_MSB | cls.BIT_MANTISSA_LSB)
             return (exponent, mantissa)
         
@@ -122,6 +131,11 @@ class Opt3002(SensorBase):
         FAULT_COUNT_4 = 0b10
         FAULT_COUNT_8 = 0b11
         
+        # NOTE 
+        #   Exponent bits of the low limit register which make the INT pin 
+        #   report the end of every conversion.
+        LIMIT_LOW_END_OF_CONVERSION = b"\xc0\x00"
+        
         def __init__(self) -> None:            
             self._range_number: int = 0
             self._conversion_time: int = 0
@@ -160,7 +174,7 @@ class Opt3002(SensorBase):
             
             # make byte of upper
             upper |= self._range_number << 4
-            upper |= self._conversion_time << 2
+            upper |= self._conversion_time << 3
             upper |= self._conversion_ope_mode << 1
             upper |= self._flag_overflow
             
@@ -262,14 +276,117 @@ class Opt3002(SensorBase):
         self._handler: I2CHandlerBase = handler
         self._config = self.Config()
         
+        self._continuous: bool = False
+        self._pin: Optional[DigitalInputHandlerBase] = None
+        self._lock: Lock = Lock()
+        self._ready: bool = False
+        self._timestamp_ready: Optional[float] = None
+        self._model: Optional[Opt3002.DataModel] = None
+        
+    @property
+    def continuous(self) -> bool:
+        return self._continuous
+        
     def read(self):
+        if self._continuous:
+            return self._read_continuous()
+        
         exponent, mantissa = self._read_raw_data()
         irr = self.Data.calc_optical_power(exponent, mantissa)
         
         model = self.DataModel(self.name)
-        model.setup(irr)
+        model.setup(irr, timestamp=time.time())
         return model
     
+    def _read_continuous(self):
+        timestamp = self._poll_ready()
+        if timestamp is None and self._model is not None:
+            return self._model
+        if timestamp is None:
+            timestamp = time.time()
+        
+        exponent, mantissa = self._read_raw_data()
+        model = self.DataModel(self.name)
+        model.setup(self.Data.calc_optical_power(exponent, mantissa), timestamp=timestamp)
+        self._model = model
+        return model
+    
+    def _poll_ready(self) -> Optional[float]:
+        if self._pin is None:
+            # NOTE Reading the configuration register clears the flag.
+            if self.load_config().conversion_ready:
+                return time.time()
+            return None
+        
+        with self._lock:
+            if not self._ready:
+                return None
+            self._ready = False
+            timestamp = self._timestamp_ready
+        
+        # NOTE The INT pin is latched until the configuration register is read.
+        self.load_config()
+        return timestamp
+    
+    def _on_ready(self, level: bool, tick: int) -> None:
+        with self._lock:
+            self._ready = True
+            self._timestamp_ready = time.time()
+            
+    def start_continuous(self, 
+                         conv_time: int = Config.CONVERSION_TIME_800,
+                         pin: Optional[DigitalInputHandlerBase] = None) -> None:
+        """Start continuous conversions.
+        
+        In the continuous mode, 'read' fetches the result only when 
+        a new conversion has been completed and otherwise returns the 
+        last data model, so stale conversions are never read over the 
+        bus again. The completion is known from the conversion ready 
+        flag of the configuration register, or from the INT pin if 
+        its handler is given. The timestamp of a model is the time 
+        when the completion is detected.
+        
+        NOTE 
+            If 'pin' is given, the low limit register is overwritten 
+            to make the INT pin report the end of every conversion.
+
+        Parameters
+        ----------
+            conv_time : int, optional
+                Conversion time, by default Config.CONVERSION_TIME_800.
+            pin : Optional[DigitalInputHandlerBase], optional
+                Handler of the pin connected with the INT pin, by default None.
+        """
+        if pin is not None and not isinstance(pin, DigitalInputHandlerBase):
+            raise TypeError(
+                "'pin' must be DigitalInputHandlerBase."
+            )
+        
+        self.load_config()
+        if pin is not None:
+            self._handler.write(self.Reg.LIMIT_LOW, self.Config.LIMIT_LOW_END_OF_CONVERSION)
+            edge = DigitalInputHandlerBase.Edge.FALLING
+            if self._config.polarity == self.Config.POLARITY_ACTIVE_HIGH:
+                edge = DigitalInputHandlerBase.Edge.RISING
+            pin.set_callback(self._on_ready, edge=edge)
+        
+        self._pin = pin
+        self._ready = False
+        self._model = None
+        self._continuous = True
+        self.set_config(conv_time=conv_time, 
+                        conv_mode=self.Config.CONVERSION_MODE_CONTINUOUS_1, 
+                        latche=self.Config.LATCH_WINDOW)
+        
+    def stop_continuous(self) -> None:
+        """Stop continuous conversions and shut the sensor down.
+        """
+        self.set_config(conv_mode=self.Config.CONVERSION_MODE_SHUTDOWN)
+        if self._pin is not None:
+            self._pin.clear_callback()
+        self._pin = None
+        self._continuous = False
+    
     @cached_property
     def id(self) -> int:
         while True:
@@ -277,7 +394,7 @@ class Opt3002(SensorBase):
             if count == 2:
                 break
             
-        return (data[0] << 7) | data[1]
+        return (data[0] << 8) | data[1]
     
     def _read_raw_data(self) -> Tuple[int]:
         count, data = self._handler.read(self.Reg.RESULT, self.Reg.LEN_BYTE)
@@ -1,23 +1,276 @@
 
-from typing import Optional, Tuple, Union
+import time
+from threading import Condition
+from typing import Dict, Optional, Tuple, Union
 
 from pisat.handler.i2c_handler_base import I2CHandlerBase
 from pisat.handler.serial_handler_base import SerialHandlerBase
 from pisat.model.datamodel import DataModelBase, loggable
 from pisat.sensor.sensor_base import HandlerMismatchError, SensorBase
 from pisat.sensor.serial_gps import SerialGPS
+from pisat.util.nmea import NMEAFix, NMEAStreamDecoder
+from pisat.util.ubx import ACKModel, NAVPVTModel, UBXConfig, UBXParser, UBXStreamDecoder
 
 
-class UARTSamM8Q(SerialGPS):
-    pass
+class DDCHandler(SerialHandlerBase):
+    """DDC port of u-blox receivers as a serial port.
+    
+    DDC is the I2C compatible interface of u-blox receivers. The number 
+    of bytes available is read from the registers 0xFD and 0xFE, and the 
+    stream is read from the register 0xFF in bulk, so the bus is used 
+    only for bytes actually received. As a SerialHandlerBase, this class 
+    is buffered in the same way as UART and can feed the same decoders.
+    """
+    
+    REG_COUNTS = 0xFD
+    REG_STREAM = 0xFF
+    MAX_LEN_READ = 32
+    
+    # sec
+    # NOTE Polling costs a transaction on the bus, so the interval is longer than UART.
+    INTERVAL_POLL = 0.02
+    
+    def __init__(self, 
+                 handler: I2CHandlerBase,
+                 name: Optional[str] = None) -> None:
+        if not isinstance(handler, I2CHandlerBase):
+            raise TypeError(
+                "'handler' must be I2CHandlerBase."
+            )
+        super().__init__(f"i2c-{handler.bus}:{handler.address:#x}", 0, name=name)
+        
+        self._handler: I2CHandlerBase = handler
+        self._max_len_read: int = getattr(handler, "MAX_LEN_READ", self.MAX_LEN_READ)
+        
+    @property
+    def handler(self):
+        return self._handler
+    
+    def _counts_pending(self) -> int:
+        # NOTE The address is incremented from 0xFD to 0xFE in a read.
+        count, raw = self._handler.read(self.REG_COUNTS, 2)
+        if count != 2:
+            return 0
+        return (raw[0] << 8) | raw[1]
+    
+    def _read_pending(self, count: int) -> bytes:
+        result = bytearray()
+        while len(result) < count:
+            size, raw = self._handler.read(self.REG_STREAM, min(count - len(result), self._max_len_read))
+            if size <= 0:
+                break
+            result.extend(raw[:size])
+        return bytes(result)
+    
+    def write(self, data: Union[bytes, bytearray]) -> None:
+        # NOTE 
+        #   A write of more than one byte is regarded as a message, so 
+        #   the first byte of each chunk is given as the register. A chunk 
+        #   of one byte would set the register address, so it is avoided.
+        size = self._max_len_read + 1
+        chunks = [data[i:i + size] for i in range(0, len(data), size)]
+        if len(chunks) > 1 and len(chunks[-1]) == 1:
+            chunks[-1] = chunks[-2][-1:] + chunks[-1]
+            chunks[-2] = chunks[-2][:-1]
+        for chunk in chunks:
+            self._handler.write(chunk[0], bytes(chunk[1:]))
 
 
-# TODO I2C ver.
-class I2CSamM8Q(SensorBase):
-    pass
+class SamM8QBase(SerialGPS):
+    """Base class of SAM-M8Q.
+    
+    Both NMEA sentences and UBX frames are decoded from the stream, so 
+    the module can be switched to the binary output by 'set_binary_output' 
+    on the fly. A UBX-NAV-PVT frame is merged into the fix like NMEA 
+    sentences, and the last one is also available as 'pvt'.
+    """
+    
+    PORT = UBXConfig.Port.UART1
+    
+    # sec
+    TIMEOUT_ACK = 1.
+    
+    # knots per m/s
+    KNOTS_PER_MPS = 3600 / 1852
+    
+    def __init__(self,
+                 handler: SerialHandlerBase,
+                 background: bool = True,
+                 name: Optional[str] = None) -> None:
+        super().__init__(handler, background=False, name=name)
+        
+        self._decoder_nmea: NMEAStreamDecoder = NMEAStreamDecoder(self._parser)
+        self._decoder_ubx: UBXStreamDecoder = UBXStreamDecoder(UBXParser(self.name))
+        self._pvt: Optional[NAVPVTModel] = None
+        self._cond_ack: Condition = Condition()
+        self._acks: Dict[Tuple[int, int], bool] = {}
+        
+        if background:
+            self.start()
+            
+    @property
+    def pvt(self) -> Optional[NAVPVTModel]:
+        """The last UBX-NAV-PVT received."""
+        return self._pvt
+    
+    def _feed(self, chunk: bytes) -> None:
+        # NOTE 
+        #   Both decoders skip bytes of the other protocol, so they can 
+        #   share the same chunks.
+        for data in self._decoder_nmea.feed(chunk):
+            self._merge(data)
+        for data in self._decoder_ubx.feed(chunk):
+            self._merge(data)
+            
+    def _run(self) -> None:
+        for chunk in self._iter_chunks():
+            self._feed(chunk)
+            
+    def _poll(self) -> None:
+        self._feed(self._handler.read_available(timeout=self.TIMEOUT_READ))
+            
+    def _merge(self, data) -> bool:
+        if isinstance(data, NAVPVTModel):
+            with self._lock:
+                self._pvt = data
+                self.merge_pvt(self._fix, data, time.time())
+            self._event_update.set()
+            return True
+        elif isinstance(data, ACKModel):
+            with self._cond_ack:
+                self._acks[(data.cls_acked, data.id_acked)] = data.acknowledged
+                self._cond_ack.notify_all()
+            return False
+        else:
+            return super()._merge(data)
+        
+    @classmethod
+    def merge_pvt(cls, fix: NMEAFix, pvt: NAVPVTModel, timestamp: float) -> None:
+        """Merge UBX-NAV-PVT into a fix built from NMEA sentences.
+        """
+        if pvt.valid_time:
+            fix.time_utc = pvt.time_utc
+        if pvt.valid_date:
+            day, month, year = pvt.date_utc
+            fix.date_utc = (day, month, year % 100)
+        
+        fix.satellites_used = pvt.num_SV
+        fix.PDOP = pvt.PDOP
+        fix.timestamp_dop = timestamp
+        
+        fix_type = pvt.fix_type
+        if fix_type in (NAVPVTModel.FixType.FIX_3D.value, NAVPVTModel.FixType.GNSS_DEAD_RECKONING.value):
+            fix.fix_type = "3"
+        elif fix_type == NAVPVTModel.FixType.FIX_2D.value:
+            fix.fix_type = "2"
+        else:
+            fix.fix_type = "1"
+            
+        if pvt.gnss_fix_ok:
+            fix.quality = 1
+            fix.status = "A"
+            fix.latitude = pvt.latitude
+            fix.longitude = pvt.longitude
+            fix.altitude = pvt.altitude
+            fix.timestamp_position = timestamp
+            fix.speed_knots = pvt.ground_speed * cls.KNOTS_PER_MPS
+            fix.true_course = pvt.heading
+            fix.timestamp_velocity = timestamp
+        else:
+            fix.quality = 0
+            fix.status = "V"
+        fix.timestamp = timestamp
+        
+    def send_config(self, frame: bytes, timeout: float = TIMEOUT_ACK) -> bool:
+        """Write a UBX-CFG frame and wait for its acknowledgement.
+
+        Parameters
+        ----------
+            frame : bytes
+                Frame built by pisat.util.ubx.UBXConfig.
+            timeout : float, optional
+                Timeout to wait the acknowledgement in seconds, by default 1.
+
+        Returns
+        -------
+            bool
+                True if UBX-ACK-ACK is received, False if UBX-ACK-NAK 
+                is received or timeout.
+        """
+        key = (frame[2], frame[3])
+        with self._cond_ack:
+            self._acks.pop(key, None)
+        self._handler.write(frame)
+        
+        deadline = time.time() + timeout
+        while True:
+            with self._cond_ack:
+                if key in self._acks:
+                    return self._acks.pop(key)
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    return False
+                if self.background:
+                    self._cond_ack.wait(remaining)
+                    continue
+            self._feed(self._handler.read_available(timeout=min(remaining, self.TIMEOUT_READ)))
+        
+    def set_binary_output(self, 
+                          rate: Union[int, float] = 1, 
+                          timeout: float = TIMEOUT_ACK) -> bool:
+        """Switch the port to output only UBX-NAV-PVT at the rate.
 
+        Parameters
+        ----------
+            rate : Union[int, float], optional
+                Navigation rate in Hz, by default 1.
+            timeout : float, optional
+                Timeout to wait each acknowledgement in seconds, by default 1.
+
+        Returns
+        -------
+            bool
+                True if all configurations are acknowledged.
+        """
+        frames = UBXConfig.build_binary_output(rate=rate, 
+                                               port=self.PORT, 
+                                               baudrate=self._handler.baudrate)
+        return all([self.send_config(frame, timeout=timeout) for frame in frames])
+
+
+class UARTSamM8Q(SamM8QBase):
+    """SAM-M8Q connected via UART."""
+    
+    PORT = UBXConfig.Port.UART1
+
+
+class I2CSamM8Q(SamM8QBase):
+    """SAM-M8Q connected via I2C.
+    
+    The DDC port is wrapped by DDCHandler, so the receiver shares the 
+    I2C bus with other sensors while the stream is decoded in the same 
+    way as UART.
+    """
+    
+    PORT = UBXConfig.Port.DDC
+    
+    def __init__(self,
+                 handler: I2CHandlerBase,
+                 background: bool = True,
+                 name: Optional[str] = None) -> None:
+        """
+        Parameters
+        ----------
+            handler : I2CHandlerBase
+                Handler of the I2C address of the receiver, 0x42 by default.
+            background : bool, optional
+                If True, the stream is read by a background thread, by default True.
+            name : Optional[str], optional
+                Name of the component, by default None.
+        """
+        super().__init__(DDCHandler(handler), background=background, name=name)
+        
 
-# TODO I2C ver.
 class SamM8Q(SensorBase):
     
     class DataModel(DataModelBase):
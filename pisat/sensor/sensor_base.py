@@ -31,11 +31,21 @@ some logging classes like SensorController and DataLogger in order to
 execute retreiving data from multiple sensor objects, and in the logging 
 classes, sensors can be cooperated with sensors.
 
+A sensor can also support raw capture, which means it gives raw bytes 
+read from the hardware as they are with 'read_raw', and its class decodes 
+them later with 'decode_raw'. Classes supporting raw capture define 
+'ID_DECODER' and are registered as decoders of the ID automatically, 
+so captured data can be decoded offline only with the ID.
+
 [info]
 pisat.core.logger.SensorController
+pisat.core.logger.CaptureLogger
 """
 
-from typing import Optional
+import importlib
+from typing import Dict, Optional, Type
+
+import numpy as np
 
 from pisat.base.component import Component
 from pisat.model.datamodel import DataModelBase
@@ -69,7 +79,65 @@ class SensorBase(Component):
     This class is an abstract class of sensors. Subclasses of this class 
     must override the read method. More information, see the references of 
     this class.
+    
+    Subclasses supporting raw capture must define 'ID_DECODER' and override 
+    'read_raw' and 'decode_raw', and 'dump_context' if decoding needs 
+    calibration parameters or settings of the sensor.
     """
+    
+    # NOTE
+    #   ID of the decoder of raw frames of the sensor. A class defining
+    #   the ID is registered as the decoder in __init_subclass__, and its
+    #   subclasses share the decoder unless they define another ID.
+    ID_DECODER: Optional[str] = None
+    
+    _Decoders: Dict[str, Type["SensorBase"]] = {}
+    
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        
+        id_decoder = cls.__dict__.get("ID_DECODER")
+        if id_decoder is not None:
+            registered = SensorBase._Decoders.get(id_decoder)
+            # NOTE A class defined again, for example by reloading, can override itself.
+            if registered is not None and \
+                    (registered.__module__, registered.__qualname__) != (cls.__module__, cls.__qualname__):
+                raise ValueError(
+                    f"The decoder ID '{id_decoder}' has already been used by {registered.__name__}."
+                )
+            SensorBase._Decoders[id_decoder] = cls
+            
+    @classmethod
+    def get_decoder(cls, id_decoder: str) -> Type["SensorBase"]:
+        """Search the class registered as the decoder of the ID.
+
+        Parameters
+        ----------
+            id_decoder : str
+                ID of a decoder.
+
+        Returns
+        -------
+            Type[SensorBase]
+                Class of a sensor which decodes raw frames.
+
+        Raises
+        ------
+            ValueError
+                Raised if no class is registered with the ID.
+        """
+        decoder = SensorBase._Decoders.get(id_decoder)
+        if decoder is None:
+            # NOTE 
+            #   Decoders are registered when their drivers are imported, 
+            #   so the drivers are imported only if a decoder is not found.
+            importlib.import_module("pisat.sensor")
+            decoder = SensorBase._Decoders.get(id_decoder)
+        if decoder is None:
+            raise ValueError(
+                f"No decoder is registered with '{id_decoder}'."
+            )
+        return decoder
         
     def read(self) -> DataModelBase:
         """Read data of sensor.
@@ -83,4 +151,53 @@ class SensorBase(Component):
                 A data model which has retrieved data from the sensor.
         """
         pass
+    
+    def read_raw(self) -> bytes:
+        """Read a raw frame of the sensor without decoding.
+        
+        This method should only read registers of the hardware, 
+        and the frame can be decoded by 'decode_raw' of the class 
+        with the context given by 'dump_context'.
+
+        Returns
+        -------
+            bytes
+                Raw frame.
+        """
+        raise NotImplementedError(
+            f"{self.__class__.__name__} doesn't support raw capture."
+        )
+    
+    def dump_context(self) -> bytes:
+        """Dump parameters required to decode raw frames into bytes.
+        
+        For example, calibration parameters or units of the sensor.
+        The context should be dumped again if the parameters change.
+
+        Returns
+        -------
+            bytes
+                Context of decoding.
+        """
+        return b""
+    
+    @classmethod
+    def decode_raw(cls, frames: np.ndarray, context: bytes) -> Dict[str, np.ndarray]:
+        """Decode raw frames into arrays.
+
+        Parameters
+        ----------
+            frames : np.ndarray
+                Raw frames as uint8 of the shape (n, length of a frame).
+            context : bytes
+                Context given by 'dump_context'.
+
+        Returns
+        -------
+            Dict[str, np.ndarray]
+                Arrays of the length n indexed by names of data.
+        """
+        raise NotImplementedError(
+            f"{cls.__name__} doesn't support raw capture."
+        )
         
\ No newline at end of file
@@ -1,11 +1,13 @@
 
 
-from typing import Optional, Tuple, Union
+import time
+from threading import Event, Lock, Thread
+from typing import Iterator, Optional, Tuple, Union
 
 from pisat.handler.serial_handler_base import SerialHandlerBase
 from pisat.model.datamodel import DataModelBase, loggable
 from pisat.sensor.sensor_base import SensorBase
-from pisat.util.nmea import NMEAParser
+from pisat.util.nmea import NMEAFix, NMEAModelBase, NMEAParser, iter_nmea
 
 
 class SerialGPS(SensorBase):
@@ -15,17 +17,39 @@ class SerialGPS(SensorBase):
     FORMAT_RMC = "RMC"
     FORMAT_ZDA = "ZDA"
     
+    # NOTE 
+    #   Only formats merged into NMEAFix are parsed, so GSV sentences, 
+    #   which are the most frequent, are skipped before decoding.
+    FORMATS_FIX = ("GGA", "GLL", "GSA", "RMC", "VTG", "ZDA")
+    
+    # sec
+    TIMEOUT_READ = 0.1
+    
     class DataModel(DataModelBase):
         
         def setup(self, 
                   time_utc: Optional[Tuple[Union[int, float]]] = None,
                   latitude: Optional[float] = None,
                   longitude: Optional[float] = None,
-                  altitude: Optional[float] = None):
+                  altitude: Optional[float] = None,
+                  speed_knots: Optional[float] = None,
+                  true_course: Optional[float] = None,
+                  quality: Optional[int] = None,
+                  satellites_used: Optional[int] = None,
+                  HDOP: Optional[float] = None,
+                  fix_type: Optional[str] = None,
+                  age: Optional[float] = None):
             self._time_utc = time_utc
             self._latitude = latitude
             self._longitude = longitude
             self._altitude = altitude
+            self._speed_knots = speed_knots
+            self._true_course = true_course
+            self._quality = quality
+            self._satellites_used = satellites_used
+            self._HDOP = HDOP
+            self._fix_type = fix_type
+            self._age = age
         
         @loggable
         def time_utc(self):
@@ -50,11 +74,57 @@ class SerialGPS(SensorBase):
         @loggable
         def altitude(self):
             return self._altitude
+        
+        @loggable
+        def speed_knots(self):
+            return self._speed_knots
+        
+        @loggable
+        def true_course(self):
+            return self._true_course
+        
+        @loggable
+        def quality(self):
+            return self._quality
+        
+        @loggable
+        def satellites_used(self):
+            return self._satellites_used
+        
+        @loggable
+        def HDOP(self):
+            return self._HDOP
+        
+        @loggable
+        def fix_type(self):
+            return self._fix_type
+        
+        @loggable
+        def age(self):
+            """Seconds since the position was received."""
+            return self._age
     
     
     def __init__(self,
                  handler: SerialHandlerBase,
+                 background: bool = True,
                  name: Optional[str] = None) -> None:
+        """
+        Parameters
+        ----------
+            handler : SerialHandlerBase
+                Handler of the serial port connected with the receiver.
+            background : bool, optional
+                If True, sentences are read by a background thread and 
+                'read' returns the latest fix without blocking, by default True.
+            name : Optional[str], optional
+                Name of the component, by default None.
+
+        Raises
+        ------
+            TypeError
+                Raised if 'handler' is not SerialHandlerBase.
+        """
         if not isinstance(handler, SerialHandlerBase):
             raise TypeError(
                 "'handler' must be SerialHandlerBase."
@@ -62,31 +132,109 @@ class SerialGPS(SensorBase):
         super().__init__(name=name)
 
         self._handler: SerialHandlerBase = handler
-        self._parser: NMEAParser = NMEAParser(self.name)
+        self._parser: NMEAParser = NMEAParser(self.name, formats=self.FORMATS_FIX)
         
-    def read(self):
-        sentence = self._handler.readline()
+        self._fix: NMEAFix = NMEAFix()
+        self._lock: Lock = Lock()
+        self._event_stop: Event = Event()
+        self._event_update: Event = Event()
+        self._thread: Optional[Thread] = None
+        
+        if background:
+            self.start()
+            
+    @property
+    def background(self) -> bool:
+        return self._thread is not None
+    
+    @property
+    def fix(self) -> NMEAFix:
+        """Copy of the latest fix."""
+        with self._lock:
+            return self._fix.copy()
+            
+    def start(self) -> None:
+        """Start reading sentences in a background thread.
+        """
+        if self._thread is not None:
+            return
+        self._event_stop.clear()
+        self._thread = Thread(target=self._run, daemon=True)
+        self._thread.start()
+        
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop the background thread.
+
+        Parameters
+        ----------
+            timeout : Optional[float], optional
+                Timeout to join the thread in seconds, by default None.
+        """
+        if self._thread is None:
+            return
+        self._event_stop.set()
+        self._thread.join(timeout=timeout)
+        self._thread = None
+        
+    def close(self) -> None:
+        self.stop()
+        
+    def wait_update(self, timeout: Optional[float] = None) -> bool:
+        """Block until a sentence is merged into the fix.
+
+        Parameters
+        ----------
+            timeout : Optional[float], optional
+                Timeout in seconds, by default None.
+
+        Returns
+        -------
+            bool
+                True if the fix has been updated, False if timeout.
+        """
+        updated = self._event_update.wait(timeout=timeout)
+        self._event_update.clear()
+        return updated
+            
+    def _iter_chunks(self) -> Iterator[bytes]:
+        while not self._event_stop.is_set():
+            yield self._handler.read_available(timeout=self.TIMEOUT_READ)
+            
+    def _run(self) -> None:
+        for data in iter_nmea(self._iter_chunks(), self._parser):
+            self._merge(data)
+            
+    def _merge(self, data: NMEAModelBase) -> bool:
+        with self._lock:
+            updated = self._fix.update(data, timestamp=time.time())
+        if updated:
+            self._event_update.set()
+        return updated
+            
+    def _update(self, sentence: bytes) -> bool:
         data = self._parser.parse(sentence)
+        if data is None:
+            return False
+        return self._merge(data)
+        
+    def _poll(self) -> None:
+        self._update(self._handler.readline())
         
+    def read(self):
+        if self._thread is None:
+            self._poll()
+        
+        fix = self.fix
         model = self.DataModel(self.name)
-        if data is None:
-            model.setup()
-        elif data.type == self.FORMAT_GGA:
-            model.setup(time_utc=data.time_utc, 
-                        latitude=data.latitude,
-                        longitude=data.longitude,
-                        altitude=data.altitude)
-        elif data.type == self.FORMAT_GLL:
-            model.setup(time_utc=data.time_utc,
-                        latitude=data.latitude,
-                        longitude=data.longitude)
-        elif data.type == self.FORMAT_RMC:
-            model.setup(time_utc=data.time_utc,
-                        latitude=data.latitude,
-                        longitude=data.longitude)
-        elif data.type == self.FORMAT_ZDA:
-            model.setup(time_utc=data.time_utc)
-        else:
-            model.setup()
-            
+        model.setup(time_utc=fix.time_utc,
+                    latitude=fix.latitude,
+                    longitude=fix.longitude,
+                    altitude=fix.altitude,
+                    speed_knots=fix.speed_knots,
+                    true_course=fix.true_course,
+                    quality=fix.quality,
+                    satellites_used=fix.satellites_used,
+                    HDOP=fix.HDOP,
+                    fix_type=fix.fix_type,
+                    age=fix.age())
         return model
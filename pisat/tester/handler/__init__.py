@@ -0,0 +1,15 @@
+
+from pisat.tester.handler.fake_digital_input_handler import FakeDigitalInputHandler
+from pisat.tester.handler.fake_digital_output_handler import FakeDigitalOutputHandler
+from pisat.tester.handler.fake_i2c_handler import FakeI2CHandler
+from pisat.tester.handler.fake_serial_handler import FakeSerialHandler
+from pisat.tester.handler.fake_pigpio import FakePi
+from pisat.tester.handler.pty_serial_port import PtySerialPort
+
+from pisat.tester.handler.fake_device import FakeDevice, FakeRegisterDevice, FakeStreamDevice
+from pisat.tester.handler.fake_bme280 import FakeBme280
+from pisat.tester.handler.fake_bno055 import FakeBno055, FakeBno055UART
+from pisat.tester.handler.fake_apds9301 import FakeApds9301
+from pisat.tester.handler.fake_opt3002 import FakeOpt3002
+from pisat.tester.handler.fake_hc_sr04 import FakeHcSr04
+from pisat.tester.handler.fake_gps import FakeGPS
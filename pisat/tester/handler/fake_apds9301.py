@@ -0,0 +1,114 @@
+#! python3
+
+"""
+
+pisat.tester.handler.fake_apds9301
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+An emulated APDS9301.
+Registers of APDS9301 are accessed through the command byte, whose 
+lower bits are the address and upper bits are flags, and the device 
+is emulated with the same command protocol. The level interrupt is 
+emulated when raw values of channels are set, and the interrupt line 
+is given to a listener such as FakeDigitalInputHandler.set_level.
+
+[info]
+APDS9301 datasheet
+    https://datasheetspdf.com/datasheet/APDS-9301.html
+pisat.sensor.Apds9301
+"""
+
+import struct
+from typing import Callable, Optional
+
+from pisat.sensor.apds9301 import Apds9301
+from pisat.tester.handler.fake_device import FakeRegisterDevice
+
+
+class FakeApds9301(FakeRegisterDevice):
+    """An emulated APDS9301.
+    
+    Examples
+    --------
+        >> pin = FakeDigitalInputHandler(level=True)
+        >> device = FakeApds9301(interrupt=pin.set_level)
+        >> apds9301 = Apds9301(FakeI2CHandler(device, Apds9301.ADDRESS_I2C_FLOAT), name="apds9301")
+        >> device.set_raw(1000, 200)
+    """
+    
+    ID = 0x50
+    MASK_ADDRESS = 0x0F
+    
+    # NOTE about 24 lux with the default timing.
+    RAW_CH0 = 1000
+    RAW_CH1 = 200
+    
+    def __init__(self,
+                 interrupt: Optional[Callable[[bool], None]] = None,
+                 speed: float = 1.) -> None:
+        """
+        Parameters
+        ----------
+            interrupt : Optional[Callable[[bool], None]], optional
+                Listener of the level of the INT pin, which is active low, 
+                by default None.
+            speed : float, optional
+                Ratio of the speed of time in the device to real time, by default 1.
+        """
+        super().__init__(speed=speed)
+        
+        self._interrupt: Optional[Callable[[bool], None]] = interrupt
+        self._asserted: bool = False
+        
+        self.set_register(Apds9301.BITS_REG_TIMING, Apds9301.BITS_TIMING_INTEG_DEFAULT)
+        self.set_register(Apds9301.BITS_REG_ID, self.ID)
+        self.set_raw(self.RAW_CH0, self.RAW_CH1)
+        
+    @property
+    def powered(self) -> bool:
+        return self._memory[Apds9301.BITS_REG_CTRL] & Apds9301.BITS_POW_UP == Apds9301.BITS_POW_UP
+    
+    @property
+    def asserted(self) -> bool:
+        """Whether the interrupt is asserted."""
+        return self._asserted
+    
+    @property
+    def threshold_low(self) -> int:
+        return struct.unpack_from("<H", self._memory, Apds9301.BITS_REG_THRESH_LOW_LOW)[0]
+    
+    @property
+    def threshold_high(self) -> int:
+        return struct.unpack_from("<H", self._memory, Apds9301.BITS_REG_THRESH_HIGH_LOW)[0]
+    
+    def set_raw(self, ch0: int, ch1: int) -> None:
+        """Set raw values of channels and evaluate the interrupt.
+
+        Parameters
+        ----------
+            ch0 : int
+                Raw value of the channel 0 (visible and infrared).
+            ch1 : int
+                Raw value of the channel 1 (infrared).
+        """
+        self.set_register(Apds9301.BITS_REG_DATA0[0], struct.pack("<HH", ch0, ch1))
+        
+        enabled = self._memory[Apds9301.BITS_REG_INTERRUPT] & Apds9301.BITS_INTR_LEVEL_ENABLED
+        if enabled and self.powered and not (self.threshold_low <= ch0 <= self.threshold_high):
+            self._set_interrupt(True)
+            
+    def _set_interrupt(self, asserted: bool) -> None:
+        if asserted == self._asserted:
+            return
+        self._asserted = asserted
+        if self._interrupt is not None:
+            self._interrupt(not asserted)
+        
+    def read(self, reg: int, count: int) -> bytes:
+        if reg & Apds9301.BITS_COMMAND_CLEAR:
+            self._set_interrupt(False)
+        return super().read(reg & self.MASK_ADDRESS, count)
+    
+    def write(self, reg: int, data: bytes) -> None:
+        if reg & Apds9301.BITS_COMMAND_CLEAR:
+            self._set_interrupt(False)
+        super().write(reg & self.MASK_ADDRESS, data)
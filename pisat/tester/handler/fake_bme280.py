@@ -0,0 +1,123 @@
+#! python3
+
+"""
+
+pisat.tester.handler.fake_bme280
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+An emulated BME280.
+The register map of BME280 is emulated with calibration parameters 
+and raw data given as the example of the datasheet, so the driver 
+calculates the same values as the real device does from raw data.
+
+[info]
+BME280 datasheet
+    https://www.bosch-sensortec.com/media/boschsensortec/downloads/datasheets/bst-bme280-ds002.pdf
+pisat.sensor.Bme280
+"""
+
+import struct
+from typing import Optional, Tuple
+
+from pisat.sensor.bme280 import Bme280
+from pisat.tester.handler.fake_device import FakeRegisterDevice
+
+
+class FakeBme280(FakeRegisterDevice):
+    """An emulated BME280.
+    
+    Examples
+    --------
+        >> device = FakeBme280()
+        >> bme280 = Bme280(FakeI2CHandler(device, Bme280.ADDRESS_I2C_GND), name="bme280")
+        >> device.set_raw(press=415148, temp=519888)
+    """
+    
+    CHIP_ID = 0x60
+    
+    # NOTE
+    #   Calibration parameters of temperature and pressure are the example 
+    #   of the datasheet, and ones of humidity are read from a real device.
+    DIG_TEMP = (27504, 26435, -1000)
+    DIG_PRESS = (36477, -10685, 3024, 2855, 140, -7, 15500, -14600, 6000)
+    DIG_HUM = (75, 362, 0, 313, 50, 30)
+    
+    # NOTE 25.08 deg C, 1006.53 hPa and about 60 % with the parameters above.
+    RAW_TEMP = 519888
+    RAW_PRESS = 415148
+    RAW_HUM = 31000
+    
+    def __init__(self,
+                 dig_temp: Tuple[int] = DIG_TEMP,
+                 dig_press: Tuple[int] = DIG_PRESS,
+                 dig_hum: Tuple[int] = DIG_HUM,
+                 speed: float = 1.) -> None:
+        """
+        Parameters
+        ----------
+            dig_temp : Tuple[int], optional
+                Calibration parameters dig_T1 ~ dig_T3, by default FakeBme280.DIG_TEMP.
+            dig_press : Tuple[int], optional
+                Calibration parameters dig_P1 ~ dig_P9, by default FakeBme280.DIG_PRESS.
+            dig_hum : Tuple[int], optional
+                Calibration parameters dig_H1 ~ dig_H6, by default FakeBme280.DIG_HUM.
+            speed : float, optional
+                Ratio of the speed of time in the device to real time, by default 1.
+        """
+        super().__init__(speed=speed)
+        
+        self.set_calib_params(dig_temp, dig_press, dig_hum)
+        self.reset()
+        self.set_raw(self.RAW_PRESS, self.RAW_TEMP, self.RAW_HUM)
+        
+    def reset(self) -> None:
+        self.set_register(Bme280.REG_ID, self.CHIP_ID)
+        self.set_register(Bme280.REG_CTRL_HUM, 0)
+        self.set_register(Bme280.REG_STATUS, 0)
+        self.set_register(Bme280.REG_CTRL_MEAS, 0)
+        self.set_register(Bme280.REG_CONFIG, 0)
+        
+    def set_calib_params(self, 
+                         dig_temp: Tuple[int], 
+                         dig_press: Tuple[int], 
+                         dig_hum: Tuple[int]) -> None:
+        self.set_register(0x88, struct.pack("<Hhh", *dig_temp))
+        self.set_register(0x8E, struct.pack("<Hhhhhhhhh", *dig_press))
+        self.set_register(0xA1, dig_hum[0])
+        self.set_register(0xE1, struct.pack("<hB", dig_hum[1], dig_hum[2]))
+        h4, h5 = dig_hum[3] & 0xFFF, dig_hum[4] & 0xFFF
+        self.set_register(0xE4, bytes((h4 >> 4, (h5 & 0xF) << 4 | h4 & 0xF, h5 >> 4)))
+        self.set_register(0xE7, struct.pack("<b", dig_hum[5]))
+        
+    @property
+    def mode(self) -> int:
+        return self._memory[Bme280.REG_CTRL_MEAS] & 0b11
+        
+    def set_raw(self, 
+                press: Optional[int] = None, 
+                temp: Optional[int] = None, 
+                hum: Optional[int] = None) -> None:
+        """Set raw values of ADCs in the data registers.
+
+        Parameters
+        ----------
+            press : Optional[int], optional
+                20 bits raw pressure, by default None. If None, not changed.
+            temp : Optional[int], optional
+                20 bits raw temperature, by default None. If None, not changed.
+            hum : Optional[int], optional
+                16 bits raw humidity, by default None. If None, not changed.
+        """
+        if press is not None:
+            self.set_register(Bme280.REG_PRESS[0], self._encode_20bits(press))
+        if temp is not None:
+            self.set_register(Bme280.REG_TEMP[0], self._encode_20bits(temp))
+        if hum is not None:
+            self.set_register(Bme280.REG_HUM[0], struct.pack(">H", hum))
+            
+    @staticmethod
+    def _encode_20bits(raw: int) -> bytes:
+        return bytes(((raw >> 12) & 0xFF, (raw >> 4) & 0xFF, (raw & 0xF) << 4))
+    
+    def _on_write(self, reg: int, data: bytes) -> None:
+        if reg == Bme280.REG_RESET and data[0] == Bme280.VALUE_RESET:
+            self.reset()
@@ -0,0 +1,268 @@
+#! python3
+
+"""
+
+pisat.tester.handler.fake_bno055
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+An emulated BNO055 with I2C and UART interfaces.
+FakeBno055 emulates the register map of BNO055 including its two 
+pages, and data registers are set by users in units selected by 
+the default UNIT_SEL. FakeBno055UART wraps a FakeBno055 and speaks 
+the UART protocol of BNO055, so drivers for both interfaces can be 
+tested with the same device. The UART interface can also inject 
+error statuses in order to test recovery of drivers.
+
+[info]
+pisat.sensor.Bno055
+"""
+
+from collections import deque
+import struct
+import time
+from typing import Deque, Optional, Sequence, Tuple, Union
+
+from pisat.sensor.bno055 import Bno055Base, UARTBno055
+from pisat.tester.handler.fake_device import FakeRegisterDevice, FakeStreamDevice
+
+
+class FakeBno055(FakeRegisterDevice):
+    """An emulated BNO055 with the register map of two pages.
+    
+    Examples
+    --------
+        >> device = FakeBno055()
+        >> device.set_acc((0., 0., 9.8))
+        >> bno055 = Bno055(FakeI2CHandler(device, 0x28), name="bno055")
+    """
+    
+    ID_CHIP = 0xA0
+    ID_ACC = 0xFB
+    ID_MAG = 0x32
+    ID_GYRO = 0x0F
+    ID_SW_REV = 0x0311
+    ID_BL_REV = 0x15
+    
+    DEFAULT_AXIS_MAP_CONFIG = 0x24
+    DEFAULT_AXIS_MAP_SIGN = 0x00
+    DEFAULT_UNIT_SEL = 0x80
+    
+    # NOTE LSB per unit in the default UNIT_SEL, see datasheet page 31 ~ 37.
+    SCALE_ACC = 100
+    SCALE_MAG = 16
+    SCALE_GYRO = 16
+    SCALE_EULER = 16
+    SCALE_QUAT = 1 << 14
+    
+    def __init__(self, speed: float = 1.) -> None:
+        super().__init__(speed=speed)
+        self._pages = (self._memory, bytearray(self.SIZE_MEMORY))
+        self._page: int = Bno055Base.Page.PAGE_0.value
+        self.reset()
+        
+    @property
+    def page(self) -> int:
+        return self._page
+    
+    @property
+    def operation_mode(self) -> int:
+        return self._pages[0][Bno055Base.RegPage0.OPR_MODE] & 0x0F
+        
+    def reset(self) -> None:
+        page0, page1 = self._pages
+        page0[:] = bytes(self.SIZE_MEMORY)
+        page1[:] = bytes(self.SIZE_MEMORY)
+        self._page = Bno055Base.Page.PAGE_0.value
+        self._memory = page0
+        
+        reg = Bno055Base.RegPage0
+        page0[reg.CHIP_ID] = self.ID_CHIP
+        page0[reg.ACC_ID] = self.ID_ACC
+        page0[reg.MAG_ID] = self.ID_MAG
+        page0[reg.GYR_ID] = self.ID_GYRO
+        page0[reg.SW_REV_ID_LSB:reg.SW_REC_ID_MSB + 1] = struct.pack("<H", self.ID_SW_REV)
+        page0[reg.BL_REV_ID] = self.ID_BL_REV
+        page0[reg.ST_RESULT] = 0x0F
+        page0[reg.CALIB_STAT] = 0xFF
+        page0[reg.UNIT_SEL] = self.DEFAULT_UNIT_SEL
+        page0[reg.AXIS_MAP_CONFIG] = self.DEFAULT_AXIS_MAP_CONFIG
+        page0[reg.AXIS_MAP_SIGN] = self.DEFAULT_AXIS_MAP_SIGN
+        
+        page1[Bno055Base.RegPage1.PAGE_ID] = Bno055Base.Page.PAGE_1.value
+        page1[Bno055Base.RegPage1.ACC_CONFIG] = 0x0D
+        page1[Bno055Base.RegPage1.MAG_CONFIG] = 0x6D
+        page1[Bno055Base.RegPage1.GYR_CONFIG_0] = 0x38
+        
+    def _set_vector(self, reg: int, vector: Sequence[float], scale: Union[int, float]) -> None:
+        raw = [max(min(round(val * scale), 0x7FFF), -0x8000) for val in vector]
+        self._pages[0][reg:reg + 2 * len(raw)] = struct.pack(f"<{len(raw)}h", *raw)
+        
+    def set_acc(self, vector: Sequence[float]) -> None:
+        """Set acceleration in m/s^2."""
+        self._set_vector(Bno055Base.RegPage0.ACC_DATA_X_LSB, vector, self.SCALE_ACC)
+        
+    def set_mag(self, vector: Sequence[float]) -> None:
+        """Set magnetic field in micro tesla."""
+        self._set_vector(Bno055Base.RegPage0.MAG_DATA_X_LSB, vector, self.SCALE_MAG)
+        
+    def set_gyro(self, vector: Sequence[float]) -> None:
+        """Set angular velocity in degrees per second."""
+        self._set_vector(Bno055Base.RegPage0.GYR_DATA_X_LSB, vector, self.SCALE_GYRO)
+        
+    def set_euler(self, vector: Sequence[float]) -> None:
+        """Set euler angles as heading, roll and pitch in degrees."""
+        self._set_vector(Bno055Base.RegPage0.EUL_HEADING_LSB, vector, self.SCALE_EULER)
+        
+    def set_quat(self, vector: Sequence[float]) -> None:
+        """Set quaternion as w, x, y and z."""
+        self._set_vector(Bno055Base.RegPage0.QUA_DATA_W_LSB, vector, self.SCALE_QUAT)
+        
+    def set_acc_lin(self, vector: Sequence[float]) -> None:
+        """Set linear acceleration in m/s^2."""
+        self._set_vector(Bno055Base.RegPage0.LIA_DATA_X_LSB, vector, self.SCALE_ACC)
+        
+    def set_acc_gra(self, vector: Sequence[float]) -> None:
+        """Set gravity vector in m/s^2."""
+        self._set_vector(Bno055Base.RegPage0.GRV_DATA_X_LSB, vector, self.SCALE_ACC)
+        
+    def set_temp(self, temp: int) -> None:
+        """Set temperature in celsius degrees."""
+        self._pages[0][Bno055Base.RegPage0.TEMP] = struct.pack("<b", temp)[0]
+        
+    def _on_write(self, reg: int, data: bytes) -> None:
+        if reg <= Bno055Base.RegPage0.PAGE_ID < reg + len(data):
+            page = data[Bno055Base.RegPage0.PAGE_ID - reg] & 0x01
+            self._page = page
+            self._memory = self._pages[page]
+            self._memory[Bno055Base.RegPage0.PAGE_ID] = page
+            
+
+class FakeBno055UART(FakeStreamDevice):
+    """A UART interface of an emulated BNO055.
+    
+    Examples
+    --------
+        >> device = FakeBno055UART(FakeBno055())
+        >> bno055 = UARTBno055(FakeSerialHandler(device), name="bno055")
+        >> device.inject(UARTBno055.StatusRead.BUS_OVER_RUN_ERROR.value)
+    """
+    
+    LEN_HEADER = 4
+    MAX_LEN_DATA = 128
+    
+    def __init__(self, 
+                 device: Optional[FakeBno055] = None, 
+                 latency: float = 0.,
+                 speed: float = 1.) -> None:
+        """
+        Parameters
+        ----------
+            device : Optional[FakeBno055], optional
+                Device whose registers are accessed, by default None.
+                If None, a new FakeBno055 is created.
+            latency : float, optional
+                Time until a response is sent in seconds, by default 0.
+                The time is scaled by 'speed'.
+            speed : float, optional
+                Ratio of the speed of time in the device to real time, by default 1.
+        """
+        super().__init__(speed=speed)
+        if device is None:
+            device = FakeBno055(speed=speed)
+        
+        self._device: FakeBno055 = device
+        self._input: bytearray = bytearray()
+        self._errors: Deque[int] = deque()
+        self._latency: float = latency
+        self._responses: Deque[Tuple[float, bytes]] = deque()
+        self._counts_command: int = 0
+        
+    @property
+    def device(self):
+        return self._device
+    
+    @property
+    def counts_command(self) -> int:
+        """Number of commands received."""
+        return self._counts_command
+    
+    def inject(self, *statuses: int) -> None:
+        """Make next commands fail with given statuses in order.
+        
+        Parameters
+        ----------
+            *statuses : int
+                Statuses of error responses, for example 
+                UARTBno055.StatusRead.FAIL.value.
+        """
+        self._errors.extend(statuses)
+        
+    def _respond(self, data: bytes) -> None:
+        if self._latency > 0:
+            with self._cond:
+                self._responses.append((time.monotonic() + self.scale(self._latency), data))
+        else:
+            self._send(data)
+    
+    def _respond_status(self, status: int) -> None:
+        self._respond(bytes((UARTBno055.Protocol.RESPONSE_HEADER.value, status)))
+        
+    def _update(self) -> None:
+        now = time.monotonic()
+        with self._cond:
+            while len(self._responses) and self._responses[0][0] <= now:
+                self._output.extend(self._responses.popleft()[1])
+                self._cond.notify_all()
+                
+    def _time_next_update(self) -> Optional[float]:
+        if not len(self._responses):
+            return None
+        return max(self._responses[0][0] - time.monotonic(), 0.)
+    
+    def _on_receive(self, data: bytes) -> None:
+        self._input.extend(data)
+        while len(self._input) >= self.LEN_HEADER:
+            start, command, reg, length = self._input[:self.LEN_HEADER]
+            if start != UARTBno055.Protocol.START_BYTE.value:
+                del self._input[:1]
+                self._respond_status(UARTBno055.StatusRead.WRONG_START_BYTE.value)
+                continue
+            
+            if command == UARTBno055.Protocol.WRITE_BYTE.value:
+                if len(self._input) < self.LEN_HEADER + length:
+                    return
+                payload = bytes(self._input[self.LEN_HEADER:self.LEN_HEADER + length])
+                del self._input[:self.LEN_HEADER + length]
+                self._execute_write(reg, payload)
+            else:
+                del self._input[:self.LEN_HEADER]
+                self._execute_read(reg, length)
+            
+    def _execute_write(self, reg: int, payload: bytes) -> None:
+        self._counts_command += 1
+        if len(self._errors):
+            self._respond_status(self._errors.popleft())
+            return
+        if not len(payload):
+            self._respond_status(UARTBno055.StatusWrite.MIN_LENGTH_ERROR.value)
+            return
+        if len(payload) > self.MAX_LEN_DATA:
+            self._respond_status(UARTBno055.StatusWrite.MAX_LENGTH_ERROR.value)
+            return
+        
+        self._device.write(reg, payload)
+        self._respond_status(UARTBno055.StatusWrite.SUCCESS.value)
+        
+    def _execute_read(self, reg: int, length: int) -> None:
+        self._counts_command += 1
+        if len(self._errors):
+            self._respond_status(self._errors.popleft())
+            return
+        if not length:
+            self._respond_status(UARTBno055.StatusRead.MIN_LENGTH_ERROR.value)
+            return
+        if length > self.MAX_LEN_DATA:
+            self._respond_status(UARTBno055.StatusRead.MAX_LENGTH_ERROR.value)
+            return
+        
+        data = self._device.read(reg, length)
+        self._respond(bytes((UARTBno055.Protocol.READ_RESPONSE.value, length)) + data)
@@ -0,0 +1,196 @@
+#! python3
+
+"""
+
+pisat.tester.handler.fake_device
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+Base classes of emulated devices.
+Emulated devices behave as sensor hardware connected with a bus,
+and fake handlers or FakePi forward transactions of drivers to
+them instead of a real bus. FakeRegisterDevice represents a device
+with a register map like I2C sensors, and FakeStreamDevice
+represents a device with a byte stream like UART sensors.
+
+Time inside devices, for example conversion time of a sensor, can
+be accelerated by 'speed', so that the logging system can be run
+faster than real time.
+
+[info]
+pisat.tester.handler.FakeI2CHandler
+pisat.tester.handler.FakeSerialHandler
+pisat.tester.handler.FakePi
+"""
+
+import time
+from threading import Condition
+from typing import Optional, Union
+
+
+class FakeDevice:
+    """Base class of emulated devices."""
+
+    def __init__(self, speed: float = 1.) -> None:
+        """
+        Parameters
+        ----------
+            speed : float, optional
+                Ratio of the speed of time in the device to real time,
+                by default 1. If larger than 1, conversions of the device
+                are accelerated.
+        """
+        if speed <= 0:
+            raise ValueError(
+                "'speed' must be larger than 0."
+            )
+        self._speed: float = speed
+
+    @property
+    def speed(self):
+        return self._speed
+
+    def scale(self, period: float) -> float:
+        """Convert a period in the device into one in real time."""
+        return period / self._speed
+
+
+class FakeRegisterDevice(FakeDevice):
+    """Emulated device with a register map.
+
+    Registers are held as a bytearray, and the address is incremented
+    automatically in sequential reads and writes like most of I2C devices.
+    Subclasses can react to accesses by overriding '_on_read' and '_on_write',
+    or can override 'read' and 'write' if the register map is not byte-wise.
+    """
+
+    SIZE_MEMORY = 0x100
+
+    def __init__(self, speed: float = 1.) -> None:
+        super().__init__(speed=speed)
+        self._memory: bytearray = bytearray(self.SIZE_MEMORY)
+
+    @property
+    def memory(self) -> bytearray:
+        return self._memory
+
+    def read(self, reg: int, count: int) -> bytes:
+        """Read registers as a bus master does.
+
+        Parameters
+        ----------
+            reg : int
+                Address of the first register.
+            count : int
+                Number of bytes to be read.
+
+        Returns
+        -------
+            bytes
+                Data read.
+        """
+        self._on_read(reg, count)
+        return bytes(self._memory[reg:reg + count])
+
+    def write(self, reg: int, data: Union[bytes, bytearray]) -> None:
+        """Write registers as a bus master does.
+
+        Parameters
+        ----------
+            reg : int
+                Address of the first register.
+            data : Union[bytes, bytearray]
+                Data to be written.
+        """
+        self._memory[reg:reg + len(data)] = data
+        self._on_write(reg, bytes(data))
+
+    def set_register(self, reg: int, data: Union[int, bytes, bytearray]) -> None:
+        """Set values of registers without any side effects."""
+        if isinstance(data, int):
+            data = bytes((data, ))
+        self._memory[reg:reg + len(data)] = data
+
+    def _on_read(self, reg: int, count: int) -> None:
+        pass
+
+    def _on_write(self, reg: int, data: bytes) -> None:
+        pass
+
+
+class FakeStreamDevice(FakeDevice):
+    """Emulated device communicating with a byte stream.
+
+    Bytes written by the host are given to '_on_receive', and bytes sent
+    by the device are queued by '_send' until the host reads them.
+    Subclasses which send data periodically should generate the data
+    in '_update', which is called every time the host accesses the device.
+    """
+
+    def __init__(self, speed: float = 1.) -> None:
+        super().__init__(speed=speed)
+        self._output: bytearray = bytearray()
+        self._cond: Condition = Condition()
+
+    @property
+    def counts_available(self) -> int:
+        """Number of bytes sent by the device and not read yet."""
+        self._update()
+        with self._cond:
+            return len(self._output)
+
+    def read(self, count: int) -> bytes:
+        """Read at most 'count' bytes sent by the device."""
+        self._update()
+        with self._cond:
+            data = bytes(self._output[:count])
+            del self._output[:count]
+            return data
+
+    def write(self, data: Union[bytes, bytearray]) -> None:
+        """Send bytes to the device."""
+        self._on_receive(bytes(data))
+
+    def wait(self, timeout: float = -1.) -> bool:
+        """Block until the device sends any bytes.
+
+        Parameters
+        ----------
+            timeout : float, optional
+                Timeout in seconds, by default -1. If negative, waits
+                without timeout.
+
+        Returns
+        -------
+            bool
+                True if any bytes can be read, False if timeout.
+        """
+        time_init = time.monotonic()
+        while True:
+            self._update()
+            with self._cond:
+                if len(self._output):
+                    return True
+                remain = self._time_next_update()
+                if timeout >= 0:
+                    left = timeout - (time.monotonic() - time_init)
+                    if left <= 0:
+                        return False
+                    remain = left if remain is None else min(remain, left)
+                self._cond.wait(remain)
+
+    def _send(self, data: Union[bytes, bytearray]) -> None:
+        with self._cond:
+            self._output.extend(data)
+            self._cond.notify_all()
+
+    def _on_receive(self, data: bytes) -> None:
+        pass
+
+    def _update(self) -> None:
+        pass
+
+    def _time_next_update(self) -> Optional[float]:
+        """Seconds in real time until '_update' generates data next time.
+
+        None means that the device sends data only in response to the host.
+        """
+        return None
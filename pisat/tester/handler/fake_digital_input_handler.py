@@ -0,0 +1,115 @@
+#! python3
+
+"""
+
+pisat.tester.handler.fake_digital_input_handler
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+A digital input handler without any GPIO backends.
+The level of the pin is changed by users, and callbacks 
+are called as a backend library does when an edge occurs. 
+This class is useful for testing interrupt-driven features 
+on any machines.
+
+[info]
+pisat.handler.DigitalInputHandlerBase
+"""
+
+import time
+from threading import Lock
+from typing import Callable, Optional
+
+from pisat.handler.digital_input_handler_base import DigitalInputHandlerBase
+
+
+class FakeDigitalInputHandler(DigitalInputHandlerBase):
+    """A digital input handler without any GPIO backends.
+    
+    The level of the pin is changed by 'set_level', 'set_high' or 
+    'set_low' methods, and the registered callback is called in the 
+    caller thread if the change matches the edge to be detected.
+    """
+    
+    def __init__(self,
+                 pin: int = 0,
+                 level: bool = False,
+                 name: Optional[str] = None) -> None:
+        self._level: bool = level
+        self._lock: Lock = Lock()
+        self._callback: Optional[Callable[[bool, int], None]] = None
+        self._edge: DigitalInputHandlerBase.Edge = self.Edge.EITHER
+        
+        super().__init__(pin, name=name)
+        
+    @staticmethod
+    def get_current_tick() -> int:
+        return (time.perf_counter_ns() // 1000) & DigitalInputHandlerBase.TICK_MAX
+    
+    def set_pull_up_down(self, pulldown: bool = False) -> None:
+        self._level = not pulldown
+        
+    def observe(self) -> bool:
+        return self._level
+    
+    def set_level(self, level: bool, tick: Optional[int] = None) -> None:
+        """Change the level of the pin and emulate an edge.
+
+        Parameters
+        ----------
+            level : bool
+                New level of the pin.
+            tick : Optional[int], optional
+                Tick of the edge in microseconds, by default None. 
+                If None, the current tick is used.
+        """
+        with self._lock:
+            if level == self._level:
+                return
+            self._level = level
+            callback = self._callback
+            edge = self._edge
+            
+        if callback is None:
+            return
+        if edge == self.Edge.RISING and not level:
+            return
+        if edge == self.Edge.FALLING and level:
+            return
+        
+        if tick is None:
+            tick = self.get_current_tick()
+        callback(level, tick & self.TICK_MAX)
+        
+    def set_high(self, tick: Optional[int] = None) -> None:
+        self.set_level(True, tick=tick)
+        
+    def set_low(self, tick: Optional[int] = None) -> None:
+        self.set_level(False, tick=tick)
+        
+    def pulse(self, width: int, tick: Optional[int] = None) -> None:
+        """Emulate a pulse whose width is given in microseconds.
+
+        The level goes back to the current one after the pulse.
+        
+        Parameters
+        ----------
+            width : int
+                Width of the pulse in microseconds.
+            tick : Optional[int], optional
+                Tick of the first edge in microseconds, by default None.
+        """
+        if tick is None:
+            tick = self.get_current_tick()
+        level = self._level
+        self.set_level(not level, tick=tick)
+        self.set_level(level, tick=tick + width)
+        
+    def set_callback(self, 
+                     callback: Callable[[bool, int], None],
+                     edge: DigitalInputHandlerBase.Edge = DigitalInputHandlerBase.Edge.EITHER) -> None:
+        with self._lock:
+            self._callback = callback
+            self._edge = edge
+            
+    def clear_callback(self) -> None:
+        with self._lock:
+            self._callback = None
@@ -0,0 +1,62 @@
+#! python3
+
+"""
+
+pisat.tester.handler.fake_digital_output_handler
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+A digital output handler without any GPIO backends.
+The level output is held by the handler and given to a listener, 
+for example an emulated device whose input pin is connected with 
+the pin. This class is useful for testing drivers which trigger 
+devices on any machines.
+
+[info]
+pisat.handler.DigitalOutputHandlerBase
+"""
+
+from typing import Callable, Optional
+
+from pisat.handler.digital_output_handler_base import DigitalOutputHandlerBase
+
+
+class FakeDigitalOutputHandler(DigitalOutputHandlerBase):
+    """A digital output handler without any GPIO backends.
+    
+    The listener is called in the caller thread with the new level 
+    every time the level is changed.
+    """
+    
+    def __init__(self,
+                 pin: int = 0,
+                 listener: Optional[Callable[[bool], None]] = None,
+                 default: bool = False,
+                 name: Optional[str] = None) -> None:
+        self._level: bool = False
+        self._listener: Optional[Callable[[bool], None]] = listener
+        
+        super().__init__(pin, default=default, name=name)
+        
+    @property
+    def level(self) -> bool:
+        return self._level
+    
+    @property
+    def listener(self):
+        return self._listener
+    
+    @listener.setter
+    def listener(self, val: Optional[Callable[[bool], None]]):
+        self._listener = val
+        
+    def _set_level(self, level: bool) -> None:
+        if level == self._level:
+            return
+        self._level = level
+        if self._listener is not None:
+            self._listener(level)
+    
+    def set_high(self) -> None:
+        self._set_level(True)
+        
+    def set_low(self) -> None:
+        self._set_level(False)
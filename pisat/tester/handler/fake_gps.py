@@ -0,0 +1,159 @@
+#! python3
+
+"""
+
+pisat.tester.handler.fake_gps
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+An emulated GPS receiver sending NMEA sentences.
+The receiver moves from an initial position with a constant 
+velocity, and sends GGA, RMC and VTG sentences of the position 
+at the update rate. Sentences are generated lazily when the host 
+accesses the device, so no threads are needed, and the time of the 
+device can be accelerated by 'speed'.
+
+[info]
+pisat.sensor.SerialGPS
+pisat.util.nmea
+"""
+
+import math
+import time
+from typing import Iterable, Optional, Tuple
+
+from pisat.tester.handler.fake_device import FakeStreamDevice
+from pisat.util.nmea import NMEAParser
+
+
+class FakeGPS(FakeStreamDevice):
+    """An emulated GPS receiver sending NMEA sentences.
+    
+    Examples
+    --------
+        >> device = FakeGPS(38.2604, 140.8542, velocity=(1., 0.), rate=5., speed=10.)
+        >> gps = SerialGPS(FakeSerialHandler(device, baudrate=9600), name="gps")
+    """
+    
+    FORMATS = ("GGA", "RMC", "VTG")
+    
+    # m
+    RADIUS_EARTH = 6378137.
+    
+    KNOTS_PER_MPS = 1.943844
+    
+    def __init__(self,
+                 latitude: float = 38.2604,
+                 longitude: float = 140.8542,
+                 altitude: float = 50.,
+                 velocity: Tuple[float, float] = (0., 0.),
+                 rate: float = 1.,
+                 formats: Iterable[str] = FORMATS,
+                 talker: str = "GN",
+                 speed: float = 1.) -> None:
+        """
+        Parameters
+        ----------
+            latitude : float, optional
+                Initial latitude in degrees, by default 38.2604.
+            longitude : float, optional
+                Initial longitude in degrees, by default 140.8542.
+            altitude : float, optional
+                Altitude in meters, by default 50.
+            velocity : Tuple[float, float], optional
+                Velocity to the north and the east in m/s, by default (0., 0.).
+            rate : float, optional
+                Update rate in Hz, by default 1.
+            formats : Iterable[str], optional
+                Formats of sentences sent at every update, by default FakeGPS.FORMATS.
+            talker : str, optional
+                Talker ID of sentences, by default "GN".
+            speed : float, optional
+                Ratio of the speed of time in the device to real time, by default 1.
+        """
+        super().__init__(speed=speed)
+        if rate <= 0:
+            raise ValueError(
+                "'rate' must be larger than 0."
+            )
+        
+        self._latitude: float = latitude
+        self._longitude: float = longitude
+        self._altitude: float = altitude
+        self._velocity: Tuple[float, float] = velocity
+        self._rate: float = rate
+        self._formats: Tuple[str] = tuple(formats)
+        self._talker: str = talker
+        
+        self._time_init: float = time.monotonic()
+        self._time_utc_init: float = time.time()
+        self._counts_epoch: int = 0
+        
+    @property
+    def rate(self):
+        return self._rate
+    
+    @property
+    def counts_epoch(self) -> int:
+        """Number of updates sent."""
+        return self._counts_epoch
+    
+    @property
+    def velocity(self):
+        return self._velocity
+    
+    def position(self, elapsed: float) -> Tuple[float, float, float]:
+        """Calculate the position after 'elapsed' seconds of the device time."""
+        north, east = self._velocity
+        latitude = self._latitude + math.degrees(north * elapsed / self.RADIUS_EARTH)
+        longitude = self._longitude + math.degrees(
+            east * elapsed / (self.RADIUS_EARTH * math.cos(math.radians(self._latitude)))
+        )
+        return (latitude, longitude, self._altitude)
+        
+    def _elapsed(self) -> float:
+        return (time.monotonic() - self._time_init) * self._speed
+    
+    def _update(self) -> None:
+        # NOTE The first update is sent at once.
+        due = int(self._elapsed() * self._rate) + 1
+        with self._cond:
+            while self._counts_epoch < due:
+                self._output.extend(self.build_epoch(self._counts_epoch / self._rate))
+                self._counts_epoch += 1
+                self._cond.notify_all()
+            
+    def _time_next_update(self) -> Optional[float]:
+        remain = self._counts_epoch / self._rate - self._elapsed()
+        return max(self.scale(remain), 0.)
+    
+    def build_epoch(self, elapsed: float) -> bytes:
+        """Build sentences of an update after 'elapsed' seconds of the device time."""
+        latitude, longitude, altitude = self.position(elapsed)
+        north, east = self._velocity
+        
+        centisec = round((self._time_utc_init + elapsed) * 100)
+        gmtime = time.gmtime(centisec // 100)
+        time_utc = time.strftime("%H%M%S", gmtime) + f".{centisec % 100:02d}"
+        date_utc = time.strftime("%d%m%y", gmtime)
+        lat, ns = self.format_degrees(latitude, 2), "N" if latitude >= 0 else "S"
+        lon, ew = self.format_degrees(longitude, 3), "E" if longitude >= 0 else "W"
+        knots = math.hypot(north, east) * self.KNOTS_PER_MPS
+        course = math.degrees(math.atan2(east, north)) % 360
+        
+        bodies = {
+            "GGA": f"GGA,{time_utc},{lat},{ns},{lon},{ew},1,08,1.00,{altitude:.1f},M,39.4,M,,",
+            "RMC": f"RMC,{time_utc},A,{lat},{ns},{lon},{ew},{knots:.3f},{course:.2f},{date_utc},,,A",
+            "VTG": f"VTG,{course:.2f},T,,M,{knots:.3f},N,{knots * 1.852:.3f},K,A",
+        }
+        return b"".join(self.build_sentence(self._talker + bodies[fmt]) for fmt in self._formats)
+    
+    @staticmethod
+    def format_degrees(degrees: float, width: int) -> str:
+        degrees = abs(degrees)
+        integer = int(degrees)
+        minutes = (degrees - integer) * 60
+        return f"{integer:0{width}d}{minutes:08.5f}"
+    
+    @staticmethod
+    def build_sentence(body: str) -> bytes:
+        body = body.encode("ascii")
+        return b"$" + body + b"*%02X\r\n" % NMEAParser.calc_checksum(body)
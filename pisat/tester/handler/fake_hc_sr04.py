@@ -0,0 +1,121 @@
+#! python3
+
+"""
+
+pisat.tester.handler.fake_hc_sr04
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+An emulated HC-SR04.
+The trigger pin of the device is connected with a fake output 
+handler, and an echo pulse whose width corresponds to the distance 
+is given to a listener of the echo pin such as 
+FakeDigitalInputHandler.set_level. By default edges of the pulse 
+are given at once with ticks of the emulated time, which is enough 
+for drivers capturing edges with callbacks. If 'realtime' is True, 
+edges are given with timers, so drivers polling the pin also work.
+
+[info]
+pisat.sensor.HcSr04
+"""
+
+from threading import Timer
+import time
+from typing import Callable, Optional
+
+from pisat.handler.digital_input_handler_base import DigitalInputHandlerBase
+from pisat.tester.handler.fake_device import FakeDevice
+from pisat.tester.handler.fake_digital_output_handler import FakeDigitalOutputHandler
+
+
+class FakeHcSr04(FakeDevice):
+    """An emulated HC-SR04.
+    
+    Examples
+    --------
+        >> echo = FakeDigitalInputHandler()
+        >> device = FakeHcSr04(echo.set_level, distance=1.5)
+        >> hcsr04 = HcSr04(echo, device.trigger, name="hcsr04")
+    """
+    
+    # m/s
+    VELOCITY_SOUND_AIR = 340.65
+    
+    # sec
+    TIME_DELAY_ECHO = 4.5e-4
+    TIME_ECHO_MAX = 0.038
+    
+    # m
+    DISTANCE_MAX = 4.
+    
+    def __init__(self,
+                 echo: Callable[[bool, Optional[int]], None],
+                 distance: Optional[float] = 1.,
+                 realtime: bool = False) -> None:
+        """
+        Parameters
+        ----------
+            echo : Callable[[bool, Optional[int]], None]
+                Listener of the echo pin given the level and the tick 
+                in microseconds. The tick is None if 'realtime' is True.
+            distance : Optional[float], optional
+                Distance to an obstacle in meters, by default 1.
+                If None, no obstacle is found.
+            realtime : bool, optional
+                If True, edges of the echo are given with timers, 
+                by default False.
+        """
+        super().__init__()
+        
+        self._echo: Callable[[bool, Optional[int]], None] = echo
+        self._distance: Optional[float] = distance
+        self._realtime: bool = realtime
+        self._triggered: bool = False
+        self._counts_trigger: int = 0
+        self._trigger: FakeDigitalOutputHandler = FakeDigitalOutputHandler(listener=self.on_trigger)
+        
+    @property
+    def trigger(self) -> FakeDigitalOutputHandler:
+        """Output handler connected with the trigger pin."""
+        return self._trigger
+    
+    @property
+    def distance(self):
+        return self._distance
+    
+    @distance.setter
+    def distance(self, val: Optional[float]):
+        self._distance = val
+        
+    @property
+    def counts_trigger(self) -> int:
+        return self._counts_trigger
+    
+    @property
+    def time_echo(self) -> float:
+        """Width of the echo pulse in seconds."""
+        if self._distance is None or self._distance > self.DISTANCE_MAX:
+            return self.TIME_ECHO_MAX
+        return 2 * self._distance / self.VELOCITY_SOUND_AIR
+        
+    def on_trigger(self, level: bool) -> None:
+        """Receive a level of the trigger pin.
+        
+        A measurement starts at the falling edge of a trigger pulse.
+        """
+        if level:
+            self._triggered = True
+            return
+        if not self._triggered:
+            return
+        self._triggered = False
+        self._counts_trigger += 1
+        
+        width = self.time_echo
+        if self._realtime:
+            for delay, level in ((self.TIME_DELAY_ECHO, True), (self.TIME_DELAY_ECHO + width, False)):
+                timer = Timer(delay, self._echo, args=(level, None))
+                timer.daemon = True
+                timer.start()
+        else:
+            tick = time.perf_counter_ns() // 1000 + round(self.TIME_DELAY_ECHO * 1e6)
+            self._echo(True, tick & DigitalInputHandlerBase.TICK_MAX)
+            self._echo(False, (tick + round(width * 1e6)) & DigitalInputHandlerBase.TICK_MAX)
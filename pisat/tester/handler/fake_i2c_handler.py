@@ -0,0 +1,116 @@
+#! python3
+
+"""
+
+pisat.tester.handler.fake_i2c_handler
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+An I2C handler connected with an emulated device.
+Transactions of a driver are forwarded to a FakeRegisterDevice 
+instead of an I2C bus, and each transaction can take a latency 
+as a real bus does. This class is useful for testing and profiling 
+drivers and the logging system on any machines.
+
+[info]
+pisat.handler.I2CHandlerBase
+pisat.tester.handler.FakeRegisterDevice
+"""
+
+import time
+from threading import Lock
+from typing import Optional, Tuple, Union
+
+from pisat.handler.i2c_handler_base import I2CHandlerBase
+from pisat.tester.handler.fake_device import FakeRegisterDevice
+
+
+class FakeI2CHandler(I2CHandlerBase):
+    """An I2C handler connected with an emulated device.
+    
+    Examples
+    --------
+        >> device = FakeBme280()
+        >> handler = FakeI2CHandler(device, Bme280.ADDRESS_I2C_GND, latency=2e-4)
+        >> bme280 = Bme280(handler, name="bme280")
+    """
+    
+    MAX_LEN_READ = 32
+    
+    def __init__(self,
+                 device: FakeRegisterDevice,
+                 address: int = 0,
+                 bus: int = 1,
+                 latency: float = 0.,
+                 name: Optional[str] = None) -> None:
+        """
+        Parameters
+        ----------
+            device : FakeRegisterDevice
+                Device connected with the handler.
+            address : int, optional
+                Address of the device, by default 0.
+            bus : int, optional
+                Number of the bus, by default 1.
+            latency : float, optional
+                Time taken by a transaction in seconds, by default 0.
+            name : Optional[str], optional
+                Name of the component, by default None.
+        """
+        if not isinstance(device, FakeRegisterDevice):
+            raise TypeError(
+                "'device' must be FakeRegisterDevice."
+            )
+        super().__init__(address, bus, name=name)
+        
+        self._device: FakeRegisterDevice = device
+        self._latency: float = latency
+        self._lock: Lock = Lock()
+        self._counts_transaction: int = 0
+        
+    @property
+    def device(self):
+        return self._device
+    
+    @property
+    def latency(self):
+        return self._latency
+    
+    @latency.setter
+    def latency(self, val: float):
+        self._latency = val
+        
+    @property
+    def counts_transaction(self) -> int:
+        """Number of transactions since the handler was created."""
+        return self._counts_transaction
+    
+    def _transact(self) -> None:
+        self._counts_transaction += 1
+        if self._latency > 0:
+            time.sleep(self._latency)
+    
+    def read(self, reg: int, count: int) -> Tuple[int, bytearray]:
+        if reg < 0:
+            raise ValueError(
+                "'reg' must be no less than 0."
+            )
+        if count > self.MAX_LEN_READ:
+            raise ValueError(
+                f"'count' is out of range. It must be 0 <= 'count' <= {self.MAX_LEN_READ}."
+            )
+            
+        with self._lock:
+            self._transact()
+            data = self._device.read(reg, count)
+        return (len(data), bytearray(data))
+    
+    def write(self, reg: int, data: Union[int, bytes, bytearray]) -> None:
+        if reg < 0:
+            raise ValueError(
+                "'reg' must be no less than 0."
+            )
+        if isinstance(data, int):
+            data = bytes((data, ))
+            
+        with self._lock:
+            self._transact()
+            self._device.write(reg, data)
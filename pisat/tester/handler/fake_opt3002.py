@@ -0,0 +1,228 @@
+#! python3
+
+"""
+
+pisat.tester.handler.fake_opt3002
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+An emulated OPT3002.
+Registers of OPT3002 are 16 bits and addressed one by one, and 
+conversions are emulated in single-shot and continuous modes with 
+the conversion time in CONFIG, accelerated by 'speed'. The end of 
+a conversion sets the conversion-ready flag and drives the INT pin 
+according to the limit registers, the latch field and the polarity, 
+so interrupt-driven drivers can be tested without the device.
+
+[info]
+pisat.sensor.Opt3002
+"""
+
+import struct
+from threading import RLock, Timer
+from typing import Callable, Optional
+
+from pisat.sensor.opt3002 import Opt3002
+from pisat.tester.handler.fake_device import FakeRegisterDevice
+
+
+class FakeOpt3002(FakeRegisterDevice):
+    """An emulated OPT3002.
+    
+    Examples
+    --------
+        >> pin = FakeDigitalInputHandler(level=True)
+        >> device = FakeOpt3002(interrupt=pin.set_level, speed=10.)
+        >> opt3002 = Opt3002(FakeI2CHandler(device, Opt3002.AddrI2C.GND), name="opt3002")
+        >> device.irradiance = 1000.
+    """
+    
+    ID = 0x5449
+    DEFAULT_CONFIG = 0xC810
+    DEFAULT_LIMIT_LOW = 0x0000
+    DEFAULT_LIMIT_HIGH = 0xBFFF
+    
+    # sec
+    TIME_CONVERSION = (0.1, 0.8)
+    
+    RANGE_AUTO = 0b1100
+    
+    BIT_OVERFLOW = 0x0100
+    BIT_CONVERSION_READY = 0x0080
+    BIT_FLAG_HIGH = 0x0040
+    BIT_FLAG_LOW = 0x0020
+    BIT_LATCH = 0x0010
+    BIT_POLARITY = 0x0008
+    BITS_READ_ONLY = BIT_OVERFLOW | BIT_CONVERSION_READY | BIT_FLAG_HIGH | BIT_FLAG_LOW
+    BITS_END_OF_CONVERSION = 0xC000
+    
+    def __init__(self,
+                 irradiance: float = 1000.,
+                 interrupt: Optional[Callable[[bool], None]] = None,
+                 auto: bool = True,
+                 speed: float = 1.) -> None:
+        """
+        Parameters
+        ----------
+            irradiance : float, optional
+                Irradiance in nW/cm^2 to be measured, by default 1000.
+            interrupt : Optional[Callable[[bool], None]], optional
+                Listener of the level of the INT pin, by default None.
+            auto : bool, optional
+                If True, conversions end after the conversion time with 
+                timers, by default True. If False, conversions end only 
+                when 'complete' is called, which is useful for testing.
+            speed : float, optional
+                Ratio of the speed of time in the device to real time, by default 1.
+        """
+        super().__init__(speed=speed)
+        
+        self._irradiance: float = irradiance
+        self._interrupt: Optional[Callable[[bool], None]] = interrupt
+        self._auto: bool = auto
+        self._asserted: bool = False
+        self._timer: Optional[Timer] = None
+        self._lock: RLock = RLock()
+        self._counts_conversion: int = 0
+        
+        self._registers = {
+            Opt3002.Reg.RESULT: 0,
+            Opt3002.Reg.CONFIG: self.DEFAULT_CONFIG,
+            Opt3002.Reg.LIMIT_LOW: self.DEFAULT_LIMIT_LOW,
+            Opt3002.Reg.LIMIT_HIGH: self.DEFAULT_LIMIT_HIGH,
+            Opt3002.Reg.ID: self.ID,
+        }
+        
+    @property
+    def irradiance(self):
+        return self._irradiance
+    
+    @irradiance.setter
+    def irradiance(self, val: float):
+        self._irradiance = val
+        
+    @property
+    def counts_conversion(self) -> int:
+        """Number of conversions completed."""
+        return self._counts_conversion
+        
+    @property
+    def config(self) -> int:
+        return self._registers[Opt3002.Reg.CONFIG]
+    
+    @property
+    def mode(self) -> int:
+        return (self.config >> 9) & 0b11
+    
+    @property
+    def time_conversion(self) -> float:
+        """Conversion time in real time."""
+        return self.scale(self.TIME_CONVERSION[(self.config >> 11) & 0b1])
+    
+    @property
+    def asserted(self) -> bool:
+        """Whether the interrupt is asserted."""
+        return self._asserted
+    
+    def read(self, reg: int, count: int) -> bytes:
+        with self._lock:
+            value = self._registers.get(reg, 0)
+            if reg == Opt3002.Reg.CONFIG:
+                self._clear_flags()
+        return struct.pack(">H", value)[:count]
+    
+    def write(self, reg: int, data: bytes) -> None:
+        if len(data) != Opt3002.Reg.LEN_BYTE or reg not in self._registers:
+            return
+        value = struct.unpack(">H", data)[0]
+        
+        with self._lock:
+            if reg == Opt3002.Reg.CONFIG:
+                config = self.config
+                self._registers[reg] = value & ~self.BITS_READ_ONLY | config & self.BITS_READ_ONLY
+                self._schedule()
+            elif reg in (Opt3002.Reg.LIMIT_LOW, Opt3002.Reg.LIMIT_HIGH):
+                self._registers[reg] = value
+                
+    def close(self) -> None:
+        """Cancel the timer of the conversion in progress."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+    
+    def complete(self) -> None:
+        """End the conversion in progress and latch its result."""
+        with self._lock:
+            self._timer = None
+            if self.mode == Opt3002.Config.CONVERSION_MODE_SHUTDOWN:
+                return
+            
+            result, overflow = self._encode(self._irradiance)
+            self._registers[Opt3002.Reg.RESULT] = result
+            self._counts_conversion += 1
+            
+            config = self.config | self.BIT_CONVERSION_READY
+            if overflow:
+                config |= self.BIT_OVERFLOW
+            if self.mode == Opt3002.Config.CONVERSION_MODE_SINGLE_SHOT:
+                config &= ~(0b11 << 9)
+            
+            limit_low = self._registers[Opt3002.Reg.LIMIT_LOW]
+            if limit_low & self.BITS_END_OF_CONVERSION == self.BITS_END_OF_CONVERSION:
+                self._registers[Opt3002.Reg.CONFIG] = config
+                self._set_interrupt(True)
+            else:
+                high = result > self._registers[Opt3002.Reg.LIMIT_HIGH]
+                low = result < limit_low
+                if high:
+                    config |= self.BIT_FLAG_HIGH
+                if low:
+                    config |= self.BIT_FLAG_LOW
+                self._registers[Opt3002.Reg.CONFIG] = config
+                if high or low:
+                    self._set_interrupt(True)
+                elif not config & self.BIT_LATCH:
+                    self._set_interrupt(False)
+                
+            self._schedule()
+    
+    def _schedule(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._auto or self.mode == Opt3002.Config.CONVERSION_MODE_SHUTDOWN:
+            return
+        
+        self._timer = Timer(self.time_conversion, self.complete)
+        self._timer.daemon = True
+        self._timer.start()
+        
+    def _clear_flags(self) -> None:
+        config = self.config & ~self.BIT_CONVERSION_READY
+        if config & self.BIT_LATCH:
+            config &= ~(self.BIT_FLAG_HIGH | self.BIT_FLAG_LOW)
+            self._set_interrupt(False)
+        self._registers[Opt3002.Reg.CONFIG] = config
+        
+    def _set_interrupt(self, asserted: bool) -> None:
+        if asserted == self._asserted:
+            return
+        self._asserted = asserted
+        if self._interrupt is not None:
+            polarity = bool(self.config & self.BIT_POLARITY)
+            self._interrupt(asserted == polarity)
+            
+    def _encode(self, irradiance: float):
+        mantissa_max = Opt3002.Data.MAX_MANTISSA
+        value = max(irradiance / Opt3002.Data.WEIGHT_OPTICAL_POWER, 0.)
+        
+        range_number = self.config >> 12
+        if range_number == self.RANGE_AUTO:
+            exponent = 0
+            while value / (1 << exponent) > mantissa_max and exponent < Opt3002.Data.MAX_EXPONENT:
+                exponent += 1
+        else:
+            exponent = range_number
+            
+        mantissa = int(value / (1 << exponent))
+        overflow = mantissa > mantissa_max
+        return (exponent << 12 | min(mantissa, mantissa_max), overflow)
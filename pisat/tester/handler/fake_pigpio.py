@@ -0,0 +1,277 @@
+#! python3
+
+"""
+
+pisat.tester.handler.fake_pigpio
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+A substitute of pigpio.pi connected with emulated devices.
+This class has the subset of the API of pigpio.pi used by the 
+Pigpio handlers of pisat, and forwards I2C and serial transactions 
+to emulated devices attached to the bus addresses and the ports. 
+GPIO levels are held by the object, and levels driven by devices 
+fire callbacks as the pigpio daemon does. Each transaction can take 
+a latency, so the whole system can be run and profiled on machines 
+without the pigpio daemon.
+
+[info]
+pigpio API
+    http://abyz.me.uk/rpi/pigpio/python.html
+pisat.handler.PigpioI2CHandler
+pisat.handler.PigpioSerialHandler
+"""
+
+from itertools import count
+from threading import RLock
+import time
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+from pisat.tester.handler.fake_device import FakeRegisterDevice, FakeStreamDevice
+
+
+class FakePi:
+    """A substitute of pigpio.pi connected with emulated devices.
+    
+    Examples
+    --------
+        >> pi = FakePi(latency=2e-4)
+        >> pi.attach_i2c(Bme280.ADDRESS_I2C_GND, FakeBme280())
+        >> pi.attach_serial("/dev/serial0", FakeGPS())
+        >> bme280 = Bme280(PigpioI2CHandler(pi, Bme280.ADDRESS_I2C_GND), name="bme280")
+    """
+    
+    # NOTE Same values as the constants of pigpio.
+    INPUT = 0
+    OUTPUT = 1
+    LOW = 0
+    HIGH = 1
+    PUD_OFF = 0
+    PUD_DOWN = 1
+    PUD_UP = 2
+    RISING_EDGE = 0
+    FALLING_EDGE = 1
+    EITHER_EDGE = 2
+    TICK_MAX = 0xFFFFFFFF
+    
+    class Callback:
+        """Object returned by 'callback' as the one of pigpio."""
+        
+        def __init__(self, pi, gpio: int, edge: int, func: Callable[[int, int, int], None]) -> None:
+            self._pi = pi
+            self.gpio: int = gpio
+            self.edge: int = edge
+            self.func: Callable[[int, int, int], None] = func
+            self.tally: int = 0
+            
+        def cancel(self) -> None:
+            self._pi._cancel(self)
+    
+    def __init__(self, latency: float = 0.) -> None:
+        """
+        Parameters
+        ----------
+            latency : float, optional
+                Time taken by an I2C or serial transaction in seconds, by default 0.
+        """
+        self._latency: float = latency
+        self._lock: RLock = RLock()
+        self._handles = count()
+        
+        self._devices_i2c: Dict[Tuple[int, int], FakeRegisterDevice] = {}
+        self._devices_serial: Dict[str, FakeStreamDevice] = {}
+        self._handles_i2c: Dict[int, FakeRegisterDevice] = {}
+        self._handles_serial: Dict[int, FakeStreamDevice] = {}
+        
+        self._modes: Dict[int, int] = {}
+        self._levels: Dict[int, int] = {}
+        self._listeners: Dict[int, Callable[[bool], None]] = {}
+        self._callbacks: List[FakePi.Callback] = []
+        self._pwm: Dict[int, Dict[str, int]] = {}
+        
+        self.connected: bool = True
+        
+    @property
+    def latency(self):
+        return self._latency
+    
+    @latency.setter
+    def latency(self, val: float):
+        self._latency = val
+        
+    def _transact(self) -> None:
+        if self._latency > 0:
+            time.sleep(self._latency)
+            
+    def stop(self) -> None:
+        self.connected = False
+        
+    #   -   -   -   -   -   -   -   -   -   -   -   -   -   -   -   -   -   -   #
+    #   Devices                                                                 #
+    #   -   -   -   -   -   -   -   -   -   -   -   -   -   -   -   -   -   -   #
+        
+    def attach_i2c(self, address: int, device: FakeRegisterDevice, bus: int = 1) -> None:
+        """Connect a device with an address of an I2C bus."""
+        self._devices_i2c[(bus, address)] = device
+        
+    def attach_serial(self, port: str, device: FakeStreamDevice) -> None:
+        """Connect a device with a serial port."""
+        self._devices_serial[port] = device
+        
+    def attach_gpio(self, gpio: int, listener: Callable[[bool], None]) -> None:
+        """Give levels written to a GPIO to a listener such as an input pin of a device."""
+        self._listeners[gpio] = listener
+        
+    def set_level(self, gpio: int, level: bool, tick: Optional[int] = None) -> None:
+        """Drive a GPIO from outside, for example by an output pin of a device.
+        
+        Callbacks registered on the GPIO are called in the caller thread.
+        """
+        level = int(bool(level))
+        with self._lock:
+            if self._levels.get(gpio, self.LOW) == level:
+                return
+            self._levels[gpio] = level
+            callbacks = [cb for cb in self._callbacks if cb.gpio == gpio]
+            
+        if tick is None:
+            tick = self.get_current_tick()
+        for cb in callbacks:
+            if cb.edge == self.EITHER_EDGE or (cb.edge == self.RISING_EDGE) == bool(level):
+                cb.tally += 1
+                cb.func(gpio, level, tick & self.TICK_MAX)
+        
+    #   -   -   -   -   -   -   -   -   -   -   -   -   -   -   -   -   -   -   #
+    #   I2C                                                                     #
+    #   -   -   -   -   -   -   -   -   -   -   -   -   -   -   -   -   -   -   #
+    
+    def _get_i2c(self, handle: int) -> FakeRegisterDevice:
+        device = self._handles_i2c.get(handle)
+        if device is None:
+            raise ValueError(
+                f"'{handle}' is not an opened I2C handle."
+            )
+        return device
+        
+    def i2c_open(self, i2c_bus: int, i2c_address: int, i2c_flags: int = 0) -> int:
+        device = self._devices_i2c.get((i2c_bus, i2c_address))
+        if device is None:
+            raise ValueError(
+                f"No device is attached to the address {hex(i2c_address)} of the bus {i2c_bus}."
+            )
+        handle = next(self._handles)
+        self._handles_i2c[handle] = device
+        return handle
+    
+    def i2c_close(self, handle: int) -> None:
+        self._handles_i2c.pop(handle, None)
+        
+    def i2c_read_i2c_block_data(self, handle: int, reg: int, count: int) -> Tuple[int, bytearray]:
+        device = self._get_i2c(handle)
+        with self._lock:
+            self._transact()
+            data = device.read(reg, count)
+        return (len(data), bytearray(data))
+    
+    def i2c_read_byte_data(self, handle: int, reg: int) -> int:
+        return self.i2c_read_i2c_block_data(handle, reg, 1)[1][0]
+    
+    def i2c_write_i2c_block_data(self, handle: int, reg: int, data: Union[bytes, bytearray]) -> None:
+        device = self._get_i2c(handle)
+        with self._lock:
+            self._transact()
+            device.write(reg, bytes(data))
+    
+    def i2c_write_byte_data(self, handle: int, reg: int, byte_val: int) -> None:
+        self.i2c_write_i2c_block_data(handle, reg, bytes((byte_val, )))
+        
+    #   -   -   -   -   -   -   -   -   -   -   -   -   -   -   -   -   -   -   #
+    #   Serial                                                                  #
+    #   -   -   -   -   -   -   -   -   -   -   -   -   -   -   -   -   -   -   #
+    
+    def _get_serial(self, handle: int) -> FakeStreamDevice:
+        device = self._handles_serial.get(handle)
+        if device is None:
+            raise ValueError(
+                f"'{handle}' is not an opened serial handle."
+            )
+        return device
+    
+    def serial_open(self, tty: str, baud: int, ser_flags: int = 0) -> int:
+        device = self._devices_serial.get(tty)
+        if device is None:
+            raise ValueError(
+                f"No device is attached to '{tty}'."
+            )
+        handle = next(self._handles)
+        self._handles_serial[handle] = device
+        return handle
+    
+    def serial_close(self, handle: int) -> None:
+        self._handles_serial.pop(handle, None)
+        
+    def serial_data_available(self, handle: int) -> int:
+        return self._get_serial(handle).counts_available
+    
+    def serial_read(self, handle: int, count: int = 1000) -> Tuple[int, bytearray]:
+        device = self._get_serial(handle)
+        self._transact()
+        data = device.read(count)
+        return (len(data), bytearray(data))
+    
+    def serial_write(self, handle: int, data: Union[bytes, bytearray]) -> None:
+        device = self._get_serial(handle)
+        self._transact()
+        device.write(bytes(data))
+        
+    #   -   -   -   -   -   -   -   -   -   -   -   -   -   -   -   -   -   -   #
+    #   GPIO                                                                    #
+    #   -   -   -   -   -   -   -   -   -   -   -   -   -   -   -   -   -   -   #
+    
+    @staticmethod
+    def get_current_tick() -> int:
+        return (time.perf_counter_ns() // 1000) & FakePi.TICK_MAX
+    
+    def set_mode(self, gpio: int, mode: int) -> None:
+        self._modes[gpio] = mode
+        
+    def get_mode(self, gpio: int) -> int:
+        return self._modes.get(gpio, self.INPUT)
+    
+    def set_pull_up_down(self, gpio: int, pud: int) -> None:
+        if self.get_mode(gpio) == self.INPUT and pud != self.PUD_OFF:
+            self.set_level(gpio, pud == self.PUD_UP)
+    
+    def read(self, gpio: int) -> int:
+        return self._levels.get(gpio, self.LOW)
+    
+    def write(self, gpio: int, level: int) -> None:
+        self.set_level(gpio, level)
+        listener = self._listeners.get(gpio)
+        if listener is not None:
+            listener(bool(level))
+            
+    def callback(self, user_gpio: int, edge: int = RISING_EDGE, func: Optional[Callable[[int, int, int], None]] = None):
+        cb = self.Callback(self, user_gpio, edge, func if func is not None else lambda *args: None)
+        with self._lock:
+            self._callbacks.append(cb)
+        return cb
+    
+    def _cancel(self, cb: Callback) -> None:
+        with self._lock:
+            if cb in self._callbacks:
+                self._callbacks.remove(cb)
+                
+    def _set_pwm(self, user_gpio: int, key: str, value: int) -> int:
+        self._pwm.setdefault(user_gpio, {})[key] = value
+        return 0
+                
+    def set_PWM_dutycycle(self, user_gpio: int, dutycycle: int) -> int:
+        return self._set_pwm(user_gpio, "dutycycle", dutycycle)
+    
+    def set_PWM_frequency(self, user_gpio: int, frequency: int) -> int:
+        return self._set_pwm(user_gpio, "frequency", frequency)
+    
+    def set_PWM_range(self, user_gpio: int, range_: int) -> int:
+        return self._set_pwm(user_gpio, "range", range_)
+    
+    def get_PWM_dutycycle(self, user_gpio: int) -> int:
+        return self._pwm.get(user_gpio, {}).get("dutycycle", 0)
@@ -0,0 +1,92 @@
+#! python3
+
+"""
+
+pisat.tester.handler.fake_serial_handler
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+A serial handler connected with an emulated device.
+Bytes written by a driver are sent to a FakeStreamDevice, and 
+bytes sent by the device are read by the driver through the buffer 
+of SerialHandlerBase. Each transaction can take a latency as a real 
+port does.
+
+[info]
+pisat.handler.SerialHandlerBase
+pisat.tester.handler.FakeStreamDevice
+"""
+
+import time
+from typing import Optional, Union
+
+from pisat.handler.serial_handler_base import SerialHandlerBase
+from pisat.tester.handler.fake_device import FakeStreamDevice
+
+
+class FakeSerialHandler(SerialHandlerBase):
+    """A serial handler connected with an emulated device.
+    
+    Examples
+    --------
+        >> device = FakeGPS(speed=10.)
+        >> handler = FakeSerialHandler(device, baudrate=9600)
+        >> gps = SerialGPS(handler, name="gps")
+    """
+    
+    def __init__(self,
+                 device: FakeStreamDevice,
+                 port: str = "fake",
+                 baudrate: int = 115200,
+                 latency: float = 0.,
+                 name: Optional[str] = None) -> None:
+        """
+        Parameters
+        ----------
+            device : FakeStreamDevice
+                Device connected with the handler.
+            port : str, optional
+                Name of the port, by default "fake".
+            baudrate : int, optional
+                Baudrate, by default 115200.
+            latency : float, optional
+                Time taken by a transaction in seconds, by default 0.
+            name : Optional[str], optional
+                Name of the component, by default None.
+        """
+        if not isinstance(device, FakeStreamDevice):
+            raise TypeError(
+                "'device' must be FakeStreamDevice."
+            )
+        super().__init__(port, baudrate, name=name)
+        
+        self._device: FakeStreamDevice = device
+        self._latency: float = latency
+        
+    @property
+    def device(self):
+        return self._device
+    
+    @property
+    def latency(self):
+        return self._latency
+    
+    @latency.setter
+    def latency(self, val: float):
+        self._latency = val
+        
+    def _transact(self) -> None:
+        if self._latency > 0:
+            time.sleep(self._latency)
+    
+    def _counts_pending(self) -> int:
+        return self._device.counts_available
+    
+    def _read_pending(self, count: int) -> bytes:
+        self._transact()
+        return self._device.read(count)
+    
+    def _wait_pending(self, timeout: float) -> bool:
+        return self._device.wait(timeout)
+    
+    def write(self, data: Union[bytes, bytearray]) -> None:
+        self._transact()
+        self._device.write(data)
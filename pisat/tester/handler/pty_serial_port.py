@@ -0,0 +1,126 @@
+#! python3
+
+"""
+
+pisat.tester.handler.pty_serial_port
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+A pseudo terminal connected with an emulated device.
+The slave side of a pty pair is a real serial port for programs, 
+so PyserialSerialHandler or any other serial tools can open it with 
+the path, and a thread relays bytes between the master side and 
+an emulated device. This class is useful for testing the whole 
+serial stack including pyserial and the OS on any POSIX machines.
+
+[info]
+pisat.handler.PyserialSerialHandler
+pisat.tester.handler.FakeStreamDevice
+"""
+
+import os
+import select
+from threading import Event, Thread
+import time
+import tty
+from typing import Optional
+
+from pisat.tester.handler.fake_device import FakeStreamDevice
+
+
+class PtySerialPort:
+    """A pseudo terminal connected with an emulated device.
+    
+    Examples
+    --------
+        >> port = PtySerialPort(FakeGPS())
+        >> port.start()
+        >> handler = PyserialSerialHandler(port.path, baudrate=9600)
+        >> gps = SerialGPS(handler, name="gps")
+        >> ...
+        >> port.close()
+    """
+    
+    # sec
+    INTERVAL_RELAY = 1e-3
+    
+    SIZE_READ = 4096
+    
+    def __init__(self, device: FakeStreamDevice, latency: float = 0.) -> None:
+        """
+        Parameters
+        ----------
+            device : FakeStreamDevice
+                Device connected with the port.
+            latency : float, optional
+                Delay of relaying bytes in seconds, by default 0.
+        """
+        if not isinstance(device, FakeStreamDevice):
+            raise TypeError(
+                "'device' must be FakeStreamDevice."
+            )
+        
+        self._device: FakeStreamDevice = device
+        self._latency: float = latency
+        
+        self._master, self._slave = os.openpty()
+        tty.setraw(self._slave)
+        self._path: str = os.ttyname(self._slave)
+        
+        self._event_stop: Event = Event()
+        self._thread: Optional[Thread] = None
+        
+    @property
+    def path(self) -> str:
+        """Path of the port to be opened by programs."""
+        return self._path
+    
+    @property
+    def device(self):
+        return self._device
+    
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+    
+    def start(self) -> None:
+        """Start relaying bytes in a daemon thread."""
+        if self.running:
+            return
+        self._event_stop.clear()
+        self._thread = Thread(target=self._run, daemon=True)
+        self._thread.start()
+        
+    def stop(self) -> None:
+        """Stop relaying bytes."""
+        self._event_stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        
+    def close(self) -> None:
+        """Stop relaying bytes and close the pty pair."""
+        self.stop()
+        for fd in (self._master, self._slave):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+            
+    def _run(self) -> None:
+        while not self._event_stop.is_set():
+            readable, _, _ = select.select([self._master], [], [], self.INTERVAL_RELAY)
+            if len(readable):
+                try:
+                    data = os.read(self._master, self.SIZE_READ)
+                except OSError:
+                    break
+                self._delay()
+                self._device.write(data)
+                
+            if self._device.counts_available:
+                data = self._device.read(self.SIZE_READ)
+                self._delay()
+                os.write(self._master, data)
+                
+    def _delay(self) -> None:
+        if self._latency > 0:
+            time.sleep(self._latency)
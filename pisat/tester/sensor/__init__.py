@@ -1,3 +1,4 @@
 
 
 from pisat.tester.sensor.sensor_testor import SensorTestor
+from pisat.tester.sensor.sensor_benchmark import BenchmarkResult, Regression, SensorBenchmark
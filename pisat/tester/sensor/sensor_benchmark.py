@@ -0,0 +1,372 @@
+#! python3
+
+"""
+
+pisat.tester.sensor.sensor_benchmark
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+A benchmark runner of sensors with latency percentiles.
+This class measures latency of the 'read' method of a sensor
+or a sensor group with time.perf_counter_ns after some warmup
+reads, and reports its distribution as percentiles with the
+throughput. Results can be dumped as JSON and compared with
+a baseline stored before, so that regressions of drivers or
+handlers can be detected on real hardware and also with
+simulated devices.
+
+[info]
+pisat.sensor.SensorBase
+pisat.sensor.SensorGroup
+"""
+
+import json
+import time
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+import numpy as np
+
+from pisat.sensor.sensor_base import SensorBase
+from pisat.sensor.sensor_group import SensorGroup
+
+
+class BenchmarkResult:
+    """Result of a benchmark of a sensor.
+
+    Latencies are held in nanoseconds, and statistics are given
+    in seconds except for 'throughput', which is reads per second.
+    """
+
+    PERCENTILES = (50, 95, 99)
+
+    def __init__(self,
+                 name: str,
+                 latencies: Sequence[int],
+                 time_total: int,
+                 warmup: int = 0) -> None:
+        """
+        Parameters
+        ----------
+            name : str
+                Name of the sensor benchmarked.
+            latencies : Sequence[int]
+                Latencies of reads in nanoseconds.
+            time_total : int
+                Total time of the reads in nanoseconds including intervals.
+            warmup : int, optional
+                Number of reads ignored as warmup, by default 0.
+        """
+        self._name: str = name
+        self._latencies: np.ndarray = np.asarray(latencies, dtype=np.int64)
+        self._time_total: int = time_total
+        self._warmup: int = warmup
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def latencies(self) -> np.ndarray:
+        """Latencies of reads in nanoseconds."""
+        return self._latencies
+
+    @property
+    def times(self) -> int:
+        return len(self._latencies)
+
+    @property
+    def warmup(self) -> int:
+        return self._warmup
+
+    def percentile(self, q: Union[int, float]) -> float:
+        """Calculate a percentile of latencies in seconds.
+
+        Parameters
+        ----------
+            q : Union[int, float]
+                Percentile between 0 and 100.
+
+        Returns
+        -------
+            float
+                Latency in seconds.
+        """
+        return float(np.percentile(self._latencies, q)) * 1e-9
+
+    @property
+    def p50(self) -> float:
+        return self.percentile(50)
+
+    @property
+    def p95(self) -> float:
+        return self.percentile(95)
+
+    @property
+    def p99(self) -> float:
+        return self.percentile(99)
+
+    @property
+    def max(self) -> float:
+        return int(self._latencies.max()) * 1e-9
+
+    @property
+    def min(self) -> float:
+        return int(self._latencies.min()) * 1e-9
+
+    @property
+    def mean(self) -> float:
+        return float(self._latencies.mean()) * 1e-9
+
+    @property
+    def throughput(self) -> float:
+        """Reads per second over the whole run."""
+        if self._time_total <= 0:
+            return float("inf")
+        return self.times / (self._time_total * 1e-9)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self._name,
+            "times": self.times,
+            "warmup": self._warmup,
+            "min": self.min,
+            "mean": self.mean,
+            "p50": self.p50,
+            "p95": self.p95,
+            "p99": self.p99,
+            "max": self.max,
+            "throughput": self.throughput,
+        }
+
+    def to_json(self, **kwargs) -> str:
+        return json.dumps(self.to_dict(), **kwargs)
+
+    def __repr__(self) -> str:
+        return (f"{self.__class__.__name__}({self._name!r}, times={self.times}, "
+                f"p50={self.p50:.6f}, p95={self.p95:.6f}, p99={self.p99:.6f}, "
+                f"max={self.max:.6f}, throughput={self.throughput:.1f})")
+
+
+class Regression:
+    """A statistic of a result worse than the baseline."""
+
+    def __init__(self, name: str, key: str, value: float, baseline: float) -> None:
+        self.name: str = name
+        self.key: str = key
+        self.value: float = value
+        self.baseline: float = baseline
+
+    @property
+    def ratio(self) -> float:
+        if self.baseline == 0:
+            return float("inf")
+        return self.value / self.baseline
+
+    def __repr__(self) -> str:
+        return (f"{self.__class__.__name__}({self.name!r}, {self.key!r}, "
+                f"value={self.value:.6f}, baseline={self.baseline:.6f})")
+
+
+class SensorBenchmark:
+    """A benchmark runner of sensors with latency percentiles.
+
+    Examples
+    --------
+        >> benchmark = SensorBenchmark(bme280, warmup=10)
+        >> result = benchmark.run(times=1000)
+        >> result.p99
+        >> SensorBenchmark.save("baseline.json", result)
+        >>
+        >> # later, with a modified driver
+        >> regressions = SensorBenchmark.compare(benchmark.run(times=1000),
+                                                 SensorBenchmark.load("baseline.json"))
+
+    See Also
+    --------
+        pisat.tester.sensor.SensorTestor : Simple tester of a sensor.
+    """
+
+    # NOTE
+    #   Keys of statistics compared with a baseline. Latencies regress
+    #   when they get larger, and throughput regresses when it gets smaller.
+    KEYS_LATENCY = ("p50", "p95", "p99")
+    KEY_THROUGHPUT = "throughput"
+
+    def __init__(self, sensor: SensorBase, warmup: int = 10) -> None:
+        """
+        Parameters
+        ----------
+            sensor : SensorBase
+                Sensor or SensorGroup to be benchmarked.
+            warmup : int, optional
+                Number of reads before measurement, by default 10.
+
+        Raises
+        ------
+            TypeError
+                Raised if 'sensor' is not SensorBase.
+            ValueError
+                Raised if 'warmup' is negative.
+        """
+        if not isinstance(sensor, SensorBase):
+            raise TypeError(
+                "'sensor' must be SensorBase."
+            )
+        if warmup < 0:
+            raise ValueError(
+                "'warmup' must be no less than 0."
+            )
+
+        self._sensor: SensorBase = sensor
+        self._warmup: int = warmup
+
+    @property
+    def sensor(self):
+        return self._sensor
+
+    @property
+    def warmup(self):
+        return self._warmup
+
+    @staticmethod
+    def measure(sensor: SensorBase,
+                times: int = 100,
+                warmup: int = 10,
+                interval: float = 0.) -> BenchmarkResult:
+        """Measure latencies of the 'read' method of a sensor.
+
+        Parameters
+        ----------
+            sensor : SensorBase
+                Sensor to be measured.
+            times : int, optional
+                Number of reads measured, by default 100.
+            warmup : int, optional
+                Number of reads before measurement, by default 10.
+            interval : float, optional
+                Sleep between reads in seconds, by default 0.
+
+        Returns
+        -------
+            BenchmarkResult
+                Result of the benchmark.
+        """
+        if times <= 0:
+            raise ValueError(
+                "'times' must be larger than 0."
+            )
+
+        read = sensor.read
+        counter = time.perf_counter_ns
+        for _ in range(warmup):
+            read()
+
+        latencies = [0] * times
+        time_init = counter()
+        for i in range(times):
+            time_read = counter()
+            read()
+            latencies[i] = counter() - time_read
+            if interval > 0:
+                time.sleep(interval)
+        time_total = counter() - time_init
+
+        return BenchmarkResult(sensor.name, latencies, time_total, warmup=warmup)
+
+    def run(self, times: int = 100, interval: float = 0.) -> BenchmarkResult:
+        """Benchmark the sensor.
+
+        Parameters
+        ----------
+            times : int, optional
+                Number of reads measured, by default 100.
+            interval : float, optional
+                Sleep between reads in seconds, by default 0.
+
+        Returns
+        -------
+            BenchmarkResult
+                Result of the benchmark.
+        """
+        return self.measure(self._sensor, times=times, warmup=self._warmup, interval=interval)
+
+    def run_all(self, times: int = 100, interval: float = 0.) -> Dict[str, BenchmarkResult]:
+        """Benchmark the sensor and each sensor in it if it is a SensorGroup.
+
+        Parameters
+        ----------
+            times : int, optional
+                Number of reads measured, by default 100.
+            interval : float, optional
+                Sleep between reads in seconds, by default 0.
+
+        Returns
+        -------
+            Dict[str, BenchmarkResult]
+                Results of the benchmark indexed by names of sensors.
+        """
+        results = {}
+        if isinstance(self._sensor, SensorGroup):
+            for name, sensor in self._sensor.get_sensors().items():
+                results[name] = self.measure(sensor, times=times, warmup=self._warmup, interval=interval)
+        results[self._sensor.name] = self.run(times=times, interval=interval)
+        return results
+
+    @staticmethod
+    def dumps(*results: BenchmarkResult, **kwargs) -> str:
+        """Dump results as JSON indexed by names of sensors."""
+        return json.dumps({result.name: result.to_dict() for result in results}, **kwargs)
+
+    @classmethod
+    def save(cls, path: str, *results: BenchmarkResult) -> None:
+        """Save results as JSON to be used as a baseline."""
+        with open(path, "wt") as f:
+            f.write(cls.dumps(*results, indent=4))
+
+    @staticmethod
+    def load(path: str) -> Dict[str, Dict[str, Any]]:
+        """Load a baseline saved by 'save'."""
+        with open(path, "rt") as f:
+            return json.load(f)
+
+    @classmethod
+    def compare(cls,
+                results: Union[BenchmarkResult, Sequence[BenchmarkResult], Dict[str, BenchmarkResult]],
+                baseline: Dict[str, Dict[str, Any]],
+                tolerance: float = 0.1) -> List[Regression]:
+        """Compare results with a baseline and find regressions.
+
+        Parameters
+        ----------
+            results : Union[BenchmarkResult, Sequence[BenchmarkResult], Dict[str, BenchmarkResult]]
+                Results to be compared.
+            baseline : Dict[str, Dict[str, Any]]
+                Baseline loaded by 'load', or parsed from the output of 'dumps'.
+            tolerance : float, optional
+                Ratio of allowed degradation, by default 0.1. For example,
+                p99 latency 10 % larger than the baseline is allowed with 0.1.
+
+        Returns
+        -------
+            List[Regression]
+                Statistics worse than the baseline beyond the tolerance.
+                Sensors not in the baseline are ignored.
+        """
+        if isinstance(results, BenchmarkResult):
+            results = [results]
+        elif isinstance(results, dict):
+            results = list(results.values())
+
+        regressions = []
+        for result in results:
+            base: Optional[Dict[str, Any]] = baseline.get(result.name)
+            if base is None:
+                continue
+
+            stats = result.to_dict()
+            for key in cls.KEYS_LATENCY:
+                if key in base and stats[key] > base[key] * (1 + tolerance):
+                    regressions.append(Regression(result.name, key, stats[key], base[key]))
+            key = cls.KEY_THROUGHPUT
+            if key in base and stats[key] < base[key] * (1 - tolerance):
+                regressions.append(Regression(result.name, key, stats[key], base[key]))
+
+        return regressions
@@ -1,7 +1,10 @@
 
 
-import re
-from typing import Dict, Optional, Tuple, Type, Union
+import copy
+import time
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Type, Union
+
+import numpy as np
 
 from pisat.model.datamodel import DataModelBase, loggable
 from pisat.util.type import empty_None
@@ -36,12 +39,14 @@ class NMEAModelBase(DataModelBase):
         
         @classmethod
         def calc_date_utc(cls, raw: str) -> Tuple[Union[int]]:
-            day, month, year = raw[:2], raw[:4], raw[4:]
+            day, month, year = raw[:2], raw[2:4], raw[4:]
             return (int(day), int(month), int(year))
         
         @classmethod
         def calc_latitude(cls, value: str, ns: str) -> float:
-            d, m = float(value[:-8]), float(value[-8:])
+            # NOTE the number of decimal places depends on receivers.
+            point = value.find(".")
+            d, m = float(value[:point - 2]), float(value[point - 2:])
             degree = d + m / 60
             if ns == "S":
                 degree = - degree
@@ -49,7 +54,9 @@ class NMEAModelBase(DataModelBase):
         
         @classmethod
         def calc_longitude(cls, value: str, ew: str) -> float:
-            d, m = float(value[:-8]), float(value[-8:])
+            # NOTE the number of decimal places depends on receivers.
+            point = value.find(".")
+            d, m = float(value[:point - 2]), float(value[point - 2:])
             degree = d + m / 60
             if ew == "W":
                 degree = - degree
@@ -518,41 +525,507 @@ TYPE_MODELCLASS = Union[Type[GGAModel], Type[GLLModel], Type[GSAModel], Type[GSV
 
 
 class NMEAParser:
+    """Parser of NMEA 0183 sentences.
+    
+    The parser rejects sentences as early and as cheaply as possible. 
+    The type of a sentence is checked on the raw bytes before anything 
+    is decoded, so sentences of formats not given to the parser cost 
+    only a slice and a lookup. Fields are split by str.split instead 
+    of a regular expression, and the checksum is verified before a 
+    model is built, so corrupted sentences are never returned.
+    
+    Examples
+    --------
+        >> parser = NMEAParser("gps", formats=("GGA", "RMC"))
+        >> model = parser.parse(b"$GNGGA,...*77\\r\\n")
+        >> models = parser.parse_many(handler.read_available())
+    """
     
     HEAD = "$"
     TAIL = "\r\n"
     DELIMITER_FILED = ","
     DELIMITER_CHECKSUM = "*"
-    DELIMITER_PATTERN = "[,*]"
         
-    MODELS: Dict[bytes, TYPE_MODELCLASS] = {GGAModel.FORMAT: GGAModel, GLLModel.FORMAT: GLLModel, 
-                                            GSAModel.FORMAT: GSAModel, GSVModel.FORMAT: GSVModel, 
-                                            RMCModel.FORMAT: RMCModel, VTGModel.FORMAT: VTGModel,
-                                            ZDAModel.FORMAT: ZDAModel}
-    
-    def __init__(self, comp_name: str) -> None:
-        self._comp_name = comp_name
+    MODELS: Dict[str, TYPE_MODELCLASS] = {GGAModel.FORMAT: GGAModel, GLLModel.FORMAT: GLLModel, 
+                                          GSAModel.FORMAT: GSAModel, GSVModel.FORMAT: GSVModel, 
+                                          RMCModel.FORMAT: RMCModel, VTGModel.FORMAT: VTGModel,
+                                          ZDAModel.FORMAT: ZDAModel}
+    
+    def __init__(self, 
+                 comp_name: str,
+                 formats: Optional[Iterable[str]] = None,
+                 checksum: bool = True) -> None:
+        """
+        Parameters
+        ----------
+            comp_name : str
+                Name of the component given to models as the publisher.
+            formats : Optional[Iterable[str]], optional
+                Formats to be parsed like "GGA", by default None. 
+                If None, all formats in NMEAParser.MODELS are parsed.
+            checksum : bool, optional
+                If True, sentences whose checksum is missing or wrong 
+                are rejected, by default True.
+
+        Raises
+        ------
+            ValueError
+                Raised if 'formats' includes an unsupported format.
+        """
+        if formats is None:
+            formats = self.MODELS.keys()
         
-    def parse(self, sentence: bytes) -> TYPE_MODELS:
+        self._comp_name: str = comp_name
+        self._checksum: bool = checksum
+        self._models: Dict[bytes, TYPE_MODELCLASS] = {}
         
-        try:
-            sentence = sentence.decode()
-        except UnicodeDecodeError:
-            return None
+        for fmt in formats:
+            modeltype = self.MODELS.get(fmt)
+            if modeltype is None:
+                raise ValueError(
+                    f"'{fmt}' is not a supported format."
+                )
+            self._models[fmt.encode()] = modeltype
             
-        if len(sentence) < 5:
+    @property
+    def formats(self) -> Tuple[str]:
+        return tuple(fmt.decode() for fmt in self._models.keys())
+    
+    @property
+    def checksum(self) -> bool:
+        return self._checksum
+            
+    @staticmethod
+    def calc_checksum(body: bytes) -> int:
+        """Calculate XOR of all bytes between '$' and '*'.
+        
+        The bytes are folded as one integer, so the loop runs only 
+        log2(len(body)) times.
+        """
+        value = int.from_bytes(body, "little")
+        width = len(body)
+        while width > 1:
+            half = (width + 1) // 2
+            value = (value >> (half << 3)) ^ (value & ((1 << (half << 3)) - 1))
+            width = half
+        return value
+        
+    def parse(self, sentence: bytes) -> TYPE_MODELS:
+        """Parse a sentence terminated by a line feed.
+
+        Parameters
+        ----------
+            sentence : bytes
+                Sentence starting with '$' and ending with '\\r\\n' or '\\n'.
+
+        Returns
+        -------
+            TYPE_MODELS
+                Model of the sentence, or None if the sentence is 
+                invalid or its format is not to be parsed.
+        """
+        if sentence[-1:] != b"\n":
             return None
-        if sentence[0] != self.HEAD or sentence[-2:] != self.TAIL:
+        if sentence[-2:-1] == b"\r":
+            return self._parse_line(sentence[:-2])
+        else:
+            return self._parse_line(sentence[:-1])
+        
+    def parse_many(self, buffer: bytes) -> List[TYPE_MODELS]:
+        """Parse all sentences in a buffer.
+        
+        Invalid sentences and ones of formats not to be parsed are 
+        skipped. Bytes after the last line feed are ignored as an 
+        incomplete sentence. Checksums of all sentences are calculated 
+        at once from the prefix XOR of the buffer.
+
+        Parameters
+        ----------
+            buffer : bytes
+                Bytes including multiple sentences.
+
+        Returns
+        -------
+            List[TYPE_MODELS]
+                Models of the sentences in the order of the buffer.
+        """
+        result = []
+        buffer = bytes(buffer)
+        lines = buffer.split(b"\n")
+        lines.pop()
+        
+        # NOTE
+        #   XOR of buffer[i:j] is prefix[i] ^ prefix[j], where prefix[i]
+        #   is XOR of buffer[:i], so each checksum costs two lookups.
+        prefix = None
+        if self._checksum and len(lines):
+            accumulated = np.zeros(len(buffer) + 1, dtype=np.uint8)
+            np.bitwise_xor.accumulate(np.frombuffer(buffer, dtype=np.uint8), out=accumulated[1:])
+            prefix = accumulated.tobytes()
+        
+        head = 0
+        for line in lines:
+            offset = head
+            head += len(line) + 1
+            if line[-1:] == b"\r":
+                line = line[:-1]
+            model = self._parse_line(line, prefix=prefix, offset=offset)
+            if model is not None:
+                result.append(model)
+        return result
+        
+    def _parse_line(self, 
+                    line: bytes, 
+                    prefix: Optional[bytes] = None, 
+                    offset: int = 0) -> TYPE_MODELS:
+        # NOTE
+        #   Checks are ordered from the cheapest one, so sentences of
+        #   formats not to be parsed are rejected before decoding.
+        if line[:1] != b"$" or line[6:7] != b",":
             return None
-                
-        fields = re.split(self.DELIMITER_PATTERN, sentence[1:-2])
-        modeltype = self.MODELS.get(fields[0][2:])
+        modeltype = self._models.get(bytes(line[3:6]))
         if modeltype is None:
             return None
+        
+        # NOTE 
+        #   A memoryview given by NMEAStreamDecoder is copied only here, 
+        #   after the sentence is known to be parsed.
+        if isinstance(line, memoryview):
+            line = line.tobytes()
+        
+        star = line.rfind(b"*")
+        if star < 0:
+            if self._checksum:
+                return None
+            body, checksum = line[1:], b""
+        else:
+            body, checksum = line[1:star], line[star + 1:]
+            if self._checksum:
+                if prefix is None:
+                    expected = self.calc_checksum(body)
+                else:
+                    expected = prefix[offset + 1] ^ prefix[offset + star]
+                try:
+                    if int(checksum, 16) != expected:
+                        return None
+                except ValueError:
+                    return None
+        
+        try:
+            fields = body.decode("ascii").split(self.DELIMITER_FILED)
+            fields.append(checksum.decode("ascii"))
+        except UnicodeDecodeError:
+            return None
+        
         # a length of the GSV format is changable, but the others not.
-        if modeltype != GSVModel and len(fields) != modeltype.NUM_FIELDS:
+        if modeltype is not GSVModel and len(fields) != modeltype.NUM_FIELDS:
             return None
-                 
+        
         model = modeltype(self._comp_name)
-        model.setup(fields)
+        try:
+            model.setup(fields)
+        except (ValueError, IndexError):
+            return None
         return model
+
+    
+class NMEAStreamDecoder:
+    """Incremental decoder of NMEA sentences over chunks of bytes.
+    
+    Chunks can be split at any position, e.g. chunks read from a serial 
+    port as they arrive, and a sentence split across chunks is kept 
+    until it is completed. Sentences are sliced from the internal buffer 
+    as memoryviews, so sentences not to be parsed are never copied. 
+    If garbage is received, the decoder resynchronizes on the next '$'.
+    
+    Examples
+    --------
+        >> decoder = NMEAStreamDecoder(NMEAParser("gps"))
+        >> for model in decoder.feed(handler.read_available(timeout=0.1)):
+        >>     fix.update(model)
+    """
+    
+    HEAD = b"$"
+    TAIL = b"\n"
+    
+    # NOTE 
+    #   NMEA 0183 limits a sentence to 82 characters, but some receivers 
+    #   output longer proprietary ones. Bytes without a line feed longer 
+    #   than this are regarded as garbage.
+    MAX_LEN_SENTENCE = 256
+    
+    def __init__(self, parser: NMEAParser) -> None:
+        if not isinstance(parser, NMEAParser):
+            raise TypeError(
+                "'parser' must be NMEAParser."
+            )
+        
+        self._parser: NMEAParser = parser
+        self._buffer: bytearray = bytearray()
+        self._cursor: int = 0
+        
+    @property
+    def parser(self):
+        return self._parser
+    
+    @property
+    def pending(self) -> int:
+        """Number of bytes of an incomplete sentence."""
+        return len(self._buffer) - self._cursor
+    
+    def reset(self) -> None:
+        """Discard an incomplete sentence.
+        """
+        self._buffer.clear()
+        self._cursor = 0
+        
+    def feed(self, chunk: Union[bytes, bytearray, memoryview]) -> Iterator[TYPE_MODELS]:
+        """Add a chunk and iterate models of completed sentences.
+        
+        The chunk is decoded immediately, so no sentence is lost 
+        even if the returned iterator is not consumed.
+
+        Parameters
+        ----------
+            chunk : Union[bytes, bytearray, memoryview]
+                Bytes received.
+
+        Returns
+        -------
+            Iterator[TYPE_MODELS]
+                Models of valid sentences in the order of arrival.
+        """
+        # Compact the buffer only when consumed bytes are dominant.
+        if self._cursor and self._cursor >= len(self._buffer) // 2:
+            del self._buffer[:self._cursor]
+            self._cursor = 0
+        self._buffer.extend(chunk)
+        
+        # NOTE 
+        #   The buffer can't be resized while a memoryview of it exists, 
+        #   so all completed sentences are parsed before returning them.
+        models = []
+        with memoryview(self._buffer) as view:
+            self._decode(view, models)
+        return iter(models)
+        
+    def _decode(self, view: memoryview, models: List[TYPE_MODELS]) -> None:
+        buffer = self._buffer
+        while True:
+            head = buffer.find(self.HEAD, self._cursor)
+            if head < 0:
+                self._cursor = len(buffer)
+                return
+            
+            tail = buffer.find(self.TAIL, head)
+            if tail < 0:
+                self._cursor = head
+                if len(buffer) - head > self.MAX_LEN_SENTENCE:
+                    self._cursor = head + 1
+                    continue
+                return
+            
+            # NOTE 
+            #   '$' before the line feed means the former sentence was 
+            #   broken, so the decoder resynchronizes on the last one.
+            head = buffer.rfind(self.HEAD, head, tail)
+            self._cursor = tail + 1
+            
+            model = self._parser.parse(view[head:tail + 1])
+            if model is not None:
+                models.append(model)
+
+
+def iter_nmea(chunks: Iterable[bytes], parser: NMEAParser) -> Iterator[TYPE_MODELS]:
+    """Decode a stream of chunks into models of NMEA sentences.
+    
+    This is the pipeline shared by live readers and capture files.
+
+    Parameters
+    ----------
+        chunks : Iterable[bytes]
+            Chunks of a stream, which may be split at any position.
+        parser : NMEAParser
+            Parser of sentences.
+
+    Returns
+    -------
+        Iterator[TYPE_MODELS]
+            Models of valid sentences in the order of the stream.
+    """
+    decoder = NMEAStreamDecoder(parser)
+    for chunk in chunks:
+        yield from decoder.feed(chunk)
+        
+
+def iter_file_chunks(path: str, size: int = 4096) -> Iterator[bytes]:
+    """Iterate chunks of a file like a capture of NMEA sentences.
+    """
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(size)
+            if not len(chunk):
+                break
+            yield chunk
+            
+
+def iter_nmea_file(path: str, 
+                   parser: Optional[NMEAParser] = None, 
+                   size: int = 4096) -> Iterator[TYPE_MODELS]:
+    """Decode a capture file of NMEA sentences like a '.nmea' file.
+
+    Parameters
+    ----------
+        path : str
+            Path of the file.
+        parser : Optional[NMEAParser], optional
+            Parser of sentences, by default None. If None, a parser 
+            of all formats whose component name is "nmea" is used.
+        size : int, optional
+            Size of chunks read from the file, by default 4096.
+
+    Returns
+    -------
+        Iterator[TYPE_MODELS]
+            Models of valid sentences in the file.
+    """
+    if parser is None:
+        parser = NMEAParser("nmea")
+    return iter_nmea(iter_file_chunks(path, size=size), parser)
+    
+    
+class NMEAFix:
+    """Latest state of a fix merged from NMEA sentences.
+    
+    A receiver reports a fix over several sentences, e.g. GGA for 
+    position and altitude, RMC and VTG for velocity and GSA for 
+    dilution of precision. This class merges those sentences into 
+    one state and records when each part of the state was updated, 
+    so users can know how old the values are.
+    
+    Timestamps are seconds since the epoch given by time.time().
+    """
+    
+    def __init__(self) -> None:
+        self.time_utc: Optional[Tuple[Union[int, float]]] = None
+        self.date_utc: Optional[Tuple[int]] = None
+        self.latitude: Optional[float] = None
+        self.longitude: Optional[float] = None
+        self.altitude: Optional[float] = None
+        self.quality: Optional[int] = None
+        self.satellites_used: Optional[int] = None
+        self.status: Optional[str] = None
+        self.speed_knots: Optional[float] = None
+        self.true_course: Optional[float] = None
+        self.fix_type: Optional[str] = None
+        self.PDOP: Optional[float] = None
+        self.HDOP: Optional[float] = None
+        self.VDOP: Optional[float] = None
+        
+        self.timestamp: Optional[float] = None
+        self.timestamp_position: Optional[float] = None
+        self.timestamp_velocity: Optional[float] = None
+        self.timestamp_dop: Optional[float] = None
+        
+    @property
+    def has_position(self) -> bool:
+        return self.latitude is not None and self.longitude is not None
+        
+    def age(self, now: Optional[float] = None) -> Optional[float]:
+        """Seconds since the position was updated last.
+
+        Parameters
+        ----------
+            now : Optional[float], optional
+                Current time, by default None. If None, time.time() is used.
+
+        Returns
+        -------
+            Optional[float]
+                Age of the position, or None if no position has been received.
+        """
+        if self.timestamp_position is None:
+            return None
+        if now is None:
+            now = time.time()
+        return now - self.timestamp_position
+    
+    def copy(self) -> "NMEAFix":
+        return copy.copy(self)
+        
+    def update(self, model: TYPE_MODELS, timestamp: Optional[float] = None) -> bool:
+        """Merge a parsed sentence into the state.
+
+        Parameters
+        ----------
+            model : TYPE_MODELS
+                Model of a sentence returned by NMEAParser.
+            timestamp : Optional[float], optional
+                Time when the sentence was received, by default None. 
+                If None, time.time() is used.
+
+        Returns
+        -------
+            bool
+                True if the state is updated, otherwise False.
+        """
+        if timestamp is None:
+            timestamp = time.time()
+        
+        if isinstance(model, GGAModel):
+            self._update_time(model.time_utc)
+            self.quality = model.quality
+            self.satellites_used = model.satellites_used
+            self.HDOP = model.HDOP
+            # NOTE quality 0 means the fix is not available.
+            if model.quality and model.latitude is not None and model.longitude is not None:
+                self._update_position(model.latitude, model.longitude, timestamp)
+                self.altitude = model.altitude
+        elif isinstance(model, RMCModel):
+            self._update_time(model.time_utc)
+            if model.date_utc is not None:
+                self.date_utc = model.date_utc
+            self.status = model.status
+            if model.status == "A":
+                if model.latitude is not None and model.longitude is not None:
+                    self._update_position(model.latitude, model.longitude, timestamp)
+                self._update_velocity(model.speed_knots, model.true_course, timestamp)
+        elif isinstance(model, VTGModel):
+            if model.speed_knots is not None:
+                self._update_velocity(model.speed_knots, model.true_course, timestamp)
+        elif isinstance(model, GSAModel):
+            self.fix_type = model.fix_type
+            self.PDOP = model.PDOP
+            self.HDOP = model.HDOP
+            self.VDOP = model.VDOP
+            self.timestamp_dop = timestamp
+        elif isinstance(model, GLLModel):
+            self._update_time(model.time_utc)
+            if model.status == "A" and model.latitude is not None and model.longitude is not None:
+                self._update_position(model.latitude, model.longitude, timestamp)
+        elif isinstance(model, ZDAModel):
+            self._update_time(model.time_utc)
+            if model.date_utc is not None:
+                self.date_utc = model.date_utc
+        else:
+            return False
+        
+        self.timestamp = timestamp
+        return True
+            
+    def _update_time(self, time_utc: Optional[Tuple[Union[int, float]]]) -> None:
+        if time_utc is not None:
+            self.time_utc = time_utc
+    
+    def _update_position(self, latitude: float, longitude: float, timestamp: float) -> None:
+        self.latitude = latitude
+        self.longitude = longitude
+        self.timestamp_position = timestamp
+        
+    def _update_velocity(self, 
+                         speed_knots: Optional[float], 
+                         true_course: Optional[float],
+                         timestamp: float) -> None:
+        self.speed_knots = speed_knots
+        self.true_course = true_course
+        self.timestamp_velocity = timestamp
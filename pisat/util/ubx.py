@@ -0,0 +1,568 @@
+#! python3
+
+"""
+
+pisat.util.ubx
+~~~~~~~~~~~~~~
+Parser and builder of frames of the UBX protocol.
+UBX is the binary protocol of u-blox receivers like SAM-M8Q.
+A frame consists of two sync characters, a class, an ID,
+a little-endian length, a payload and a Fletcher checksum.
+Compared with NMEA, one NAV-PVT frame carries time, position,
+velocity and their accuracies without any text formatting.
+
+[info]
+u-blox 8 / u-blox M8 Receiver Description Including Protocol Specification
+    https://www.u-blox.com/en/docs/UBX-13003221
+"""
+
+import struct
+from enum import Enum
+from typing import Dict, Iterable, Iterator, List, Tuple, Type, Union
+
+from pisat.model.datamodel import DataModelBase, loggable
+
+
+SYNC = b"\xb5\x62"
+LEN_HEADER = 6
+LEN_CHECKSUM = 2
+
+
+class UBXClass(Enum):
+    NAV = 0x01
+    ACK = 0x05
+    CFG = 0x06
+
+
+def calc_checksum(data: Union[bytes, bytearray, memoryview]) -> Tuple[int, int]:
+    """Calculate the 8-bit Fletcher checksum of UBX.
+
+    Parameters
+    ----------
+        data : Union[bytes, bytearray, memoryview]
+            Bytes from the class to the end of the payload.
+
+    Returns
+    -------
+        Tuple[int, int]
+            CK_A and CK_B.
+    """
+    ck_a = ck_b = 0
+    for byte in data:
+        ck_a += byte
+        ck_b += ck_a
+    return (ck_a & 0xFF, ck_b & 0xFF)
+
+
+def build_frame(cls: int, id: int, payload: bytes = b"") -> bytes:
+    """Build a UBX frame.
+
+    Parameters
+    ----------
+        cls : int
+            Class of the message.
+        id : int
+            ID of the message.
+        payload : bytes, optional
+            Payload of the message, by default b"".
+
+    Returns
+    -------
+        bytes
+            Frame including the sync characters and the checksum.
+    """
+    body = struct.pack("<BBH", cls, id, len(payload)) + bytes(payload)
+    return SYNC + body + bytes(calc_checksum(body))
+
+
+class UBXModelBase(DataModelBase):
+
+    CLASS: int = None
+    ID: int = None
+    LEN_PAYLOAD: int = 0
+
+    def setup(self, payload: bytes):
+        pass
+
+
+class NAVPVTModel(UBXModelBase):
+    """Model of UBX-NAV-PVT, the navigation position velocity time solution."""
+
+    CLASS = UBXClass.NAV.value
+    ID = 0x07
+    LEN_PAYLOAD = 92
+    FORMAT = "<IHBBBBBBIiBBBBiiiiIIiiiiiIIH6xihH"
+
+    class FixType(Enum):
+        NO_FIX = 0
+        DEAD_RECKONING = 1
+        FIX_2D = 2
+        FIX_3D = 3
+        GNSS_DEAD_RECKONING = 4
+        TIME_ONLY = 5
+
+    # bits of 'valid'
+    BIT_VALID_DATE = 0x01
+    BIT_VALID_TIME = 0x02
+
+    # bits of 'flags'
+    BIT_GNSS_FIX_OK = 0x01
+
+    def setup(self, payload: bytes):
+        (self._iTOW, year, month, day, hour, minute, sec, self._valid,
+         self._time_acc, nano, self._fix_type, self._flags, _, self._num_SV,
+         lon, lat, height, hMSL, h_acc, v_acc, vel_N, vel_E, vel_D,
+         ground_speed, heading, speed_acc, heading_acc, pDOP,
+         _, _, _) = struct.unpack(self.FORMAT, payload)
+
+        self._date_utc = (day, month, year)
+        self._time_utc = (hour, minute, sec + nano * 1e-9)
+
+        # deg
+        self._longitude = lon * 1e-7
+        self._latitude = lat * 1e-7
+        self._heading = heading * 1e-5
+        self._heading_acc = heading_acc * 1e-5
+
+        # m
+        self._height = height * 1e-3
+        self._altitude = hMSL * 1e-3
+        self._h_acc = h_acc * 1e-3
+        self._v_acc = v_acc * 1e-3
+
+        # m/s
+        self._vel = (vel_N * 1e-3, vel_E * 1e-3, vel_D * 1e-3)
+        self._ground_speed = ground_speed * 1e-3
+        self._speed_acc = speed_acc * 1e-3
+
+        self._PDOP = pDOP * 0.01
+
+    @property
+    def valid_date(self) -> bool:
+        return bool(self._valid & self.BIT_VALID_DATE)
+
+    @property
+    def valid_time(self) -> bool:
+        return bool(self._valid & self.BIT_VALID_TIME)
+
+    @property
+    def gnss_fix_ok(self) -> bool:
+        return bool(self._flags & self.BIT_GNSS_FIX_OK)
+
+    @loggable
+    def iTOW(self):
+        """GPS time of week of the navigation epoch in milliseconds."""
+        return self._iTOW
+
+    @loggable
+    def date_utc(self):
+        return self._date_utc
+
+    @date_utc.formatter
+    def date_utc(self):
+        return {self.get_tag("date_utc"): f"{self._date_utc[2]}.{self._date_utc[1]}.{self._date_utc[0]}"}
+
+    @loggable
+    def time_utc(self):
+        return self._time_utc
+
+    @time_utc.formatter
+    def time_utc(self):
+        return {self.get_tag("time_utc"): f"{self._time_utc[0]}:{self._time_utc[1]}:{self._time_utc[2]}"}
+
+    @loggable
+    def fix_type(self):
+        return self._fix_type
+
+    @loggable
+    def num_SV(self):
+        return self._num_SV
+
+    @loggable
+    def latitude(self):
+        return self._latitude
+
+    @loggable
+    def longitude(self):
+        return self._longitude
+
+    @loggable
+    def height(self):
+        """Height above the ellipsoid in meters."""
+        return self._height
+
+    @loggable
+    def altitude(self):
+        """Height above the mean sea level in meters."""
+        return self._altitude
+
+    @loggable
+    def h_acc(self):
+        return self._h_acc
+
+    @loggable
+    def v_acc(self):
+        return self._v_acc
+
+    @loggable
+    def vel(self):
+        """Velocity in NED frame in m/s."""
+        return self._vel
+
+    @vel.formatter
+    def vel(self):
+        names = [self.get_tag(f"vel_{x}") for x in ("N", "E", "D")]
+        return {name: val for name, val in zip(names, self._vel)}
+
+    @loggable
+    def ground_speed(self):
+        return self._ground_speed
+
+    @loggable
+    def heading(self):
+        """Heading of motion in degrees."""
+        return self._heading
+
+    @loggable
+    def speed_acc(self):
+        return self._speed_acc
+
+    @loggable
+    def heading_acc(self):
+        return self._heading_acc
+
+    @loggable
+    def PDOP(self):
+        return self._PDOP
+
+
+class ACKModel(UBXModelBase):
+    """Model of UBX-ACK-ACK and UBX-ACK-NAK."""
+
+    CLASS = UBXClass.ACK.value
+    LEN_PAYLOAD = 2
+
+    def setup(self, payload: bytes):
+        self._cls_acked, self._id_acked = payload[0], payload[1]
+
+    @property
+    def acknowledged(self) -> bool:
+        return True
+
+    @loggable
+    def cls_acked(self):
+        return self._cls_acked
+
+    @loggable
+    def id_acked(self):
+        return self._id_acked
+
+
+class ACKACKModel(ACKModel):
+
+    ID = 0x01
+
+
+class ACKNAKModel(ACKModel):
+
+    ID = 0x00
+
+    @property
+    def acknowledged(self) -> bool:
+        return False
+
+
+TYPE_UBXMODELS = Union[NAVPVTModel, ACKACKModel, ACKNAKModel, None]
+
+
+class UBXParser:
+    """Parser of UBX frames.
+
+    Examples
+    --------
+        >> parser = UBXParser("gps")
+        >> model = parser.parse(frame)
+    """
+
+    MODELS: Dict[Tuple[int, int], Type[UBXModelBase]] = {
+        (NAVPVTModel.CLASS, NAVPVTModel.ID): NAVPVTModel,
+        (ACKACKModel.CLASS, ACKACKModel.ID): ACKACKModel,
+        (ACKNAKModel.CLASS, ACKNAKModel.ID): ACKNAKModel,
+    }
+
+    def __init__(self, comp_name: str) -> None:
+        self._comp_name = comp_name
+
+    def parse(self, frame: Union[bytes, bytearray, memoryview]) -> TYPE_UBXMODELS:
+        """Parse a whole frame.
+
+        Parameters
+        ----------
+            frame : Union[bytes, bytearray, memoryview]
+                Frame starting with the sync characters.
+
+        Returns
+        -------
+            TYPE_UBXMODELS
+                Model of the frame, or None if the frame is invalid or
+                its message is not supported.
+        """
+        if len(frame) < LEN_HEADER + LEN_CHECKSUM or frame[:2] != SYNC:
+            return None
+
+        cls, id, length = struct.unpack_from("<BBH", frame, 2)
+        if len(frame) != LEN_HEADER + length + LEN_CHECKSUM:
+            return None
+
+        modeltype = self.MODELS.get((cls, id))
+        if modeltype is None or length != modeltype.LEN_PAYLOAD:
+            return None
+        if tuple(frame[-2:]) != calc_checksum(frame[2:-2]):
+            return None
+
+        model = modeltype(self._comp_name)
+        model.setup(bytes(frame[LEN_HEADER:-2]))
+        return model
+
+
+class UBXStreamDecoder:
+    """Incremental decoder of UBX frames over chunks of bytes.
+
+    This class is the counterpart of pisat.util.nmea.NMEAStreamDecoder,
+    and both decoders can be fed with the same chunks of a stream where
+    NMEA sentences and UBX frames are mixed. Bytes which don't belong
+    to UBX frames are skipped by searching the sync characters.
+    """
+
+    # NOTE Payloads of messages supported are much shorter than this.
+    MAX_LEN_PAYLOAD = 1024
+
+    def __init__(self, parser: UBXParser) -> None:
+        if not isinstance(parser, UBXParser):
+            raise TypeError(
+                "'parser' must be UBXParser."
+            )
+
+        self._parser: UBXParser = parser
+        self._buffer: bytearray = bytearray()
+        self._cursor: int = 0
+
+    @property
+    def parser(self):
+        return self._parser
+
+    @property
+    def pending(self) -> int:
+        """Number of bytes of an incomplete frame."""
+        return len(self._buffer) - self._cursor
+
+    def reset(self) -> None:
+        """Discard an incomplete frame.
+        """
+        self._buffer.clear()
+        self._cursor = 0
+
+    def feed(self, chunk: Union[bytes, bytearray, memoryview]) -> Iterator[TYPE_UBXMODELS]:
+        """Add a chunk and iterate models of completed frames.
+
+        Parameters
+        ----------
+            chunk : Union[bytes, bytearray, memoryview]
+                Bytes received.
+
+        Returns
+        -------
+            Iterator[TYPE_UBXMODELS]
+                Models of valid frames in the order of arrival.
+        """
+        if self._cursor and self._cursor >= len(self._buffer) // 2:
+            del self._buffer[:self._cursor]
+            self._cursor = 0
+        self._buffer.extend(chunk)
+
+        models = []
+        with memoryview(self._buffer) as view:
+            self._decode(view, models)
+        return iter(models)
+
+    def _decode(self, view: memoryview, models: List[TYPE_UBXMODELS]) -> None:
+        buffer = self._buffer
+        while True:
+            head = buffer.find(SYNC, self._cursor)
+            if head < 0:
+                # NOTE The first sync character may be the last byte.
+                self._cursor = len(buffer) - 1 if buffer[-1:] == SYNC[:1] else len(buffer)
+                return
+
+            self._cursor = head
+            if len(buffer) - head < LEN_HEADER:
+                return
+
+            length = buffer[head + 4] | (buffer[head + 5] << 8)
+            if length > self.MAX_LEN_PAYLOAD:
+                self._cursor = head + 1
+                continue
+
+            tail = head + LEN_HEADER + length + LEN_CHECKSUM
+            if len(buffer) < tail:
+                return
+
+            model = self._parser.parse(view[head:tail])
+            if model is None:
+                # NOTE The sync characters may be a part of other data.
+                self._cursor = head + 1
+                continue
+
+            self._cursor = tail
+            models.append(model)
+
+
+def iter_ubx(chunks: Iterable[bytes], parser: UBXParser) -> Iterator[TYPE_UBXMODELS]:
+    """Decode a stream of chunks into models of UBX frames.
+    """
+    decoder = UBXStreamDecoder(parser)
+    for chunk in chunks:
+        yield from decoder.feed(chunk)
+
+
+class UBXConfig:
+    """Builder of UBX-CFG frames.
+
+    Examples
+    --------
+        >> for frame in UBXConfig.build_binary_output(rate=5):
+        >>     handler.write(frame)
+    """
+
+    ID_PRT = 0x00
+    ID_MSG = 0x01
+    ID_RATE = 0x08
+
+    class Port(Enum):
+        DDC = 0
+        UART1 = 1
+        USB = 3
+        SPI = 4
+
+    class Protocol(Enum):
+        UBX = 0x01
+        NMEA = 0x02
+
+    # NOTE
+    #   8 data bits, no parity and 1 stop bit, which is the default
+    #   setting of UART ports.
+    MODE_UART_8N1 = 0x000008C0
+    ADDRESS_DDC = 0x42
+
+    @classmethod
+    def build_prt(cls,
+                  port: "UBXConfig.Port" = Port.UART1,
+                  baudrate: int = 9600,
+                  in_proto: int = Protocol.UBX.value | Protocol.NMEA.value,
+                  out_proto: int = Protocol.UBX.value) -> bytes:
+        """Build UBX-CFG-PRT to select protocols of a port.
+
+        Parameters
+        ----------
+            port : UBXConfig.Port, optional
+                Port to be configured, by default Port.UART1.
+            baudrate : int, optional
+                Baudrate of the UART port, by default 9600.
+                This is ignored for the other ports.
+            in_proto : int, optional
+                Mask of input protocols, by default UBX and NMEA.
+            out_proto : int, optional
+                Mask of output protocols, by default UBX only.
+
+        Returns
+        -------
+            bytes
+                Frame of UBX-CFG-PRT.
+        """
+        if port == cls.Port.UART1:
+            mode = cls.MODE_UART_8N1
+        elif port == cls.Port.DDC:
+            mode = cls.ADDRESS_DDC << 1
+            baudrate = 0
+        else:
+            mode = 0
+            baudrate = 0
+
+        payload = struct.pack("<BBHIIHHHH", port.value, 0, 0, mode, baudrate, in_proto, out_proto, 0, 0)
+        return build_frame(UBXClass.CFG.value, cls.ID_PRT, payload)
+
+    @classmethod
+    def build_rate(cls, meas_rate: int = 1000, nav_rate: int = 1, time_ref: int = 1) -> bytes:
+        """Build UBX-CFG-RATE to set the navigation rate.
+
+        Parameters
+        ----------
+            meas_rate : int, optional
+                Period of measurements in milliseconds, by default 1000.
+            nav_rate : int, optional
+                Number of measurements for a navigation solution, by default 1.
+            time_ref : int, optional
+                Time system to which measurements are aligned, by default 1 (GPS).
+
+        Returns
+        -------
+            bytes
+                Frame of UBX-CFG-RATE.
+        """
+        payload = struct.pack("<HHH", meas_rate, nav_rate, time_ref)
+        return build_frame(UBXClass.CFG.value, cls.ID_RATE, payload)
+
+    @classmethod
+    def build_msg(cls, msg_cls: int, msg_id: int, rate: int = 1) -> bytes:
+        """Build UBX-CFG-MSG to set the rate of a message on the current port.
+
+        Parameters
+        ----------
+            msg_cls : int
+                Class of the message.
+            msg_id : int
+                ID of the message.
+            rate : int, optional
+                The message is output once per 'rate' solutions, by default 1.
+                If 0, the message is disabled.
+
+        Returns
+        -------
+            bytes
+                Frame of UBX-CFG-MSG.
+        """
+        payload = struct.pack("<BBB", msg_cls, msg_id, rate)
+        return build_frame(UBXClass.CFG.value, cls.ID_MSG, payload)
+
+    @classmethod
+    def build_binary_output(cls,
+                            rate: Union[int, float] = 1,
+                            port: "UBXConfig.Port" = Port.UART1,
+                            baudrate: int = 9600) -> List[bytes]:
+        """Build frames to output only NAV-PVT at the given rate.
+
+        Parameters
+        ----------
+            rate : Union[int, float], optional
+                Navigation rate in Hz, by default 1. SAM-M8Q supports
+                up to 10 Hz.
+            port : UBXConfig.Port, optional
+                Port to be configured, by default Port.UART1.
+            baudrate : int, optional
+                Baudrate of the UART port, by default 9600.
+
+        Returns
+        -------
+            List[bytes]
+                Frames to be written in order.
+        """
+        if not 0 < rate <= 10:
+            raise ValueError(
+                "'rate' must be 0 < 'rate' <= 10."
+            )
+
+        return [
+            cls.build_prt(port=port, baudrate=baudrate, out_proto=cls.Protocol.UBX.value),
+            cls.build_rate(meas_rate=int(round(1000 / rate))),
+            cls.build_msg(NAVPVTModel.CLASS, NAVPVTModel.ID, rate=1),
+        ]
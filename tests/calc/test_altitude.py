@@ -0,0 +1,102 @@
+
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from pisat.calc import AltitudeEstimator, press2alti, press2alti_array
+from pisat.core.logger import DataLogger, LogQueue
+from pisat.model import LinkedDataModelBase, linked_loggable
+from pisat.sensor import NumberGenerator
+
+
+NAME_GENERATOR = "barometer"
+COUNTS_BASELINE = 10
+PRESS_GROUND = 1000.
+TEMP = 20.
+
+
+class LinkedDataModel(LinkedDataModelBase):
+
+    num = linked_loggable(NumberGenerator.DataModel.num, NAME_GENERATOR)
+
+
+def generate_pressures():
+    rng = np.random.default_rng(0)
+    ground = PRESS_GROUND + rng.normal(0., 0.05, COUNTS_BASELINE)
+    ascent = np.linspace(PRESS_GROUND, 950., 100)
+    return np.concatenate((ground, ascent))
+
+
+class TestAltitude(unittest.TestCase):
+
+    def test_press2alti_array(self):
+        press = np.array([1013.25, 1000., 900.])
+        temp = np.array([15., 20., 0.])
+        np.testing.assert_allclose(press2alti_array(press, temp),
+                                   [press2alti(p, t) for p, t in zip(press, temp)])
+        self.assertEqual(press2alti_array(1013.25, 15.), 0.)
+
+    def test_estimator(self):
+        pressures = generate_pressures()
+        estimator = AltitudeEstimator(COUNTS_BASELINE, temp=TEMP)
+        outputs = [estimator.update(p) for p in pressures]
+
+        self.assertTrue(all(x is None for x in outputs[:COUNTS_BASELINE - 1]))
+        self.assertTrue(estimator.ready)
+        self.assertAlmostEqual(estimator.press_ref, pressures[:COUNTS_BASELINE].mean())
+
+        expected = press2alti_array(pressures[-1], TEMP, press_ref=estimator.press_ref)
+        self.assertAlmostEqual(estimator.value, expected, places=6)
+        self.assertGreater(estimator.value, 400.)
+
+        # The batch form gives the same outputs.
+        outputs = np.array([np.nan if x is None else x for x in outputs])
+        np.testing.assert_allclose(AltitudeEstimator(COUNTS_BASELINE, temp=TEMP).estimate_array(pressures), outputs)
+
+        # The batch form continues the baseline being captured.
+        partial = AltitudeEstimator(COUNTS_BASELINE, temp=TEMP)
+        for p in pressures[:3]:
+            partial.update(p)
+        np.testing.assert_allclose(partial.estimate_array(pressures[3:]), outputs[3:])
+        self.assertIsNone(partial.press_ref)
+        self.assertTrue(np.isnan(partial.estimate_array(pressures[3:5])).all())
+
+        estimator.reset()
+        self.assertIsNone(estimator.value)
+        estimator.calibrate(PRESS_GROUND)
+        self.assertEqual(estimator.update(PRESS_GROUND), 0.)
+
+        with self.assertRaises(ValueError):
+            AltitudeEstimator(0)
+
+    def test_derived_channel(self):
+        pressures = iter(generate_pressures())
+        barometer = NumberGenerator(lambda: next(pressures), name=NAME_GENERATOR)
+        estimator = AltitudeEstimator(COUNTS_BASELINE, temp=TEMP)
+
+        with tempfile.TemporaryDirectory() as dir:
+            que = LogQueue(LinkedDataModel, path=os.path.join(dir, "log.csv"))
+            with DataLogger(que, barometer, winlen=20, modelclass=LinkedDataModel) as dlogger:
+                dlogger.derive(f"{NAME_GENERATOR}-altitude", f"{NAME_GENERATOR}-num", estimator)
+                with self.assertRaises(ValueError):
+                    dlogger.derive(f"{NAME_GENERATOR}-num", f"{NAME_GENERATOR}-num", AltitudeEstimator())
+
+                for _ in range(COUNTS_BASELINE + 5):
+                    dlogger.read()
+
+                altitudes = dlogger.window(f"{NAME_GENERATOR}-altitude")
+                self.assertEqual(len(altitudes), 6)
+                self.assertEqual(altitudes[-1], estimator.value)
+
+                # Derived channels are kept when the model is changed.
+                dlogger.set_model(LinkedDataModel)
+                self.assertIn(f"{NAME_GENERATOR}-altitude", dlogger.channels)
+
+                dlogger.detach(f"{NAME_GENERATOR}-num", estimator)
+                self.assertNotIn(f"{NAME_GENERATOR}-altitude", dlogger.channels)
+
+
+if __name__ == "__main__":
+    unittest.main()
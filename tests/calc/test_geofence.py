@@ -0,0 +1,90 @@
+
+import math
+import unittest
+
+import numpy as np
+
+from pisat.calc import EnuProjection, Geofence, Position, PositionArray
+
+
+LONGI_ORIGIN = math.radians(139.987)
+LATI_ORIGIN = math.radians(40.142)
+COUNTS_POINTS = 2000
+
+# NOTE
+#   Polygons in the local frame: the allowed zone of a square of 200 m,
+#   a no-go triangle inside it and a concave no-go zone outside it.
+ENU_POLYGONS = (
+    ((-100., -100.), (100., -100.), (100., 100.), (-100., 100.)),
+    ((0., 0.), (50., 0.), (0., 50.)),
+    ((150., -50.), (250., -50.), (250., 50.), (200., 0.), (150., 50.), (150., -50.)),
+)
+
+
+class TestGeofence(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.projection = EnuProjection(Position(LONGI_ORIGIN, LATI_ORIGIN))
+        self.polygons = [[self.projection.inverse(east, north) for east, north in polygon]
+                         for polygon in ENU_POLYGONS]
+        self.fence = Geofence(self.polygons, projection=self.projection)
+
+    def position(self, east: float, north: float) -> Position:
+        return self.projection.inverse(east, north)
+
+    def test_contains(self):
+        self.assertEqual(self.fence.contains(self.position(-50., -50.)), [0])
+        self.assertEqual(self.fence.contains(self.position(10., 10.)), [0, 1])
+        self.assertEqual(self.fence.contains(self.position(160., 0.)), [2])
+        # In the notch of the concave polygon
+        self.assertEqual(self.fence.contains(self.position(200., 30.)), [])
+        self.assertEqual(self.fence.contains(self.position(1000., 0.)), [])
+
+        self.assertTrue(self.fence.inside(self.position(10., 10.), 1))
+        self.assertFalse(self.fence.inside(self.position(-10., 10.), 1))
+        self.assertFalse(self.fence.inside(self.position(120., 0.)))
+
+    def test_nearest(self):
+        index, distance = self.fence.nearest(self.position(120., 0.))
+        self.assertEqual(index, 0)
+        self.assertAlmostEqual(distance, 20., places=3)
+
+        index, distance = self.fence.nearest(self.position(200., 10.))
+        self.assertEqual(index, 2)
+        self.assertAlmostEqual(distance, 10. / math.sqrt(2), places=3)
+
+        index, distance = self.fence.nearest(self.position(300., 200.))
+        self.assertEqual(index, 2)
+        self.assertAlmostEqual(distance, math.hypot(50., 150.), places=3)
+
+    def test_batch(self):
+        rng = np.random.default_rng(0)
+        east = rng.uniform(-150., 300., COUNTS_POINTS)
+        north = rng.uniform(-150., 150., COUNTS_POINTS)
+        longi, lati = self.projection.inverse_array(east, north)
+
+        inside = self.fence.contains_array(longi, lati)
+        indices, distances = self.fence.nearest_array(longi, lati)
+        self.assertEqual(inside.shape, (COUNTS_POINTS, len(ENU_POLYGONS)))
+
+        for i in range(COUNTS_POINTS):
+            p = Position(longi[i], lati[i])
+            self.assertEqual(self.fence.contains(p), np.flatnonzero(inside[i]).tolist())
+            _, distance = self.fence.nearest(p)
+            self.assertAlmostEqual(distance, distances[i], places=6)
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            Geofence([])
+        with self.assertRaises(ValueError):
+            Geofence([self.polygons[0][:2]])
+        with self.assertRaises(ValueError):
+            Geofence(self.polygons, cell=0.)
+
+        fence = Geofence([PositionArray.from_positions(self.polygons[0])])
+        self.assertEqual(len(fence), 1)
+        self.assertTrue(fence.inside(self.position(0., 0.)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+
+import math
+import unittest
+
+import numpy as np
+
+from pisat.calc import EnuProjection, Navigator, Position
+
+
+LONGI_GOAL = math.radians(139.987)
+LATI_GOAL = math.radians(40.142)
+COUNTS_POINTS = 500
+# NOTE About 3 km around the goal
+RANGE_POINTS = 3e-2
+
+
+class TestNavigator(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.goal = Position(LONGI_GOAL, LATI_GOAL)
+        rng = np.random.default_rng(0)
+        self.positions = [
+            Position(LONGI_GOAL + dlo, LATI_GOAL + dla)
+            for dlo, dla in np.radians(rng.uniform(- RANGE_POINTS, RANGE_POINTS, (COUNTS_POINTS, 2)))
+        ]
+
+    def test_delta(self):
+        navigator = Navigator(self.goal)
+        p = Position(LONGI_GOAL, LATI_GOAL - 1e-4)
+        self.assertAlmostEqual(navigator.delta_distance(p), self.goal.distance_from(p))
+        # The goal is in the north and the heading is the north.
+        self.assertAlmostEqual(navigator.delta_angle(p, 0.), math.pi)
+
+    def test_projection(self):
+        navigator = Navigator(self.goal)
+        projected = Navigator(self.goal, projection=EnuProjection(self.goal))
+        self.assertIsNotNone(projected.projection)
+
+        for p in self.positions:
+            self.assertAlmostEqual(projected.delta_distance(p), navigator.delta_distance(p), delta=1e-2)
+            delta = projected.delta_angle(p, 1.) - navigator.delta_angle(p, 1.)
+            self.assertLess(abs(math.remainder(delta, 2 * math.pi)), math.radians(0.1))
+
+
+if __name__ == "__main__":
+    unittest.main()
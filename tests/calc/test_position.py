@@ -0,0 +1,159 @@
+
+import contextlib
+import io
+import math
+import time
+import unittest
+
+import numpy as np
+
+from pisat.calc.position import (
+    diff_geopos, relative_quadrant, distance_hubeny, calc_relative_coordinate,
+    diff_geopos_array, relative_quadrant_array, distance_hubeny_array,
+    calc_relative_coordinate_array, calc_azimuth_array, calc_distance_azimuth_array,
+    Position, PositionArray,
+)
+from pisat.calc import Navigator
+
+
+COUNTS_POINTS = 10000
+LONGI_GOAL = math.radians(139.987)
+LATI_GOAL = math.radians(40.142)
+
+
+def generate_points(counts: int = COUNTS_POINTS):
+    rng = np.random.default_rng(0)
+    longi = rng.uniform(- math.pi, math.pi, counts)
+    lati = rng.uniform(- math.pi / 2 + 0.1, math.pi / 2 - 0.1, counts)
+
+    # NOTE Points on the axes of the goal are included to test the quadrants.
+    longi[:4] = LONGI_GOAL
+    lati[4:8] = LATI_GOAL
+    longi[8], lati[8] = LONGI_GOAL, LATI_GOAL
+    return longi, lati
+
+
+def azimuth_from(longi_1, lati_1, longi_2, lati_2):
+    x, y = calc_relative_coordinate(longi_1, lati_1, longi_2, lati_2)
+    return np.mod(math.pi / 2 - math.atan2(y, x), 2 * math.pi)
+
+
+class TestPositionArray(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.longi, self.lati = generate_points()
+
+    def scalar(self, func):
+        return np.array([func(lo, la, LONGI_GOAL, LATI_GOAL) for lo, la in zip(self.longi, self.lati)])
+
+    def test_diff_geopos(self):
+        expected = self.scalar(diff_geopos)
+        result = diff_geopos_array(self.longi, self.lati, LONGI_GOAL, LATI_GOAL)
+        np.testing.assert_allclose(np.stack(result, axis=1), expected)
+
+        # across the antimeridian
+        np.testing.assert_allclose(diff_geopos_array(3., 0., -3., 0.),
+                                   diff_geopos(3., 0., -3., 0.))
+
+    def test_relative_quadrant(self):
+        expected = self.scalar(relative_quadrant)
+        result = relative_quadrant_array(self.longi, self.lati, LONGI_GOAL, LATI_GOAL)
+        np.testing.assert_array_equal(result, expected)
+        self.assertEqual(set(result[:9]), {-2, -4, -1, -3, 0})
+
+    def test_distance_and_coordinate(self):
+        np.testing.assert_allclose(distance_hubeny_array(self.longi, self.lati, LONGI_GOAL, LATI_GOAL),
+                                   self.scalar(distance_hubeny))
+        np.testing.assert_allclose(np.stack(calc_relative_coordinate_array(self.longi, self.lati, LONGI_GOAL, LATI_GOAL), axis=1),
+                                   self.scalar(calc_relative_coordinate))
+
+    def test_azimuth(self):
+        expected = self.scalar(azimuth_from)
+        np.testing.assert_allclose(calc_azimuth_array(self.longi, self.lati, LONGI_GOAL, LATI_GOAL), expected)
+
+        distance, azimuth = calc_distance_azimuth_array(self.longi, self.lati, LONGI_GOAL, LATI_GOAL)
+        np.testing.assert_allclose(distance, self.scalar(distance_hubeny))
+        np.testing.assert_allclose(azimuth, expected)
+
+    def test_benchmark(self):
+        time_init = time.perf_counter()
+        distance_scalar = self.scalar(distance_hubeny)
+        coordinate_scalar = self.scalar(calc_relative_coordinate)
+        time_scalar = time.perf_counter() - time_init
+
+        time_init = time.perf_counter()
+        distance_array = distance_hubeny_array(self.longi, self.lati, LONGI_GOAL, LATI_GOAL)
+        coordinate_array = calc_relative_coordinate_array(self.longi, self.lati, LONGI_GOAL, LATI_GOAL)
+        time_array = time.perf_counter() - time_init
+
+        print(f"time to calculate {COUNTS_POINTS} distances and coordinates: "
+              f"scalar {time_scalar} [sec], array {time_array} [sec]")
+        np.testing.assert_allclose(distance_array, distance_scalar)
+        np.testing.assert_allclose(np.stack(coordinate_array, axis=1), coordinate_scalar)
+
+
+class TestPosition(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.longi, self.lati = generate_points(1000)
+        self.goal = Position(LONGI_GOAL, LATI_GOAL)
+        self.positions = [Position(lo, la) for lo, la in zip(self.longi, self.lati)]
+
+    def test_position(self):
+        for p in self.positions:
+            self.assertAlmostEqual(self.goal.distance_from(p), distance_hubeny(LONGI_GOAL, LATI_GOAL, p.longi, p.lati), delta=1e-6)
+            x, y = calc_relative_coordinate(LONGI_GOAL, LATI_GOAL, p.longi, p.lati)
+            self.assertAlmostEqual(self.goal.azimuth_from(p), np.mod(math.pi / 2 - math.atan2(y, x), 2 * math.pi), places=9)
+            # NOTE The direction -pi is regarded as pi.
+            self.assertAlmostEqual(math.remainder(self.goal.direction_from(p) + math.atan2(x, y), 2 * math.pi), 0., places=9)
+
+        self.assertEqual(Position(180., 90., degree=True).lati, math.pi / 2)
+        with self.assertRaises(AttributeError):
+            self.goal.x = 0.
+
+    def test_no_output(self):
+        with contextlib.redirect_stdout(io.StringIO()) as output:
+            self.goal.azimuth_from(self.positions[-1])
+        self.assertEqual(output.getvalue(), "")
+
+    def test_position_array(self):
+        array = PositionArray(self.longi, self.lati)
+        self.assertEqual(len(array), len(self.positions))
+        self.assertEqual(array[10].lati, self.positions[10].lati)
+
+        np.testing.assert_allclose(array.distance_from(self.goal),
+                                   [p.distance_from(self.goal) for p in self.positions])
+        np.testing.assert_allclose(array.azimuth_from(self.goal),
+                                   [p.azimuth_from(self.goal) for p in self.positions])
+        np.testing.assert_allclose(np.stack(array.relative_coordinate_from(self.goal), axis=1),
+                                   [calc_relative_coordinate(p.longi, p.lati, LONGI_GOAL, LATI_GOAL) for p in self.positions])
+
+        array = PositionArray.from_positions(self.positions[:3])
+        np.testing.assert_array_equal(array.longi, self.longi[:3])
+        with self.assertRaises(ValueError):
+            PositionArray([0., 1.], [0.])
+
+    def test_benchmark(self):
+        navigator = Navigator(self.goal)
+
+        distance_navigator = []
+        time_init = time.perf_counter()
+        for p in self.positions:
+            navigator.delta_angle(p, 0.)
+            distance_navigator.append(navigator.delta_distance(p))
+        time_navigator = time.perf_counter() - time_init
+
+        distance_scalar = []
+        time_init = time.perf_counter()
+        for p in self.positions:
+            calc_relative_coordinate(LONGI_GOAL, LATI_GOAL, p.longi, p.lati)
+            distance_scalar.append(distance_hubeny(LONGI_GOAL, LATI_GOAL, p.longi, p.lati))
+        time_scalar = time.perf_counter() - time_init
+
+        print(f"time to navigate {len(self.positions)} positions: "
+              f"Navigator {time_navigator} [sec], scalar functions {time_scalar} [sec]")
+        np.testing.assert_allclose(distance_navigator, distance_scalar, atol=1e-6)
+
+
+if __name__ == "__main__":
+    unittest.main()
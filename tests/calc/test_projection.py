@@ -0,0 +1,71 @@
+
+import math
+import unittest
+
+import numpy as np
+
+from pisat.calc import EnuProjection, Position
+from pisat.calc.position import distance_hubeny_array
+
+
+LONGI_GOAL = math.radians(139.987)
+LATI_GOAL = math.radians(40.142)
+COUNTS_POINTS = 1000
+
+
+def generate_enu(radius: float, counts: int = COUNTS_POINTS):
+    rng = np.random.default_rng(0)
+    angle = rng.uniform(0., 2 * math.pi, counts)
+    distance = rng.uniform(0., radius, counts)
+    return distance * np.sin(angle), distance * np.cos(angle)
+
+
+class TestEnuProjection(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.goal = Position(LONGI_GOAL, LATI_GOAL)
+        self.projection = EnuProjection(self.goal)
+
+    def test_round_trip(self):
+        east, north = generate_enu(20000.)
+        longi, lati = self.projection.inverse_array(east, north)
+        result = self.projection.forward_array(longi, lati)
+        np.testing.assert_allclose(result[0], east, atol=1e-6)
+        np.testing.assert_allclose(result[1], north, atol=1e-6)
+
+        p = self.projection.inverse(east[0], north[0])
+        self.assertIsInstance(p, Position)
+        np.testing.assert_allclose(self.projection.forward(p), (east[0], north[0]), atol=1e-6)
+        np.testing.assert_allclose(self.projection.forward(self.goal), (0., 0.), atol=1e-9)
+
+    def test_axes(self):
+        east, north = self.projection.forward(Position(LONGI_GOAL, LATI_GOAL + 1e-4))
+        self.assertAlmostEqual(east, 0.)
+        self.assertGreater(north, 0.)
+        east, north = self.projection.forward(Position(LONGI_GOAL + 1e-4, LATI_GOAL))
+        self.assertGreater(east, 0.)
+        # NOTE Parallels curve to the north in the frame.
+        self.assertGreater(north, 0.)
+        self.assertLess(north, 0.1)
+
+    def test_error_bounds(self):
+        # The error bounds documented in pisat.calc.projection.
+        for radius, bound in ((2000., 1e-3), (10000., 1e-2), (20000., 1e-1)):
+            east, north = generate_enu(radius)
+            longi, lati = self.projection.inverse_array(east, north)
+            distance = distance_hubeny_array(longi, lati, LONGI_GOAL, LATI_GOAL)
+            self.assertLess(np.max(np.abs(np.hypot(east, north) - distance)), bound)
+
+        east, north = generate_enu(10000., counts=2 * COUNTS_POINTS)
+        longi, lati = self.projection.inverse_array(east, north)
+        distance = distance_hubeny_array(longi[::2], lati[::2], longi[1::2], lati[1::2])
+        error = np.abs(np.hypot(east[::2] - east[1::2], north[::2] - north[1::2]) - distance)
+        self.assertLess(np.max(error), 5e-2)
+
+    def test_invalid(self):
+        with self.assertRaises(TypeError):
+            EnuProjection((LONGI_GOAL, LATI_GOAL))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+
+import math
+import time
+import unittest
+
+import numpy as np
+
+from pisat.calc import EnuProjection, Position, PositionArray, RouteNavigator
+
+
+LONGI_ORIGIN = math.radians(139.987)
+LATI_ORIGIN = math.radians(40.142)
+RADIUS = 3.
+
+# NOTE Waypoints of a route of an L shape in the local frame: north 100 m, then east 50 m.
+ENU_WAYPOINTS = ((0., 0.), (0., 100.), (50., 100.))
+
+
+class TestRouteNavigator(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.projection = EnuProjection(Position(LONGI_ORIGIN, LATI_ORIGIN))
+        self.waypoints = [self.projection.inverse(east, north) for east, north in ENU_WAYPOINTS]
+        self.route = RouteNavigator(self.waypoints, radius=RADIUS, projection=self.projection)
+
+    def update(self, east: float, north: float) -> bool:
+        return self.route.update(self.projection.inverse(east, north))
+
+    def test_progress(self):
+        self.assertFalse(self.update(2., 30.))
+        self.assertEqual(self.route.index, 1)
+        self.assertAlmostEqual(self.route.cross_track, 2., places=4)
+        self.assertAlmostEqual(self.route.along_track, 30., places=4)
+        self.assertAlmostEqual(self.route.distance_remaining, math.hypot(2., 70.) + 50., places=4)
+
+        # Within the radius of the waypoint
+        self.assertTrue(self.update(-1., 98.))
+        self.assertEqual(self.route.index, 2)
+        # On the right side of the leg to the east
+        self.assertAlmostEqual(self.route.cross_track, 2., places=4)
+        self.assertAlmostEqual(self.route.distance_remaining, math.hypot(51., 2.), places=4)
+        self.assertAlmostEqual(self.route.azimuth(degree=True), math.degrees(math.atan2(51., 2.)), places=4)
+
+        # Passing the end of the leg switches to the last waypoint and finishes.
+        self.assertTrue(self.update(60., 110.))
+        self.assertTrue(self.route.finished)
+        self.assertEqual(self.route.distance_remaining, 0.)
+        self.assertFalse(self.update(60., 110.))
+
+        self.route.reset()
+        self.assertFalse(self.route.finished)
+        self.assertEqual(self.route.index, 1)
+
+    def test_passing(self):
+        # Passing several waypoints at once
+        self.assertTrue(self.update(51., 101.))
+        self.assertTrue(self.route.finished)
+
+    def test_heading_error(self):
+        with self.assertRaises(ValueError):
+            self.route.heading_error(0.)
+
+        self.update(0., 50.)
+        self.assertAlmostEqual(self.route.heading_error(0.), 0., places=6)
+        self.assertAlmostEqual(self.route.heading_error(90., degree=True), -90., places=4)
+        self.assertAlmostEqual(self.route.heading_error(270., degree=True), 90., places=4)
+
+    def test_waypoints(self):
+        route = RouteNavigator(PositionArray.from_positions(self.waypoints))
+        self.assertEqual(route.projection.origin.longi, self.waypoints[-1].longi)
+        self.assertAlmostEqual(route.distance_remaining, 150., places=3)
+
+        with self.assertRaises(ValueError):
+            RouteNavigator(self.waypoints[:1])
+        with self.assertRaises(ValueError):
+            RouteNavigator(self.waypoints, radius=-1.)
+
+    def test_benchmark(self):
+        # The work per fix doesn't depend on the number of waypoints:
+        # each update computes the current leg once, plus once per waypoint passed.
+        rng = np.random.default_rng(0)
+        for counts in (10, 1000):
+            enu = np.cumsum(rng.uniform(10., 20., (counts, 2)), axis=0)
+            longi, lati = self.projection.inverse_array(enu[:, 0], enu[:, 1])
+            route = RouteNavigator(PositionArray(longi, lati), projection=self.projection)
+            positions = [route.waypoints[0]] * 1000
+
+            legs = []
+            update_leg = route._update_leg
+            route._update_leg = lambda east, north: (legs.append(route.index), update_leg(east, north))
+
+            time_init = time.perf_counter()
+            for p in positions:
+                route.update(p)
+            print(f"time to update with {len(positions)} fixes along {counts} waypoints: "
+                  f"{time.perf_counter() - time_init} [sec]")
+            self.assertEqual(len(legs), len(positions))
+
+            # A fix beyond the 5th waypoint advances the legs only up to it.
+            legs.clear()
+            self.assertTrue(route.update(route.waypoints[5]))
+            self.assertEqual(legs, [1, 2, 3, 4, 5, 6])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+
+import os
+import random
+import tempfile
+import unittest
+
+import numpy as np
+
+from pisat.calc import (
+    EMA, MovingStats, RunningMax, RunningMin, RollingMedian, Derivative, Debounce
+)
+from pisat.core.logger import DataLogger, LogQueue
+from pisat.model import LinkedDataModelBase, linked_loggable
+from pisat.sensor import NumberGenerator
+
+
+NAME_GENERATOR = "number-generator"
+SIZE_WINDOW = 7
+COUNTS_SAMPLING = 300
+
+
+class LinkedDataModel(LinkedDataModelBase):
+
+    num = linked_loggable(NumberGenerator.DataModel.num, NAME_GENERATOR)
+
+
+def generate_samples(counts: int = COUNTS_SAMPLING):
+    random.seed(0)
+    # NOTE Duplicated values are included to test the median.
+    return [random.choice((random.gauss(0., 1.), float(random.randint(-3, 3)))) for _ in range(counts)]
+
+
+class TestStreamFilter(unittest.TestCase):
+
+    def assert_window(self, f, func, samples):
+        for i, x in enumerate(samples):
+            value = f.update(x)
+            window = samples[max(0, i + 1 - f.size):i + 1]
+            self.assertAlmostEqual(value, func(window), places=9)
+
+    def test_ema(self):
+        ema = EMA(0.5)
+        self.assertIsNone(ema.value)
+        self.assertEqual(ema.update(2.), 2.)
+        self.assertEqual(ema.update(4.), 3.)
+        self.assertEqual(ema.update(4.), 3.5)
+        self.assertEqual(EMA.from_span(3).alpha, 0.5)
+
+        ema.reset()
+        self.assertIsNone(ema.value)
+        with self.assertRaises(ValueError):
+            EMA(0.)
+
+    def test_moving_stats(self):
+        stats = MovingStats(SIZE_WINDOW)
+        self.assertIsNone(stats.mean)
+        samples = generate_samples()
+        for i, x in enumerate(samples):
+            stats.update(x)
+            window = samples[max(0, i + 1 - SIZE_WINDOW):i + 1]
+            self.assertAlmostEqual(stats.mean, np.mean(window), places=9)
+            self.assertAlmostEqual(stats.variance, np.var(window), places=9)
+
+    def test_running_max_min(self):
+        samples = generate_samples()
+        self.assert_window(RunningMax(SIZE_WINDOW), max, samples)
+        self.assert_window(RunningMin(SIZE_WINDOW), min, samples)
+
+    def test_rolling_median(self):
+        samples = generate_samples()
+        self.assert_window(RollingMedian(SIZE_WINDOW), np.median, samples)
+        self.assert_window(RollingMedian(SIZE_WINDOW + 1), np.median, samples)
+        self.assert_window(RollingMedian(1), np.median, samples)
+
+    def test_derivative(self):
+        derivative = Derivative(span=2)
+        self.assertIsNone(derivative.update(0., 0.))
+        self.assertIsNone(derivative.update(1., 0.5))
+        self.assertEqual(derivative.update(4., 1.), 4.)
+        self.assertEqual(derivative.update(4., 1.5), 3.)
+
+    def test_debounce(self):
+        debounce = Debounce(10., counts=2, hysteresis=1.)
+        states = [debounce.update(x) for x in (11., 9., 11., 12., 9.5, 8., 11., 8.5, 8.)]
+        self.assertEqual(states, [False, False, False, True, True, True, True, True, False])
+
+        descent = Debounce(100., counts=1, above=False)
+        self.assertFalse(descent.update(120.))
+        self.assertTrue(descent.update(90.))
+
+    def test_datalogger(self):
+        samples = iter(generate_samples())
+        generator = NumberGenerator(lambda: next(samples), name=NAME_GENERATOR)
+        median = RollingMedian(SIZE_WINDOW)
+        stats = MovingStats(SIZE_WINDOW)
+
+        with tempfile.TemporaryDirectory() as dir:
+            que = LogQueue(LinkedDataModel, path=os.path.join(dir, "log.csv"))
+            with DataLogger(que, generator, modelclass=LinkedDataModel) as dlogger:
+                dlogger.attach(f"{NAME_GENERATOR}-num", median, stats)
+                self.assertEqual(dlogger.get_filters(f"{NAME_GENERATOR}-num"), (median, stats))
+
+                values = [dlogger.read().num for _ in range(20)]
+                self.assertEqual(median.value, np.median(values[-SIZE_WINDOW:]))
+                self.assertAlmostEqual(stats.mean, np.mean(values[-SIZE_WINDOW:]))
+
+                dlogger.detach(f"{NAME_GENERATOR}-num", stats)
+                dlogger.read()
+                self.assertEqual(stats.counts, 20)
+                self.assertEqual(median.counts, 21)
+
+        self.assertEqual(DataLogger.parse_channel("a-b-press"), ("a-b", "press"))
+        with self.assertRaises(ValueError):
+            DataLogger.parse_channel("press")
+
+
+if __name__ == "__main__":
+    unittest.main()
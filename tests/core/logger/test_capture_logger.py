@@ -0,0 +1,108 @@
+
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from pisat.core.logger import CaptureLogger, CaptureReader
+from pisat.sensor import Bme280, Bno055, NumberGenerator, SensorBase
+from pisat.tester.handler import FakeBme280, FakeBno055, FakeI2CHandler
+
+
+NAME_BME280 = "bme280"
+NAME_BNO055 = "bno055"
+COUNTS_SAMPLING = 50
+
+RAW_PRESS = (415148, 400000, 430000)
+RAW_TEMP = (519888, 500000, 540000)
+RAW_HUM = (29000, 20000, 40000)
+
+
+class TestCaptureLogger(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.dir.name, "test.cap")
+
+        self.device_bme = FakeBme280()
+        self.device_bno = FakeBno055()
+        self.device_bno.set_acc((0., 1.5, 9.8))
+        self.device_bno.set_temp(25)
+        self.bme280 = Bme280(FakeI2CHandler(self.device_bme, Bme280.ADDRESS_I2C_GND), name=NAME_BME280)
+        self.bno055 = Bno055(FakeI2CHandler(self.device_bno, 0x28), name=NAME_BNO055)
+
+    def tearDown(self) -> None:
+        self.dir.cleanup()
+
+    def test_decoder(self):
+        self.assertIs(SensorBase.get_decoder(Bme280.ID_DECODER), Bme280)
+        self.assertIs(SensorBase.get_decoder(Bno055.ID_DECODER).decode_raw.__func__,
+                      Bno055.decode_raw.__func__)
+        with self.assertRaises(ValueError):
+            SensorBase.get_decoder("unknown")
+
+    def test_decode_bme280(self):
+        frames = []
+        expected = []
+        for press, temp, hum in zip(RAW_PRESS, RAW_TEMP, RAW_HUM):
+            self.device_bme.set_raw(press, temp, hum)
+            frames.append(np.frombuffer(self.bme280.read_raw(), dtype=np.uint8))
+            model = self.bme280.read()
+            expected.append((model.press, model.temp, model.hum))
+
+        result = Bme280.decode_raw(np.stack(frames), self.bme280.dump_context())
+        np.testing.assert_allclose(result["press"], [e[0] for e in expected], rtol=1e-12)
+        np.testing.assert_allclose(result["temp"], [e[1] for e in expected], rtol=1e-12)
+        np.testing.assert_allclose(result["hum"], [e[2] for e in expected], rtol=1e-12)
+
+    def test_capture(self):
+        with CaptureLogger(self.bme280, self.bno055, path=self.path) as logger:
+            for _ in range(COUNTS_SAMPLING):
+                logger.read()
+
+            # Frames after the change of units are decoded with the new context.
+            self.bno055.change_unit(temp=Bno055.TempUnit.FAHRENHEIT)
+            logger.update_context(self.bno055)
+            logger.read()
+
+        reader = CaptureReader(self.path)
+        self.assertEqual(reader.names, [NAME_BME280, NAME_BNO055])
+        self.assertEqual(reader.counts(NAME_BME280), COUNTS_SAMPLING + 1)
+
+        data = reader.load()
+        model = self.bme280.read()
+        np.testing.assert_allclose(data[NAME_BME280]["press"], model.press)
+        np.testing.assert_allclose(data[NAME_BNO055]["acc"], [[0., 1.5, 9.8]] * (COUNTS_SAMPLING + 1))
+        np.testing.assert_allclose(data[NAME_BNO055]["temp"], [25.] * COUNTS_SAMPLING + [50.])
+
+        timestamps = data[NAME_BNO055]["timestamp"]
+        self.assertTrue(np.all(np.diff(timestamps) >= 0))
+        self.assertLess(abs(timestamps[0] - os.path.getmtime(self.path)), 10.)
+
+        frames, _ = reader.read_raw(NAME_BNO055)
+        self.assertEqual(frames.shape, (COUNTS_SAMPLING + 1, Bno055.LEN_FRAME))
+
+    def test_truncated(self):
+        with CaptureLogger(self.bme280, path=self.path) as logger:
+            for _ in range(COUNTS_SAMPLING):
+                logger.read()
+
+        with open(self.path, "rb+") as f:
+            f.truncate(os.path.getsize(self.path) - 3)
+
+        reader = CaptureReader(self.path)
+        self.assertEqual(reader.counts(NAME_BME280), COUNTS_SAMPLING - 1)
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            CaptureLogger(NumberGenerator(lambda: 0, name="generator"), path=self.path)
+
+        with open(self.path, "wb") as f:
+            f.write(b"invalid")
+        with self.assertRaises(ValueError):
+            CaptureReader(self.path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,141 @@
+
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from pisat.core.logger import DataLogger, LogQueue, SampleWindow
+from pisat.model import LinkedDataModelBase, linked_loggable
+from pisat.sensor import Bno055, NumberGenerator
+from pisat.tester.handler import FakeBno055, FakeI2CHandler
+
+
+NAME_GENERATOR = "number-generator"
+NAME_BNO055 = "bno055"
+SIZE_WINDOW = 8
+COUNTS_SAMPLING = 20
+
+
+class LinkedDataModel(LinkedDataModelBase):
+
+    num = linked_loggable(NumberGenerator.DataModel.num, NAME_GENERATOR)
+    acc = linked_loggable(Bno055.DataModel.acc, NAME_BNO055)
+
+
+class OtherModel(LinkedDataModelBase):
+
+    num = linked_loggable(NumberGenerator.DataModel.num, NAME_GENERATOR)
+
+
+class TestSampleWindow(unittest.TestCase):
+
+    def test_view(self):
+        window = SampleWindow(SIZE_WINDOW)
+        self.assertEqual(window.view().shape, (0, ))
+        self.assertIsNone(window.latest)
+
+        for i in range(COUNTS_SAMPLING):
+            window.append(i)
+            expected = np.arange(max(0, i + 1 - SIZE_WINDOW), i + 1)
+            np.testing.assert_array_equal(window.view(), expected)
+            np.testing.assert_array_equal(window.view(3), expected[-3:])
+            self.assertEqual(window.latest, i)
+
+        view = window.view()
+        self.assertFalse(view.flags.writeable)
+        self.assertFalse(view.flags.owndata)
+        self.assertEqual(len(window), SIZE_WINDOW)
+        self.assertEqual(window.counts, COUNTS_SAMPLING)
+
+        with self.assertRaises(ValueError):
+            SampleWindow(0)
+
+    def test_from_sample(self):
+        window = SampleWindow.from_sample(SIZE_WINDOW, (1., 2., 3.))
+        window.append((4., 5., 6.))
+        self.assertEqual(window.shape, (3, ))
+        np.testing.assert_array_equal(window.view(), [[1., 2., 3.], [4., 5., 6.]])
+
+        with self.assertRaises(TypeError):
+            SampleWindow.from_sample(SIZE_WINDOW, "12:00:00")
+
+    def test_between(self):
+        window = SampleWindow(SIZE_WINDOW)
+        timestamps = [0., 0.1, 0.3, 0.3, 0.7, 1.2, 1.3, 2.0, 2.1, 2.6]
+        for i, t in enumerate(timestamps):
+            window.append(i, t)
+
+        # The first two samples have been overwritten.
+        np.testing.assert_array_equal(window.timestamps(), timestamps[2:])
+        values, ts = window.between(0.3, 1.3)
+        np.testing.assert_array_equal(values, [2, 3, 4, 5, 6])
+        np.testing.assert_array_equal(ts, [0.3, 0.3, 0.7, 1.2, 1.3])
+        np.testing.assert_array_equal(window.between(2.05)[0], [8, 9])
+        self.assertEqual(len(window.between(3.)[0]), 0)
+
+        self.assertEqual(window.at(1.25), 5)
+        self.assertEqual(window.at(2.6), 9)
+        self.assertEqual(window.at(10.), 9)
+        self.assertIsNone(window.at(0.2))
+        self.assertEqual(window.latest_timestamp, 2.6)
+
+    def test_datalogger(self):
+        numbers = iter(range(COUNTS_SAMPLING * 2))
+        generator = NumberGenerator(lambda: next(numbers), name=NAME_GENERATOR)
+        device = FakeBno055()
+        device.set_acc((0., 1.5, 9.8))
+        bno055 = Bno055(FakeI2CHandler(device, 0x28), name=NAME_BNO055)
+
+        with tempfile.TemporaryDirectory() as dir:
+            que = LogQueue(LinkedDataModel, path=os.path.join(dir, "log.csv"))
+            with DataLogger(que, generator, bno055, winlen=SIZE_WINDOW, modelclass=LinkedDataModel) as dlogger:
+                self.assertEqual(set(dlogger.channels), {f"{NAME_GENERATOR}-num", f"{NAME_BNO055}-acc"})
+                self.assertEqual(len(dlogger.window(f"{NAME_GENERATOR}-num")), 0)
+
+                for _ in range(COUNTS_SAMPLING):
+                    dlogger.read()
+
+                np.testing.assert_array_equal(dlogger.window(f"{NAME_GENERATOR}-num", 5),
+                                              np.arange(COUNTS_SAMPLING - 5, COUNTS_SAMPLING))
+                np.testing.assert_array_equal(dlogger.window(f"{NAME_BNO055}-acc"),
+                                              [[0., 1.5, 9.8]] * SIZE_WINDOW)
+
+                values, timestamps = dlogger.history(f"{NAME_GENERATOR}-num", 60.)
+                np.testing.assert_array_equal(values, dlogger.window(f"{NAME_GENERATOR}-num"))
+                self.assertTrue(np.all(np.diff(timestamps) >= 0))
+                self.assertEqual(timestamps[-1], dlogger.timestamp)
+                self.assertEqual(len(dlogger.history(f"{NAME_GENERATOR}-num", 1., now=timestamps[0] - 2.)[0]), 0)
+                self.assertEqual(dlogger.value_at(f"{NAME_GENERATOR}-num", dlogger.timestamp), COUNTS_SAMPLING - 1)
+                self.assertIsNone(dlogger.value_at(f"{NAME_GENERATOR}-num", timestamps[0] - 1.))
+
+                # Windows of channels not used by the new model are dropped.
+                dlogger.set_model(OtherModel)
+                dlogger.read()
+                self.assertEqual(dlogger.channels, (f"{NAME_GENERATOR}-num", ))
+                self.assertEqual(dlogger.window(f"{NAME_GENERATOR}-num")[-1], COUNTS_SAMPLING)
+                with self.assertRaises(ValueError):
+                    dlogger.window(f"{NAME_BNO055}-acc")
+
+        with self.assertRaises(ValueError):
+            DataLogger(que, winlen=-1)
+
+    def test_datalogger_shape(self):
+        samples = iter([(1., 2.), (3., 4.), (5., 6., 7.), (8., 9.)])
+        generator = NumberGenerator(lambda: next(samples), name=NAME_GENERATOR)
+
+        with tempfile.TemporaryDirectory() as dir:
+            que = LogQueue(OtherModel, path=os.path.join(dir, "log.csv"))
+            with DataLogger(que, generator, winlen=SIZE_WINDOW, modelclass=OtherModel) as dlogger:
+                dlogger.read()
+                dlogger.read()
+                self.assertEqual(len(dlogger.window(f"{NAME_GENERATOR}-num")), 2)
+
+                # The channel is dropped by a sample which can't be kept in the window.
+                self.assertEqual(dlogger.read().num, (5., 6., 7.))
+                self.assertEqual(dlogger.channels, ())
+                dlogger.read()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+
+import threading
+import time
+import unittest
+
+from pisat.core.nav import InterruptEvent, PostEvent
+from pisat.handler import DigitalInputHandlerBase
+from pisat.tester.handler import FakeDigitalInputHandler
+
+
+class TestInterruptEvent(unittest.TestCase):
+    
+    def setUp(self) -> None:
+        self.handler = FakeDigitalInputHandler(pin=4, level=True, name="int")
+        self.acknowledged = 0
+        
+        def acknowledge():
+            self.acknowledged += 1
+        
+        self.event = InterruptEvent(self.handler, 
+                                    edge=DigitalInputHandlerBase.Edge.FALLING,
+                                    acknowledge=acknowledge,
+                                    name="landing")
+        
+    def tearDown(self) -> None:
+        self.event.close()
+        
+    def test_fire_on_edge(self):
+        self.assertFalse(self.event.is_set())
+        
+        # rising edges are ignored.
+        self.handler.set_low(tick=100)
+        self.handler.set_high(tick=200)
+        self.assertEqual(self.event.count, 1)
+        self.assertEqual(self.event.tick, 100)
+        self.assertTrue(self.event.is_set())
+        
+        self.event.clear()
+        self.assertFalse(self.event.is_set())
+        self.assertEqual(self.acknowledged, 1)
+        
+    def test_wait(self):
+        self.assertFalse(self.event.wait(timeout=0.01))
+        
+        timer = threading.Timer(0.05, self.handler.set_low)
+        timer.start()
+        time_init = time.time()
+        self.assertTrue(self.event.wait(timeout=1.))
+        self.assertLess(time.time() - time_init, 1.)
+        timer.join()
+        
+    def test_bind(self):
+        post = PostEvent()
+        self.event.bind(post, package="landed")
+        self.handler.set_low()
+        self.assertTrue(post.is_set())
+        self.assertEqual(post.package, "landed")
+        
+        post.clear()
+        self.event.unbind()
+        self.handler.set_high()
+        self.handler.set_low()
+        self.assertFalse(post.is_set())
+        
+    def test_close(self):
+        self.event.close()
+        self.handler.set_low()
+        self.assertFalse(self.event.is_set())
+        
+    def test_diff_tick(self):
+        tick_max = DigitalInputHandlerBase.TICK_MAX
+        self.assertEqual(DigitalInputHandlerBase.diff_tick(10, 30), 20)
+        self.assertEqual(DigitalInputHandlerBase.diff_tick(tick_max - 9, 10), 20)
+        
+        
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+
+import os
+import threading
+import time
+import unittest
+
+from pisat.handler import PyserialSerialHandler, SerialHandlerBase
+
+
+class BufferSerialHandler(SerialHandlerBase):
+    
+    def __init__(self) -> None:
+        super().__init__("buffer", 9600)
+        self.buf = bytearray()
+        self.calls = 0
+        
+    def _counts_pending(self) -> int:
+        return len(self.buf)
+    
+    def _read_pending(self, count: int) -> bytes:
+        self.calls += 1
+        data = bytes(self.buf[:count])
+        del self.buf[:count]
+        return data
+    
+
+class TestSerialHandlerBase(unittest.TestCase):
+    
+    def setUp(self) -> None:
+        self.handler = BufferSerialHandler()
+    
+    def test_readline_chunked(self):
+        self.handler.buf.extend(b"first\r\nsecond\r\nthi")
+        self.assertEqual(self.handler.readline(end=b"\r\n"), b"first\r\n")
+        self.assertEqual(self.handler.calls, 1)
+        self.assertEqual(self.handler.readline(end=b"\r\n"), b"second\r\n")
+        self.assertEqual(self.handler.calls, 1)
+        self.assertEqual(self.handler.counts_readable, 3)
+        
+        # return a partial line at timeout
+        self.assertEqual(self.handler.readline(end=b"\r\n"), b"thi")
+        self.assertEqual(self.handler.readline(), b"")
+        
+    def test_terminator_across_chunks(self):
+        self.handler.buf.extend(b"abc\r")
+        threading.Timer(0.02, lambda: self.handler.buf.extend(b"\ndef")).start()
+        self.assertEqual(self.handler.readline(end=b"\r\n", timeout=1.), b"abc\r\n")
+        self.assertEqual(self.handler.read(10), (3, b"def"))
+        
+    def test_read_after_readline(self):
+        self.handler.buf.extend(b"line\n\x01\x02\x03")
+        self.handler.readline()
+        self.assertEqual(self.handler.read(2), (2, b"\x01\x02"))
+        self.assertEqual(self.handler.read_available(), b"\x03")
+        self.assertRaises(ValueError, self.handler.read, -1)
+        
+    def test_timeout(self):
+        time_init = time.time()
+        self.assertEqual(self.handler.readline(timeout=0.05), b"")
+        self.assertGreaterEqual(time.time() - time_init, 0.05)
+        
+    def test_readlines(self):
+        self.handler.buf.extend(b"a\nb\nc\n")
+        self.assertEqual(self.handler.readlines(), [b"a\n", b"b\n", b"c\n"])
+        
+
+@unittest.skipUnless(hasattr(os, "openpty"), "pty is not available")
+class TestPyserialSerialHandler(unittest.TestCase):
+    
+    def setUp(self) -> None:
+        self.master, slave = os.openpty()
+        self.handler = PyserialSerialHandler(os.ttyname(slave), baudrate=9600)
+        os.close(slave)
+        
+    def tearDown(self) -> None:
+        self.handler.close()
+        os.close(self.master)
+        
+    def test_readline_blocking(self):
+        threading.Timer(0.05, lambda: os.write(self.master, b"$GNGGA\r\n")).start()
+        self.assertEqual(self.handler.readline(timeout=1.), b"$GNGGA\r\n")
+        
+        time_init = time.time()
+        self.assertEqual(self.handler.readline(timeout=0.05), b"")
+        self.assertGreaterEqual(time.time() - time_init, 0.05)
+        
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,145 @@
+
+import csv
+import os
+import tempfile
+import unittest
+
+from pisat.core.logger import LogQueue
+from pisat.model import cached_loggable, linked_loggable, LinkedDataModelBase, RawDataModelBase
+from pisat.sensor import Bno055
+from pisat.tester.handler import FakeBno055, FakeI2CHandler
+
+
+NAME_PUBLISHER = "publisher"
+NAME_BNO055 = "bno055"
+
+
+class RawDataModel(RawDataModelBase):
+
+    counts_decode = 0
+
+    @cached_loggable
+    def a(self):
+        RawDataModel.counts_decode += 1
+        return int.from_bytes(self.raw[:2], "little") / 16
+
+    @cached_loggable
+    def b(self):
+        RawDataModel.counts_decode += 1
+        return self.raw[2]
+
+
+class LinkedDataModel(LinkedDataModelBase):
+
+    a = linked_loggable(RawDataModel.a, NAME_PUBLISHER)
+    acc = linked_loggable(Bno055.DataModel.acc, NAME_BNO055)
+    temp = linked_loggable(Bno055.DataModel.temp, NAME_BNO055, logging=False)
+
+    @cached_loggable
+    def c(self):
+        return self.a * 2
+
+
+def create_model(raw: bytes) -> RawDataModel:
+    model = RawDataModel(NAME_PUBLISHER)
+    model.setup(raw)
+    return model
+
+
+class TestRawDataModel(unittest.TestCase):
+
+    def setUp(self) -> None:
+        RawDataModel.counts_decode = 0
+        self.device = FakeBno055()
+        self.device.set_acc((0., 1.5, 9.8))
+        self.device.set_temp(-5)
+        self.bno055 = Bno055(FakeI2CHandler(self.device, 0x28), name=NAME_BNO055)
+
+    def test_decode_lazily(self):
+        model = create_model(b"\x20\x00\x07")
+        self.assertEqual(model.raw, b"\x20\x00\x07")
+        self.assertFalse(model.decoded("a"))
+
+        self.assertEqual(model.a, 2.)
+        self.assertEqual(model.a, 2.)
+        self.assertTrue(model.decoded("a"))
+        self.assertFalse(model.decoded("b"))
+        self.assertEqual(RawDataModel.counts_decode, 1)
+
+    def test_extract_raw(self):
+        model = create_model(b"\x20\x00\x07")
+        self.assertEqual(model.extract_raw(), {f"{NAME_PUBLISHER}-raw": b"\x20\x00\x07"})
+        self.assertEqual(RawDataModel.counts_decode, 0)
+        self.assertEqual(model.extract(), {f"{NAME_PUBLISHER}-a": 2., f"{NAME_PUBLISHER}-b": 7})
+
+    def test_bno055(self):
+        model = self.bno055.read()
+        self.assertEqual(len(model.raw), 45)
+        self.assertFalse(model.decoded("acc"))
+        self.assertEqual(model.acc, (0., 1.5, 9.8))
+        self.assertTrue(model.decoded("acc"))
+        self.assertFalse(model.decoded("euler"))
+        self.assertEqual(model.temp, -5)
+
+        self.bno055.change_unit(temp=Bno055.TempUnit.FAHRENHEIT)
+        self.assertEqual(self.bno055.read().temp, -10)
+        # Models read before keep the units at the time.
+        self.assertEqual(model.temp, -5)
+
+    def test_bno055_values(self):
+        model = Bno055.DataModel(NAME_BNO055)
+        model.setup(acc=(1., 2., 3.))
+        self.assertIsNone(model.raw)
+        self.assertEqual(model.acc, (1., 2., 3.))
+        self.assertEqual(model.extract_raw()[f"{NAME_BNO055}-acc_X"], 1.)
+
+    def test_linked(self):
+        model1 = create_model(b"\x10\x00\x00")
+        model2 = create_model(b"\x20\x00\x00")
+
+        linked1 = LinkedDataModel("linked")
+        linked1.sync(model1)
+        linked2 = LinkedDataModel("linked")
+        linked2.sync(model2)
+
+        # Each linked model keeps its own model.
+        self.assertEqual(linked1.a, 1.)
+        self.assertEqual(linked2.a, 2.)
+        self.assertEqual(linked1.c, 2.)
+
+        # Decoded values are cached in the original model.
+        self.assertTrue(model1.decoded("a"))
+        self.assertEqual(RawDataModel.counts_decode, 2)
+
+    def test_linked_extract_raw(self):
+        linked = LinkedDataModel("linked")
+        linked.sync(create_model(b"\x10\x00\x00"), self.bno055.read())
+
+        data = linked.extract_raw()
+        self.assertEqual(data[f"{NAME_PUBLISHER}-raw"], b"\x10\x00\x00")
+        self.assertEqual(len(data[f"{NAME_BNO055}-raw"]), 45)
+        self.assertEqual(data["linked-c"], 2.)
+        self.assertNotIn("linked-a", data)
+        self.assertNotIn("linked-acc", data)
+
+    def test_logque_raw(self):
+        with tempfile.TemporaryDirectory() as dir:
+            path = os.path.join(dir, "raw.csv")
+            with LogQueue(LinkedDataModel, path=path, raw=True) as logque:
+                for i in range(3):
+                    logque.append(create_model(bytes((i, 0, 0))), self.bno055.read())
+
+            with open(path, "rt", newline="") as f:
+                rows = list(csv.DictReader(f))
+
+        self.assertEqual(len(rows), 3)
+        for i, row in enumerate(rows):
+            self.assertEqual(bytes.fromhex(row[f"{NAME_PUBLISHER}-raw"]), bytes((i, 0, 0)))
+            model = Bno055.DataModel(NAME_BNO055)
+            model.setup(raw=bytes.fromhex(row[f"{NAME_BNO055}-raw"]), divisors=self.bno055._calc_divisors())
+            self.assertEqual(model.acc, (0., 1.5, 9.8))
+            self.assertEqual(float(row[f"{logque.name}-c"]), i / 8)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+
+import time
+import unittest
+
+import numpy as np
+
+from pisat.sensor import Bno055, Bno055Sampler
+from pisat.tester.handler import FakeBno055, FakeI2CHandler
+
+
+NAME_BNO055 = "bno055"
+RATE_SAMPLING = 200
+SIZE_RING = 16
+
+
+class FailingI2CHandler(FakeI2CHandler):
+
+    failing = False
+
+    def read(self, reg: int, count: int):
+        if self.failing:
+            raise OSError("device not found")
+        return super().read(reg, count)
+
+
+class TestBno055Sampler(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.device = FakeBno055()
+        self.device.set_acc((0., 1.5, 9.8))
+        self.device.set_euler((90., 0., -10.))
+        self.device.set_quat((0., 0., 0.5, -0.5))
+        self.device.set_temp(-5)
+        self.bno055 = Bno055(FakeI2CHandler(self.device, 0x28), name=NAME_BNO055)
+        self.sampler = Bno055Sampler(self.bno055, rate=RATE_SAMPLING, size=SIZE_RING)
+
+    def tearDown(self) -> None:
+        self.sampler.stop()
+
+    def test_read_without_sampling(self):
+        model = self.sampler.read()
+        self.assertEqual(model.acc, (0., 1.5, 9.8))
+        self.assertEqual(self.sampler.counts_frame, 0)
+
+    def test_read(self):
+        self.sampler.start()
+        self.assertTrue(self.sampler.wait(1, timeout=1.))
+        model = self.sampler.read()
+        self.assertEqual(model.publisher, NAME_BNO055)
+        self.assertEqual(model.acc, (0., 1.5, 9.8))
+        self.assertEqual(model.euler, (90., 0., -10.))
+        self.assertEqual(model.quat, (0., 0., 0.5, -0.5))
+        self.assertEqual(model.temp, -5)
+
+        # The latest frame is decoded only once.
+        self.sampler.stop()
+        self.assertIs(self.sampler.read(), self.sampler.read())
+
+    def test_read_failing(self):
+        handler = FailingI2CHandler(self.device, 0x28)
+        bno055 = Bno055(handler, name=NAME_BNO055)
+        handler.failing = True
+        sampler = Bno055Sampler(bno055, rate=RATE_SAMPLING, size=SIZE_RING)
+        sampler.start()
+        try:
+            time_init = time.monotonic()
+            with self.assertRaises(OSError):
+                sampler.read()
+            self.assertLess(time.monotonic() - time_init, 1.)
+            self.assertGreater(sampler.counts_error, 0)
+        finally:
+            sampler.stop()
+
+    def test_read_window(self):
+        self.sampler.start()
+        self.assertTrue(self.sampler.wait(3, timeout=1.))
+        self.sampler.stop()
+
+        window = self.sampler.read_window(3)
+        self.assertEqual(window["acc"].shape, (3, 3))
+        self.assertEqual(window["quat"].shape, (3, 4))
+        self.assertEqual(window["temp"].shape, (3, ))
+        np.testing.assert_allclose(window["acc"], [[0., 1.5, 9.8]] * 3)
+        np.testing.assert_allclose(window["euler"], [[90., 0., -10.]] * 3)
+        np.testing.assert_allclose(window["quat"], [[0., 0., 0.5, -0.5]] * 3)
+        np.testing.assert_allclose(window["temp"], [-5.] * 3)
+        self.assertTrue(np.all(np.diff(window["timestamp"]) > 0))
+
+        with self.assertRaises(ValueError):
+            self.sampler.read_window(SIZE_RING + 1)
+
+    def test_ring(self):
+        self.sampler.start()
+        self.assertTrue(self.sampler.wait(SIZE_RING + 5, timeout=2.))
+        self.sampler.stop()
+
+        self.assertEqual(len(self.sampler), SIZE_RING)
+        self.assertEqual(self.sampler.read_raw_window(SIZE_RING).shape, (SIZE_RING, Bno055Sampler.LEN_FRAME))
+
+        # Frames are ordered from the oldest to the latest across the end of the ring.
+        timestamps = self.sampler.read_window(SIZE_RING)["timestamp"]
+        self.assertEqual(len(timestamps), SIZE_RING)
+        self.assertTrue(np.all(np.diff(timestamps) > 0))
+
+    def test_rate(self):
+        self.sampler.start()
+        time.sleep(0.2)
+        self.sampler.stop()
+
+        timestamps = self.sampler.read_window(SIZE_RING)["timestamp"]
+        period = np.median(np.diff(timestamps))
+        self.assertAlmostEqual(period, 1 / RATE_SAMPLING, delta=0.5 / RATE_SAMPLING)
+
+    def test_decode(self):
+        self.device.set_acc((-1., 2., -3.))
+        frames = np.frombuffer(self.bno055._retreive_data(), dtype=np.uint8)
+        window = self.sampler.decode(np.stack([frames, frames]))
+        np.testing.assert_allclose(window["acc"], [[-1., 2., -3.]] * 2)
+        self.assertEqual(self.bno055._decode_data(frames.tobytes()).acc, (-1., 2., -3.))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+
+import time
+import unittest
+
+from pisat.handler import DataBrokenError
+from pisat.sensor import Bno055
+from pisat.sensor.bno055 import UARTBno055
+from pisat.tester.handler import FakeBno055UART, FakeSerialHandler, FakeStreamDevice
+
+
+# sec, about 45 bytes at 115200 bps with the processing time of BNO055
+LATENCY_RESPONSE = 5e-3
+RATE_SAMPLING = 100
+TIME_SAMPLING = 0.5
+
+
+def read_spin(handler, reg, counts):
+    # NOTE The legacy implementation spinning on the count of received bytes.
+    handler.write(UARTBno055.build_read_command(reg, counts))
+    while handler.counts_readable < 2:
+        pass
+    _, response = handler.read(2)
+    while handler.counts_readable < response[1]:
+        pass
+    return handler.read(response[1])[1]
+
+
+def measure_cpu(func) -> float:
+    counts = int(RATE_SAMPLING * TIME_SAMPLING)
+    period = 1 / RATE_SAMPLING
+    time_init = time.perf_counter()
+    cpu_init = time.process_time()
+    for i in range(counts):
+        func()
+        remain = time_init + (i + 1) * period - time.perf_counter()
+        if remain > 0:
+            time.sleep(remain)
+    return (time.process_time() - cpu_init) / (time.perf_counter() - time_init)
+
+
+class TestUARTBno055(unittest.TestCase):
+    
+    def setUp(self) -> None:
+        self.device = FakeBno055UART()
+        self.device.device.set_acc((1., 2., 3.))
+        self.handler = FakeSerialHandler(self.device)
+        self.bno055 = UARTBno055(self.handler, name="bno055")
+        
+    def test_read(self):
+        self.assertEqual(self.bno055.chip_id, 0xA0)
+        counts = self.device.counts_command
+        self.assertEqual(self.bno055.read().acc, (1., 2., 3.))
+        self.assertEqual(self.device.counts_command, counts + 1)
+        
+    def test_write(self):
+        self.bno055.change_operation_mode(Bno055.OperationMode.NDOF)
+        self.assertEqual(self.device.device.operation_mode, Bno055.OperationMode.NDOF.value)
+        
+        self.bno055.change_page()
+        self.assertEqual(self.bno055.current_page_id, Bno055.Page.PAGE_1)
+        self.assertEqual(self.device.device.page, 1)
+        self.bno055.change_page()
+        self.assertEqual(self.bno055.current_page_id, Bno055.Page.PAGE_0)
+        self.assertEqual(self.device.device.page, 0)
+        
+    def test_retry(self):
+        self.device.inject(UARTBno055.StatusRead.FAIL.value, UARTBno055.StatusRead.BUS_OVER_RUN_ERROR.value)
+        self.assertEqual(self.bno055._read_single_byte(Bno055.RegPage0.CHIP_ID), 0xA0)
+        
+        self.device.inject(UARTBno055.StatusWrite.FAIL.value)
+        self.bno055.change_operation_mode(Bno055.OperationMode.IMU)
+        self.assertEqual(self.device.device.operation_mode, Bno055.OperationMode.IMU.value)
+        
+        self.device.inject(*[UARTBno055.StatusRead.FAIL.value] * (UARTBno055.RETRIES_MAX + 1))
+        with self.assertRaises(DataBrokenError):
+            self.bno055._read_single_byte(Bno055.RegPage0.CHIP_ID)
+            
+        self.device.inject(UARTBno055.StatusRead.REGMAP_INVALID_ADDRESS.value)
+        with self.assertRaises(DataBrokenError):
+            self.bno055._read_single_byte(Bno055.RegPage0.CHIP_ID)
+        self.assertEqual(self.bno055._read_single_byte(Bno055.RegPage0.CHIP_ID), 0xA0)
+        
+    def test_timeout(self):
+        bno055 = UARTBno055(FakeSerialHandler(FakeStreamDevice()), timeout=0.01, retries=1, name="bno055")
+        time_init = time.perf_counter()
+        with self.assertRaises(DataBrokenError):
+            bno055._read_single_byte(Bno055.RegPage0.CHIP_ID)
+        self.assertGreaterEqual(time.perf_counter() - time_init, 0.02)
+        
+    def test_read_registers(self):
+        counts = self.device.counts_command
+        ids, acc = self.bno055.read_registers((Bno055.RegPage0.CHIP_ID, 4), (Bno055.RegPage0.ACC_DATA_X_LSB, 6))
+        self.assertEqual(ids, b"\xa0\xfb\x32\x0f")
+        self.assertEqual(acc, b"\x64\x00\xc8\x00\x2c\x01")
+        self.assertEqual(self.device.counts_command, counts + 2)
+        
+        self.device.inject(UARTBno055.StatusRead.FAIL.value)
+        ids, acc = self.bno055.read_registers((Bno055.RegPage0.CHIP_ID, 4), (Bno055.RegPage0.ACC_DATA_X_LSB, 6))
+        self.assertEqual((ids, acc), (b"\xa0\xfb\x32\x0f", b"\x64\x00\xc8\x00\x2c\x01"))
+        
+    def test_wrapper(self):
+        bno055 = Bno055(self.handler, name="bno055")
+        self.assertEqual(bno055.read().acc, (1., 2., 3.))
+        
+    def test_cpu_utilization(self):
+        device = FakeBno055UART(latency=LATENCY_RESPONSE)
+        handler = FakeSerialHandler(device)
+        bno055 = UARTBno055(handler, name="bno055")
+        reg = Bno055.RegPage0.FIRST_DATA_REG
+        counts = Bno055.RegPage0.FIRST_LEN_DATA + Bno055.RegPage0.SECOND_LEN_DATA
+        
+        cpu_spin = measure_cpu(lambda: read_spin(handler, reg, counts))
+        cpu_blocking = measure_cpu(bno055.read)
+        print(f"\nCPU utilization at {RATE_SAMPLING} Hz: spin {cpu_spin:.1%}, blocking {cpu_blocking:.1%}")
+        self.assertLess(cpu_blocking, cpu_spin)
+        
+        
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+
+import itertools
+import threading
+import time
+import unittest
+
+from pisat.sensor import CachedSensor, NumberGenerator
+
+
+TIME_READ = 0.05
+
+
+class TestCachedSensor(unittest.TestCase):
+    
+    def setUp(self) -> None:
+        self.counter = itertools.count()
+        self.released = threading.Event()
+        self.released.set()
+        
+        def slow():
+            self.released.wait()
+            time.sleep(TIME_READ)
+            return next(self.counter)
+        
+        self.numgen = NumberGenerator(slow, name="numgen")
+        
+    def test_fresh(self):
+        cached = CachedSensor(self.numgen, ttl=10.)
+        self.assertIsNone(cached.age)
+        self.assertEqual(cached.read().num, 0)
+        
+        time_init = time.time()
+        self.assertEqual(cached.read().num, 0)
+        self.assertLess(time.time() - time_init, TIME_READ)
+        self.assertLess(cached.age, 10.)
+        self.assertEqual(cached.read().publisher, "numgen")
+        cached.close()
+        
+    def test_stale_while_revalidate(self):
+        cached = CachedSensor(self.numgen, ttl=TIME_READ * 2)
+        self.assertEqual(cached.read().num, 0)
+        time.sleep(TIME_READ * 2)
+        
+        self.released.clear()
+        time_init = time.time()
+        self.assertEqual(cached.read().num, 0)
+        self.assertTrue(cached.refreshing)
+        self.assertEqual(cached.read().num, 0)
+        self.assertLess(time.time() - time_init, TIME_READ)
+        
+        self.released.set()
+        cached._future.result()
+        self.assertFalse(cached.refreshing)
+        self.assertEqual(cached.read().num, 1)
+        self.assertLess(cached.age, TIME_READ * 2)
+        cached.close()
+        
+    def test_no_revalidate(self):
+        cached = CachedSensor(self.numgen, ttl=0., revalidate=False)
+        self.assertEqual(cached.read().num, 0)
+        self.assertEqual(cached.read().num, 1)
+        
+    def test_invalidate(self):
+        cached = CachedSensor(self.numgen, ttl=10., revalidate=False)
+        cached.read()
+        cached.invalidate()
+        self.assertTrue(cached.expired)
+        self.assertEqual(cached.read().num, 1)
+        self.assertFalse(cached.expired)
+        
+    def test_ttl(self):
+        cached = CachedSensor(self.numgen, ttl=1., revalidate=False)
+        with self.assertRaises(ValueError):
+            cached.ttl = -1.
+        with self.assertRaises(ValueError):
+            CachedSensor(self.numgen, ttl=-1.)
+        
+    def test_stamp(self):
+        cached = CachedSensor(self.numgen, ttl=TIME_READ * 2, stamp=True)
+        model = cached.read()
+        self.assertIsInstance(model, CachedSensor.DataModel)
+        self.assertEqual(model.num, 0)
+        self.assertEqual(model.publisher, "numgen")
+        self.assertEqual(model.extract(), {"numgen-num": 0, "numgen-timestamp": model.timestamp})
+        
+        time.sleep(TIME_READ * 2)
+        cached.read()
+        cached._future.result()
+        latest = cached.read()
+        self.assertEqual(latest.num, 1)
+        self.assertGreater(latest.timestamp, model.timestamp)
+        self.assertGreater(model.age, latest.age)
+        cached.close()
+        
+    def test_error(self):
+        def fail():
+            raise IOError("device not found")
+        
+        cached = CachedSensor(NumberGenerator(fail, name="fail"), ttl=0.)
+        self.assertRaises(IOError, cached.read)
+        
+        cached = CachedSensor(self.numgen, ttl=0.)
+        cached.read()
+        self.numgen._func = fail
+        cached.read()
+        cached._future.result()
+        self.assertRaises(IOError, cached.read)
+        cached.close()
+        
+        
+if __name__ == "__main__":
+    unittest.main()
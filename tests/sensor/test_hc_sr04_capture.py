@@ -0,0 +1,99 @@
+
+import unittest
+from typing import Optional
+
+from pisat.handler import DigitalInputHandlerBase, DigitalOutputHandlerBase, EdgeCapture
+from pisat.sensor import HcSr04
+from pisat.tester.handler import FakeDigitalInputHandler
+
+
+WIDTH_ECHO = 5830
+
+
+class EchoOutputHandler(DigitalOutputHandlerBase):
+    
+    def __init__(self, echo: FakeDigitalInputHandler, width: Optional[int] = WIDTH_ECHO) -> None:
+        self.echo = echo
+        self.width = width
+        super().__init__(0)
+    
+    def set_low(self) -> None:
+        if self.width is not None:
+            self.echo.pulse(self.width)
+        
+        
+class PollingInputHandler(DigitalInputHandlerBase):
+    
+    def observe(self) -> bool:
+        return False
+        
+
+class TestEdgeCapture(unittest.TestCase):
+    
+    def test_pulse_width(self):
+        handler = FakeDigitalInputHandler()
+        capture = EdgeCapture(handler)
+        capture.start()
+        
+        self.assertIsNone(capture.wait_pulse(timeout=0.01))
+        handler.pulse(100, tick=DigitalInputHandlerBase.TICK_MAX - 10)
+        self.assertEqual(capture.wait_pulse(timeout=0.01), 100)
+        self.assertEqual(len(capture), 2)
+        
+        capture.clear()
+        handler.pulse(300)
+        self.assertIsNone(capture.pulse_width(level=False))
+        
+        capture.stop()
+        handler.pulse(300)
+        self.assertEqual(len(capture), 2)
+        
+        
+class TestHcSr04Capture(unittest.TestCase):
+    
+    def setUp(self) -> None:
+        self.echo = FakeDigitalInputHandler()
+        self.trigger = EchoOutputHandler(self.echo)
+        
+    def test_read(self):
+        hcsr04 = HcSr04(self.echo, self.trigger, timeout=0.1)
+        dist = hcsr04.read().dist
+        self.assertAlmostEqual(dist, WIDTH_ECHO * 1e-6 * HcSr04.VELOCITY_SOUND_AIR / 2)
+        
+    def test_trigger_collect(self):
+        hcsr04 = HcSr04(self.echo, self.trigger, timeout=0.1)
+        self.assertIsNone(hcsr04.collect_distance())
+        
+        hcsr04.trigger()
+        self.assertTrue(hcsr04.ready)
+        self.assertIsNotNone(hcsr04.collect().dist)
+        self.assertIsNone(hcsr04.collect_distance())
+        
+    def test_timeout(self):
+        self.trigger.width = None
+        hcsr04 = HcSr04(self.echo, self.trigger, timeout=0.01)
+        hcsr04.trigger()
+        self.assertFalse(hcsr04.ready)
+        self.assertIsNone(hcsr04.collect_distance())
+        
+    def test_nonblock(self):
+        hcsr04 = HcSr04(self.echo, self.trigger, nonblock=True)
+        self.assertIsNone(hcsr04.read().dist)
+        self.assertIsNotNone(hcsr04.read().dist)
+        hcsr04.close()
+        
+    def test_polling_fallback(self):
+        hcsr04 = HcSr04(PollingInputHandler(0), self.trigger, timeout=0.01)
+        self.assertIsNone(hcsr04.read().dist)
+        with self.assertRaises(ValueError):
+            HcSr04(PollingInputHandler(0), self.trigger, nonblock=True)
+            
+    def test_timeout_default(self):
+        self.trigger.width = None
+        hcsr04 = HcSr04(self.echo, self.trigger)
+        self.assertIsNone(hcsr04.read().dist)
+        hcsr04.close()
+        
+
+if __name__ == "__main__":
+    unittest.main()
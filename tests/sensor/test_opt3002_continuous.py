@@ -0,0 +1,99 @@
+
+import unittest
+
+from pisat.handler import I2CHandlerBase
+from pisat.sensor import Opt3002
+from pisat.tester.handler import FakeDigitalInputHandler
+
+
+class Opt3002I2CHandler(I2CHandlerBase):
+    
+    BIT_CRF = 0x80
+    
+    def __init__(self) -> None:
+        super().__init__(Opt3002.AddrI2C.GND)
+        self.regs = {Opt3002.Reg.RESULT: bytearray(2), 
+                     Opt3002.Reg.CONFIG: bytearray(b"\xc8\x10"),
+                     Opt3002.Reg.LIMIT_LOW: bytearray(2),
+                     Opt3002.Reg.ID: bytearray(b"\x54\x49")}
+        self.reads = []
+        self.pin = None
+        
+    def complete(self, exponent: int, mantissa: int) -> None:
+        self.regs[Opt3002.Reg.RESULT][:] = bytes((exponent << 4 | mantissa >> 8, mantissa & 0xFF))
+        self.regs[Opt3002.Reg.CONFIG][1] |= self.BIT_CRF
+        if self.pin is not None:
+            self.pin.set_low()
+        
+    def read(self, reg: int, count: int):
+        self.reads.append(reg)
+        data = bytes(self.regs[reg])
+        if reg == Opt3002.Reg.CONFIG:
+            self.regs[reg][1] &= ~self.BIT_CRF
+            if self.pin is not None:
+                self.pin.set_high()
+        return (count, bytearray(data))
+    
+    def write(self, reg: int, data: bytes) -> None:
+        self.regs[reg][:] = data
+        
+
+class TestOpt3002Continuous(unittest.TestCase):
+    
+    def setUp(self) -> None:
+        self.handler = Opt3002I2CHandler()
+        self.opt3002 = Opt3002(self.handler, name="opt3002")
+        
+    def test_data(self):
+        self.assertEqual(Opt3002.Data.parse_raw_data(b"\x2a\xbc"), (2, 0xabc))
+        self.assertEqual(Opt3002.Data.parse_optical_power(1.2 * 400), (0, 400))
+        self.assertEqual(self.opt3002.id, 0x5449)
+        
+    def test_config(self):
+        self.opt3002.load_config()
+        self.opt3002.set_config(conv_time=Opt3002.Config.CONVERSION_TIME_800,
+                                conv_mode=Opt3002.Config.CONVERSION_MODE_CONTINUOUS_1)
+        self.assertEqual(self.handler.regs[Opt3002.Reg.CONFIG][0], 0xce)
+        
+    def test_polling(self):
+        self.opt3002.start_continuous()
+        self.assertTrue(self.opt3002.continuous)
+        self.assertEqual(self.handler.regs[Opt3002.Reg.CONFIG][0] & 0b110, 0b110)
+        
+        self.handler.complete(1, 100)
+        model = self.opt3002.read()
+        self.assertAlmostEqual(model.irradiance, 2 * 100 * 1.2)
+        self.assertIsNotNone(model.timestamp)
+        
+        self.handler.reads.clear()
+        self.assertIs(self.opt3002.read(), model)
+        self.assertEqual(self.handler.reads, [Opt3002.Reg.CONFIG])
+        
+        self.handler.complete(2, 100)
+        self.assertAlmostEqual(self.opt3002.read().irradiance, 4 * 100 * 1.2)
+        
+        self.opt3002.stop_continuous()
+        self.assertFalse(self.opt3002.continuous)
+        self.assertEqual(self.handler.regs[Opt3002.Reg.CONFIG][0] & 0b110, 0)
+        
+    def test_interrupt(self):
+        pin = FakeDigitalInputHandler(level=True)
+        self.handler.pin = pin
+        self.opt3002.start_continuous(pin=pin)
+        self.assertEqual(bytes(self.handler.regs[Opt3002.Reg.LIMIT_LOW]), b"\xc0\x00")
+        
+        self.handler.complete(0, 10)
+        model = self.opt3002.read()
+        self.assertAlmostEqual(model.irradiance, 12.)
+        
+        self.handler.reads.clear()
+        self.assertIs(self.opt3002.read(), model)
+        self.assertEqual(self.handler.reads, [])
+        
+        self.handler.complete(0, 20)
+        self.assertAlmostEqual(self.opt3002.read().irradiance, 24.)
+        self.opt3002.stop_continuous()
+        
+        
+if __name__ == "__main__":
+    unittest.main()
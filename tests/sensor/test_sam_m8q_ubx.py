@@ -0,0 +1,148 @@
+
+import threading
+import unittest
+
+from pisat.handler import I2CHandlerBase, SerialHandlerBase
+from pisat.sensor.sam_m8q import DDCHandler, I2CSamM8Q, UARTSamM8Q
+from pisat.util.ubx import build_frame
+
+from tests.util.test_ubx import SENTENCE_GGA, build_pvt
+
+
+class UBXSerialHandler(SerialHandlerBase):
+    
+    def __init__(self, nak: bool = False) -> None:
+        super().__init__("buffer", 9600)
+        self.buf = bytearray()
+        self.written = []
+        self.nak = nak
+        self.lock = threading.Lock()
+        
+    def feed(self, data: bytes) -> None:
+        with self.lock:
+            self.buf.extend(data)
+        
+    def _counts_pending(self) -> int:
+        with self.lock:
+            return len(self.buf)
+    
+    def _read_pending(self, count: int) -> bytes:
+        with self.lock:
+            data = bytes(self.buf[:count])
+            del self.buf[:count]
+        return data
+    
+    def write(self, data: bytes) -> None:
+        self.written.append(bytes(data))
+        self.feed(build_frame(0x05, 0x00 if self.nak else 0x01, data[2:4]))
+        
+
+class TestUARTSamM8Q(unittest.TestCase):
+    
+    def test_pvt(self):
+        handler = UBXSerialHandler()
+        gps = UARTSamM8Q(handler, background=False, name="gps")
+        handler.feed(SENTENCE_GGA + build_pvt(lat=35.5, lon=139.5))
+        
+        model = gps.read()
+        self.assertAlmostEqual(model.latitude, 35.5)
+        self.assertAlmostEqual(model.longitude, 139.5)
+        self.assertEqual(model.fix_type, "3")
+        self.assertAlmostEqual(model.speed_knots, 0.224 * 3600 / 1852)
+        self.assertAlmostEqual(gps.pvt.h_acc, 1.5)
+        
+    def test_set_binary_output_foreground(self):
+        handler = UBXSerialHandler()
+        gps = UARTSamM8Q(handler, background=False, name="gps")
+        self.assertTrue(gps.set_binary_output(rate=5))
+        self.assertEqual(len(handler.written), 3)
+        
+        handler = UBXSerialHandler(nak=True)
+        gps = UARTSamM8Q(handler, background=False, name="gps")
+        self.assertFalse(gps.send_config(frame_cfg_rate(), timeout=0.1))
+        
+    def test_set_binary_output_background(self):
+        handler = UBXSerialHandler()
+        gps = UARTSamM8Q(handler, name="gps")
+        try:
+            self.assertTrue(gps.set_binary_output(rate=10))
+            handler.feed(build_pvt(lat=10.))
+            self.assertTrue(gps.wait_update(timeout=1.))
+            self.assertAlmostEqual(gps.read().latitude, 10.)
+        finally:
+            gps.close()
+            
+            
+class DDCI2CHandler(I2CHandlerBase):
+    
+    MAX_LEN_READ = 32
+    
+    def __init__(self) -> None:
+        super().__init__(0x42)
+        self.stream = bytearray()
+        self.written = bytearray()
+        self.reads = 0
+        self.lock = threading.Lock()
+        
+    def feed(self, data: bytes) -> None:
+        with self.lock:
+            self.stream.extend(data)
+        
+    def read(self, reg: int, count: int):
+        self.reads += 1
+        with self.lock:
+            if reg == DDCHandler.REG_COUNTS:
+                n = len(self.stream)
+                return (2, bytearray([n >> 8, n & 0xFF]))
+            elif reg == DDCHandler.REG_STREAM:
+                assert count <= self.MAX_LEN_READ
+                data = self.stream[:count]
+                del self.stream[:count]
+                return (len(data), bytearray(data))
+        return (0, bytearray())
+    
+    def write(self, reg: int, data: bytes) -> None:
+        assert len(data) >= 1 and len(data) <= self.MAX_LEN_READ
+        self.written.append(reg)
+        self.written.extend(data)
+        if len(self.written) >= 8 and len(self.written) == 8 + (self.written[4] | self.written[5] << 8):
+            self.feed(build_frame(0x05, 0x01, self.written[2:4]))
+            self.written.clear()
+            
+
+class TestI2CSamM8Q(unittest.TestCase):
+    
+    def test_read(self):
+        handler = DDCI2CHandler()
+        gps = I2CSamM8Q(handler, background=False, name="gps")
+        handler.feed(SENTENCE_GGA + build_pvt(lat=35.5, lon=139.5))
+        
+        model = gps.read()
+        self.assertAlmostEqual(model.latitude, 35.5)
+        self.assertEqual(model.satellites_used, 9)
+        # one read of the counts and bulk reads of the stream
+        self.assertEqual(handler.reads, 1 + -(-(len(SENTENCE_GGA) + 100) // 32))
+        
+    def test_set_binary_output(self):
+        handler = DDCI2CHandler()
+        gps = I2CSamM8Q(handler, name="gps")
+        try:
+            self.assertTrue(gps.set_binary_output(rate=2))
+        finally:
+            gps.close()
+            
+    def test_write_chunks(self):
+        handler = DDCI2CHandler()
+        ddc = DDCHandler(handler)
+        frame = build_frame(0x06, 0x00, bytes(26))
+        self.assertEqual(len(frame) % 33, 1)
+        ddc.write(frame)
+        self.assertEqual(handler.stream[:4], b"\xb5\x62\x05\x01")
+        
+        
+def frame_cfg_rate() -> bytes:
+    return build_frame(0x06, 0x08, b"\x64\x00\x01\x00\x01\x00")
+        
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+
+import threading
+import time
+import unittest
+
+from pisat.handler import SerialHandlerBase
+from pisat.sensor import SerialGPS
+
+
+SENTENCES = (
+    b"$GNGGA,085120.000,3541.1493,N,13945.3994,E,1,08,1.0,39.1,M,39.4,M,,*71\r\n",
+    b"$GNGSA,A,3,21,05,29,25,12,10,26,02,,,,,1.9,1.0,1.6*2C\r\n",
+    b"$GNRMC,085120.000,A,3541.1493,N,13945.3994,E,0.85,88.8,310320,,,A*79\r\n",
+    b"$GNVTG,88.8,T,,M,0.85,N,1.57,K,A*25\r\n",
+)
+
+
+class BufferSerialHandler(SerialHandlerBase):
+    
+    def __init__(self) -> None:
+        super().__init__("buffer", 9600)
+        self._buf = bytearray()
+        self._lock = threading.Lock()
+        
+    def feed(self, data: bytes) -> None:
+        with self._lock:
+            self._buf.extend(data)
+        
+    def _counts_pending(self) -> int:
+        with self._lock:
+            return len(self._buf)
+        
+    def _read_pending(self, count: int) -> bytes:
+        with self._lock:
+            data = bytes(self._buf[:count])
+            del self._buf[:count]
+        return data
+
+
+class TestSerialGPSBackground(unittest.TestCase):
+    
+    def setUp(self) -> None:
+        self.handler = BufferSerialHandler()
+        
+    def test_merge(self):
+        gps = SerialGPS(self.handler, name="gps")
+        try:
+            model = gps.read()
+            self.assertIsNone(model.latitude)
+            self.assertIsNone(model.age)
+            
+            for sentence in SENTENCES:
+                self.handler.feed(sentence)
+            deadline = time.time() + 2.
+            while self.handler.counts_readable and time.time() < deadline:
+                gps.wait_update(timeout=0.1)
+            gps.wait_update(timeout=0.2)
+            
+            model = gps.read()
+            self.assertAlmostEqual(model.latitude, 35 + 41.1493 / 60)
+            self.assertAlmostEqual(model.longitude, 139 + 45.3994 / 60)
+            self.assertEqual(model.altitude, 39.1)
+            self.assertEqual(model.quality, 1)
+            self.assertEqual(model.fix_type, "3")
+            self.assertEqual(model.speed_knots, 0.85)
+            self.assertEqual(model.true_course, 88.8)
+            self.assertGreaterEqual(model.age, 0.)
+        finally:
+            gps.stop()
+        self.assertFalse(gps.background)
+        
+    def test_read_does_not_block(self):
+        gps = SerialGPS(self.handler, name="gps")
+        try:
+            time_init = time.time()
+            for _ in range(100):
+                gps.read()
+            self.assertLess(time.time() - time_init, 0.5)
+        finally:
+            gps.close()
+        
+    def test_foreground(self):
+        gps = SerialGPS(self.handler, background=False, name="gps")
+        self.handler.feed(SENTENCES[0])
+        model = gps.read()
+        self.assertEqual(model.satellites_used, 8)
+        self.assertIsNotNone(model.latitude)
+        
+
+if __name__ == "__main__":
+    unittest.main()
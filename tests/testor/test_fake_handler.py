@@ -0,0 +1,292 @@
+
+from functools import partial
+import os
+import tempfile
+import time
+import unittest
+
+from pisat.core.cansat import CanSat
+from pisat.core.logger import DataLogger, LogQueue
+from pisat.core.manager import ComponentManager
+from pisat.core.nav import Context, Node
+from pisat.handler import PyserialSerialHandler
+from pisat.handler.pigpio_digital_input_handler import PigpioDigitalInputHandler
+from pisat.handler.pigpio_digital_output_handler import PigpioDigitalOutputHandler
+from pisat.handler.pigpio_i2c_handler import PigpioI2CHandler
+from pisat.handler.pigpio_serial_handler import PigpioSerialHandler
+from pisat.model import LinkedDataModelBase, linked_loggable
+from pisat.sensor import Apds9301, Bme280, Bno055, HcSr04, Opt3002, SerialGPS
+from pisat.sensor.bno055 import UARTBno055
+from pisat.tester.handler import (
+    FakeApds9301, FakeBme280, FakeBno055, FakeBno055UART, FakeDigitalInputHandler, 
+    FakeGPS, FakeHcSr04, FakeI2CHandler, FakeOpt3002, FakePi, FakeSerialHandler, PtySerialPort
+)
+
+
+NAME_BME280 = "bme280"
+NAME_BNO055 = "bno055"
+NAME_HCSR04 = "hcsr04"
+NAME_DLOGGER = "dlogger"
+PORT_GPS = "/dev/serial0"
+PIN_ECHO = 4
+PIN_TRIGGER = 17
+
+
+class LinkedDataModel(LinkedDataModelBase):
+    
+    press = linked_loggable(Bme280.DataModel.press, NAME_BME280)
+    acc = linked_loggable(Bno055.DataModel.acc, NAME_BNO055)
+    dist = linked_loggable(HcSr04.DataModel.dist, NAME_HCSR04)
+    
+    
+class WaitingNode(Node):
+    
+    model = LinkedDataModel
+    
+    def judge(self, data: LinkedDataModel) -> bool:
+        return data.press > 900.
+    
+    
+class ApproachingNode(Node):
+    
+    model = LinkedDataModel
+    
+    def enter(self):
+        self.counter = 0
+        
+    def judge(self, data: LinkedDataModel) -> bool:
+        self.counter += 1
+        return self.counter >= 20 and data.dist < 2.
+    
+    
+class TestFakeDevices(unittest.TestCase):
+    
+    def test_bme280(self):
+        handler = FakeI2CHandler(FakeBme280(), Bme280.ADDRESS_I2C_GND)
+        bme280 = Bme280(handler, name=NAME_BME280)
+        self.assertEqual(bme280.id, FakeBme280.CHIP_ID)
+        self.assertAlmostEqual(bme280.read().temp, 25.08, places=1)
+        self.assertAlmostEqual(bme280.read().press, 1006.53, places=1)
+        
+        handler.device.set_raw(press=FakeBme280.RAW_PRESS + 1000)
+        self.assertLess(bme280.read().press, 1006.)
+        
+    def test_bno055(self):
+        device = FakeBno055()
+        device.set_acc((0., 1.5, 9.8))
+        device.set_euler((90., 0., -10.))
+        
+        bno055 = Bno055(FakeI2CHandler(device, 0x28), name=NAME_BNO055)
+        self.assertEqual(bno055.chip_id, FakeBno055.ID_CHIP)
+        self.assertEqual(bno055.read().acc, (0., 1.5, 9.8))
+        self.assertEqual(bno055.read().euler, (90., 0., -10.))
+        
+        bno055.change_operation_mode(Bno055.OperationMode.NDOF)
+        self.assertEqual(device.operation_mode, Bno055.OperationMode.NDOF.value)
+        
+    def test_bno055_uart(self):
+        device = FakeBno055UART()
+        device.device.set_acc((1., 2., 3.))
+        bno055 = UARTBno055(FakeSerialHandler(device), name=NAME_BNO055)
+        self.assertEqual(bno055.chip_id, FakeBno055.ID_CHIP)
+        self.assertEqual(bno055.read().acc, (1., 2., 3.))
+        
+    def test_apds9301(self):
+        pin = FakeDigitalInputHandler(level=True)
+        device = FakeApds9301(interrupt=pin.set_level)
+        apds9301 = Apds9301(FakeI2CHandler(device, Apds9301.ADDRESS_I2C_FLOAT), name="apds9301")
+        self.assertEqual(apds9301.id, FakeApds9301.ID)
+        self.assertTrue(device.powered)
+        self.assertGreater(apds9301.read().illuminance, 0.)
+        
+        apds9301.set_interrupt(low=10, high=500, islevel=True)
+        device.set_raw(1000, 200)
+        self.assertFalse(pin.observe())
+        apds9301.clear_interrupt()
+        self.assertTrue(pin.observe())
+        
+    def test_opt3002(self):
+        pin = FakeDigitalInputHandler(level=True)
+        device = FakeOpt3002(irradiance=1200., interrupt=pin.set_level, auto=False)
+        opt3002 = Opt3002(FakeI2CHandler(device, Opt3002.AddrI2C.GND), name="opt3002")
+        self.assertEqual(opt3002.id, FakeOpt3002.ID)
+        
+        opt3002.start_continuous(pin=pin)
+        device.complete()
+        self.assertFalse(pin.observe())
+        self.assertAlmostEqual(opt3002.read().irradiance, 1200., delta=1.2)
+        self.assertTrue(pin.observe())
+        opt3002.stop_continuous()
+        
+    def test_opt3002_auto(self):
+        device = FakeOpt3002(speed=100.)
+        opt3002 = Opt3002(FakeI2CHandler(device, Opt3002.AddrI2C.GND), name="opt3002")
+        opt3002.start_continuous(conv_time=Opt3002.Config.CONVERSION_TIME_100)
+        time.sleep(0.05)
+        opt3002.stop_continuous()
+        self.assertGreaterEqual(device.counts_conversion, 2)
+        
+    def test_hc_sr04(self):
+        echo = FakeDigitalInputHandler()
+        device = FakeHcSr04(echo.set_level, distance=1.5)
+        hcsr04 = HcSr04(echo, device.trigger, timeout=0.1, name="hcsr04")
+        self.assertAlmostEqual(hcsr04.read().dist, 1.5, places=2)
+        self.assertEqual(device.counts_trigger, 1)
+        
+        device.distance = 0.5
+        self.assertAlmostEqual(hcsr04.read().dist, 0.5, places=2)
+        
+    def test_gps(self):
+        device = FakeGPS(velocity=(10., 0.), rate=10., speed=10.)
+        gps = SerialGPS(FakeSerialHandler(device, baudrate=9600), name="gps")
+        try:
+            self.assertTrue(gps.wait_update(timeout=1.))
+            latitude = gps.read().latitude
+            self.assertAlmostEqual(latitude, 38.2604, places=3)
+            
+            time.sleep(0.1)
+            self.assertGreater(gps.read().latitude, latitude)
+            self.assertGreater(device.counts_epoch, 5)
+        finally:
+            gps.close()
+            
+    def test_latency(self):
+        handler = FakeI2CHandler(FakeBme280(), Bme280.ADDRESS_I2C_GND)
+        bme280 = Bme280(handler, name=NAME_BME280)
+        
+        handler.latency = 0.01
+        counts = handler.counts_transaction
+        time_init = time.perf_counter()
+        bme280.read()
+        self.assertGreaterEqual(time.perf_counter() - time_init, 0.01)
+        self.assertEqual(handler.counts_transaction, counts + 1)
+        
+        
+class TestFakePi(unittest.TestCase):
+    
+    def setUp(self) -> None:
+        self.pi = FakePi()
+        self.pi.attach_i2c(Bme280.ADDRESS_I2C_GND, FakeBme280())
+        self.pi.attach_i2c(0x28, FakeBno055())
+        self.pi.attach_serial(PORT_GPS, FakeGPS(speed=10.))
+        
+    def test_i2c(self):
+        bme280 = Bme280(PigpioI2CHandler(self.pi, Bme280.ADDRESS_I2C_GND), name=NAME_BME280)
+        self.assertAlmostEqual(bme280.read().temp, 25.08, places=1)
+        with self.assertRaises(ValueError):
+            PigpioI2CHandler(self.pi, 0x77)
+        
+    def test_serial(self):
+        gps = SerialGPS(PigpioSerialHandler(self.pi, PORT_GPS, baudrate=9600), name="gps")
+        try:
+            self.assertTrue(gps.wait_update(timeout=1.))
+        finally:
+            gps.close()
+            
+    def test_gpio(self):
+        edges = []
+        cb = self.pi.callback(4, FakePi.FALLING_EDGE, lambda gpio, level, tick: edges.append(level))
+        self.pi.set_level(4, True)
+        self.pi.set_level(4, False)
+        self.assertEqual(edges, [0])
+        cb.cancel()
+        self.pi.set_level(4, True)
+        self.pi.set_level(4, False)
+        self.assertEqual(edges, [0])
+        
+        levels = []
+        self.pi.attach_gpio(17, levels.append)
+        self.pi.write(17, FakePi.HIGH)
+        self.assertEqual((levels, self.pi.read(17)), ([True], FakePi.HIGH))
+        
+    def test_gpio_handlers(self):
+        echo = PigpioDigitalInputHandler(self.pi, PIN_ECHO, pulldown=True)
+        self.assertEqual(self.pi.get_mode(PIN_ECHO), FakePi.INPUT)
+        self.assertFalse(echo.observe())
+        echo.set_pull_up_down(pulldown=False)
+        self.assertTrue(echo.observe())
+        
+        trigger = PigpioDigitalOutputHandler(self.pi, PIN_TRIGGER)
+        self.assertEqual(self.pi.get_mode(PIN_TRIGGER), FakePi.OUTPUT)
+        trigger.set_high()
+        self.assertEqual(self.pi.read(PIN_TRIGGER), FakePi.HIGH)
+        
+    def attach_hc_sr04(self, distance: float) -> HcSr04:
+        device = FakeHcSr04(partial(self.pi.set_level, PIN_ECHO), distance=distance)
+        self.pi.attach_gpio(PIN_TRIGGER, device.on_trigger)
+        return HcSr04(PigpioDigitalInputHandler(self.pi, PIN_ECHO),
+                      PigpioDigitalOutputHandler(self.pi, PIN_TRIGGER),
+                      timeout=0.1,
+                      name=NAME_HCSR04)
+        
+    def test_hc_sr04(self):
+        hcsr04 = self.attach_hc_sr04(1.5)
+        try:
+            self.assertAlmostEqual(hcsr04.read().dist, 1.5, places=2)
+        finally:
+            hcsr04.close()
+            
+    def test_cansat(self):
+        bme280 = Bme280(PigpioI2CHandler(self.pi, Bme280.ADDRESS_I2C_GND), name=NAME_BME280)
+        bno055 = Bno055(PigpioI2CHandler(self.pi, 0x28), name=NAME_BNO055)
+        hcsr04 = self.attach_hc_sr04(1.5)
+        
+        with tempfile.TemporaryDirectory() as dir:
+            logque = LogQueue(LinkedDataModel, path=os.path.join(dir, "data.csv"))
+            dlogger = DataLogger(logque, bme280, bno055, hcsr04, name=NAME_DLOGGER)
+            manager = ComponentManager(dlogger, recursive=True)
+            context = Context({WaitingNode: {True: ApproachingNode, False: WaitingNode},
+                               ApproachingNode: {True: None, False: ApproachingNode}},
+                              start=WaitingNode)
+            
+            cansat = CanSat(context, manager, dlogger=dlogger)
+            try:
+                cansat.run()
+            finally:
+                hcsr04.close()
+            
+            data = dlogger.refqueue.get()[0]
+            self.assertAlmostEqual(data.press, 1006.53, places=1)
+            self.assertAlmostEqual(data.dist, 1.5, places=2)
+        
+    def test_datalogger(self):
+        bme280 = Bme280(PigpioI2CHandler(self.pi, Bme280.ADDRESS_I2C_GND), name=NAME_BME280)
+        bno055 = Bno055(PigpioI2CHandler(self.pi, 0x28), name=NAME_BNO055)
+        
+        with tempfile.TemporaryDirectory() as dir:
+            logque = LogQueue(LinkedDataModel, path=os.path.join(dir, "data.csv"))
+            dlogger = DataLogger(logque, bme280, bno055, modelclass=LinkedDataModel)
+            with dlogger:
+                for _ in range(100):
+                    data = dlogger.read()
+            self.assertAlmostEqual(data.press, 1006.53, places=1)
+            
+            
+@unittest.skipUnless(hasattr(os, "openpty"), "pty is not available")
+class TestPtySerialPort(unittest.TestCase):
+    
+    def test_bno055(self):
+        device = FakeBno055UART()
+        port = PtySerialPort(device)
+        port.start()
+        handler = PyserialSerialHandler(port.path, baudrate=115200)
+        try:
+            handler.write(b"\xaa\x01\x00\x01")
+            self.assertEqual(handler.read_available(timeout=1.)[:3], b"\xbb\x01\xa0")
+        finally:
+            handler.close()
+            port.close()
+            
+    def test_gps(self):
+        port = PtySerialPort(FakeGPS(rate=10., speed=10.))
+        port.start()
+        gps = SerialGPS(PyserialSerialHandler(port.path, baudrate=9600), name="gps")
+        try:
+            self.assertTrue(gps.wait_update(timeout=1.))
+        finally:
+            gps.close()
+            port.close()
+        
+        
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+
+import json
+import os
+import tempfile
+import time
+import unittest
+
+from pisat.model import LinkedDataModelBase, linked_loggable
+from pisat.sensor import NumberGenerator, SensorGroup
+from pisat.tester.sensor import BenchmarkResult, SensorBenchmark
+
+
+NAME_NUMGEN1 = "numgen1"
+NAME_NUMGEN2 = "numgen2"
+TIME_READ = 1e-3
+
+
+def sleep_read():
+    time.sleep(TIME_READ)
+    return 1
+
+
+class LinkedDataModel(LinkedDataModelBase):
+    
+    num1 = linked_loggable(NumberGenerator.DataModel.num, NAME_NUMGEN1)
+    num2 = linked_loggable(NumberGenerator.DataModel.num, NAME_NUMGEN2)
+    
+
+class TestSensorBenchmark(unittest.TestCase):
+    
+    def setUp(self) -> None:
+        self.numgen1 = NumberGenerator(sleep_read, name=NAME_NUMGEN1)
+        self.numgen2 = NumberGenerator(lambda: 2, name=NAME_NUMGEN2)
+        self.group = SensorGroup(LinkedDataModel, self.numgen1, self.numgen2, name="group")
+        
+    def test_result(self):
+        result = BenchmarkResult("sensor", list(range(1, 101)), 10 ** 9)
+        self.assertEqual(result.times, 100)
+        self.assertAlmostEqual(result.p50, 50.5e-9)
+        self.assertAlmostEqual(result.max, 100e-9)
+        self.assertAlmostEqual(result.throughput, 100.)
+        self.assertEqual(json.loads(result.to_json())["p99"], result.p99)
+        
+    def test_run(self):
+        calls = []
+        numgen = NumberGenerator(lambda: calls.append(None), name="numgen")
+        result = SensorBenchmark(numgen, warmup=5).run(times=20)
+        self.assertEqual(len(calls), 25)
+        self.assertEqual(result.times, 20)
+        self.assertEqual(result.warmup, 5)
+        
+        result = SensorBenchmark(self.numgen1, warmup=1).run(times=10)
+        self.assertGreaterEqual(result.p50, TIME_READ)
+        self.assertLessEqual(result.p50, result.p95)
+        self.assertLessEqual(result.p99, result.max)
+        self.assertLess(result.throughput, 1 / TIME_READ)
+        
+    def test_run_all(self):
+        results = SensorBenchmark(self.group, warmup=1).run_all(times=10)
+        self.assertEqual(set(results), {NAME_NUMGEN1, NAME_NUMGEN2, "group"})
+        self.assertGreater(results["group"].p50, results[NAME_NUMGEN2].p50)
+        
+    def test_compare(self):
+        result = BenchmarkResult(NAME_NUMGEN1, [1000] * 10, 10 ** 4)
+        slow = BenchmarkResult(NAME_NUMGEN1, [2000] * 10, 2 * 10 ** 4)
+        unknown = BenchmarkResult("unknown", [2000] * 10, 2 * 10 ** 4)
+        
+        with tempfile.TemporaryDirectory() as dir:
+            path = os.path.join(dir, "baseline.json")
+            SensorBenchmark.save(path, result)
+            baseline = SensorBenchmark.load(path)
+            
+        self.assertEqual(SensorBenchmark.compare(result, baseline), [])
+        regressions = SensorBenchmark.compare([slow, unknown], baseline)
+        self.assertEqual({r.key for r in regressions}, {"p50", "p95", "p99", "throughput"})
+        self.assertAlmostEqual(regressions[0].ratio, 2.)
+        self.assertEqual(SensorBenchmark.compare(slow, baseline, tolerance=1.5), [])
+        
+        
+if __name__ == "__main__":
+    unittest.main()
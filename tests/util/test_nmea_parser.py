@@ -0,0 +1,179 @@
+
+import os
+import re
+import time
+import unittest
+
+from pisat.util.nmea import GGAModel, NMEAParser, NMEAStreamDecoder, RMCModel, iter_nmea, iter_nmea_file
+
+
+PATH_STREAM = os.path.join(os.path.dirname(__file__), "res", "satellites_raw.txt")
+SENTENCE_GGA = b"$GNGGA,072522.00,3815.83805,N,14051.91719,E,2,09,2.94,51.6,M,36.8,M,,0000*77\r\n"
+REPEAT_BENCHMARK = 5
+
+
+def parse_legacy(parser: NMEAParser, sentence: bytes):
+    # The regex based implementation which was used before.
+    try:
+        sentence = sentence.decode()
+    except UnicodeDecodeError:
+        return None
+    if len(sentence) < 5:
+        return None
+    if sentence[0] != "$" or sentence[-2:] != "\r\n":
+        return None
+    fields = re.split("[,*]", sentence[1:-2])
+    modeltype = NMEAParser.MODELS.get(fields[0][2:])
+    if modeltype is None:
+        return None
+    model = modeltype(parser._comp_name)
+    model.setup(fields)
+    return model
+
+
+class TestNMEAParser(unittest.TestCase):
+    
+    def setUp(self) -> None:
+        self.parser = NMEAParser("gps")
+        
+    def test_parse(self):
+        model = self.parser.parse(SENTENCE_GGA)
+        self.assertIsInstance(model, GGAModel)
+        self.assertEqual(model.checksum, "77")
+        self.assertEqual(model.satellites_used, 9)
+        self.assertEqual(model.altitude, 51.6)
+        self.assertIsNotNone(self.parser.parse(SENTENCE_GGA[:-2] + b"\n"))
+        
+    def test_checksum(self):
+        self.assertEqual(NMEAParser.calc_checksum(SENTENCE_GGA[1:-5]), 0x77)
+        self.assertEqual(NMEAParser.calc_checksum(b""), 0)
+        
+        corrupted = SENTENCE_GGA.replace(b"51.6", b"57.6")
+        self.assertIsNone(self.parser.parse(corrupted))
+        self.assertIsNone(self.parser.parse(SENTENCE_GGA.replace(b"*77", b"*zz")))
+        self.assertIsNone(self.parser.parse(SENTENCE_GGA.replace(b"*77", b"")))
+        
+        parser = NMEAParser("gps", checksum=False)
+        self.assertIsNotNone(parser.parse(corrupted))
+        
+        # Checksums of a buffer are calculated at once.
+        buffer = b"garbage\n" + SENTENCE_GGA + corrupted + SENTENCE_GGA.replace(b"\r\n", b"\n") + SENTENCE_GGA[:20]
+        self.assertEqual(len(self.parser.parse_many(buffer)), 2)
+        self.assertEqual(len(parser.parse_many(buffer)), 3)
+        
+    def test_invalid(self):
+        self.assertIsNone(self.parser.parse(b""))
+        self.assertIsNone(self.parser.parse(SENTENCE_GGA[:-2]))
+        self.assertIsNone(self.parser.parse(SENTENCE_GGA[1:]))
+        self.assertIsNone(self.parser.parse(b"$PUBX,00*33\r\n"))
+        self.assertIsNone(self.parser.parse(b"$GNGGA\xff,*00\r\n"))
+        
+    def test_formats(self):
+        parser = NMEAParser("gps", formats=("RMC",))
+        self.assertEqual(parser.formats, ("RMC",))
+        self.assertIsNone(parser.parse(SENTENCE_GGA))
+        self.assertRaises(ValueError, NMEAParser, "gps", formats=("XXX",))
+        
+    def test_parse_many(self):
+        with open(PATH_STREAM, "rb") as f:
+            stream = f.read()
+        lines = stream.splitlines(keepends=True)
+        
+        models = self.parser.parse_many(stream)
+        expected = [model for model in map(self.parser.parse, lines) if model is not None]
+        self.assertEqual(len(models), len(expected))
+        self.assertEqual([model.extract() for model in models], 
+                         [model.extract() for model in expected])
+        
+        # the incomplete tail is ignored
+        self.assertEqual(len(self.parser.parse_many(SENTENCE_GGA * 2 + SENTENCE_GGA[:20])), 2)
+        
+        parser = NMEAParser("gps", formats=("RMC",))
+        self.assertTrue(all(isinstance(model, RMCModel) for model in parser.parse_many(stream)))
+        
+        
+class TestNMEAStreamDecoder(unittest.TestCase):
+    
+    def setUp(self) -> None:
+        self.parser = NMEAParser("gps")
+        self.decoder = NMEAStreamDecoder(self.parser)
+        with open(PATH_STREAM, "rb") as f:
+            self.stream = f.read()
+    
+    def test_split_sentence(self):
+        self.assertEqual(list(self.decoder.feed(SENTENCE_GGA[:10])), [])
+        self.assertEqual(self.decoder.pending, 10)
+        models = list(self.decoder.feed(SENTENCE_GGA[10:] + SENTENCE_GGA[:3]))
+        self.assertEqual(len(models), 1)
+        self.assertIsInstance(models[0], GGAModel)
+        self.assertEqual(self.decoder.pending, 3)
+        
+    def test_resync(self):
+        chunk = b"\x00\xffgarbage" + SENTENCE_GGA[:30] + SENTENCE_GGA + b"$GN" + b"x" * 300 + SENTENCE_GGA
+        models = list(self.decoder.feed(chunk))
+        self.assertEqual(len(models), 2)
+        self.assertEqual(list(self.decoder.feed(b"garbage")), [])
+        self.assertEqual(self.decoder.pending, 0)
+        
+    def test_unconsumed_iterator(self):
+        first = self.decoder.feed(SENTENCE_GGA * 2)
+        self.assertEqual(len(list(self.decoder.feed(SENTENCE_GGA))), 1)
+        self.assertEqual(len(list(first)), 2)
+        
+    def test_stream(self):
+        expected = [model.extract() for model in self.parser.parse_many(self.stream)]
+        for size in (1, 7, 64, 4096):
+            chunks = (self.stream[i:i + size] for i in range(0, len(self.stream), size))
+            models = [model.extract() for model in iter_nmea(chunks, self.parser)]
+            self.assertEqual(models, expected)
+            
+    def test_file(self):
+        models = list(iter_nmea_file(PATH_STREAM, NMEAParser("gps", formats=("GGA",))))
+        self.assertEqual(len(models), 157)
+        
+
+class TestNMEAParserBenchmark(unittest.TestCase):
+    
+    def setUp(self) -> None:
+        with open(PATH_STREAM, "rb") as f:
+            self.stream = f.read()
+        self.lines = self.stream.splitlines(keepends=True)
+        
+    def measure(self, func) -> float:
+        time_init = time.perf_counter()
+        for _ in range(REPEAT_BENCHMARK):
+            func()
+        return (time.perf_counter() - time_init) / REPEAT_BENCHMARK
+    
+    def test_bench_mark(self):
+        parser = NMEAParser("gps")
+        parser_filtered = NMEAParser("gps", formats=("GGA", "RMC"))
+        parser_unchecked = NMEAParser("gps", checksum=False)
+        chunks = [self.stream[i:i + 64] for i in range(0, len(self.stream), 64)]
+        
+        expected = [model.extract() for model in (parse_legacy(parser, line) for line in self.lines) if model is not None]
+        expected_filtered = [model.extract() for model in (parse_legacy(parser, line) for line in self.lines) 
+                             if isinstance(model, (GGAModel, RMCModel))]
+        self.assertEqual([model.extract() for model in parser.parse_many(self.stream)], expected)
+        self.assertEqual([model.extract() for model in parser_unchecked.parse_many(self.stream)], expected)
+        self.assertEqual([model.extract() for model in (parser.parse(line) for line in self.lines) if model is not None], expected)
+        self.assertEqual([model.extract() for model in parser_filtered.parse_many(self.stream)], expected_filtered)
+        self.assertEqual([model.extract() for model in iter_nmea(chunks, parser_filtered)], expected_filtered)
+        
+        results = {
+            "legacy": self.measure(lambda: [parse_legacy(parser, line) for line in self.lines]),
+            "parse": self.measure(lambda: [parser.parse(line) for line in self.lines]),
+            "parse_many": self.measure(lambda: parser.parse_many(self.stream)),
+            "parse_many (no checksum)": self.measure(lambda: parser_unchecked.parse_many(self.stream)),
+            "parse_many (GGA, RMC)": self.measure(lambda: parser_filtered.parse_many(self.stream)),
+            "iter_nmea (GGA, RMC)": self.measure(lambda: list(iter_nmea(chunks, parser_filtered))),
+        }
+        
+        print()
+        print(f"{len(self.lines)} sentences")
+        for name, result in results.items():
+            print(f"{name:>24}: {result * 1e3:8.3f} [ms] {len(self.lines) / result:10.0f} [sentences/s]")
+            
+
+if __name__ == "__main__":
+    unittest.main()
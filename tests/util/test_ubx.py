@@ -0,0 +1,96 @@
+
+import struct
+import unittest
+
+from pisat.util.nmea import GGAModel, NMEAParser, NMEAStreamDecoder
+from pisat.util.ubx import (
+    ACKACKModel, ACKNAKModel, NAVPVTModel, UBXConfig, UBXParser, UBXStreamDecoder,
+    build_frame, calc_checksum
+)
+
+
+SENTENCE_GGA = b"$GNGGA,072522.00,3815.83805,N,14051.91719,E,2,09,2.94,51.6,M,36.8,M,,0000*77\r\n"
+
+
+def build_pvt(lat: float = 38.2639675, lon: float = 140.8652865, fix_type: int = 3, flags: int = 0x01) -> bytes:
+    payload = struct.pack(NAVPVTModel.FORMAT,
+                          123456000, 2020, 11, 3, 7, 25, 22, 0x07, 
+                          50, 250000000, fix_type, flags, 0, 9,
+                          round(lon * 1e7), round(lat * 1e7), 88400, 51600, 1500, 2500, 
+                          100, -200, 300, 224, 4512345, 80, 2000000, 294,
+                          0, 0, 0)
+    return build_frame(NAVPVTModel.CLASS, NAVPVTModel.ID, payload)
+
+
+class TestUBX(unittest.TestCase):
+    
+    def setUp(self) -> None:
+        self.parser = UBXParser("gps")
+    
+    def test_build_frame(self):
+        # UBX-CFG-RATE of 10 Hz
+        self.assertEqual(UBXConfig.build_rate(meas_rate=100), 
+                         bytes.fromhex("b562 0608 0600 6400 0100 0100 7a12"))
+        self.assertEqual(calc_checksum(b"\x06\x08\x06\x00\x64\x00\x01\x00\x01\x00"), (0x7A, 0x12))
+        
+    def test_parse_pvt(self):
+        pvt = self.parser.parse(build_pvt())
+        self.assertIsInstance(pvt, NAVPVTModel)
+        self.assertEqual(pvt.date_utc, (3, 11, 2020))
+        self.assertAlmostEqual(pvt.time_utc[2], 22.25)
+        self.assertAlmostEqual(pvt.latitude, 38.2639675)
+        self.assertAlmostEqual(pvt.longitude, 140.8652865)
+        self.assertAlmostEqual(pvt.altitude, 51.6)
+        self.assertAlmostEqual(pvt.h_acc, 1.5)
+        self.assertAlmostEqual(pvt.vel[1], -0.2)
+        self.assertAlmostEqual(pvt.heading, 45.12345)
+        self.assertAlmostEqual(pvt.PDOP, 2.94)
+        self.assertTrue(pvt.gnss_fix_ok)
+        self.assertEqual(pvt.num_SV, 9)
+        self.assertIn("gps-vel_D", pvt.extract())
+        
+    def test_parse_invalid(self):
+        frame = bytearray(build_pvt())
+        frame[20] ^= 0xFF
+        self.assertIsNone(self.parser.parse(frame))
+        self.assertIsNone(self.parser.parse(build_pvt()[:-1]))
+        self.assertIsNone(self.parser.parse(build_frame(0x01, 0x35, b"\x00" * 8)))
+        
+    def test_ack(self):
+        ack = self.parser.parse(build_frame(0x05, 0x01, b"\x06\x08"))
+        self.assertIsInstance(ack, ACKACKModel)
+        self.assertTrue(ack.acknowledged)
+        self.assertEqual((ack.cls_acked, ack.id_acked), (0x06, 0x08))
+        self.assertFalse(self.parser.parse(build_frame(0x05, 0x00, b"\x06\x08")).acknowledged)
+        self.assertIsInstance(self.parser.parse(build_frame(0x05, 0x00, b"\x06\x08")), ACKNAKModel)
+        
+    def test_stream_mixed(self):
+        stream = b"\xb5garbage" + SENTENCE_GGA + build_pvt() + b"\xb5\x62\x01" + SENTENCE_GGA + build_pvt(lat=-1.)
+        decoder_ubx = UBXStreamDecoder(self.parser)
+        decoder_nmea = NMEAStreamDecoder(NMEAParser("gps"))
+        
+        pvts, sentences = [], []
+        for i in range(0, len(stream), 5):
+            pvts.extend(decoder_ubx.feed(stream[i:i + 5]))
+            sentences.extend(decoder_nmea.feed(stream[i:i + 5]))
+            
+        self.assertEqual(len(pvts), 2)
+        self.assertAlmostEqual(pvts[1].latitude, -1.)
+        self.assertEqual(len(sentences), 2)
+        self.assertTrue(all(isinstance(model, GGAModel) for model in sentences))
+        
+    def test_binary_output(self):
+        frames = UBXConfig.build_binary_output(rate=5)
+        self.assertEqual(len(frames), 3)
+        prt = self.parser.parse(frames[0])
+        self.assertIsNone(prt)
+        self.assertEqual(frames[0][2:4], b"\x06\x00")
+        self.assertEqual(frames[0][6], UBXConfig.Port.UART1.value)
+        self.assertEqual(struct.unpack_from("<H", frames[0], 6 + 14)[0], UBXConfig.Protocol.UBX.value)
+        self.assertEqual(struct.unpack_from("<H", frames[1], 6)[0], 200)
+        self.assertEqual(frames[2][6:9], b"\x01\x07\x01")
+        self.assertRaises(ValueError, UBXConfig.build_binary_output, rate=0)
+        
+
+if __name__ == "__main__":
+    unittest.main()